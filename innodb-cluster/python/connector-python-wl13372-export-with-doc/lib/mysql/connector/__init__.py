@@ -30,7 +30,8 @@
 MySQL Connector/Python - MySQL driver written in Python
 """
 
-import dns.resolver
+from functools import partial
+
 import dns.exception
 
 try:
@@ -56,6 +57,8 @@ from .dbapi import (
     STRING, BINARY, NUMBER, DATETIME, ROWID,
     apilevel, threadsafety, paramstyle)
 from .optionfiles import read_option_files
+from .srv import resolve_srv
+from .utils import staggered_connect
 
 _CONNECTION_POOLS = {}
 
@@ -71,21 +74,29 @@ def _get_pooled_connection(**kwargs):
     except KeyError:
         pool_name = generate_pool_name(**kwargs)
 
+    timeout = kwargs.pop('pool_timeout', 0)
+
     # Setup the pool, ensuring only 1 thread can update at a time
     with CONNECTION_POOL_LOCK:
         if pool_name not in _CONNECTION_POOLS:
             _CONNECTION_POOLS[pool_name] = MySQLConnectionPool(**kwargs)
         elif isinstance(_CONNECTION_POOLS[pool_name], MySQLConnectionPool):
             # pool_size must be the same
-            check_size = _CONNECTION_POOLS[pool_name].pool_size
+            cnxpool = _CONNECTION_POOLS[pool_name]
+            check_size = cnxpool.pool_size
             if ('pool_size' in kwargs
                     and kwargs['pool_size'] != check_size):
                 raise PoolError("Size can not be changed "
                                 "for active pools.")
+            # Elastic pools are resized
+            min_size = kwargs.get('pool_min_size', cnxpool.min_size)
+            max_size = kwargs.get('pool_max_size', check_size)
+            if (min_size, max_size) != (cnxpool.min_size, check_size):
+                cnxpool.resize(min_size, max_size)
 
     # Return pooled connection
     try:
-        return _CONNECTION_POOLS[pool_name].get_connection()
+        return _CONNECTION_POOLS[pool_name].get_connection(timeout=timeout)
     except AttributeError:
         raise InterfaceError(
             "Failed getting connection from pool '{0}'".format(pool_name))
@@ -100,6 +111,10 @@ def _get_failover_connection(**kwargs):
     unix_socket and database. ValueError is also raised when the failover
     argument was not provided.
 
+    When connect_attempt_delay is given, the servers are tried in parallel:
+    the attempt to the next server starts after connect_attempt_delay
+    milliseconds and the first established connection is returned.
+
     Returns MySQLConnection instance.
     """
     config = kwargs.copy()
@@ -108,6 +123,7 @@ def _get_failover_connection(**kwargs):
     except KeyError:
         raise ValueError('failover argument not provided')
     del config['failover']
+    delay = config.pop('connect_attempt_delay', None)
 
     support_cnx_args = set(
         ['user', 'password', 'host', 'port', 'unix_socket',
@@ -122,9 +138,22 @@ def _get_failover_connection(**kwargs):
                     's' if len(diff) > 1 else '',
                     ', '.join(diff)))
 
+    configs = []
     for server in failover:
         new_config = config.copy()
         new_config.update(server)
+        configs.append(new_config)
+
+    if delay is not None and len(configs) > 1:
+        attempts = [partial(connect, **new_config) for new_config in configs]
+        try:
+            return staggered_connect(attempts, delay / 1000.0,
+                                     lambda cnx: cnx.close())[1]
+        except Error:
+            raise InterfaceError(
+                "Could not failover: no MySQL server available")
+
+    for new_config in configs:
         try:
             return connect(**new_config)
         except Error:
@@ -166,21 +195,11 @@ def connect(*args, **kwargs):
             kwargs['host'] = DEFAULT_CONFIGURATION['host']
 
         try:
-            srv_records = dns.resolver.query(kwargs['host'], 'SRV')
+            failover = resolve_srv(kwargs['host'])
         except dns.exception.DNSException:
             raise InterfaceError("Unable to locate any hosts for '{0}'"
                                  "".format(kwargs['host']))
 
-        failover = []
-        for srv in srv_records:
-            failover.append({
-                'host': srv.target.to_text(omit_final_dot=True),
-                'port': srv.port,
-                'priority': srv.priority,
-                'weight': srv.weight
-            })
-
-        failover.sort(key=lambda x: (x['priority'], -x['weight']))
         kwargs['failover'] = [{'host': srv['host'],
                                'port': srv['port']} for srv in failover]
 
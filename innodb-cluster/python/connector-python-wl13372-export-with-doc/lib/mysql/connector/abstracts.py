@@ -37,7 +37,9 @@ from .catch23 import make_abc, BYTE_TYPES, STRING_TYPES
 from .conversion import MySQLConverterBase
 from .constants import (ClientFlag, CharacterSet, CONN_ATTRS_DN,
                         DEFAULT_CONFIGURATION)
+from .columnar import to_arrays
 from .optionfiles import MySQLOptionsParser
+from .utils import LRUCache
 from . import errors
 
 NAMED_TUPLE_CACHE = weakref.WeakValueDictionary()
@@ -90,6 +92,9 @@ class MySQLConnectionAbstract(object):
         self._compress = False
 
         self._consume_results = False
+        self._max_allowed_packet = None
+        # Whether a cursor read the rest of the unread result set ahead
+        self._rows_read_ahead = False
 
     def _get_self(self):
         """Return self for weakref.proxy
@@ -243,6 +248,22 @@ class MySQLConnectionAbstract(object):
         except KeyError:
             self._consume_results = False
 
+        # Configure the cache of prepared statements
+        try:
+            cache_size = int(config['prepared_statement_cache_size'] or 0)
+            del config['prepared_statement_cache_size']
+        except KeyError:
+            pass  # Leave what was set or default
+        except (TypeError, ValueError):
+            raise errors.InterfaceError(
+                "prepared_statement_cache_size should be an integer")
+        else:
+            if cache_size < 0:
+                raise errors.InterfaceError(
+                    "prepared_statement_cache_size should not be negative")
+            self._prepared_statements = (LRUCache(cache_size) if cache_size
+                                         else None)
+
         # Configure auth_plugin
         try:
             self._auth_plugin = config['auth_plugin']
@@ -510,6 +531,18 @@ class MySQLConnectionAbstract(object):
         self.cmd_query("SET @@session.time_zone = '{0}'".format(value))
         self._time_zone = value
 
+    @property
+    def max_allowed_packet(self):
+        """Get the maximum size of a packet accepted by the server
+
+        The value is read once per connection since the session value
+        of max_allowed_packet is read-only.
+        """
+        if self._max_allowed_packet is None:
+            self._max_allowed_packet = int(self.info_query(
+                "SELECT @@session.max_allowed_packet")[0])
+        return self._max_allowed_packet
+
     @property
     def sql_mode(self):
         """Get the SQL mode"""
@@ -652,6 +685,8 @@ class MySQLConnectionAbstract(object):
         if not isinstance(value, bool):
             raise ValueError("Expected a boolean type")
         self._unread_result = value
+        if not value:
+            self._rows_read_ahead = False
 
     @property
     def charset(self):
@@ -712,8 +747,7 @@ class MySQLConnectionAbstract(object):
             (self._charset_id, charset_name, collation_name) = \
                     CharacterSet.get_charset_info(collation=collation)
 
-        self._execute_query("SET NAMES '{0}' COLLATE '{1}'".format(
-            charset_name, collation_name))
+        self._set_names(charset_name, collation_name)
 
         try:
             # Required for C Extension
@@ -725,6 +759,11 @@ class MySQLConnectionAbstract(object):
         if self.converter:
             self.converter.set_charset(charset_name)
 
+    def _set_names(self, charset_name, collation_name):
+        """Set the character set and collation of the session"""
+        self._execute_query("SET NAMES '{0}' COLLATE '{1}'".format(
+            charset_name, collation_name))
+
     @property
     def collation(self):
         """Returns the collation for current connection
@@ -747,6 +786,15 @@ class MySQLConnectionAbstract(object):
         """Open the connection to the MySQL server"""
         pass
 
+    def _forget_prepared_statements(self):
+        """Forget the statements prepared on the MySQL server
+
+        This method is used when the MySQL server deallocated the prepared
+        statements, for example when reconnecting or changing the user.
+        """
+        if self._prepared_statements is not None:
+            self._prepared_statements.clear()
+
     def _post_connection(self):
         """Executes commands after connection has been established
 
@@ -778,6 +826,8 @@ class MySQLConnectionAbstract(object):
             self.config(**kwargs)
 
         self.disconnect()
+        self._max_allowed_packet = None
+        self._forget_prepared_statements()
         self._open_connection()
         # Server does not allow to run any other statement different from ALTER 
         # when user's password has been expired.
@@ -1157,6 +1207,54 @@ class MySQLCursorAbstract(object):
         """
         pass
 
+    def _fetch_columnar_rows(self, size):
+        """Fetch the rows converted by fetch_arrays()
+
+        Returns a tuple holding a list of (rows, text) tuples, text is True
+        when the rows hold text protocol values, and the function converting
+        text protocol values of columns stored as objects, or None.
+        """
+        rows = self.fetchall() if size is None else self.fetchmany(size)
+        if rows and isinstance(rows[0], dict):
+            names = self.column_names
+            rows = [tuple([row[name] for name in names]) for row in rows]
+        return [(rows, bool(getattr(self, '_raw', False)))], None
+
+    def fetch_arrays(self, size=None, use_numpy=None):
+        """Returns the next rows of a result set as per-column arrays
+
+        This method fetches up to size rows, or all remaining rows when size
+        is None, and returns an OrderedDict mapping the column names to
+        arrays of values. Integer, floating point, date, datetime and time
+        columns are stored in typed arrays, NumPy arrays when NumPy is
+        installed and use_numpy is not False, array.array objects otherwise.
+        See mysql.connector.columnar.to_arrays() for the storage of each
+        column type.
+
+        Returns an OrderedDict.
+        """
+        if not self.description:
+            raise errors.InterfaceError("No result set to fetch from.")
+        segments, to_python = self._fetch_columnar_rows(size)
+        return to_arrays(self.description, segments, to_python, use_numpy)
+
+    def fetch_columnar(self, chunk_size=10000, use_numpy=None):
+        """Iterates over the rows of a result set as per-column arrays
+
+        This method fetches the rows in chunks of chunk_size rows, so that
+        memory usage stays bounded, and yields each chunk as returned by
+        fetch_arrays().
+
+        Returns an iterator.
+        """
+        if not chunk_size or chunk_size < 1:
+            raise errors.ProgrammingError("chunk_size must be 1 or higher")
+        while True:
+            chunk = self.fetch_arrays(chunk_size, use_numpy)
+            if not chunk or not len(next(iter(chunk.values()))):
+                break
+            yield chunk
+
     def nextset(self):
         """Not Implemented."""
         pass
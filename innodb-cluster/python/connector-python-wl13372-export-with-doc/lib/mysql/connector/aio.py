@@ -0,0 +1,1685 @@
+# Copyright (c) 2020, Oracle and/or its affiliates. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301  USA
+
+"""Implementing asynchronous communication with MySQL servers.
+
+The classes in this module use asyncio streams instead of blocking sockets,
+allowing a single event loop to run many queries concurrently. Packets are
+built and parsed by MySQLProtocol and values are converted by the connection
+converter, exactly like the blocking MySQLConnection:
+
+    cnx = await mysql.connector.aio.connect(user='scott', database='test')
+    cur = cnx.cursor()
+    await cur.execute("SELECT id, name FROM t1 WHERE id > %s", (10,))
+    async for row in cur:
+        print(row)
+    await cnx.close()
+
+Compression, prepared statements and changing the user of a connection are
+not supported. Session settings like autocommit, time_zone and sql_mode are
+configured using connection arguments or SQL statements.
+
+Requires Python 3.7 or later.
+"""
+
+import asyncio
+import os
+import socket
+import struct
+import weakref
+
+from collections import deque
+
+try:
+    import ssl
+except ImportError:
+    # If import fails, we don't have SSL support.
+    pass
+
+from . import errors
+from .authentication import get_auth_plugin
+from .connection import MySQLConnection
+from .constants import (CharacterSet, ClientFlag, ServerCmd, ShutdownType,
+                        NET_BUFFER_LENGTH, CNX_POOL_ARGS)
+from .columnar import to_arrays
+from .cursor import (MySQLCursor, MySQLCursorBuffered, MySQLCursorDict,
+                     MySQLCursorNamedTuple, RE_SQL_INSERT_STMT,
+                     RE_SQL_SPLIT_STMTS, ERR_NO_RESULT_TO_FETCH,
+                     _batch_insert_size)
+from .network import _prepare_packets, _strioerror
+from .pooling import MySQLConnectionPool, generate_pool_name, _clock
+from .protocol import MySQLProtocol
+from .utils import int4store, read_lc_string_list
+
+
+async def start_tls(reader, writer, context, server_hostname=None):
+    """Upgrade an asyncio stream to TLS
+
+    StreamWriter.start_tls() only exists as of Python 3.11. Older versions
+    upgrade the transport using loop.start_tls() and bind a new reader and
+    writer to it.
+
+    Returns a tuple with the reader and the writer to use from then on.
+    """
+    if hasattr(writer, "start_tls"):
+        await writer.start_tls(context, server_hostname=server_hostname)
+        return reader, writer
+
+    await writer.drain()
+    loop = asyncio.get_event_loop()
+    reader = asyncio.StreamReader()
+    protocol = asyncio.StreamReaderProtocol(reader)
+    transport = await loop.start_tls(writer.transport, protocol, context,
+                                     server_hostname=server_hostname)
+    # loop.start_tls() does not call connection_made() on the protocol
+    protocol.connection_made(transport)
+    return reader, asyncio.StreamWriter(transport, protocol, reader, loop)
+
+
+class AsyncMySQLSocket(object):
+    """MySQL socket class using asyncio streams
+
+    Opens a TCP/IP connection, or a connection through the UNIX socket when
+    unix_socket is given, to the MySQL Server.
+    """
+
+    def __init__(self, host='127.0.0.1', port=3306, unix_socket=None,
+                 force_ipv6=False):
+        self.server_host = host
+        self.server_port = port
+        self.unix_socket = unix_socket
+        self.force_ipv6 = force_ipv6
+        self._reader = None
+        self._writer = None
+        self._connection_timeout = None
+        self._packet_number = -1
+
+    @property
+    def next_packet_number(self):
+        """Increments the packet number"""
+        self._packet_number = self._packet_number + 1
+        if self._packet_number > 255:
+            self._packet_number = 0
+        return self._packet_number
+
+    def get_address(self):
+        """Get the location of the socket"""
+        if self.unix_socket:
+            return self.unix_socket
+        return "{0}:{1}".format(self.server_host, self.server_port)
+
+    def set_connection_timeout(self, timeout):
+        """Set the connection timeout"""
+        self._connection_timeout = timeout
+
+    async def open_connection(self):
+        """Open the connection to the MySQL server"""
+        errno = 2002 if self.unix_socket else 2003
+        try:
+            if self.unix_socket:
+                connection = asyncio.open_unix_connection(self.unix_socket)
+            else:
+                family = socket.AF_INET6 if self.force_ipv6 else 0
+                connection = asyncio.open_connection(
+                    self.server_host, self.server_port, family=family)
+            self._reader, self._writer = await asyncio.wait_for(
+                connection, self._connection_timeout)
+        except asyncio.TimeoutError:
+            raise errors.InterfaceError(
+                errno=errno, values=(self.get_address(), "timed out"))
+        except IOError as err:
+            raise errors.InterfaceError(
+                errno=errno, values=(self.get_address(), _strioerror(err)))
+
+    def close_connection(self):
+        """Close the connection"""
+        if self._writer is None:
+            return
+        try:
+            self._writer.close()
+        except (socket.error, RuntimeError):
+            pass  # The event loop might be closed already
+        self._reader = None
+        self._writer = None
+
+    shutdown = close_connection
+
+    def send(self, buf, packet_number=None, compressed_packet_number=None):
+        """Write packets to the stream buffer
+
+        The packets are sent by the event loop, drain() waits until they
+        were written.
+        """
+        if packet_number is None:
+            self.next_packet_number  # pylint: disable=W0104
+        else:
+            self._packet_number = packet_number
+        if self._writer is None:
+            raise errors.OperationalError(errno=2006)
+        self._writer.writelines(_prepare_packets(buf, self._packet_number))
+
+    async def drain(self):
+        """Wait until the written packets are sent to the MySQL server"""
+        if self._writer is None:
+            raise errors.OperationalError(errno=2006)
+        try:
+            await self._writer.drain()
+        except IOError as err:
+            raise errors.OperationalError(
+                errno=2055, values=(self.get_address(), _strioerror(err)))
+
+    async def recv(self):
+        """Receive a packet from the MySQL server"""
+        if self._reader is None:
+            raise errors.OperationalError(errno=2006)
+        try:
+            header = await self._reader.readexactly(4)
+            self._packet_number = header[3]
+            payload = await self._reader.readexactly(
+                struct.unpack("<I", header[0:3] + b'\x00')[0])
+        except asyncio.IncompleteReadError:
+            raise errors.InterfaceError(errno=2013)
+        except IOError as err:
+            raise errors.OperationalError(
+                errno=2055, values=(self.get_address(), _strioerror(err)))
+        return bytearray(header + payload)
+
+    async def switch_to_ssl(self, ca, cert, key, verify_cert=False,
+                            verify_identity=False, cipher=None,
+                            ssl_version=None):
+        """Switch the stream to use SSL"""
+        if self._writer is None:
+            raise errors.InterfaceError(errno=2048)
+
+        try:
+            context = ssl.SSLContext(ssl_version or ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = bool(verify_identity)
+            if verify_cert or verify_identity:
+                context.verify_mode = ssl.CERT_REQUIRED
+            else:
+                context.verify_mode = ssl.CERT_NONE
+            if ca:
+                context.load_verify_locations(ca)
+            if cert:
+                context.load_cert_chain(cert, key)
+            if cipher:
+                context.set_ciphers(cipher)
+            self._reader, self._writer = await start_tls(
+                self._reader, self._writer, context,
+                server_hostname=self.server_host if verify_identity else None)
+        except NameError:
+            raise errors.NotSupportedError(
+                "Python installation has no SSL support")
+        except ssl.CertificateError as err:
+            raise errors.InterfaceError(str(err))
+        except (ssl.SSLError, IOError) as err:
+            raise errors.InterfaceError(
+                errno=2055, values=(self.get_address(), _strioerror(err)))
+
+
+class AsyncMySQLCursor(MySQLCursor):
+    """Asynchronous cursor for interacting with MySQL
+
+    Works like MySQLCursor, except that execute(), executemany(), the
+    fetch methods and close() are coroutines, and rows are iterated using
+    'async for'. It will not automatically fetch all rows.
+    """
+
+    _raw = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        row = await self.fetchone()
+        if row is None:
+            raise StopAsyncIteration
+        return row
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to iterate over {0} rows"
+                        "".format(self.__class__.__name__))
+
+    def _set_connection(self, connection):
+        """Set the connection"""
+        if not isinstance(connection, AsyncMySQLConnection):
+            raise errors.InterfaceError(errno=2048)
+        self._connection = weakref.proxy(connection)
+
+    def _row_to_python(self, rowdata, desc=None):
+        """Convert a row fetched from the result set
+
+        Returns the row; overloaded to return dictionaries or named tuples.
+        """
+        return rowdata
+
+    async def close(self):
+        """Close the cursor
+
+        Returns True when successful, otherwise False.
+        """
+        if self._connection is None:
+            return False
+
+        await self._connection.handle_unread_result()
+        self._reset_result()
+        self._connection = None
+
+        return True
+
+    async def _fetch_warnings(self):
+        """Fetch warnings doing a SHOW WARNINGS
+
+        Returns a result set or None when there were no warnings.
+        """
+        res = []
+        try:
+            cur = self._connection.cursor()
+            await cur.execute("SHOW WARNINGS")
+            res = await cur.fetchall()
+            await cur.close()
+        except Exception as err:
+            raise errors.InterfaceError(
+                "Failed getting warnings; %s" % err)
+
+        if res:
+            return res
+
+        return None
+
+    async def _handle_warnings(self):
+        """Handle possible warnings after all results are consumed"""
+        if self._connection.get_warnings is True and self._warning_count:
+            self._warnings = await self._fetch_warnings()
+        if self._connection.raise_on_warnings is True and self._warnings:
+            raise errors.get_mysql_exception(
+                self._warnings[0][1], self._warnings[0][2])
+
+    async def _handle_noresultset(self, res):
+        """Handles result of execute() when there is no result set"""
+        try:
+            self._rowcount = res['affected_rows']
+            self._last_insert_id = res['insert_id']
+            self._warning_count = res['warning_count']
+        except (KeyError, TypeError) as err:
+            raise errors.ProgrammingError(
+                "Failed handling non-resultset; {0}".format(err))
+
+        await self._handle_warnings()
+
+    async def _handle_resultset(self):
+        """Handles result set
+
+        For non-buffering cursors, this method is doing nothing.
+        """
+        pass
+
+    async def _handle_eof(self, eof):
+        """Handle EOF packet"""
+        self._connection.unread_result = False
+        self._nextrow = (None, None)
+        self._warning_count = eof['warning_count']
+        await self._handle_warnings()
+
+    async def _handle_result(self, result):
+        """Handle the result after a command was send
+
+        Raises InterfaceError when result is not a dict() or result is
+        invalid.
+        """
+        if not isinstance(result, dict):
+            raise errors.InterfaceError('Result was not a dict()')
+
+        if 'columns' in result:
+            # Weak test, must be column/eof information
+            self._description = result['columns']
+            self._connection.unread_result = True
+            await self._handle_resultset()
+        elif 'affected_rows' in result:
+            # Weak test, must be an OK-packet
+            self._connection.unread_result = False
+            await self._handle_noresultset(result)
+        else:
+            raise errors.InterfaceError('Invalid result')
+
+    async def _execute_iter(self, query_iter):
+        """Asynchronous generator returning the cursor for each statement
+
+        This method is only used when multiple statements are executed
+        by the execute() method.
+        """
+        executed_list = RE_SQL_SPLIT_STMTS.split(self._executed)
+
+        i = 0
+        async for result in query_iter:
+            self._reset_result()
+            await self._handle_result(result)
+            try:
+                self._executed = executed_list[i].strip()
+                i += 1
+            except IndexError:
+                self._executed = executed_list[0]
+
+            yield self
+
+    async def execute(self, operation, params=None, multi=False):
+        """Executes the given operation
+
+        Executes the given operation substituting any markers with
+        the given parameters.
+
+        When multi is True, an asynchronous generator is returned which
+        yields the cursor after each executed statement:
+
+          async for cur in await cursor.execute(stmts, multi=True):
+              ...
+
+        Returns an asynchronous generator when multi is True, otherwise None.
+        """
+        if not operation:
+            return None
+
+        if not self._connection:
+            raise errors.ProgrammingError("Cursor is not connected")
+
+        await self._connection.handle_unread_result()
+
+        self._reset_result()
+        stmt = self._prepare_statement(operation, params)
+
+        self._executed = stmt
+        if multi:
+            self._executed_list = []
+            return self._execute_iter(self._connection.cmd_query_iter(stmt))
+
+        try:
+            await self._handle_result(await self._connection.cmd_query(stmt))
+        except errors.InterfaceError:
+            if self._connection._have_next_result:  # pylint: disable=W0212
+                raise errors.InterfaceError(
+                    "Use multi=True when executing multiple statements")
+            raise
+        return None
+
+    async def executemany(self, operation, seq_params):
+        """Execute the given operation multiple times
+
+        INSERT statements are optimized by batching the data, that is
+        using the MySQL multiple rows syntax. Results are discarded.
+        """
+        if not operation or not seq_params:
+            return None
+        await self._connection.handle_unread_result()
+
+        try:
+            _ = iter(seq_params)
+        except TypeError:
+            raise errors.ProgrammingError(
+                "Parameters for query must be an Iterable.")
+
+        # Optimize INSERTs by batching them
+        if RE_SQL_INSERT_STMT.match(operation):
+            parts = self._split_batch_insert(operation)
+            if parts is not None:
+                max_size = _batch_insert_size(
+                    await self._connection.get_max_allowed_packet(),
+                    self._batch_insert_max_size)
+                rowcount = 0
+                last_insert_id = 0
+                for stmt in self._batch_insert(parts, seq_params, max_size):
+                    await self.execute(stmt)
+                    rowcount += self._rowcount
+                    last_insert_id = last_insert_id or self._last_insert_id
+                self._rowcount = rowcount
+                self._last_insert_id = last_insert_id
+                return None
+
+        rowcnt = 0
+        try:
+            for params in seq_params:
+                await self.execute(operation, params)
+                if self.with_rows and self._have_unread_result():
+                    await self.fetchall()
+                rowcnt += self._rowcount
+        except (ValueError, TypeError) as err:
+            raise errors.InterfaceError(
+                "Failed executing the operation; {0}".format(err))
+        self._rowcount = rowcnt
+        return None
+
+    async def _fetch_row(self, raw=False):
+        """Returns the next row in the result set
+
+        Returns a tuple or None.
+        """
+        if not self._have_unread_result():
+            return None
+        row = None
+
+        if self._nextrow == (None, None):
+            (row, eof) = await self._connection.get_row(raw=raw)
+        else:
+            (row, eof) = self._nextrow
+
+        if row:
+            self._nextrow = await self._connection.get_row(raw=raw)
+            eof = self._nextrow[1]
+            if eof is not None:
+                await self._handle_eof(eof)
+            if self._rowcount == -1:
+                self._rowcount = 1
+            else:
+                self._rowcount += 1
+        if eof:
+            await self._handle_eof(eof)
+
+        return row
+
+    async def fetchone(self):
+        """Returns next row of a query result set
+
+        Returns a tuple or None.
+        """
+        row = await self._fetch_row(raw=self._raw)
+        if row:
+            return self._row_to_python(row, self.description)
+        return None
+
+    async def fetchmany(self, size=None):
+        """Returns the next set of rows of a query result
+
+        Returns a list of tuples.
+        """
+        res = []
+        cnt = (size or self.arraysize)
+        while cnt > 0 and self._have_unread_result():
+            cnt -= 1
+            row = await self.fetchone()
+            if row:
+                res.append(row)
+        return res
+
+    async def fetchall(self):
+        """Returns all rows of a query result set
+
+        Returns a list of tuples.
+        """
+        if not self._have_unread_result():
+            raise errors.InterfaceError(ERR_NO_RESULT_TO_FETCH)
+        (rows, eof) = await self._connection.get_rows(raw=self._raw)
+        if self._nextrow[0]:
+            rows.insert(0, self._nextrow[0])
+
+        await self._handle_eof(eof)
+        rowcount = len(rows)
+        if rowcount >= 0 and self._rowcount == -1:
+            self._rowcount = 0
+        self._rowcount += rowcount
+        return [self._row_to_python(row, self.description) for row in rows]
+
+    async def _fetch_columnar_rows(self, size):
+        """Fetch the rows converted by fetch_arrays()"""
+        segments = []
+        if self._nextrow[0]:
+            segments.append(([self._nextrow[0]], False))
+            self._nextrow = (None, None)
+            if size is not None:
+                size -= 1
+        if size != 0 and self._have_unread_result():
+            (rows, eof) = await self._connection.get_rows(count=size,
+                                                          raw=True)
+            segments.append((rows, True))
+            if eof is not None:
+                await self._handle_eof(eof)
+        rowcount = sum([len(rows) for rows, _ in segments])
+        if self._rowcount == -1:
+            self._rowcount = 0
+        self._rowcount += rowcount
+        to_python = None if self._raw else self._connection.converter.to_python
+        return segments, to_python
+
+    async def fetch_arrays(self, size=None, use_numpy=None):
+        """Returns the next rows of a result set as per-column arrays
+
+        See MySQLCursor.fetch_arrays().
+
+        Returns an OrderedDict.
+        """
+        if not self.description:
+            raise errors.InterfaceError(ERR_NO_RESULT_TO_FETCH)
+        segments, to_python = await self._fetch_columnar_rows(size)
+        return to_arrays(self.description, segments, to_python, use_numpy)
+
+    async def fetch_columnar(self, chunk_size=10000, use_numpy=None):
+        """Iterates over the rows of a result set as per-column arrays
+
+        See MySQLCursor.fetch_columnar(), the chunks are iterated using
+        'async for'.
+        """
+        if not chunk_size or chunk_size < 1:
+            raise errors.ProgrammingError("chunk_size must be 1 or higher")
+        while True:
+            chunk = await self.fetch_arrays(chunk_size, use_numpy)
+            if not chunk or not len(next(iter(chunk.values()))):
+                break
+            yield chunk
+
+
+class AsyncMySQLCursorBuffered(AsyncMySQLCursor):
+    """Asynchronous cursor which fetches rows within execute()"""
+
+    def __init__(self, connection=None):
+        AsyncMySQLCursor.__init__(self, connection)
+        self._rows = None
+        self._next_row = 0
+
+    async def _handle_resultset(self):
+        (self._rows, eof) = await self._connection.get_rows(raw=self._raw)
+        self._rowcount = len(self._rows)
+        await self._handle_eof(eof)
+        self._next_row = 0
+        self._connection.unread_result = False
+
+    def reset(self, free=True):
+        self._rows = None
+
+    async def _fetch_row(self, raw=False):
+        try:
+            row = self._rows[self._next_row]
+        except (IndexError, TypeError):
+            return None
+        self._next_row += 1
+        return row
+
+    async def fetchmany(self, size=None):
+        res = []
+        cnt = (size or self.arraysize)
+        while cnt > 0:
+            cnt -= 1
+            row = await self.fetchone()
+            if row:
+                res.append(row)
+        return res
+
+    async def fetchall(self):
+        if self._rows is None:
+            raise errors.InterfaceError(ERR_NO_RESULT_TO_FETCH)
+        res = self._rows[self._next_row:]
+        self._next_row = len(self._rows)
+        return [self._row_to_python(row, self.description) for row in res]
+
+    async def _fetch_columnar_rows(self, size):
+        return MySQLCursorBuffered._fetch_columnar_rows(self, size)
+
+    @property
+    def with_rows(self):
+        return self._rows is not None
+
+
+class AsyncMySQLCursorRaw(AsyncMySQLCursor):
+    """
+    Skips conversion from MySQL datatypes to Python types when fetching rows.
+    """
+
+    _raw = True
+
+
+class AsyncMySQLCursorBufferedRaw(AsyncMySQLCursorBuffered):
+    """
+    Cursor which skips conversion from MySQL datatypes to Python types when
+    fetching rows and fetches rows within execute().
+    """
+
+    _raw = True
+
+
+class AsyncMySQLCursorDict(AsyncMySQLCursor):
+    """Asynchronous cursor fetching rows as dictionaries"""
+
+    _row_to_python = MySQLCursorDict._row_to_python
+
+
+class AsyncMySQLCursorBufferedDict(AsyncMySQLCursorBuffered):
+    """Asynchronous buffered cursor fetching rows as dictionaries"""
+
+    _row_to_python = MySQLCursorDict._row_to_python
+
+
+class AsyncMySQLCursorNamedTuple(AsyncMySQLCursor):
+    """Asynchronous cursor fetching rows as named tuple"""
+
+    _row_to_python = MySQLCursorNamedTuple._row_to_python
+
+
+class AsyncMySQLCursorBufferedNamedTuple(AsyncMySQLCursorBuffered):
+    """Asynchronous buffered cursor fetching rows as named tuple"""
+
+    _row_to_python = MySQLCursorNamedTuple._row_to_python
+
+
+class AsyncMySQLConnection(MySQLConnection):
+    """Asynchronous connection to a MySQL Server
+
+    The connection is configured when instantiated, connect() is a coroutine
+    opening the connection. Packets are created and parsed by MySQLProtocol,
+    methods doing network I/O are coroutines.
+    """
+    def __init__(self, **kwargs):
+        super(AsyncMySQLConnection, self).__init__()
+        if kwargs:
+            self.config(**kwargs)
+
+    async def __aenter__(self):
+        if not self._socket:
+            await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_connection(self, prtcls=None):
+        """Get connection based on configuration
+
+        Returns an AsyncMySQLSocket instance.
+        """
+        if self.unix_socket and os.name != 'nt':
+            conn = AsyncMySQLSocket(unix_socket=self.unix_socket)
+        else:
+            conn = AsyncMySQLSocket(host=self.server_host,
+                                    port=self.server_port,
+                                    force_ipv6=self._force_ipv6)
+
+        conn.set_connection_timeout(self._connection_timeout)
+        return conn
+
+    async def _do_handshake(self):
+        """Get the handshake from the MySQL server"""
+        self._handle_handshake(await self._socket.recv())
+
+    async def _do_auth(self, username=None, password=None, database=None,
+                       client_flags=0, charset=45, ssl_options=None,
+                       conn_attrs=None):
+        """Authenticate with the MySQL server
+
+        Raises NotSupportedError when we get the old, insecure password
+        reply back. Raises any error coming from MySQL.
+        """
+        self._ssl_active = False
+        if client_flags & ClientFlag.SSL:
+            packet = self._protocol.make_auth_ssl(charset=charset,
+                                                  client_flags=client_flags)
+            self._socket.send(packet)
+            await self._socket.drain()
+            await self._socket.switch_to_ssl(
+                ssl_options.get('ca'), ssl_options.get('cert'),
+                ssl_options.get('key'),
+                ssl_options.get('verify_cert') or False,
+                ssl_options.get('verify_identity') or False,
+                ssl_options.get('cipher'), ssl_options.get('version', None))
+            self._ssl_active = True
+
+        packet = self._protocol.make_auth(
+            handshake=self._handshake,
+            username=username, password=password, database=database,
+            charset=charset, client_flags=client_flags,
+            ssl_enabled=self._ssl_active,
+            auth_plugin=self._auth_plugin,
+            conn_attrs=conn_attrs)
+        self._socket.send(packet)
+        await self._socket.drain()
+        await self._auth_switch_request(username, password)
+
+        if not (client_flags & ClientFlag.CONNECT_WITH_DB) and database:
+            await self.cmd_init_db(database)
+
+        return True
+
+    async def _auth_switch_request(self, username=None, password=None):
+        """Handle second part of authentication
+
+        Raises NotSupportedError when we get the old, insecure password
+        reply back. Raises any error coming from MySQL.
+        """
+        auth = None
+        new_auth_plugin = self._auth_plugin or self._handshake["auth_plugin"]
+        packet = await self._socket.recv()
+        if packet[4] == 254 and len(packet) == 5:
+            raise errors.NotSupportedError(
+                "Authentication with old (insecure) passwords "
+                "is not supported. For more information, lookup "
+                "Password Hashing in the latest MySQL manual")
+        elif packet[4] == 254:
+            # AuthSwitchRequest
+            (new_auth_plugin,
+             auth_data) = self._protocol.parse_auth_switch_request(packet)
+            auth = get_auth_plugin(new_auth_plugin)(
+                auth_data, password=password, ssl_enabled=self._ssl_active)
+            self._socket.send(auth.auth_response())
+            await self._socket.drain()
+            packet = await self._socket.recv()
+
+        if packet[4] == 1:
+            auth_data = self._protocol.parse_auth_more_data(packet)
+            auth = get_auth_plugin(new_auth_plugin)(
+                auth_data, password=password, ssl_enabled=self._ssl_active)
+            if new_auth_plugin == "caching_sha2_password":
+                response = auth.auth_response()
+                if response:
+                    self._socket.send(response)
+                    await self._socket.drain()
+                packet = await self._socket.recv()
+
+        if packet[4] == 0:
+            return self._handle_ok(packet)
+        elif packet[4] == 255:
+            raise errors.get_exception(packet)
+        return None
+
+    async def _open_connection(self):
+        """Open the connection to the MySQL server
+
+        Raises on errors.
+        """
+        if self._client_flags & ClientFlag.COMPRESS:
+            raise errors.NotSupportedError(
+                "Compression is not supported by asynchronous connections")
+        self._protocol = MySQLProtocol()
+        self._socket = self._get_connection()
+        try:
+            await self._socket.open_connection()
+            await self._do_handshake()
+            await self._do_auth(self._user, self._password,
+                                self._database, self._client_flags,
+                                self._charset_id, self._ssl, self._conn_attrs)
+            self.set_converter_class(self._converter_class)
+        except:
+            # close socket
+            self._socket.close_connection()
+            raise
+
+    async def _post_connection(self):
+        """Executes commands after connection has been established
+
+        Sets the character set, autocommit, time zone and SQL mode
+        configured for the connection.
+        """
+        (charset_name, collation_name) = \
+            CharacterSet.get_charset_info(self._charset_id)[1:3]
+        await self._execute_query("SET NAMES '{0}' COLLATE '{1}'".format(
+            charset_name, collation_name))
+        self.converter.set_charset(charset_name)
+        await self._execute_query("SET @@session.autocommit = {0}".format(
+            'ON' if self._autocommit else 'OFF'))
+        if self._time_zone:
+            await self._execute_query(
+                "SET @@session.time_zone = '{0}'".format(self._time_zone))
+        if self._sql_mode:
+            sql_mode = self._sql_mode
+            if isinstance(sql_mode, (list, tuple)):
+                sql_mode = ','.join(sql_mode)
+            await self._execute_query(
+                "SET @@session.sql_mode = '{0}'".format(sql_mode))
+
+    async def connect(self, **kwargs):
+        """Connect to the MySQL server
+
+        If no arguments are given, it will use the already configured or
+        default values.
+        """
+        if kwargs:
+            self.config(**kwargs)
+
+        await self.close()
+        self._max_allowed_packet = None
+        self._forget_prepared_statements()
+        await self._open_connection()
+        # Server does not allow to run any other statement different from
+        # ALTER when user's password has been expired.
+        if not self._client_flags & ClientFlag.CAN_HANDLE_EXPIRED_PASSWORDS:
+            await self._post_connection()
+
+    async def reconnect(self, attempts=1, delay=0):
+        """Attempt to reconnect to the MySQL server
+
+        Raises InterfaceError on errors.
+        """
+        counter = 0
+        while counter != attempts:
+            counter = counter + 1
+            try:
+                await self.disconnect()
+                await self.connect()
+                if await self.is_connected():
+                    break
+            except Exception as err:  # pylint: disable=W0703
+                if counter == attempts:
+                    msg = "Can not reconnect to MySQL after {0} "\
+                          "attempt(s): {1}".format(attempts, str(err))
+                    raise errors.InterfaceError(msg)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    def shutdown(self):
+        """Shut down connection to MySQL Server"""
+        if not self._socket:
+            return
+        self._socket.shutdown()
+
+    async def close(self):
+        """Disconnect from the MySQL server"""
+        if not self._socket:
+            return
+
+        try:
+            await self.cmd_quit()
+        except (AttributeError, errors.Error):
+            pass  # Getting an exception would mean we are disconnected.
+        self._socket.close_connection()
+
+    disconnect = close
+
+    async def _send_cmd(self, command, argument=None, packet_number=0,
+                        packet=None, expect_response=True,
+                        compressed_packet_number=0):
+        """Send a command to the MySQL server
+
+        Returns a MySQL packet or None.
+        """
+        await self.handle_unread_result()
+
+        try:
+            self._socket.send(
+                self._protocol.make_command(command, packet or argument),
+                packet_number)
+            await self._socket.drain()
+        except AttributeError:
+            raise errors.OperationalError("MySQL Connection not available.")
+
+        if not expect_response:
+            return None
+        return await self._socket.recv()
+
+    async def _send_data(self, data_file, send_empty_packet=False):
+        """Send data to the MySQL server
+
+        Returns a MySQL packet.
+        """
+        await self.handle_unread_result()
+
+        if not hasattr(data_file, 'read'):
+            raise ValueError("expecting a file-like object")
+
+        try:
+            buf = data_file.read(NET_BUFFER_LENGTH - 16)
+            while buf:
+                self._socket.send(buf)
+                await self._socket.drain()
+                buf = data_file.read(NET_BUFFER_LENGTH - 16)
+            if send_empty_packet:
+                self._socket.send(b'')
+                await self._socket.drain()
+        except AttributeError:
+            raise errors.OperationalError("MySQL Connection not available.")
+
+        return await self._socket.recv()
+
+    async def _handle_load_data_infile(self, filename):
+        """Handle a LOAD DATA INFILE LOCAL request"""
+        try:
+            data_file = open(filename, 'rb')
+        except IOError:
+            # Send a empty packet to cancel the operation
+            try:
+                self._socket.send(b'')
+                await self._socket.drain()
+            except AttributeError:
+                raise errors.OperationalError(
+                    "MySQL Connection not available.")
+            raise errors.InterfaceError(
+                "File '{0}' could not be read".format(filename))
+
+        with data_file:
+            return self._handle_ok(
+                await self._send_data(data_file, send_empty_packet=True))
+
+    async def _handle_result(self, packet):
+        """Handle a MySQL Result
+
+        Returns a dict()
+        """
+        if not packet or len(packet) < 4:
+            raise errors.InterfaceError('Empty response')
+        elif packet[4] == 0:
+            return self._handle_ok(packet)
+        elif packet[4] == 251:
+            return await self._handle_load_data_infile(packet[5:].decode())
+        elif packet[4] == 254:
+            return self._handle_eof(packet)
+        elif packet[4] == 255:
+            raise errors.get_exception(packet)
+
+        # We have a text result set
+        column_count = self._protocol.parse_column_count(packet)
+        if not column_count or not isinstance(column_count, int):
+            raise errors.InterfaceError('Illegal result set.')
+
+        self._columns_desc = [None,] * column_count
+        for i in range(0, column_count):
+            self._columns_desc[i] = self._protocol.parse_column(
+                await self._socket.recv(), self.python_charset)
+
+        eof = self._handle_eof(await self._socket.recv())
+        self.unread_result = True
+        return {'columns': self._columns_desc, 'eof': eof}
+
+    async def _read_text_result(self, count=None):
+        """Read MySQL text result
+
+        Reads all or given number of rows from the stream.
+
+        Returns a tuple with 2 elements: a list with all rows and
+        the EOF packet.
+        """
+        rows = []
+        eof = None
+        i = 0
+        while eof is None and i != count:
+            packet = await self._socket.recv()
+            if packet.startswith(b'\xff\xff\xff'):
+                datas = [packet[4:]]
+                packet = await self._socket.recv()
+                while packet.startswith(b'\xff\xff\xff'):
+                    datas.append(packet[4:])
+                    packet = await self._socket.recv()
+                datas.append(packet[4:])
+                rows.append(read_lc_string_list(bytearray(b'').join(datas)))
+            elif packet[4] == 254 and packet[0] < 7:
+                eof = self._protocol.parse_eof(packet)
+            else:
+                rowdata = read_lc_string_list(packet[4:])
+                if rowdata is None:
+                    raise errors.get_exception(packet)
+                rows.append(rowdata)
+            i += 1
+        return rows, eof
+
+    async def get_row(self, binary=False, columns=None, raw=None):
+        """Get the next row returned by the MySQL server
+
+        Returns a tuple.
+        """
+        (rows, eof) = await self.get_rows(count=1, binary=binary,
+                                          columns=columns, raw=raw)
+        if rows:
+            return (rows[0], eof)
+        return (None, eof)
+
+    async def get_rows(self, count=None, binary=False, columns=None, raw=None,
+                       prep_stmt=None):
+        """Get all rows returned by the MySQL server
+
+        Returns a tuple()
+        """
+        if binary:
+            raise errors.NotSupportedError(
+                "Binary protocol results are not supported by asynchronous "
+                "connections")
+        if raw is None:
+            raw = self._raw
+
+        if not self.unread_result:
+            raise errors.InternalError("No result set available.")
+
+        try:
+            rows, eof_p = await self._read_text_result(count=count)
+        except errors.Error:
+            self.unread_result = False
+            raise
+
+        if not raw and self._columns_desc is not None and rows:
+            decode = self.converter.row_decoder(self._columns_desc)
+            rows = [decode(row) for row in rows]
+
+        if eof_p is not None:
+            self._handle_server_status(eof_p['status_flag'] if 'status_flag' in
+                                       eof_p else eof_p['server_status'],
+                                       eof_p.get('session_state'))
+            self.unread_result = False
+
+        return rows, eof_p
+
+    async def consume_results(self):
+        """Consume results"""
+        if self.unread_result:
+            await self.get_rows()
+
+    async def handle_unread_result(self):
+        """Check whether there is an unread result"""
+        if self.can_consume_results:
+            await self.consume_results()
+        elif self.unread_result:
+            raise errors.InternalError("Unread result found")
+
+    async def cmd_init_db(self, database):
+        """Change the current database
+
+        Returns a dict()
+        """
+        return self._handle_ok(
+            await self._send_cmd(ServerCmd.INIT_DB, database.encode('utf-8')))
+
+    async def cmd_query(self, query, raw=False, buffered=False,
+                        raw_as_string=False):
+        """Send a query to the MySQL server
+
+        Returns a dict()
+        """
+        if not isinstance(query, bytes):
+            query = query.encode('utf-8')
+        result = await self._handle_result(
+            await self._send_cmd(ServerCmd.QUERY, query))
+
+        if self._have_next_result:
+            raise errors.InterfaceError(
+                'Use cmd_query_iter for statements with multiple queries.')
+
+        return result
+
+    async def cmd_query_iter(self, statements):
+        """Send one or more statements to the MySQL server
+
+        Returns an asynchronous generator yielding the result of each
+        statement.
+        """
+        if not isinstance(statements, bytearray):
+            if isinstance(statements, str):
+                statements = statements.encode('utf8')
+            statements = bytearray(statements)
+
+        # Handle the first query result
+        yield await self._handle_result(
+            await self._send_cmd(ServerCmd.QUERY, statements))
+
+        # Handle next results, if any
+        while self._have_next_result:
+            await self.handle_unread_result()
+            yield await self._handle_result(await self._socket.recv())
+
+    async def cmd_refresh(self, options):
+        """Send the Refresh command to the MySQL server
+
+        Returns a dict()
+        """
+        return self._handle_ok(
+            await self._send_cmd(ServerCmd.REFRESH, int4store(options)))
+
+    async def cmd_quit(self):
+        """Close the current connection with the server
+
+        Returns a str()
+        """
+        await self.handle_unread_result()
+
+        packet = self._protocol.make_command(ServerCmd.QUIT)
+        self._socket.send(packet, 0, 0)
+        await self._socket.drain()
+        return packet
+
+    async def cmd_shutdown(self, shutdown_type=None):
+        """Shut down the MySQL Server
+
+        Returns a dict()
+        """
+        if shutdown_type:
+            if not ShutdownType.get_info(shutdown_type):
+                raise errors.InterfaceError("Invalid shutdown type")
+            atype = shutdown_type
+        else:
+            atype = ShutdownType.SHUTDOWN_DEFAULT
+        return self._handle_eof(await self._send_cmd(ServerCmd.SHUTDOWN,
+                                                     int4store(atype)))
+
+    async def cmd_statistics(self):
+        """Send the statistics command to the MySQL Server
+
+        Returns a dict()
+        """
+        await self.handle_unread_result()
+
+        packet = self._protocol.make_command(ServerCmd.STATISTICS)
+        self._socket.send(packet, 0, 0)
+        await self._socket.drain()
+        return self._protocol.parse_statistics(await self._socket.recv())
+
+    async def cmd_process_kill(self, mysql_pid):
+        """Kill a MySQL process
+
+        Returns a dict()
+        """
+        return self._handle_ok(
+            await self._send_cmd(ServerCmd.PROCESS_KILL, int4store(mysql_pid)))
+
+    async def cmd_debug(self):
+        """Send the DEBUG command
+
+        Returns a dict()
+        """
+        return self._handle_eof(await self._send_cmd(ServerCmd.DEBUG))
+
+    async def cmd_ping(self):
+        """Send the PING command
+
+        Returns a dict()
+        """
+        return self._handle_ok(await self._send_cmd(ServerCmd.PING))
+
+    async def cmd_reset_connection(self):
+        """Resets the session state without re-authenticating
+
+        Works only for MySQL server 5.7.3 or later.
+        """
+        if self._server_version < (5, 7, 3):
+            raise errors.NotSupportedError("MySQL version 5.7.2 and "
+                                           "earlier does not support "
+                                           "COM_RESET_CONNECTION.")
+        self._handle_ok(await self._send_cmd(ServerCmd.RESET_CONNECTION))
+        await self._post_connection()
+
+    def _not_supported(self, *args, **kwargs):
+        """Raises NotSupportedError for unavailable commands"""
+        raise errors.NotSupportedError(
+            "Not supported by asynchronous connections")
+
+    cmd_change_user = _not_supported
+    cmd_stmt_prepare = _not_supported
+    cmd_stmt_execute = _not_supported
+    cmd_stmt_fetch = _not_supported
+    cmd_stmt_close = _not_supported
+    cmd_stmt_reset = _not_supported
+    cmd_stmt_send_long_data = _not_supported
+    set_charset_collation = _not_supported
+
+    # Properties running queries can not be awaited
+    time_zone = property(_not_supported, _not_supported)
+    sql_mode = property(_not_supported, _not_supported)
+    autocommit = property(_not_supported, _not_supported)
+    database = property(_not_supported, _not_supported)
+    max_allowed_packet = property(_not_supported)
+
+    async def get_max_allowed_packet(self):
+        """Get the maximum size of a packet accepted by the server
+
+        The value is read once per connection.
+
+        Returns an integer.
+        """
+        if self._max_allowed_packet is None:
+            row = await self.info_query("SELECT @@session.max_allowed_packet")
+            self._max_allowed_packet = int(row[0])
+        return self._max_allowed_packet
+
+    async def is_connected(self):
+        """Reports whether the connection to MySQL Server is available
+
+        Returns True or False.
+        """
+        try:
+            await self.cmd_ping()
+        except:
+            return False  # This method does not raise
+        return True
+
+    async def ping(self, reconnect=False, attempts=1, delay=0):
+        """Check availability of the MySQL server
+
+        Raises InterfaceError on errors.
+        """
+        try:
+            await self.cmd_ping()
+        except:
+            if reconnect:
+                await self.reconnect(attempts=attempts, delay=delay)
+            else:
+                raise errors.InterfaceError("Connection to MySQL is"
+                                            " not available.")
+
+    async def reset_session(self, user_variables=None,
+                            session_variables=None):
+        """Clears the current active session
+
+        Raises OperationalError if not connected, InternalError if there are
+        unread results and InterfaceError on errors.
+        """
+        if not await self.is_connected():
+            raise errors.OperationalError("MySQL Connection not available.")
+
+        await self.cmd_reset_connection()
+
+        cur = self.cursor()
+        if user_variables:
+            for key, value in user_variables.items():
+                await cur.execute("SET @`{0}` = %s".format(key), (value,))
+        if session_variables:
+            for key, value in session_variables.items():
+                await cur.execute("SET SESSION `{0}` = %s".format(key),
+                                  (value,))
+
+    def cursor(self, buffered=None, raw=None, prepared=None, cursor_class=None,
+               dictionary=None, named_tuple=None):
+        """Instantiates and returns an asynchronous cursor
+
+        Raises ProgrammingError when cursor_class is not a subclass of
+        AsyncMySQLCursor. Raises ValueError when cursor is not available.
+
+        Returns an AsyncMySQLCursor instance.
+        """
+        if not self._socket:
+            raise errors.OperationalError("MySQL Connection not available.")
+        if cursor_class is not None:
+            if not issubclass(cursor_class, AsyncMySQLCursor):
+                raise errors.ProgrammingError(
+                    "Cursor class needs be to subclass of AsyncMySQLCursor")
+            return (cursor_class)(self)
+        if prepared:
+            raise errors.NotSupportedError(
+                "Prepared statements are not supported by asynchronous "
+                "connections")
+
+        buffered = buffered if buffered is not None else self._buffered
+        raw = raw if raw is not None else self._raw
+
+        cursor_type = 0
+        if buffered is True:
+            cursor_type |= 1
+        if raw is True:
+            cursor_type |= 2
+        if dictionary is True:
+            cursor_type |= 4
+        if named_tuple is True:
+            cursor_type |= 8
+
+        types = {
+            0: AsyncMySQLCursor,  # 0
+            1: AsyncMySQLCursorBuffered,
+            2: AsyncMySQLCursorRaw,
+            3: AsyncMySQLCursorBufferedRaw,
+            4: AsyncMySQLCursorDict,
+            5: AsyncMySQLCursorBufferedDict,
+            8: AsyncMySQLCursorNamedTuple,
+            9: AsyncMySQLCursorBufferedNamedTuple,
+        }
+        try:
+            return (types[cursor_type])(self)
+        except KeyError:
+            args = ('buffered', 'raw', 'dictionary', 'named_tuple')
+            raise ValueError('Cursor not available with given criteria: ' +
+                             ', '.join([args[i] for i in range(4)
+                                        if cursor_type & (1 << i) != 0]))
+
+    async def commit(self):
+        """Commit current transaction"""
+        await self._execute_query("COMMIT")
+
+    async def rollback(self):
+        """Rollback current transaction"""
+        if self.unread_result:
+            await self.get_rows()
+
+        await self._execute_query("ROLLBACK")
+
+    async def start_transaction(self, consistent_snapshot=False,
+                                isolation_level=None, readonly=None):
+        """Start a transaction
+
+        Raises ProgrammingError when a transaction is already in progress
+        and when ValueError when isolation_level specifies an Unknown
+        level.
+        """
+        if self.in_transaction:
+            raise errors.ProgrammingError("Transaction already in progress")
+
+        if isolation_level:
+            level = isolation_level.strip().replace('-', ' ').upper()
+            levels = ['READ UNCOMMITTED', 'READ COMMITTED', 'REPEATABLE READ',
+                      'SERIALIZABLE']
+
+            if level not in levels:
+                raise ValueError(
+                    'Unknown isolation level "{0}"'.format(isolation_level))
+
+            await self._execute_query(
+                "SET TRANSACTION ISOLATION LEVEL {0}".format(level))
+
+        query = "START TRANSACTION"
+        if consistent_snapshot:
+            query += " WITH CONSISTENT SNAPSHOT"
+        if readonly is not None:
+            query += " READ ONLY" if readonly else " READ WRITE"
+        await self._execute_query(query)
+
+    async def _execute_query(self, query):
+        """Execute a query
+
+        Returns a dict()
+        """
+        await self.handle_unread_result()
+        await self.cmd_query(query)
+
+    async def info_query(self, query):
+        """Send a query which only returns 1 row"""
+        cursor = self.cursor(buffered=True)
+        await cursor.execute(query)
+        return await cursor.fetchone()
+
+
+class AsyncPooledMySQLConnection(object):
+    """Class holding an asynchronous MySQL Connection in a pool
+
+    Works like an AsyncMySQLConnection except for close() and config().
+    The close() coroutine adds the connection back to the pool rather
+    than disconnecting from the MySQL server.
+    """
+    def __init__(self, pool, cnx):
+        if not isinstance(pool, AsyncMySQLConnectionPool):
+            raise AttributeError(
+                "pool should be a AsyncMySQLConnectionPool")
+        if not isinstance(cnx, AsyncMySQLConnection):
+            raise AttributeError(
+                "cnx should be a AsyncMySQLConnection")
+        self._cnx_pool = pool
+        self._cnx = cnx
+
+    def __getattr__(self, attr):
+        """Calls attributes of the AsyncMySQLConnection instance"""
+        return getattr(self._cnx, attr)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Do not close, but add connection back to pool
+
+        When the pool is configured to reset the session, the session
+        state will be cleared before the connection is queued.
+        """
+        cnx = self._cnx
+        if cnx is None:
+            return
+        self._cnx = None
+        try:
+            if self._cnx_pool.reset_session:
+                await cnx.reset_session()
+        except errors.Error:
+            # The connection is reconnected when taken from the pool
+            cnx.shutdown()
+        finally:
+            self._cnx_pool._queue_connection(cnx)  # pylint: disable=W0212
+
+    def config(self, **kwargs):
+        """Configuration is done through the pool"""
+        raise errors.PoolError(
+            "Configuration for pooled connections should "
+            "be done through the pool itself."
+        )
+
+    @property
+    def pool_name(self):
+        """Return the name of the connection pool"""
+        return self._cnx_pool.pool_name
+
+
+class AsyncMySQLConnectionPool(MySQLConnectionPool):
+    """Class defining a pool of asynchronous MySQL connections
+
+    Connections are opened when requested with get_connection() until
+    pool_size connections exist; then tasks wait, in order of arrival, for
+    a connection to be returned to the pool.
+    """
+    def __init__(self, pool_size=5, pool_name=None, pool_reset_session=True,
+                 pool_min_size=None, pool_max_size=None, **kwargs):
+        """Initialize
+
+        The arguments are the ones of MySQLConnectionPool, with the
+        following differences. Connections are always opened on demand,
+        up to pool_max_size (pool_size by default), so pool_min_size can
+        only be 0. Connections are checked on every checkout and never
+        closed for being idle: pool_ping_interval, pool_max_lifetime,
+        pool_validation_interval, pool_max_idle_time and pool_open_threads
+        are not supported.
+
+        Raises NotSupportedError when an unsupported argument is given.
+        """
+        # pylint: disable=W0231
+        unsupported = sorted(key for key in kwargs if key in CNX_POOL_ARGS)
+        if pool_min_size:
+            unsupported.insert(0, 'pool_min_size')
+        if unsupported:
+            raise errors.NotSupportedError(
+                "Not supported by asynchronous pools: {0}".format(
+                    ', '.join(unsupported)))
+        self._init_state()
+        self._reset_session = pool_reset_session
+        # Connections are always opened on demand
+        self._open_on_demand = True
+        self._set_size_limits(
+            0, pool_size if pool_max_size is None else pool_max_size)
+        self._set_pool_name(pool_name or generate_pool_name(**kwargs))
+        self._cnx_idle = deque()
+
+        if kwargs:
+            self.set_config(**kwargs)
+
+    def resize(self, min_size=None, max_size=None):
+        """Change the minimum and maximum number of connections
+
+        Not supported by asynchronous pools.
+
+        Raises NotSupportedError.
+        """
+        raise errors.NotSupportedError(
+            "Resizing is not supported by asynchronous pools")
+
+    def _queue_connection(self, cnx):
+        """Put connection back in the pool
+
+        The connection is given to the first waiting task, if any.
+
+        Raises PoolError on errors.
+        """
+        if not isinstance(cnx, AsyncMySQLConnection):
+            raise errors.PoolError(
+                "Connection instance not subclass of AsyncMySQLConnection.")
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(cnx)
+                return
+        self._cnx_idle.append(cnx)
+
+    def add_connection(self, cnx=None):
+        """Add a connection to the pool
+
+        Connections are opened by get_connection(); cnx must be a connected
+        AsyncMySQLConnection instance.
+
+        Raises PoolError when no configuration is set, when no more
+        connection can be added (maximum reached) or when cnx is not an
+        AsyncMySQLConnection instance.
+        """
+        if not self._cnx_config:
+            raise errors.PoolError(
+                "Connection configuration not available")
+
+        if self._slots >= self._pool_size:
+            raise errors.PoolError(
+                "Failed adding connection; queue is full")
+
+        if not isinstance(cnx, AsyncMySQLConnection):
+            raise errors.PoolError(
+                "Connection instance not subclass of AsyncMySQLConnection.")
+
+        self._slots += 1
+        # pylint: disable=W0212
+        cnx._pool_config_version = self._config_version
+        # pylint: enable=W0212
+        self._queue_connection(cnx)
+
+    async def get_connection(self, timeout=None):
+        """Get a connection from the pool
+
+        When all connections are in use and the pool is full, the task
+        waits for a connection at most timeout seconds, or forever when
+        timeout is None.
+
+        When the MySQL connection is not connected, a reconnect is attempted.
+
+        Raises PoolError on errors.
+
+        Returns an AsyncPooledMySQLConnection instance.
+        """
+        if not self._cnx_config:
+            raise errors.PoolError(
+                "Connection configuration not available")
+
+        start = _clock()
+        if self._cnx_idle:
+            cnx = self._cnx_idle.popleft()
+            self._record_wait(_clock() - start)
+        elif self._slots < self._pool_size:
+            self._slots += 1
+            self._record_wait(_clock() - start)
+            try:
+                cnx = AsyncMySQLConnection(**self._cnx_config)
+                await cnx.connect()
+            except BaseException:
+                self._slots -= 1
+                raise
+            # pylint: disable=W0212
+            cnx._pool_config_version = self._config_version
+            # pylint: enable=W0212
+            return AsyncPooledMySQLConnection(self, cnx)
+        else:
+            waiter = asyncio.get_event_loop().create_future()
+            self._waiters.append(waiter)
+            self._count("waits")
+            try:
+                cnx = await asyncio.wait_for(waiter, timeout)
+            except asyncio.TimeoutError:
+                self._count("timeouts")
+                raise errors.PoolError(
+                    "Failed getting connection; pool exhausted")
+            finally:
+                self._record_wait(_clock() - start)
+                if not waiter.done() or waiter.cancelled():
+                    try:
+                        self._waiters.remove(waiter)
+                    except ValueError:
+                        pass
+
+        try:
+            # pylint: disable=W0212
+            if not await cnx.is_connected() \
+                    or self._config_version != cnx._pool_config_version:
+                cnx.config(**self._cnx_config)
+                await cnx.reconnect()
+                cnx._pool_config_version = self._config_version
+            # pylint: enable=W0212
+        except BaseException:
+            # Failed to reconnect, give connection back to pool
+            self._queue_connection(cnx)
+            raise
+
+        return AsyncPooledMySQLConnection(self, cnx)
+
+    async def _remove_connections(self):
+        """Close all idle connections
+
+        Returns the number of connections it closed.
+        """
+        cnt = 0
+        while self._cnx_idle:
+            cnx = self._cnx_idle.popleft()
+            self._slots -= 1
+            try:
+                await cnx.disconnect()
+                cnt += 1
+            except errors.Error:
+                # Any other error when closing means connection is closed
+                pass
+        return cnt
+
+
+async def connect(*args, **kwargs):
+    """Create an asynchronous MySQL connection
+
+    Opens a connection to the MySQL server using the given arguments; see
+    mysql.connector.connect() for the connection arguments. When a pooling
+    argument is given, a connection is taken from a pool created by this
+    function, see AsyncMySQLConnectionPool for the supported arguments.
+    With pool_timeout, the task waits at most this many seconds for a
+    connection when the pool is exhausted; it waits forever by default.
+
+    Returns an AsyncMySQLConnection or AsyncPooledMySQLConnection instance.
+    """
+    if args:
+        raise errors.NotSupportedError(
+            "Positional arguments are not supported; use keyword arguments")
+    kwargs.pop('use_pure', None)
+
+    if any([key in kwargs for key in CNX_POOL_ARGS]):
+        return await _get_pooled_connection(**kwargs)
+
+    cnx = AsyncMySQLConnection(**kwargs)
+    await cnx.connect()
+    return cnx
+
+
+_CONNECTION_POOLS = {}
+
+
+async def _get_pooled_connection(**kwargs):
+    """Return a pooled asynchronous MySQL connection"""
+    pool_name = kwargs.get('pool_name')
+    if pool_name is None:
+        pool_name = generate_pool_name(**kwargs)
+    timeout = kwargs.pop('pool_timeout', None)
+    if pool_name not in _CONNECTION_POOLS:
+        kwargs['pool_name'] = pool_name
+        _CONNECTION_POOLS[pool_name] = AsyncMySQLConnectionPool(**kwargs)
+    else:
+        cnxpool = _CONNECTION_POOLS[pool_name]
+        size = kwargs.get('pool_max_size', kwargs.get('pool_size'))
+        if size is not None and size != cnxpool.pool_size:
+            raise errors.PoolError("Size can not be changed "
+                                   "for active pools.")
+    return await _CONNECTION_POOLS[pool_name].get_connection(
+        timeout=timeout)
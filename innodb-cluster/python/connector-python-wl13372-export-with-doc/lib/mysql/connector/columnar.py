@@ -0,0 +1,266 @@
+# Copyright (c) 2020, Oracle and/or its affiliates. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301  USA
+
+"""Fetching of result sets into per-column typed arrays."""
+
+import array
+from collections import OrderedDict
+
+from .constants import FieldFlag, FieldType
+from . import errors
+
+try:
+    import numpy
+except ImportError:
+    HAVE_NUMPY = False
+else:
+    HAVE_NUMPY = True
+
+try:
+    array.array("q")
+except ValueError:
+    # Python 2 has no long long typecode, long is 64 bits on LP64 systems
+    _INT64, _UINT64 = "l", "L"
+else:
+    _INT64, _UINT64 = "q", "Q"
+
+_EPOCH_DAYS = 719468  # Days from 0000-03-01 to 1970-01-01
+_DAY_MICROSECONDS = 86400000000
+
+_INTEGER_TYPES = (FieldType.TINY, FieldType.SHORT, FieldType.INT24,
+                  FieldType.LONG, FieldType.LONGLONG, FieldType.YEAR)
+_FLOAT_TYPES = (FieldType.FLOAT, FieldType.DOUBLE)
+_DATE_TYPES = (FieldType.DATE, FieldType.NEWDATE)
+_DATETIME_TYPES = (FieldType.DATETIME, FieldType.TIMESTAMP)
+
+
+def days_from_civil(year, month, day):
+    """Returns the number of days since 1970-01-01 of a proleptic Gregorian
+    date, without creating a date object.
+    """
+    if month <= 2:
+        year -= 1
+        month += 9
+    else:
+        month -= 3
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_era = (year_of_era * 365 + year_of_era // 4 - year_of_era // 100 +
+                  (153 * month + 2) // 5 + day - 1)
+    return era * 146097 + day_of_era - _EPOCH_DAYS
+
+
+def _date_from_text(value):
+    """Converts a DATE value of the text protocol to days since epoch."""
+    month = int(value[5:7])
+    if not month:
+        # Zero dates are returned as NULL
+        return None
+    return days_from_civil(int(value[0:4]), month, int(value[8:10]))
+
+
+def _datetime_from_text(value):
+    """Converts a DATETIME value of the text protocol to microseconds since
+    epoch."""
+    days = _date_from_text(value)
+    if days is None:
+        return None
+    micros = (int(value[11:13]) * 3600 + int(value[14:16]) * 60 +
+              int(value[17:19])) * 1000000
+    if len(value) > 20:
+        micros += int(value[20:26]) * 10 ** (26 - len(value[:26]))
+    return days * _DAY_MICROSECONDS + micros
+
+
+def _time_from_text(value):
+    """Converts a TIME value of the text protocol to microseconds."""
+    negative = value[:1] == b"-"
+    if negative:
+        value = value[1:]
+    hours, minutes, seconds = value.split(b":")
+    micros = 0
+    if len(seconds) > 2:
+        micros = int(seconds[3:9]) * 10 ** (9 - len(seconds[:9]))
+        seconds = seconds[:2]
+    micros += (int(hours) * 3600 + int(minutes) * 60 +
+               int(seconds)) * 1000000
+    return -micros if negative else micros
+
+
+def _date_from_value(value):
+    """Converts a `datetime.date` to days since epoch."""
+    return days_from_civil(value.year, value.month, value.day)
+
+
+def _datetime_from_value(value):
+    """Converts a `datetime.datetime` to microseconds since epoch."""
+    return (days_from_civil(value.year, value.month, value.day) *
+            _DAY_MICROSECONDS + (value.hour * 3600 + value.minute * 60 +
+                                 value.second) * 1000000 + value.microsecond)
+
+
+def _time_from_value(value):
+    """Converts a `datetime.timedelta` to microseconds."""
+    return ((value.days * 86400 + value.seconds) * 1000000 +
+            value.microseconds)
+
+
+def _column_plan(column):
+    """Returns how the values of a column are stored.
+
+    Args:
+        column (tuple): The column description.
+
+    Returns:
+        tuple: The array typecode, the NumPy dtype name and the conversion
+               functions for text protocol values and for Python values.
+               The typecode is `None` for columns stored as objects.
+    """
+    field_type, flags = column[1], column[7]
+    if field_type in _INTEGER_TYPES:
+        if field_type == FieldType.LONGLONG and flags & FieldFlag.UNSIGNED:
+            return _UINT64, "uint64", int, int
+        return _INT64, "int64", int, int
+    if field_type in _FLOAT_TYPES:
+        return "d", "float64", float, float
+    if field_type in _DATE_TYPES:
+        return _INT64, "datetime64[D]", _date_from_text, _date_from_value
+    if field_type in _DATETIME_TYPES:
+        return (_INT64, "datetime64[us]", _datetime_from_text,
+                _datetime_from_value)
+    if field_type == FieldType.TIME:
+        return _INT64, "timedelta64[us]", _time_from_text, _time_from_value
+    return None, None, None, None
+
+
+def _build_column(index, column, segments, to_python, use_numpy):
+    """Builds the array holding the values of a column.
+
+    Args:
+        index (int): The column index.
+        column (tuple): The column description.
+        segments (list): List of `(rows, text)` tuples, `text` is `True` when
+                         the rows hold text protocol values.
+        to_python (callable): Converts text protocol values of columns stored
+                              as objects, if `None` the values are kept.
+        use_numpy (bool): `True` to return a NumPy array.
+
+    Returns:
+        array.array, numpy.ndarray or list: The column values.
+    """
+    typecode, dtype, from_text, from_value = _column_plan(column)
+    if typecode is not None:
+        values = array.array(typecode)
+        try:
+            for rows, text in segments:
+                values.extend(map(from_text if text else from_value,
+                                  [row[index] for row in rows]))
+        except (TypeError, AttributeError):
+            # NULL values, store zeros along with a mask
+            values = array.array(typecode)
+            mask = bytearray()
+            for rows, text in segments:
+                convert = from_text if text else from_value
+                for row in rows:
+                    value = row[index]
+                    if value is not None:
+                        value = convert(value)
+                    mask.append(value is None)
+                    values.append(0 if value is None else value)
+            if not use_numpy:
+                return [None if null else value
+                        for value, null in zip(values, mask)]
+            return numpy.ma.MaskedArray(
+                numpy.frombuffer(values, dtype=dtype),
+                mask=numpy.frombuffer(mask, dtype=bool))
+        if use_numpy:
+            return numpy.frombuffer(values, dtype=dtype)
+        return values
+
+    values = []
+    for rows, text in segments:
+        if text and to_python is not None:
+            values.extend([None if row[index] is None
+                           else to_python(column, row[index])
+                           for row in rows])
+        else:
+            values.extend([row[index] for row in rows])
+    if use_numpy:
+        result = numpy.empty(len(values), dtype=object)
+        result[:] = values
+        return result
+    return values
+
+
+def to_arrays(description, segments, to_python=None, use_numpy=None):
+    """Converts rows to per-column arrays.
+
+    Integer, floating point, date, datetime and time columns are stored in
+    typed buffers: `array.array` objects, or NumPy arrays of the matching
+    dtype. Dates are stored as days since epoch, datetimes as microseconds
+    since epoch and times as microseconds. Other columns are stored as lists,
+    or NumPy arrays of objects.
+
+    Columns holding NULL values are returned as NumPy masked arrays, or as
+    lists when NumPy is not used, since `array.array` can not hold NULL.
+
+    Args:
+        description (list): The columns description of the cursor.
+        segments (list): List of `(rows, text)` tuples, `text` is `True` when
+                         the rows hold text protocol values.
+        to_python (callable): Converts text protocol values of columns stored
+                              as objects, if `None` the values are kept.
+        use_numpy (bool): `True` to return NumPy arrays, `False` to return
+                          `array.array` objects. NumPy arrays are returned by
+                          default when NumPy is installed.
+
+    Raises:
+        :class:`mysql.connector.errors.InterfaceError`: If NumPy is requested
+            but not installed.
+        :class:`mysql.connector.errors.ProgrammingError`: If several columns
+            have the same name.
+
+    Returns:
+        collections.OrderedDict: The column arrays, by column name.
+    """
+    if use_numpy is None:
+        use_numpy = HAVE_NUMPY
+    elif use_numpy and not HAVE_NUMPY:
+        raise errors.InterfaceError(
+            "The NumPy module is required to fetch NumPy arrays")
+    names = set()
+    for column in description:
+        if column[0] in names:
+            raise errors.ProgrammingError(
+                "Duplicate column name '{0}', use an alias to fetch "
+                "arrays".format(column[0]))
+        names.add(column[0])
+    return OrderedDict(
+        (column[0], _build_column(index, column, segments, to_python,
+                                  use_numpy))
+        for index, column in enumerate(description))
@@ -38,8 +38,8 @@ import time
 from .authentication import get_auth_plugin
 from .catch23 import PY2, isstr, UNICODE_TYPES
 from .constants import (
-    ClientFlag, ServerCmd, ServerFlag,
-    flag_is_set, ShutdownType, NET_BUFFER_LENGTH
+    ClientFlag, ServerCmd, ServerFlag, CharacterSet, SessionTrackType,
+    flag_is_set, ShutdownType, NET_BUFFER_LENGTH, SESSION_TRACK_VARIABLES
 )
 
 from . import errors, version
@@ -90,8 +90,20 @@ class MySQLConnection(MySQLConnectionAbstract):
         self._have_next_result = False
         self._raw = False
         self._in_transaction = False
+        # Session state known from the handshake and the OK packets
+        self._session_charset_id = None
+        self._server_autocommit = None
+        # Mirror of the session state reported by the server when the
+        # session state tracker is enabled
+        self._session_track = False
+        self._session_state = {}
+        self._session_variables = {}
 
         self._prepared_statements = None
+        # Parameter types last sent per prepared statement ID
+        self._stmt_param_types = {}
+        # IDs of the prepared statements long data was sent for
+        self._stmt_long_data = set()
 
         self._ssl_active = False
         self._auth_plugin = None
@@ -143,7 +155,10 @@ class MySQLConnection(MySQLConnectionAbstract):
 
     def _do_handshake(self):
         """Get the handshake from the MySQL server"""
-        packet = self._socket.recv()
+        self._handle_handshake(self._socket.recv())
+
+    def _handle_handshake(self, packet):
+        """Handle the handshake packet sent by the MySQL server"""
         if packet[4] == 255:
             raise errors.get_exception(packet)
 
@@ -169,6 +184,11 @@ class MySQLConnection(MySQLConnectionAbstract):
         if handshake['capabilities'] & ClientFlag.PLUGIN_AUTH:
             self.set_client_flags([ClientFlag.PLUGIN_AUTH])
 
+        if handshake['capabilities'] & ClientFlag.SESION_TRACK:
+            self._client_flags |= ClientFlag.SESION_TRACK
+        else:
+            self._client_flags &= ~ClientFlag.SESION_TRACK
+
         self._handshake = handshake
 
     def _do_auth(self, username=None, password=None, database=None,
@@ -197,6 +217,11 @@ class MySQLConnection(MySQLConnectionAbstract):
                                        ssl_options.get('version', None))
             self._ssl_active = True
 
+        # Only the low byte of the character set fits in the handshake
+        # response, the server uses it as the session character set
+        self._session_charset_id = charset if charset < 256 else None
+        self._forget_session_state()
+        self._session_state['schema'] = database or None
         packet = self._protocol.make_auth(
             handshake=self._handshake,
             username=username, password=password, database=database,
@@ -252,6 +277,51 @@ class MySQLConnection(MySQLConnectionAbstract):
             raise errors.get_exception(packet)
         return None
 
+    def _post_connection(self):
+        """Executes commands after connection has been established
+
+        The character set, autocommit, time zone and SQL mode are set
+        using a single SET statement. The character set is left out when
+        the session already uses it, as set by the handshake or by
+        cmd_change_user(), and autocommit when the server status reported
+        in the last OK packet matches it.
+
+        When the server supports it, the same statement enables tracking
+        of the current schema and of the variables in
+        SESSION_TRACK_VARIABLES.
+        """
+        charset_name, collation_name = \
+            CharacterSet.get_charset_info(self._charset_id)[1:3]
+        settings = []
+        session_track = bool(self._client_flags & ClientFlag.SESION_TRACK)
+        if session_track:
+            settings.append("@@session.session_track_schema = ON")
+            settings.append(
+                "@@session.session_track_system_variables = '{0}'".format(
+                    ','.join(SESSION_TRACK_VARIABLES)))
+        if self._session_charset_id != self._charset_id:
+            settings.append("NAMES '{0}' COLLATE '{1}'".format(
+                charset_name, collation_name))
+        if self._server_autocommit is None \
+                or self._server_autocommit != bool(self._autocommit):
+            settings.append("@@session.autocommit = {0}".format(
+                'ON' if self._autocommit else 'OFF'))
+        if self._time_zone:
+            settings.append("@@session.time_zone = '{0}'".format(
+                self._time_zone))
+        if self._sql_mode:
+            sql_mode = self._sql_mode
+            if isinstance(sql_mode, (list, tuple)):
+                sql_mode = ','.join(sql_mode)
+            settings.append("@@session.sql_mode = '{0}'".format(sql_mode))
+
+        if settings:
+            self._execute_query("SET " + ", ".join(settings))
+        self._session_charset_id = self._charset_id
+        self._session_track = session_track
+        if self.converter:
+            self.converter.set_charset(charset_name)
+
     def _get_connection(self, prtcls=None):
         """Get connection based on configuration
 
@@ -316,6 +386,8 @@ class MySQLConnection(MySQLConnectionAbstract):
         except (AttributeError, errors.Error):
             pass  # Getting an exception would mean we are disconnected.
         self._socket.close_connection()
+        self._server_autocommit = None
+        self._forget_session_state()
 
     disconnect = close
 
@@ -381,16 +453,65 @@ class MySQLConnection(MySQLConnectionAbstract):
 
         return self._socket.recv()
 
-    def _handle_server_status(self, flags):
+    def _handle_server_status(self, flags, changes=None):
         """Handle the server flags found in MySQL packets
 
         This method handles the server flags send by MySQL OK and EOF
         packets. It, for example, checks whether there exists more result
         sets or whether there is an ongoing transaction.
+
+        The session state changes parsed from the packet, if any, are
+        given using the changes argument. When the server reports the
+        session state changed without the changes being known, the
+        mirrored session state is forgotten.
         """
         self._have_next_result = flag_is_set(ServerFlag.MORE_RESULTS_EXISTS,
                                              flags)
         self._in_transaction = flag_is_set(ServerFlag.STATUS_IN_TRANS, flags)
+        self._server_autocommit = flag_is_set(ServerFlag.STATUS_AUTOCOMMIT,
+                                              flags)
+        if flag_is_set(ServerFlag.STATUS_DB_DROPPED, flags):
+            # The current schema might have been dropped
+            self._session_state.pop('schema', None)
+        if changes:
+            self._handle_session_state(changes)
+        elif flag_is_set(ServerFlag.SERVER_SESSION_STATE_CHANGED, flags):
+            self._forget_session_state()
+
+    def _handle_session_state(self, changes):
+        """Handle the session state changes found in MySQL OK packets
+
+        This method updates the mirror of the session state using the
+        changes parsed by MySQLProtocol.parse_session_state(). Variables
+        are only kept when the server was asked to track them.
+        """
+        for track_type, value in changes:
+            if track_type == SessionTrackType.SCHEMA:
+                self._session_state['schema'] = value or None
+            elif track_type == SessionTrackType.TRANSACTION_STATE:
+                self._session_state['transaction_state'] = value
+            elif track_type == SessionTrackType.TRANSACTION_CHARACTERISTICS:
+                self._session_state['transaction_characteristics'] = value
+            elif track_type == SessionTrackType.SYSTEM_VARIABLES:
+                (name, value) = value
+                if name in SESSION_TRACK_VARIABLES:
+                    self._session_variables[name] = value
+                if name.startswith(('character_set_', 'collation_')) \
+                        and self._session_charset_id is not None \
+                        and value not in CharacterSet.get_charset_info(
+                                self._session_charset_id)[1:3]:
+                    self._session_charset_id = None
+
+    def _forget_session_state(self):
+        """Forget the mirrored session state
+
+        Used when the session is created or reset. The current schema is
+        kept since COM_RESET_CONNECTION does not change it.
+        """
+        self._session_track = False
+        self._session_state.pop('transaction_state', None)
+        self._session_state.pop('transaction_characteristics', None)
+        self._session_variables = {}
 
     @property
     def in_transaction(self):
@@ -408,7 +529,8 @@ class MySQLConnection(MySQLConnectionAbstract):
         """
         if packet[4] == 0:
             ok_pkt = self._protocol.parse_ok(packet)
-            self._handle_server_status(ok_pkt['status_flag'])
+            self._handle_server_status(ok_pkt['status_flag'],
+                                       ok_pkt.get('session_state'))
             return ok_pkt
         elif packet[4] == 255:
             raise errors.get_exception(packet)
@@ -425,7 +547,8 @@ class MySQLConnection(MySQLConnectionAbstract):
         """
         if packet[4] == 254:
             eof = self._protocol.parse_eof(packet)
-            self._handle_server_status(eof['status_flag'])
+            self._handle_server_status(eof['status_flag'],
+                                       eof.get('session_state'))
             return eof
         elif packet[4] == 255:
             raise errors.get_exception(packet)
@@ -508,12 +631,13 @@ class MySQLConnection(MySQLConnectionAbstract):
         return (None, eof)
 
     def get_rows(self, count=None, binary=False, columns=None, raw=None,
-                 prep_stmt=None):
+                 prep_stmt=None, max_size=None):
         """Get all rows returned by the MySQL server
 
         This method gets all rows returned by the MySQL server after sending,
         for example, the query command. The result is a tuple consisting of
-        a list of rows and the EOF packet.
+        a list of rows and the EOF packet. When max_size is given, no more
+        rows are read once the rows read reach max_size bytes.
 
         Returns a tuple()
         """
@@ -529,11 +653,12 @@ class MySQLConnection(MySQLConnectionAbstract):
                 if charset == 'utf8mb4':
                     charset = 'utf8'
                 rows = self._protocol.read_binary_result(
-                    self._socket, columns, count, charset)
+                    self._socket, columns, count, charset, max_size=max_size)
             else:
                 rows = self._protocol.read_text_result(self._socket,
                                                        self._server_version,
-                                                       count=count)
+                                                       count=count,
+                                                       max_size=max_size)
         except errors.Error as err:
             self.unread_result = False
             raise err
@@ -542,12 +667,13 @@ class MySQLConnection(MySQLConnectionAbstract):
 
         if not (binary or raw) and self._columns_desc is not None and rows \
            and hasattr(self, 'converter'):
-            row_to_python = self.converter.row_to_python
-            rows = [row_to_python(row, self._columns_desc) for row in rows]
+            decode = self.converter.row_decoder(self._columns_desc)
+            rows = [decode(row) for row in rows]
 
         if eof_p is not None:
             self._handle_server_status(eof_p['status_flag'] if 'status_flag' in
-                                       eof_p else eof_p['server_status'])
+                                       eof_p else eof_p['server_status'],
+                                       eof_p.get('session_state'))
             self.unread_result = False
 
         return rows, eof_p
@@ -555,7 +681,10 @@ class MySQLConnection(MySQLConnectionAbstract):
     def consume_results(self):
         """Consume results
         """
-        if self.unread_result:
+        if self._rows_read_ahead:
+            # A cursor already read the rows, they are not on the socket
+            self.unread_result = False
+        elif self.unread_result:
             self.get_rows()
 
     def cmd_init_db(self, database):
@@ -585,9 +714,25 @@ class MySQLConnection(MySQLConnectionAbstract):
 
         Returns a tuple()
         """
+        self._send_query(query)
+        return self._read_query_result()
+
+    def _send_query(self, query):
+        """Send a query to the MySQL server without reading the result
+
+        The result must be read using _read_query_result() before sending
+        another command.
+        """
         if not isinstance(query, bytes):
             query = query.encode('utf-8')
-        result = self._handle_result(self._send_cmd(ServerCmd.QUERY, query))
+        self._send_cmd(ServerCmd.QUERY, query, expect_response=False)
+
+    def _read_query_result(self):
+        """Read the result of a query sent using _send_query()
+
+        Returns a tuple()
+        """
+        result = self._handle_result(self._socket.recv())
 
         if self._have_next_result:
             raise errors.InterfaceError(
@@ -759,20 +904,122 @@ class MySQLConnection(MySQLConnectionAbstract):
             raise
 
         self._charset_id = charset
+        self._session_charset_id = charset
+        self._forget_session_state()
+        self._session_state['schema'] = database or None
+        self._forget_prepared_statements()
         self._post_connection()
 
         return ok_packet
 
     @property
     def database(self):
-        """Get the current database"""
-        return self.info_query("SELECT DATABASE()")[0]
+        """Get the current database
+
+        The server is only queried when the session state tracker does
+        not report the current schema.
+        """
+        if self._session_track and 'schema' in self._session_state:
+            return self._session_state['schema']
+        value = self.info_query("SELECT DATABASE()")[0]
+        if self._session_track:
+            self._session_state['schema'] = value
+        return value
 
     @database.setter
     def database(self, value):  # pylint: disable=W0221
         """Set the current database"""
+        if self._session_track and value \
+                and self._session_state.get('schema') == value:
+            return
         self.cmd_query("USE %s" % value)
 
+    def _get_session_variable(self, name):
+        """Get the value of a session variable
+
+        The value is taken from the mirrored session state when the server
+        reports changes of the variable, otherwise the server is queried.
+
+        Returns the value of the variable.
+        """
+        if self._session_track and name in self._session_variables:
+            return self._session_variables[name]
+        value = self.info_query("SELECT @@session.{0}".format(name))[0]
+        if self._session_track and name in SESSION_TRACK_VARIABLES:
+            self._session_variables[name] = value
+        return value
+
+    def _set_session_variable(self, name, value):
+        """Set the value of a session variable
+
+        Nothing is sent to the server when the mirrored session state
+        shows the variable already has the value.
+        """
+        if not self._session_track \
+                or self._session_variables.get(name) != value:
+            self.cmd_query("SET @@session.{0} = '{1}'".format(name, value))
+
+    @property
+    def time_zone(self):
+        """Get the current time zone"""
+        return self._get_session_variable('time_zone')
+
+    @time_zone.setter
+    def time_zone(self, value):
+        """Set the time zone"""
+        self._set_session_variable('time_zone', value)
+        self._time_zone = value
+
+    @property
+    def sql_mode(self):
+        """Get the SQL mode"""
+        return self._get_session_variable('sql_mode')
+
+    @sql_mode.setter
+    def sql_mode(self, value):
+        """Set the SQL mode
+
+        The value argument can be either a string with comma separate mode
+        names, or a sequence of mode names.
+        """
+        if isinstance(value, (list, tuple)):
+            value = ','.join(value)
+        self._set_session_variable('sql_mode', value)
+        self._sql_mode = value
+
+    @property
+    def autocommit(self):
+        """Get whether autocommit is on or off
+
+        The server status sent with every OK and EOF packet is used when
+        available.
+        """
+        if self._server_autocommit is not None:
+            return self._server_autocommit
+        value = self.info_query("SELECT @@session.autocommit")[0]
+        return True if value == 1 else False
+
+    @autocommit.setter
+    def autocommit(self, value):
+        """Toggle autocommit"""
+        if self._server_autocommit is None \
+                or self._server_autocommit != bool(value):
+            switch = 'ON' if value else 'OFF'
+            self.cmd_query("SET @@session.autocommit = {0}".format(switch))
+        self._autocommit = value
+
+    def _set_names(self, charset_name, collation_name):
+        """Set the character set and collation of the session
+
+        Nothing is sent to the server when the session state tracker shows
+        the session already uses them.
+        """
+        if self._session_track \
+                and self._session_charset_id == self._charset_id:
+            return
+        super(MySQLConnection, self)._set_names(charset_name, collation_name)
+        self._session_charset_id = self._charset_id
+
     def is_connected(self):
         """Reports whether the connection to MySQL Server is available
 
@@ -806,20 +1053,33 @@ class MySQLConnection(MySQLConnectionAbstract):
         """
         if not self.is_connected():
             raise errors.OperationalError("MySQL Connection not available.")
+        self._reset_session(user_variables, session_variables)
 
+    def _reset_session(self, user_variables=None, session_variables=None):
+        """Clears the current active session without checking the connection
+
+        Used by reset_session() and by connection pools which already know
+        the connection was in use moments ago.
+        """
         try:
             self.cmd_reset_connection()
         except errors.NotSupportedError:
             self.cmd_change_user(self._user, self._password,
                                  self._database, self._charset_id)
 
-        cur = self.cursor()
-        if user_variables:
-            for key, value in user_variables.items():
-                cur.execute("SET @`{0}` = %s".format(key), (value,))
-        if session_variables:
-            for key, value in session_variables.items():
-                cur.execute("SET SESSION `{0}` = %s".format(key), (value,))
+        if user_variables or session_variables:
+            # All the variables are set using a single statement
+            assignments = []
+            params = []
+            for key, value in (user_variables or {}).items():
+                assignments.append("@`{0}` = %s".format(key))
+                params.append(value)
+            for key, value in (session_variables or {}).items():
+                assignments.append("SESSION `{0}` = %s".format(key))
+                params.append(value)
+            cur = MySQLCursor(self)
+            cur.execute("SET " + ", ".join(assignments), params)
+            cur.close()
 
     def reconnect(self, attempts=1, delay=0):
         """Attempt to reconnect to the MySQL server
@@ -1039,14 +1299,29 @@ class MySQLConnection(MySQLConnectionAbstract):
         self._send_cmd(ServerCmd.STMT_FETCH, packet, expect_response=False)
         self.unread_result = True
 
+    def _forget_prepared_statements(self):
+        super(MySQLConnection, self)._forget_prepared_statements()
+        self._stmt_param_types = {}
+        self._stmt_long_data = set()
+
     def cmd_stmt_prepare(self, statement):
         """Prepare a MySQL statement
 
         This method will send the PREPARE command to MySQL together with the
         given statement.
 
+        When the connection caches prepared statements, the result for the
+        same statement is reused. The least recently used statement is
+        closed when the cache is full.
+
         Returns a dict()
         """
+        cache = self._prepared_statements
+        if cache is not None:
+            result = cache.get(statement)
+            if result is not None:
+                return result
+
         packet = self._send_cmd(ServerCmd.STMT_PREPARE, statement)
         result = self._handle_binary_ok(packet)
 
@@ -1065,6 +1340,9 @@ class MySQLConnection(MySQLConnectionAbstract):
                                                 self.python_charset))
             self._handle_eof(self._socket.recv())
 
+        if cache is not None:
+            for _, evicted in cache.put(statement, result):
+                self.cmd_stmt_close(evicted['statement_id'])
         return result
 
     def cmd_stmt_execute(self, statement_id, data=(), parameters=(), flags=0):
@@ -1083,13 +1361,55 @@ class MySQLConnection(MySQLConnectionAbstract):
                     self.cmd_stmt_send_long_data(statement_id, param_id,
                                                  data[param_id])
                     long_data_used[param_id] = (binary,)
+        if long_data_used:
+            self._stmt_long_data.add(statement_id)
 
         execute_packet = self._protocol.make_stmt_execute(
             statement_id, data, tuple(parameters), flags,
-            long_data_used, self.charset)
-        packet = self._send_cmd(ServerCmd.STMT_EXECUTE, packet=execute_packet)
-        result = self._handle_binary_result(packet)
-        return result
+            long_data_used, self.charset, self._stmt_param_types)
+        self._send_cmd(ServerCmd.STMT_EXECUTE, packet=execute_packet,
+                       expect_response=False)
+        return self._read_stmt_execute_result(statement_id)
+
+    def _make_stmt_execute(self, statement_id, data=(), parameters=()):
+        """Make the Statement Execute command for parameters without long data
+
+        The command is sent using _send_commands().
+
+        Returns bytes.
+        """
+        return self._protocol.make_command(
+            ServerCmd.STMT_EXECUTE, self._protocol.make_stmt_execute(
+                statement_id, data, tuple(parameters), 0, None, self.charset,
+                self._stmt_param_types))
+
+    def _send_commands(self, commands):
+        """Send several commands without reading their results
+
+        The results must be read in the same order before sending another
+        command, for example using _read_stmt_execute_result().
+        """
+        self.handle_unread_result()
+        try:
+            if self._compress:
+                for command in commands:
+                    self._socket.send(command, 0, 0)
+            else:
+                self._socket.send_commands(commands)
+        except AttributeError:
+            raise errors.OperationalError("MySQL Connection not available.")
+
+    def _read_stmt_execute_result(self, statement_id):
+        """Read the result of an execution of a prepared statement
+
+        Returns a tuple or dict()
+        """
+        try:
+            return self._handle_binary_result(self._socket.recv())
+        except errors.Error:
+            # The parameter types are sent again with the next execution
+            self._stmt_param_types.pop(statement_id, None)
+            raise
 
     def cmd_stmt_close(self, statement_id):
         """Deallocate a prepared MySQL statement
@@ -1098,6 +1418,12 @@ class MySQLConnection(MySQLConnectionAbstract):
         statement_id. Note that the MySQL server does not return
         anything.
         """
+        self._stmt_param_types.pop(statement_id, None)
+        self._stmt_long_data.discard(statement_id)
+        if self._prepared_statements:
+            for statement, prepared in self._prepared_statements.items():
+                if prepared['statement_id'] == statement_id:
+                    self._prepared_statements.pop(statement)
         self._send_cmd(ServerCmd.STMT_CLOSE, int4store(statement_id),
                        expect_response=False)
 
@@ -1143,6 +1469,8 @@ class MySQLConnection(MySQLConnectionAbstract):
 
         Returns a dict()
         """
+        self._stmt_param_types.pop(statement_id, None)
+        self._stmt_long_data.discard(statement_id)
         self._handle_ok(self._send_cmd(ServerCmd.STMT_RESET,
                                        int4store(statement_id)))
 
@@ -1159,6 +1487,10 @@ class MySQLConnection(MySQLConnectionAbstract):
                                            "earlier does not support "
                                            "COM_RESET_CONNECTION.")
         self._handle_ok(self._send_cmd(ServerCmd.RESET_CONNECTION))
+        # The session character set is reset to the server default
+        self._session_charset_id = None
+        self._forget_session_state()
+        self._forget_prepared_statements()
         self._post_connection()
 
     def handle_unread_result(self):
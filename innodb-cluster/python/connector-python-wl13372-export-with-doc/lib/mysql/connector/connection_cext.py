@@ -295,17 +295,18 @@ class CMySQLConnection(MySQLConnectionAbstract):
         if count is not None and count <= 0:
             raise AttributeError("count should be 1 or higher, or None")
 
+        decode = None
+        if not (self._raw or raw) and self.converter:
+            decode = self.converter.row_decoder(self._columns)
+
         counter = 0
         try:
             row = prep_stmt.fetch_row() if prep_stmt \
                 else self._cmysql.fetch_row()
             while row:
-                if not self._raw and self.converter:
-                    row = list(row)
-                    for i, _ in enumerate(row):
-                        if not raw:
-                            row[i] = self.converter.to_python(self._columns[i],
-                                                              row[i])
+                if decode:
+                    row = decode(row)
+                elif not self._raw and self.converter:
                     row = tuple(row)
                 rows.append(row)
                 counter += 1
@@ -419,16 +420,42 @@ class CMySQLConnection(MySQLConnectionAbstract):
 
         return None
 
+    def _forget_prepared_statements(self):
+        if self._prepared_statements is not None:
+            # The statements were deallocated by the MySQL server; closing
+            # them only frees their client side resources
+            for _, prep_stmt in self._prepared_statements.clear():
+                try:
+                    prep_stmt.stmt_close()
+                except MySQLInterfaceError:
+                    pass
+
     def cmd_stmt_prepare(self, statement):
-        """Prepares the SQL statement"""
+        """Prepares the SQL statement
+
+        When the connection caches prepared statements, the statement
+        prepared for the same SQL is reused. The least recently used
+        statement is closed when the cache is full.
+        """
         if not self._cmysql:
             raise errors.OperationalError("MySQL Connection not available")
 
+        cache = self._prepared_statements
+        if cache is not None:
+            prep_stmt = cache.get(statement)
+            if prep_stmt is not None:
+                return prep_stmt
+
         try:
-            return self._cmysql.stmt_prepare(statement)
+            prep_stmt = self._cmysql.stmt_prepare(statement)
         except MySQLInterfaceError as err:
             raise errors.InterfaceError(str(err))
 
+        if cache is not None:
+            for _, evicted in cache.put(statement, prep_stmt):
+                self.cmd_stmt_close(evicted)
+        return prep_stmt
+
     # pylint: disable=W0221
     def cmd_stmt_execute(self, prep_stmt, *args):
         """Executes the prepared statement"""
@@ -450,6 +477,10 @@ class CMySQLConnection(MySQLConnectionAbstract):
         """Closes the prepared statement"""
         if self._unread_result:
             raise errors.InternalError("Unread result found")
+        if self._prepared_statements:
+            for statement, cached in self._prepared_statements.items():
+                if cached is prep_stmt:
+                    self._prepared_statements.pop(statement)
         prep_stmt.stmt_close()
 
     def cmd_stmt_reset(self, prep_stmt):
@@ -633,6 +664,7 @@ class CMySQLConnection(MySQLConnectionAbstract):
                                              sqlstate=exc.sqlstate)
 
         self._charset_id = charset
+        self._forget_prepared_statements()
         self._post_connection()
 
     def cmd_refresh(self, options):
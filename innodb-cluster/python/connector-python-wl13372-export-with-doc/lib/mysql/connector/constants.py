@@ -75,9 +75,22 @@ DEFAULT_CONFIGURATION = {
     'consume_results': False,
     'conn_attrs': None,
     'dns_srv': False,
+    'connect_attempt_delay': None,
+    'prepared_statement_cache_size': 0,
 }
 
-CNX_POOL_ARGS = ('pool_name', 'pool_size', 'pool_reset_session')
+CNX_POOL_ARGS = ('pool_name', 'pool_size', 'pool_reset_session',
+                 'pool_ping_interval', 'pool_max_lifetime',
+                 'pool_validation_interval', 'pool_timeout',
+                 'pool_min_size', 'pool_max_size', 'pool_max_idle_time',
+                 'pool_open_threads')
+
+# Session system variables the server reports changes of, letting
+# MySQLConnection answer for them without querying the server
+SESSION_TRACK_VARIABLES = ('autocommit', 'character_set_client',
+                           'character_set_connection',
+                           'character_set_results', 'collation_connection',
+                           'sql_mode', 'time_zone')
 
 def flag_is_set(flag, flags):
     """Checks if the flag is set
@@ -523,6 +536,31 @@ class ServerFlag(_Flags):
     }
 
 
+class SessionTrackType(_Constants):
+    """MySQL Session State Tracker types
+
+    Types of the session state changes sent in OK packets when the client
+    has the SESION_TRACK capability set.
+    """
+    _prefix = 'SESSION_TRACK_'
+    SYSTEM_VARIABLES = 0
+    SCHEMA = 1
+    STATE_CHANGE = 2
+    GTIDS = 3
+    TRANSACTION_CHARACTERISTICS = 4
+    TRANSACTION_STATE = 5
+
+    desc = {
+        'SYSTEM_VARIABLES': (0, 'Session system variable was changed'),
+        'SCHEMA': (1, 'Current schema was changed'),
+        'STATE_CHANGE': (2, 'Session state was changed'),
+        'GTIDS': (3, 'GTIDs were generated'),
+        'TRANSACTION_CHARACTERISTICS': (4, 'Transaction characteristics '
+                                           'were changed'),
+        'TRANSACTION_STATE': (5, 'Transaction state was changed'),
+    }
+
+
 class RefreshOption(_Constants):
     """MySQL Refresh command options
 
@@ -48,6 +48,8 @@ class MySQLConverterBase(object):
     """
 
     def __init__(self, charset='utf8', use_unicode=True):
+        self._row_decoder_fields = None
+        self._row_decoder = None
         self.python_types = None
         self.mysql_types = None
         self.charset = None
@@ -67,10 +69,12 @@ class MySQLConverterBase(object):
             # default to utf8
             self.charset = 'utf8'
         self.charset_id = CharacterSet.get_charset_info(self.charset)[0]
+        self._row_decoder_fields = None
 
     def set_unicode(self, value=True):
         """Set whether to use Unicode"""
         self.use_unicode = value
+        self._row_decoder_fields = None
 
     def to_mysql(self, value):
         """Convert Python data type to MySQL"""
@@ -102,6 +106,23 @@ class MySQLConverterBase(object):
         except KeyError:
             return value
 
+    def row_decoder(self, fields):
+        """Get a callable converting rows described by fields
+
+        The returned callable takes a row and returns a tuple with each
+        value converted using to_python() and the matching field.
+
+        Returns a callable.
+        """
+        to_python = self.to_python
+
+        def decode(row):
+            """Returns the converted row as a tuple"""
+            return tuple([to_python(field, value)
+                          for field, value in zip(fields, row)])
+
+        return decode
+
     def escape(self, value):
         """Escape buffer for sending to MySQL"""
         return value
@@ -128,6 +149,7 @@ class MySQLConverter(MySQLConverterBase):
     def __init__(self, charset=None, use_unicode=True):
         MySQLConverterBase.__init__(self, charset, use_unicode)
         self._cache_field_types = {}
+        self._cache_to_mysql = {}
 
     def escape(self, value):
         """
@@ -178,12 +200,17 @@ class MySQLConverter(MySQLConverterBase):
 
     def to_mysql(self, value):
         """Convert Python data type to MySQL"""
-        type_name = value.__class__.__name__.lower()
         try:
-            return getattr(self, "_{0}_to_mysql".format(type_name))(value)
-        except AttributeError:
-            raise TypeError("Python '{0}' cannot be converted to a "
-                            "MySQL type".format(type_name))
+            convert = self._cache_to_mysql[value.__class__]
+        except KeyError:
+            type_name = value.__class__.__name__.lower()
+            try:
+                convert = getattr(self, "_{0}_to_mysql".format(type_name))
+            except AttributeError:
+                raise TypeError("Python '{0}' cannot be converted to a "
+                                "MySQL type".format(type_name))
+            self._cache_to_mysql[value.__class__] = convert
+        return convert(value)
 
     def to_python(self, vtype, value):
         """Convert MySQL data type to Python"""
@@ -384,9 +411,28 @@ class MySQLConverter(MySQLConverterBase):
 
         Returns a tuple.
         """
-        i = 0
-        result = [None]*len(fields)
+        return self._compile_row_decoder(fields)(row)
+
+    def row_decoder(self, fields):
+        """Get a callable converting text result rows described by fields
+
+        The decoder is built once for the fields: the conversion of each
+        column, including character set and Unicode handling, is resolved
+        up front so that rows are converted without per-field lookups.
+        Subclasses overriding row_to_python() or to_python() get a decoder
+        calling their implementation instead.
 
+        Returns a callable.
+        """
+        if _overridden(self.row_to_python):
+            row_to_python = self.row_to_python
+            return lambda row: row_to_python(row, fields)
+        if _overridden(self.to_python):
+            return MySQLConverterBase.row_decoder(self, fields)
+        return self._compile_row_decoder(fields)
+
+    def _get_field_type_converters(self):
+        """Returns a dict mapping field types to conversion methods"""
         if not self._cache_field_types:
             self._cache_field_types = {}
             for name, info in FieldType.desc.items():
@@ -396,6 +442,72 @@ class MySQLConverter(MySQLConverterBase):
                 except AttributeError:
                     # We ignore field types which has no method
                     pass
+        return self._cache_field_types
+
+    def _compile_field_converter(self, field):
+        """Returns a callable converting a non-NULL value of field"""
+        method = self._get_field_type_converters().get(field[1])
+        if method is None:
+            return _decode_unknown
+        func = getattr(method, '__func__', method)
+        charset = self.charset
+        if func is _MYSQL_CONVERTER_FUNCS.get('_INT_to_python'):
+            return int
+        if func is _MYSQL_CONVERTER_FUNCS.get('_FLOAT_to_python'):
+            return float
+        if func is _MYSQL_CONVERTER_FUNCS.get('_DECIMAL_to_python'):
+            return lambda value: Decimal(value.decode(charset))
+        flags = field[7] if len(field) > 7 else 0
+        if func is _MYSQL_CONVERTER_FUNCS.get('_STRING_to_python') \
+           and not flags & FieldFlag.SET:
+            if flags & FieldFlag.BINARY:
+                if charset == 'binary':
+                    return _identity
+                return lambda value: _decode_or_keep(value, charset)
+            if charset == 'binary' or not self.use_unicode:
+                return _identity
+            return lambda value: value.decode(charset)
+        return lambda value: method(value, field)
+
+    def _compile_row_decoder(self, fields):
+        """Returns the decoder for fields, building it if needed"""
+        cached = self._row_decoder_fields
+        if cached is not None and (fields is cached or fields == cached):
+            return self._row_decoder
+
+        converters = tuple([self._compile_field_converter(field)
+                            for field in fields])
+        convert_row = self._convert_row
+
+        def decode(row):
+            """Returns the converted row as a tuple
+
+            On error the row is converted again by _convert_row(), which
+            gives the exact result or raises the annotated error.
+            """
+            if len(row) != len(converters):
+                return convert_row(row, fields)
+            try:
+                return tuple([None if value is None else convert(value)
+                              for convert, value in zip(converters, row)])
+            except (AttributeError, TypeError, ValueError):
+                return convert_row(row, fields)
+
+        self._row_decoder_fields = fields
+        self._row_decoder = decode
+        return decode
+
+    def _convert_row(self, row, fields):
+        """Convert a row field by field
+
+        This is the reference conversion used when a row decoder
+        hits a value it can not handle.
+
+        Returns a tuple.
+        """
+        i = 0
+        result = [None]*len(fields)
+        field_types = self._get_field_type_converters()
 
         for field in fields:
             field_type = field[1]
@@ -406,7 +518,7 @@ class MySQLConverter(MySQLConverterBase):
                 continue
 
             try:
-                result[i] = self._cache_field_types[field_type](row[i], field)
+                result[i] = field_types[field_type](row[i], field)
             except KeyError:
                 # If one type is not defined, we just return the value as str
                 try:
@@ -683,3 +795,38 @@ class MySQLConverter(MySQLConverterBase):
     _LONG_BLOB_to_python = _BLOB_to_python
     _MEDIUM_BLOB_to_python = _BLOB_to_python
     _TINY_BLOB_to_python = _BLOB_to_python
+
+
+def _overridden(method):
+    """Returns whether a bound method is not the one of MySQLConverter"""
+    func = getattr(method, '__func__', method)
+    return func is not _MYSQL_CONVERTER_FUNCS.get(func.__name__)
+
+
+def _identity(value):
+    """Returns value unchanged"""
+    return value
+
+
+def _decode_or_keep(value, charset):
+    """Returns value decoded using charset, or unchanged if not possible"""
+    if isinstance(value, str):
+        return value
+    try:
+        return value.decode(charset)
+    except (LookupError, UnicodeDecodeError):
+        return value
+
+
+def _decode_unknown(value):
+    """Returns a value of an unknown field type decoded as UTF-8 if possible"""
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        return value
+
+
+_MYSQL_CONVERTER_FUNCS = dict(
+    (name, getattr(func, '__func__', func))
+    for name, func in vars(MySQLConverter).items()
+    if name.endswith('to_python'))
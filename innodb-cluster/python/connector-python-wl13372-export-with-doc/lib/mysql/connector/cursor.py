@@ -30,6 +30,7 @@
 """
 
 from collections import namedtuple
+from io import IOBase
 import re
 import weakref
 
@@ -37,6 +38,7 @@ from . import errors
 from .abstracts import MySQLCursorAbstract, NAMED_TUPLE_CACHE
 from .catch23 import PY2
 from .constants import ServerFlag
+from .utils import LRUCache
 
 SQL_COMMENT = r"\/\*.*?\*\/"
 RE_SQL_COMMENT = re.compile(
@@ -63,34 +65,12 @@ RE_SQL_SPLIT_STMTS = re.compile(
     b''';(?=(?:[^"'`]*["'`][^"'`]*["'`])*[^"'`]*$)''')
 RE_SQL_FIND_PARAM = re.compile(
     b'''%s(?=(?:[^"'`]*["'`][^"'`]*["'`])*[^"'`]*$)''')
+RE_SQL_CALL = re.compile(br'\s*CALL\b', re.I)
 
 ERR_NO_RESULT_TO_FETCH = "No result set to fetch from"
 
 MAX_RESULTS = 4294967295
 
-class _ParamSubstitutor(object):
-    """
-    Substitutes parameters into SQL statement.
-    """
-    def __init__(self, params):
-        self.params = params
-        self.index = 0
-
-    def __call__(self, matchobj):
-        index = self.index
-        self.index += 1
-        try:
-            return bytes(self.params[index])
-        except IndexError:
-            raise errors.ProgrammingError(
-                "Not enough parameters for the SQL statement")
-
-    @property
-    def remaining(self):
-        """Returns number of parameters remaining to be substituted"""
-        return len(self.params) - self.index
-
-
 def _bytestr_format_dict(bytestr, value_dict):
     """
     >>> _bytestr_format_dict(b'%(a)s', {b'a': b'foobar'})
@@ -126,6 +106,120 @@ def _bytestr_format_dict(bytestr, value_dict):
     return stmt
 
 
+# Parameter markers of the statements executed recently, see _params_layout()
+PARAMS_LAYOUT_CACHE = LRUCache(maxsize=1024)
+# Longer operations are not cached, they are rarely executed repeatedly
+PARAMS_LAYOUT_MAX_LENGTH = 8192
+
+
+def _split_pyformat(stmt):
+    """Split a statement around its %(name)s markers
+
+    Returns a tuple with the list of segments between the markers and the
+    list of marker names, or None when a marker uses a conversion type
+    other than 's' or '%'.
+    """
+    segments = []
+    keys = []
+    segment = b''
+    pos = 0
+    for match in RE_PY_MAPPING_PARAM.finditer(stmt):
+        segment += stmt[pos:match.start()]
+        pos = match.end()
+        conversion_type = match.group("conversion_type")
+        if conversion_type == b"%":
+            segment += b"%"
+        elif conversion_type == b"s":
+            segments.append(segment)
+            keys.append(match.group("mapping_key"))
+            segment = b''
+        else:
+            return None
+    segments.append(segment + stmt[pos:])
+    return segments, keys
+
+
+def _params_layout(operation, charset, pyformat=False):
+    """Get the encoded operation split around its parameter markers
+
+    The layout of each operation up to PARAMS_LAYOUT_MAX_LENGTH long is
+    cached in PARAMS_LAYOUT_CACHE so that statements executed repeatedly
+    are encoded and parsed only once.
+    For %s markers, the layout is the list of segments between the
+    markers. For %(name)s markers, see _split_pyformat().
+
+    Raises UnicodeError when the operation can not be encoded.
+
+    Returns a list, a tuple or None.
+    """
+    if isinstance(operation, bytearray):
+        operation = bytes(operation)
+    key = (operation, charset, pyformat)
+    layout = PARAMS_LAYOUT_CACHE.get(key)
+    if layout is None:
+        stmt = operation if isinstance(operation, bytes) \
+            else operation.encode(charset)
+        layout = _split_pyformat(stmt) if pyformat else stmt.split(b'%s')
+        if layout is not None and len(operation) <= PARAMS_LAYOUT_MAX_LENGTH:
+            PARAMS_LAYOUT_CACHE.put(key, layout)
+    return layout
+
+
+def _interpolate_params(segments, params):
+    """Join the segments of a statement with the parameters between them
+
+    Raises ProgrammingError when the number of parameters does not match
+    the number of markers.
+
+    Returns bytes.
+    """
+    markers = len(segments) - 1
+    if len(params) != markers:
+        if len(params) < markers:
+            raise errors.ProgrammingError(
+                "Not enough parameters for the SQL statement")
+        raise errors.ProgrammingError(
+            "Not all parameters were used in the SQL statement")
+    parts = [None] * (2 * markers + 1)
+    parts[::2] = segments
+    parts[1::2] = [bytes(param) for param in params] if PY2 else params
+    return b''.join(parts)
+
+
+def _join_batch_insert(prefix, suffix, values, max_size=None):
+    """Generate multi row INSERT statements
+
+    The VALUES rows are joined and put between prefix and suffix. When
+    max_size is given, rows are spread over statements of at most max_size
+    bytes; a row too large for it gets a statement of its own.
+
+    Returns a generator.
+    """
+    statement_size = len(prefix) + len(suffix)
+    rows = []
+    size = statement_size
+    for row in values:
+        if rows and max_size and size + len(row) + 1 > max_size:
+            yield prefix + b','.join(rows) + suffix
+            rows = []
+            size = statement_size
+        rows.append(row)
+        size += len(row) + 1
+    if rows:
+        yield prefix + b','.join(rows) + suffix
+
+
+def _batch_insert_size(max_allowed_packet, max_size):
+    """Returns the maximum size of the statements of a multi row insert
+
+    The size is limited by max_allowed_packet, minus room for the packet
+    headers. This room is at most half of a small max_allowed_packet, so
+    that rows are still spread over statements.
+    """
+    return min(max_size, max(max_allowed_packet - 1024,
+                             max_allowed_packet // 2, 1))
+
+
 class CursorBase(MySQLCursorAbstract):
     """
     Base for defining MySQLCursor. This class is a skeleton and defines
@@ -210,7 +304,9 @@ class CursorBase(MySQLCursorAbstract):
         cursor.executemany(stmt, data)
 
         INSERT statements are optimized by batching the data, that is
-        using the MySQL multiple rows syntax.
+        using the MySQL multiple rows syntax. The parameters are consumed
+        lazily and spread over as many statements as needed to stay under
+        the max_allowed_packet of the server.
 
         Results are discarded. If they are needed, consider looping over
         data using the execute() method.
@@ -311,7 +407,10 @@ class MySQLCursor(CursorBase):
     """Default cursor for interacting with MySQL
 
     This cursor will execute statements and handle the result. It will
-    not automatically fetch all rows.
+    not automatically fetch all rows. The fetch methods read up to 1000
+    rows ahead of the ones fetched, as long as these rows hold less than
+    read_ahead_size bytes (1 MiB by default). Lower read_ahead_size to use
+    less memory with large rows; with 0, rows are read one at a time.
 
     MySQLCursor should be inherited whenever other functionallity is
     required. An example would to change the fetch* member functions
@@ -319,11 +418,21 @@ class MySQLCursor(CursorBase):
 
     Implements the Python Database API Specification v2.0 (PEP-249)
     """
+
+    # Number of rows read from the socket at once by the fetch methods
+    _read_batch_size = 1000
+    # Maximum number of bytes of rows read ahead of fetching them
+    read_ahead_size = 1024 * 1024
+    # Maximum size of the statements built by executemany() for INSERT
+    _batch_insert_max_size = 16 * 1024 * 1024
+
     def __init__(self, connection=None):
         CursorBase.__init__(self)
         self._connection = None
         self._stored_results = []
         self._nextrow = (None, None)
+        self._batch = []
+        self._batch_eof = None
         self._warnings = None
         self._warning_count = 0
         self._executed = None
@@ -352,6 +461,8 @@ class MySQLCursor(CursorBase):
         """Reset the cursor to default"""
         self._rowcount = -1
         self._nextrow = (None, None)
+        self._batch = []
+        self._batch_eof = None
         self._stored_results = []
         self._warnings = None
         self._warning_count = 0
@@ -423,15 +534,11 @@ class MySQLCursor(CursorBase):
     def _process_params(self, params):
         """Process query parameters."""
         try:
-            res = params
-
             to_mysql = self._connection.converter.to_mysql
             escape = self._connection.converter.escape
             quote = self._connection.converter.quote
 
-            res = [to_mysql(i) for i in res]
-            res = [escape(i) for i in res]
-            res = [quote(i) for i in res]
+            res = [quote(escape(to_mysql(value))) for value in params]
         except Exception as err:
             raise errors.ProgrammingError(
                 "Failed processing format-parameters; %s" % err)
@@ -512,6 +619,44 @@ class MySQLCursor(CursorBase):
             except StopIteration:
                 return
 
+    def _prepare_statement(self, operation, params=None):
+        """Encodes the operation and substitutes the parameters
+
+        The operation is encoded using the character set of the connection
+        and any markers are substituted by the escaped and quoted
+        parameters.
+
+        Raises ProgrammingError when the operation can not be encoded or
+        when not all parameters were used.
+
+        Returns bytes.
+        """
+        charset = self._connection.python_charset
+        try:
+            if isinstance(params, (list, tuple)):
+                segments = _params_layout(operation, charset)
+                return _interpolate_params(
+                    segments, self._process_params(params))
+            if isinstance(params, dict) and not PY2:
+                layout = _params_layout(operation, charset, pyformat=True)
+                if layout is not None:
+                    values = self._process_params_dict(params)
+                    segments, keys = layout
+                    return _interpolate_params(
+                        segments, [values[key] for key in keys])
+
+            if not isinstance(operation, (bytes, bytearray)):
+                stmt = operation.encode(charset)
+            else:
+                stmt = operation
+        except (UnicodeDecodeError, UnicodeEncodeError) as err:
+            raise errors.ProgrammingError(str(err))
+
+        if isinstance(params, dict):
+            stmt = _bytestr_format_dict(
+                stmt, self._process_params_dict(params))
+        return stmt
+
     def execute(self, operation, params=None, multi=False):
         """Executes the given operation
 
@@ -539,26 +684,7 @@ class MySQLCursor(CursorBase):
         self._connection.handle_unread_result()
 
         self._reset_result()
-        stmt = ''
-
-        try:
-            if not isinstance(operation, (bytes, bytearray)):
-                stmt = operation.encode(self._connection.python_charset)
-            else:
-                stmt = operation
-        except (UnicodeDecodeError, UnicodeEncodeError) as err:
-            raise errors.ProgrammingError(str(err))
-
-        if params is not None:
-            if isinstance(params, dict):
-                stmt = _bytestr_format_dict(
-                    stmt, self._process_params_dict(params))
-            elif isinstance(params, (list, tuple)):
-                psub = _ParamSubstitutor(self._process_params(params))
-                stmt = RE_PY_PARAM.sub(psub, stmt)
-                if psub.remaining != 0:
-                    raise errors.ProgrammingError(
-                        "Not all parameters were used in the SQL statement")
+        stmt = self._prepare_statement(operation, params)
 
         self._executed = stmt
         if multi:
@@ -574,8 +700,13 @@ class MySQLCursor(CursorBase):
             raise
         return None
 
-    def _batch_insert(self, operation, seq_params):
-        """Implements multi row insert"""
+    def _split_batch_insert(self, operation):
+        """Split an INSERT statement around its VALUES row
+
+        Returns a tuple holding the statement before the VALUES row, the
+        row and the statement after it, as bytes, or None when the
+        operation can not be rewritten.
+        """
         def remove_comments(match):
             """Remove comments from INSERT statements.
 
@@ -596,37 +727,103 @@ class MySQLCursor(CursorBase):
                 "Failed rewriting statement for multi-row INSERT. "
                 "Check SQL syntax."
             )
-        fmt = matches.group(1).encode(self._connection.python_charset)
-        values = []
-
         try:
+            fmt = matches.group(1).encode(self._connection.python_charset)
             stmt = operation.encode(self._connection.python_charset)
-            for params in seq_params:
-                tmp = fmt
-                if isinstance(params, dict):
-                    tmp = _bytestr_format_dict(
-                        tmp, self._process_params_dict(params))
-                else:
-                    psub = _ParamSubstitutor(self._process_params(params))
-                    tmp = RE_PY_PARAM.sub(psub, tmp)
-                    if psub.remaining != 0:
-                        raise errors.ProgrammingError(
-                            "Not all parameters were used in the SQL statement")
-                    #for p in self._process_params(params):
-                    #    tmp = tmp.replace(b'%s',p,1)
-                values.append(tmp)
-            if fmt in stmt:
-                stmt = stmt.replace(fmt, b','.join(values), 1)
-                self._executed = stmt
-                return stmt
-            return None
         except (UnicodeDecodeError, UnicodeEncodeError) as err:
             raise errors.ProgrammingError(str(err))
-        except errors.Error:
-            raise
-        except Exception as err:
-            raise errors.InterfaceError(
-                "Failed executing the operation; %s" % err)
+        if fmt not in stmt:
+            return None
+        prefix, _, suffix = stmt.partition(fmt)
+        return prefix, fmt, suffix
+
+    def _batch_insert(self, parts, seq_params, max_size=None):
+        """Implements multi row insert
+
+        The statement parts are the ones returned by _split_batch_insert().
+        The rows of seq_params are consumed while the statements are
+        generated, see _join_batch_insert().
+
+        Returns an iterator over statements.
+        """
+        prefix, fmt, suffix = parts
+        return _join_batch_insert(prefix, suffix,
+                                  self._batch_insert_values(fmt, seq_params),
+                                  max_size)
+
+    def _batch_insert_values(self, fmt, seq_params):
+        """Generate the VALUES rows of a multi row insert
+
+        Returns a generator.
+        """
+        segments = fmt.split(b'%s')
+        pyformat = None if PY2 else _split_pyformat(fmt)
+        for params in seq_params:
+            try:
+                if isinstance(params, dict):
+                    if pyformat is None:
+                        yield _bytestr_format_dict(
+                            fmt, self._process_params_dict(params))
+                        continue
+                    processed = self._process_params_dict(params)
+                    yield _interpolate_params(
+                        pyformat[0], [processed[key] for key in pyformat[1]])
+                else:
+                    yield _interpolate_params(
+                        segments, self._process_params(params))
+            except (UnicodeDecodeError, UnicodeEncodeError) as err:
+                raise errors.ProgrammingError(str(err))
+            except errors.Error:
+                raise
+            except Exception as err:
+                raise errors.InterfaceError(
+                    "Failed executing the operation; %s" % err)
+
+    def _get_batch_insert_size(self):
+        """Returns the maximum size of the statements of a multi row insert
+
+        The size is limited by the max_allowed_packet of the server, see
+        _batch_insert_size().
+        """
+        return _batch_insert_size(self._connection.max_allowed_packet,
+                                  self._batch_insert_max_size)
+
+    def _execute_batch_insert(self, statements):
+        """Execute the statements of a multi row insert
+
+        Each statement is sent before the next one is generated, so that
+        the server executes it meanwhile; its result is read before
+        sending the next statement. The row count is the total of all
+        statements and the last insert ID is the one of the first
+        statement, as when inserting all rows using a single statement.
+        """
+        # pylint: disable=W0212
+        self._reset_result()
+        rowcount = 0
+        last_insert_id = 0
+        sent = False
+        statements = iter(statements)
+        while True:
+            try:
+                stmt = next(statements)
+            except StopIteration:
+                stmt = None
+            except Exception:
+                if sent:
+                    self._handle_result(
+                        self._connection._read_query_result())
+                raise
+            if sent:
+                self._handle_result(self._connection._read_query_result())
+                rowcount += self._rowcount
+                last_insert_id = last_insert_id or self._last_insert_id
+            if stmt is None:
+                break
+            self._executed = stmt
+            self._connection._send_query(stmt)
+            sent = True
+        self._rowcount = rowcount
+        self._last_insert_id = last_insert_id
 
     def executemany(self, operation, seq_params):
         """Execute the given operation multiple times
@@ -662,12 +859,11 @@ class MySQLCursor(CursorBase):
 
         # Optimize INSERTs by batching them
         if re.match(RE_SQL_INSERT_STMT, operation):
-            if not seq_params:
-                self._rowcount = 0
+            parts = self._split_batch_insert(operation)
+            if parts is not None:
+                self._execute_batch_insert(self._batch_insert(
+                    parts, seq_params, self._get_batch_insert_size()))
                 return None
-            stmt = self._batch_insert(operation, seq_params)
-            if stmt is not None:
-                return self.execute(stmt)
 
         rowcnt = 0
         try:
@@ -840,13 +1036,81 @@ class MySQLCursor(CursorBase):
             raise errors.get_mysql_exception(
                 self._warnings[0][1], self._warnings[0][2])
 
+    def _read_batch(self, count, raw=False):
+        """Reads the next rows of the result set ahead of fetching them
+
+        The rows are read and converted with a single call and kept in
+        reverse order, so they are taken from the end of the list. No more
+        rows are read once they reach read_ahead_size bytes, at least one
+        row is read.
+        """
+        (rows, eof) = self._connection.get_rows(
+            count=count, binary=self._binary, columns=self.description,
+            raw=raw, max_size=self.read_ahead_size)
+        rows.reverse()
+        self._batch = rows
+        if eof is None:
+            return
+        if rows:
+            # The result set is reported as unread until these rows are
+            # fetched, see _handle_batch_eof()
+            self._batch_eof = eof
+            self._connection.unread_result = True
+            self._connection._rows_read_ahead = True  # pylint: disable=W0212
+        else:
+            self._handle_eof(eof)
+
+    def _handle_batch_eof(self):
+        """Handles the EOF packet read with the rows read ahead
+
+        The EOF packet is handled once all rows read ahead were fetched,
+        unless the connection consumed the result set meanwhile.
+        """
+        if self._batch_eof is None or self._batch:
+            return
+        eof = self._batch_eof
+        self._batch_eof = None
+        if self._connection._rows_read_ahead:  # pylint: disable=W0212
+            self._handle_eof(eof)
+
+    def _take_read_ahead(self):
+        """Returns the rows read ahead which were not fetched yet
+
+        Returns a list.
+        """
+        rows = self._batch[::-1]
+        self._batch = []
+        if self._nextrow[0]:
+            rows.append(self._nextrow[0])
+            self._nextrow = (None, None)
+        return rows
+
     def _fetch_row(self, raw=False):
         """Returns the next row in the result set
 
         Returns a tuple or None.
         """
+        if self._batch:
+            row = self._batch.pop()
+            self._handle_batch_eof()
+            if not self._batch and self._have_unread_result():
+                # Read ahead to detect the end of the result set
+                self._read_batch(self._read_batch_size, raw)
+            if self._rowcount == -1:
+                self._rowcount = 1
+            else:
+                self._rowcount += 1
+            return row
+
         if not self._have_unread_result():
             return None
+
+        if self._read_batch_size > 1 and self._nextrow == (None, None):
+            self._read_batch(self._read_batch_size, raw)
+            if not self._batch:
+                return None
+            return self._fetch_row(raw)
+
         row = None
 
         if self._nextrow == (None, None):
@@ -880,29 +1144,89 @@ class MySQLCursor(CursorBase):
             return row
         return None
 
+    def _fetch_rows(self, size, raw=False):
+        """Returns up to size rows of the result set
+
+        The rows are taken from batches read with a single call, instead of
+        reading them one by one.
+
+        Returns a list.
+        """
+        rows = self._take_read_ahead() if self._nextrow[0] else []
+        while len(rows) < size:
+            if not self._batch:
+                if not self._have_unread_result():
+                    break
+                self._read_batch(max(size - len(rows), self._read_batch_size),
+                                 raw)
+                continue
+            count = size - len(rows)
+            batch = self._batch[-count:]
+            del self._batch[-count:]
+            batch.reverse()
+            rows.extend(batch)
+            self._handle_batch_eof()
+        if not self._batch and self._have_unread_result():
+            # Read ahead to detect the end of the result set
+            self._read_batch(self._read_batch_size, raw)
+        if rows:
+            if self._rowcount == -1:
+                self._rowcount = 0
+            self._rowcount += len(rows)
+        return rows
+
+    def _fetch_all_rows(self, raw=None):
+        """Returns the remaining rows of the result set
+
+        Returns a list.
+        """
+        rows = self._take_read_ahead()
+        self._handle_batch_eof()
+        if self._have_unread_result():
+            (tail, eof) = self._connection.get_rows(raw=raw)
+            rows.extend(tail)
+            self._handle_eof(eof)
+        elif not rows:
+            raise errors.InterfaceError(ERR_NO_RESULT_TO_FETCH)
+        if self._rowcount == -1:
+            self._rowcount = 0
+        self._rowcount += len(rows)
+        return rows
+
     def fetchmany(self, size=None):
-        res = []
-        cnt = (size or self.arraysize)
-        while cnt > 0 and self._have_unread_result():
-            cnt -= 1
-            row = self.fetchone()
-            if row:
-                res.append(row)
-        return res
+        return self._fetch_rows(size or self.arraysize)
 
     def fetchall(self):
-        if not self._have_unread_result():
-            raise errors.InterfaceError("No result set to fetch from.")
-        (rows, eof) = self._connection.get_rows()
-        if self._nextrow[0]:
-            rows.insert(0, self._nextrow[0])
+        return self._fetch_all_rows()
 
-        self._handle_eof(eof)
-        rowcount = len(rows)
-        if rowcount >= 0 and self._rowcount == -1:
+    def _fetch_columnar_rows(self, size):
+        """Fetch the rows converted by fetch_arrays()
+
+        The rows are read without converting their values, fetch_arrays()
+        converts them straight into the column arrays.
+        """
+        segments = []
+        rows = self._take_read_ahead()
+        if rows:
+            # Rows already read and converted by fetchone()
+            if size is not None and len(rows) > size:
+                self._batch = rows[size:][::-1]
+                rows = rows[:size]
+            self._handle_batch_eof()
+            segments.append((rows, self._raw))
+            if size is not None:
+                size -= len(rows)
+        if size != 0 and self._have_unread_result():
+            (rows, eof) = self._connection.get_rows(count=size, raw=True)
+            segments.append((rows, True))
+            if eof is not None:
+                self._handle_eof(eof)
+        rowcount = sum([len(rows) for rows, _ in segments])
+        if self._rowcount == -1:
             self._rowcount = 0
         self._rowcount += rowcount
-        return rows
+        to_python = None if self._raw else self._connection.converter.to_python
+        return segments, to_python
 
     @property
     def column_names(self):
@@ -1019,6 +1343,14 @@ class MySQLCursorBuffered(MySQLCursor):
 
         return res
 
+    def _fetch_columnar_rows(self, size):
+        if self._rows is None:
+            raise errors.InterfaceError("No result set to fetch from.")
+        end = len(self._rows) if size is None else self._next_row + size
+        rows = self._rows[self._next_row:end]
+        self._next_row += len(rows)
+        return [(rows, self._raw)], None
+
     @property
     def with_rows(self):
         return self._rows is not None
@@ -1038,18 +1370,11 @@ class MySQLCursorRaw(MySQLCursor):
             return row
         return None
 
+    def fetchmany(self, size=None):
+        return self._fetch_rows(size or self.arraysize, raw=True)
+
     def fetchall(self):
-        if not self._have_unread_result():
-            raise errors.InterfaceError("No result set to fetch from.")
-        (rows, eof) = self._connection.get_rows(raw=True)
-        if self._nextrow[0]:
-            rows.insert(0, self._nextrow[0])
-        self._handle_eof(eof)
-        rowcount = len(rows)
-        if rowcount >= 0 and self._rowcount == -1:
-            self._rowcount = 0
-        self._rowcount += rowcount
-        return rows
+        return self._fetch_all_rows(raw=True)
 
 
 class MySQLCursorBufferedRaw(MySQLCursorBuffered):
@@ -1089,6 +1414,13 @@ class MySQLCursorBufferedRaw(MySQLCursorBuffered):
 class MySQLCursorPrepared(MySQLCursor):
     """Cursor using MySQL Prepared Statements
     """
+
+    # Rows are fetched one by one when a server side cursor is used
+    _read_batch_size = 1
+    # Number of executions a pipelined executemany() sends before reading
+    # their results
+    _pipeline_size = 256
+
     def __init__(self, connection=None):
         super(MySQLCursorPrepared, self).__init__(connection)
         self._rows = None
@@ -1098,11 +1430,25 @@ class MySQLCursorPrepared(MySQLCursor):
         self._have_result = None
         self._last_row_sent = False
         self._cursor_exists = False
+        self._statement = None
+        self._prepared_call = False
+
+    def _statement_cached(self):
+        """Check whether the connection caches the prepared statements
+
+        Cached statements are closed by the connection, not by the cursor.
+
+        Returns True or False.
+        """
+        # pylint: disable=W0212
+        return self._connection._prepared_statements is not None
 
     def reset(self, free=True):
         if self._prepared:
             try:
-                self._connection.cmd_stmt_close(self._prepared['statement_id'])
+                if not self._statement_cached():
+                    self._connection.cmd_stmt_close(
+                        self._prepared['statement_id'])
             except errors.Error:
                 # We tried to deallocate, but it's OK when we fail.
                 pass
@@ -1167,48 +1513,86 @@ class MySQLCursorPrepared(MySQLCursor):
             elif 'server_status' in result[2]:
                 self._handle_server_status(result[2]['server_status'])
 
-    def execute(self, operation, params=(), multi=False):  # multi is unused
-        """Prepare and execute a MySQL Prepared Statement
+    def _prepare_operation(self, operation):
+        """Prepare the operation unless it is the prepared statement
 
-        This method will preare the given operation and execute it using
-        the optionally given parameters.
-
-        If the cursor instance already had a prepared statement, it is
-        first closed.
+        If the cursor instance already had another prepared statement, it is
+        first closed. When the connection caches prepared statements, they
+        are looked up on each execution since other cursors can evict them.
         """
+        cached = self._statement_cached()
         if operation is not self._executed:
-            if self._prepared:
-                self._connection.cmd_stmt_close(self._prepared['statement_id'])
+            if self._prepared and not cached:
+                self._connection.cmd_stmt_close(
+                    self._prepared['statement_id'])
 
-            self._executed = operation
+            self._executed = None
+            statement = operation
             try:
-                if not isinstance(operation, bytes):
+                if not isinstance(statement, bytes):
                     charset = self._connection.charset
                     if charset == 'utf8mb4':
                         charset = 'utf8'
-                    operation = operation.encode(charset)
+                    statement = statement.encode(charset)
             except (UnicodeDecodeError, UnicodeEncodeError) as err:
                 raise errors.ProgrammingError(str(err))
 
             # need to convert %s to ? before sending it to MySQL
-            if b'%s' in operation:
-                operation = re.sub(RE_SQL_FIND_PARAM, b'?', operation)
+            if b'%s' in statement:
+                statement = re.sub(RE_SQL_FIND_PARAM, b'?', statement)
+            self._executed = operation
+            self._statement = statement
+            self._prepared_call = RE_SQL_CALL.match(statement) is not None
+        elif not cached:
+            return
 
-            try:
-                self._prepared = self._connection.cmd_stmt_prepare(operation)
-            except errors.Error:
-                self._executed = None
-                raise
+        try:
+            self._prepared = self._connection.cmd_stmt_prepare(
+                self._statement)
+        except errors.Error:
+            self._executed = None
+            raise
+
+    def _reset_statement(self):
+        """Reset the prepared statement when needed
+
+        The statement is only reset on the MySQL server when long data was
+        sent or a server side cursor was opened executing it.
+        """
+        # pylint: disable=W0212
+        statement_id = self._prepared['statement_id']
+        if (self._cursor_exists or
+                statement_id in self._connection._stmt_long_data):
+            self._connection.cmd_stmt_reset(statement_id)
 
-        self._connection.cmd_stmt_reset(self._prepared['statement_id'])
+    def _check_params(self, params):
+        """Check the number of parameters given for the prepared statement
 
+        Returns False when the statement should not be executed.
+        """
         if self._prepared['parameters'] and not params:
-            return
+            return False
         elif len(self._prepared['parameters']) != len(params):
             raise errors.ProgrammingError(
                 errno=1210,
                 msg="Incorrect number of arguments " \
                     "executing prepared statement")
+        return True
+
+    def execute(self, operation, params=(), multi=False):  # multi is unused
+        """Prepare and execute a MySQL Prepared Statement
+
+        This method will preare the given operation and execute it using
+        the optionally given parameters.
+
+        If the cursor instance already had a prepared statement, it is
+        first closed.
+        """
+        self._prepare_operation(operation)
+        self._reset_statement()
+
+        if not self._check_params(params):
+            return
 
         res = self._connection.cmd_stmt_execute(
             self._prepared['statement_id'],
@@ -1216,7 +1600,93 @@ class MySQLCursorPrepared(MySQLCursor):
             parameters=self._prepared['parameters'])
         self._handle_result(res)
 
-    def executemany(self, operation, seq_params):
+    def _can_pipeline(self):
+        """Check whether executions of the prepared statement can be pipelined
+
+        Only statements without result set are pipelined. Warnings are
+        fetched using another statement, so they must not be requested.
+
+        Returns True or False.
+        """
+        return not (self._prepared['columns'] or self._prepared_call or
+                    self._connection.get_warnings)
+
+    def _read_pipelined_results(self, count):
+        """Read the results of count pipelined executions
+
+        All results are read, even when one of them is an error, keeping
+        the connection usable. The first error is raised afterwards.
+
+        Returns the number of affected rows.
+        """
+        rowcnt = 0
+        error = None
+        statement_id = self._prepared['statement_id']
+        for _ in range(count):
+            try:
+                res = self._connection._read_stmt_execute_result(statement_id)
+            except errors.Error as err:
+                if error is None:
+                    error = err
+                continue
+            self._handle_result(res)
+            rowcnt += self._rowcount
+        if error is not None:
+            raise error
+        return rowcnt
+
+    def _execute_commands(self, commands):
+        """Send pipelined executions and read their results
+
+        Returns the number of affected rows.
+        """
+        count = len(commands)
+        try:
+            self._connection._send_commands(commands)  # pylint: disable=W0212
+        finally:
+            del commands[:]
+        return self._read_pipelined_results(count)
+
+    def _execute_pipelined(self, seq_params):
+        """Execute the prepared statement for each item of seq_params
+
+        Up to _pipeline_size executions are sent to the MySQL server at once
+        before reading their results. Parameters sent as long data are
+        executed one at a time.
+
+        Returns the number of affected rows.
+        """
+        # pylint: disable=W0212
+        make_command = self._connection._make_stmt_execute
+        statement_id = self._prepared['statement_id']
+        parameters = self._prepared['parameters']
+        rowcnt = 0
+        commands = []
+        self._reset_statement()
+        try:
+            for params in seq_params:
+                if not self._check_params(params):
+                    continue
+                if any(isinstance(value, IOBase) for value in params):
+                    if commands:
+                        rowcnt += self._execute_commands(commands)
+                    self.execute(self._executed, params)
+                    rowcnt += self._rowcount
+                    self._reset_statement()
+                    continue
+                commands.append(make_command(statement_id, params, parameters))
+                if len(commands) == self._pipeline_size:
+                    rowcnt += self._execute_commands(commands)
+        except:
+            # Executions prepared before the error are still carried out
+            if commands:
+                self._execute_commands(commands)
+            raise
+        if commands:
+            rowcnt += self._execute_commands(commands)
+        return rowcnt
+
+    def executemany(self, operation, seq_params, pipeline=False):
         """Prepare and execute a MySQL Prepared Statement many times
 
         This method will prepare the given operation and execute with each
@@ -1225,15 +1695,24 @@ class MySQLCursorPrepared(MySQLCursor):
         If the cursor instance already had a prepared statement, it is
         first closed.
 
-        executemany() simply calls execute().
+        executemany() simply calls execute(), unless pipeline is True and
+        the statement does not produce a result set. Executions are then sent
+        without waiting for the result of the previous one. When one of them
+        fails, the executions already sent are still carried out by the
+        MySQL server.
         """
         rowcnt = 0
         try:
-            for params in seq_params:
-                self.execute(operation, params)
-                if self.with_rows and self._have_unread_result():
-                    self.fetchall()
-                rowcnt += self._rowcount
+            if pipeline:
+                self._prepare_operation(operation)
+            if pipeline and self._can_pipeline():
+                rowcnt = self._execute_pipelined(seq_params)
+            else:
+                for params in seq_params:
+                    self.execute(operation, params)
+                    if self.with_rows and self._have_unread_result():
+                        self.fetchall()
+                    rowcnt += self._rowcount
         except (ValueError, TypeError) as err:
             raise errors.InterfaceError(
                 "Failed executing the operation; {error}".format(error=err))
@@ -1278,6 +1757,10 @@ class MySQLCursorPrepared(MySQLCursor):
         self._rowcount = len(rows)
         return rows
 
+    def _fetch_columnar_rows(self, size):
+        # Rows of the binary protocol are converted while being read
+        return MySQLCursorAbstract._fetch_columnar_rows(self, size)
+
 
 class MySQLCursorDict(MySQLCursor):
     """
@@ -1310,23 +1793,17 @@ class MySQLCursorDict(MySQLCursor):
             return self._row_to_python(row, self.description)
         return None
 
+    def fetchmany(self, size=None):
+        """Returns the next set of rows of a query result set
+        """
+        return [self._row_to_python(row, self.description)
+                for row in self._fetch_rows(size or self.arraysize)]
+
     def fetchall(self):
         """Returns all rows of a query result set
         """
-        if not self._have_unread_result():
-            raise errors.InterfaceError(ERR_NO_RESULT_TO_FETCH)
-        (rows, eof) = self._connection.get_rows()
-        if self._nextrow[0]:
-            rows.insert(0, self._nextrow[0])
-        res = []
-        for row in rows:
-            res.append(self._row_to_python(row, self.description))
-        self._handle_eof(eof)
-        rowcount = len(rows)
-        if rowcount >= 0 and self._rowcount == -1:
-            self._rowcount = 0
-        self._rowcount += rowcount
-        return res
+        return [self._row_to_python(row, self.description)
+                for row in self._fetch_all_rows()]
 
 
 class MySQLCursorNamedTuple(MySQLCursor):
@@ -1366,23 +1843,20 @@ class MySQLCursorNamedTuple(MySQLCursor):
             return row
         return None
 
+    def fetchmany(self, size=None):
+        """Returns the next set of rows of a query result set
+        """
+        rows = self._fetch_rows(size or self.arraysize)
+        if hasattr(self._connection, 'converter'):
+            return [self._row_to_python(row, self.description)
+                    for row in rows]
+        return rows
+
     def fetchall(self):
         """Returns all rows of a query result set
         """
-        if not self._have_unread_result():
-            raise errors.InterfaceError(ERR_NO_RESULT_TO_FETCH)
-        (rows, eof) = self._connection.get_rows()
-        if self._nextrow[0]:
-            rows.insert(0, self._nextrow[0])
-        res = [self._row_to_python(row, self.description)
-               for row in rows]
-
-        self._handle_eof(eof)
-        rowcount = len(rows)
-        if rowcount >= 0 and self._rowcount == -1:
-            self._rowcount = 0
-        self._rowcount += rowcount
-        return res
+        return [self._row_to_python(row, self.description)
+                for row in self._fetch_all_rows()]
 
 
 class MySQLCursorBufferedDict(MySQLCursorDict, MySQLCursorBuffered):
@@ -1397,6 +1871,11 @@ class MySQLCursorBufferedDict(MySQLCursorDict, MySQLCursorBuffered):
             return self._row_to_python(row, self.description)
         return None
 
+    def fetchmany(self, size=None):
+        """Returns the next set of rows of a query result set
+        """
+        return MySQLCursorBuffered.fetchmany(self, size)
+
     def fetchall(self):
         """Returns all rows of a query result set
         """
@@ -1422,6 +1901,11 @@ class MySQLCursorBufferedNamedTuple(MySQLCursorNamedTuple, MySQLCursorBuffered):
             return self._row_to_python(row, self.description)
         return None
 
+    def fetchmany(self, size=None):
+        """Returns the next set of rows of a query result set
+        """
+        return MySQLCursorBuffered.fetchmany(self, size)
+
     def fetchall(self):
         """Returns all rows of a query result set
         """
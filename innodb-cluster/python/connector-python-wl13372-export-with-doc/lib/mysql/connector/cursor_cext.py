@@ -42,37 +42,14 @@ from . import errors
 from .errorcode import CR_NO_RESULT_SET
 
 from .cursor import (
-    RE_PY_PARAM, RE_SQL_INSERT_STMT,
+    RE_SQL_INSERT_STMT,
     RE_SQL_ON_DUPLICATE, RE_SQL_COMMENT, RE_SQL_INSERT_VALUES,
-    RE_SQL_SPLIT_STMTS, RE_SQL_FIND_PARAM
+    RE_SQL_SPLIT_STMTS, RE_SQL_FIND_PARAM,
+    _batch_insert_size, _interpolate_params, _join_batch_insert,
+    _params_layout
 )
 
 
-class _ParamSubstitutor(object):
-
-    """
-    Substitutes parameters into SQL statement.
-    """
-
-    def __init__(self, params):
-        self.params = params
-        self.index = 0
-
-    def __call__(self, matchobj):
-        index = self.index
-        self.index += 1
-        try:
-            return self.params[index]
-        except IndexError:
-            raise errors.ProgrammingError(
-                "Not enough parameters for the SQL statement")
-
-    @property
-    def remaining(self):
-        """Returns number of parameters remaining to be substituted"""
-        return len(self.params) - self.index
-
-
 class CMySQLCursor(MySQLCursorAbstract):
 
     """Default cursor for interacting with MySQL using C Extension"""
@@ -80,6 +57,8 @@ class CMySQLCursor(MySQLCursorAbstract):
     _raw = False
     _buffered = False
     _raw_as_string = False
+    # Maximum size of the statements built by executemany() for INSERT
+    _batch_insert_max_size = 16 * 1024 * 1024
 
     def __init__(self, connection):
         """Initialize"""
@@ -236,29 +215,26 @@ class CMySQLCursor(MySQLCursorAbstract):
         stmt = ''
         self.reset()
 
+        prepared = self._cnx.prepare_for_mysql(params) if params else None
         try:
-            if isunicode(operation):
+            if isinstance(prepared, (list, tuple)):
+                stmt = _interpolate_params(
+                    _params_layout(operation, self._cnx.python_charset),
+                    prepared)
+            elif isunicode(operation):
                 stmt = operation.encode(self._cnx.python_charset)
             else:
                 stmt = operation
         except (UnicodeDecodeError, UnicodeEncodeError) as err:
             raise errors.ProgrammingError(str(err))
 
-        if params:
-            prepared = self._cnx.prepare_for_mysql(params)
-            if isinstance(prepared, dict):
-                for key, value in prepared.items():
-                    if PY2:
-                        stmt = stmt.replace("%({0})s".format(key), value)
-                    else:
-                        stmt = stmt.replace("%({0})s".format(key).encode(),
-                                            value)
-            elif isinstance(prepared, (list, tuple)):
-                psub = _ParamSubstitutor(prepared)
-                stmt = RE_PY_PARAM.sub(psub, stmt)
-                if psub.remaining != 0:
-                    raise errors.ProgrammingError(
-                        "Not all parameters were used in the SQL statement")
+        if isinstance(prepared, dict):
+            for key, value in prepared.items():
+                if PY2:
+                    stmt = stmt.replace("%({0})s".format(key), value)
+                else:
+                    stmt = stmt.replace("%({0})s".format(key).encode(),
+                                        value)
 
         try:
             result = self._cnx.cmd_query(stmt, raw=self._raw,
@@ -276,8 +252,13 @@ class CMySQLCursor(MySQLCursorAbstract):
 
         return None
 
-    def _batch_insert(self, operation, seq_params):
-        """Implements multi row insert"""
+    def _split_batch_insert(self, operation):
+        """Split an INSERT statement around its VALUES row
+
+        Returns a tuple holding the statement before the VALUES row, the
+        row and the statement after it, as bytes, or None when the
+        operation can not be rewritten.
+        """
         def remove_comments(match):
             """Remove comments from INSERT statements.
 
@@ -298,36 +279,68 @@ class CMySQLCursor(MySQLCursorAbstract):
                 "Failed rewriting statement for multi-row INSERT. "
                 "Check SQL syntax."
             )
-        fmt = matches.group(1).encode(self._cnx.python_charset)
-        values = []
-
         try:
+            fmt = matches.group(1).encode(self._cnx.python_charset)
             stmt = operation.encode(self._cnx.python_charset)
-            for params in seq_params:
+        except (UnicodeDecodeError, UnicodeEncodeError) as err:
+            raise errors.ProgrammingError(str(err))
+        if fmt not in stmt:
+            return None
+        prefix, _, suffix = stmt.partition(fmt)
+        return prefix, fmt, suffix
+
+    def _batch_insert(self, parts, seq_params, max_size=None):
+        """Implements multi row insert
+
+        The statement parts are the ones returned by _split_batch_insert().
+        The rows of seq_params are consumed while the statements are
+        generated, see cursor._join_batch_insert().
+
+        Returns an iterator over statements.
+        """
+        prefix, fmt, suffix = parts
+        return _join_batch_insert(prefix, suffix,
+                                  self._batch_insert_values(fmt, seq_params),
+                                  max_size)
+
+    def _batch_insert_values(self, fmt, seq_params):
+        """Generate the VALUES rows of a multi row insert
+
+        Returns a generator.
+        """
+        segments = fmt.split(b'%s')
+        for params in seq_params:
+            try:
                 tmp = fmt
                 prepared = self._cnx.prepare_for_mysql(params)
                 if isinstance(prepared, dict):
                     for key, value in prepared.items():
                         tmp = tmp.replace("%({0})s".format(key).encode(), value)
                 elif isinstance(prepared, (list, tuple)):
-                    psub = _ParamSubstitutor(prepared)
-                    tmp = RE_PY_PARAM.sub(psub, tmp)
-                    if psub.remaining != 0:
-                        raise errors.ProgrammingError(
-                            "Not all parameters were used in the SQL statement")
-                values.append(tmp)
-
-            if fmt in stmt:
-                stmt = stmt.replace(fmt, b','.join(values), 1)
-                self._executed = stmt
-                return stmt
-            return None
-        except (UnicodeDecodeError, UnicodeEncodeError) as err:
-            raise errors.ProgrammingError(str(err))
-        except Exception as err:
-            raise errors.InterfaceError(
-                "Failed executing the operation; %s" % err)
+                    tmp = _interpolate_params(segments, prepared)
+            except (UnicodeDecodeError, UnicodeEncodeError) as err:
+                raise errors.ProgrammingError(str(err))
+            except Exception as err:
+                raise errors.InterfaceError(
+                    "Failed executing the operation; %s" % err)
+            yield tmp
+
+    def _execute_batch_insert(self, statements):
+        """Execute the statements of a multi row insert
 
+        The row count is the total of all statements and the last insert
+        ID is the one of the first statement, as when inserting all rows
+        using a single statement.
+        """
+        affected_rows = 0
+        insert_id = 0
+        for stmt in statements:
+            self.execute(stmt)
+            affected_rows += self._affected_rows
+            insert_id = insert_id or self._insert_id
+        self._affected_rows = affected_rows
+        self._insert_id = insert_id
+        self._rowcount = -1
 
     def executemany(self, operation, seq_params):
         """Execute the given operation multiple times"""
@@ -338,18 +351,24 @@ class CMySQLCursor(MySQLCursorAbstract):
             raise errors.ProgrammingError("Cursor is not connected")
         self._cnx.handle_unread_result()
 
-        if not isinstance(seq_params, (list, tuple)):
-            raise errors.ProgrammingError(
-                "Parameters for query must be list or tuple.")
-
         # Optimize INSERTs by batching them
         if re.match(RE_SQL_INSERT_STMT, operation):
-            if not seq_params:
-                self._rowcount = 0
+            try:
+                _ = iter(seq_params)
+            except TypeError:
+                raise errors.ProgrammingError(
+                    "Parameters for query must be an Iterable.")
+            parts = self._split_batch_insert(operation)
+            if parts is not None:
+                max_size = _batch_insert_size(self._cnx.max_allowed_packet,
+                                              self._batch_insert_max_size)
+                self._execute_batch_insert(
+                    self._batch_insert(parts, seq_params, max_size))
                 return None
-            stmt = self._batch_insert(operation, seq_params)
-            if stmt is not None:
-                return self.execute(stmt)
+
+        if not isinstance(seq_params, (list, tuple)):
+            raise errors.ProgrammingError(
+                "Parameters for query must be list or tuple.")
 
         rowcnt = 0
         try:
@@ -820,6 +839,27 @@ class CMySQLCursorPrepared(CMySQLCursor):
         self._next_row = 0
         self._binary = True
         self._stmt = None
+        self._statement = None
+
+    def _statement_cached(self):
+        """Check whether the connection caches the prepared statements
+
+        Cached statements are closed by the connection, not by the cursor.
+
+        Returns True or False.
+        """
+        # pylint: disable=W0212
+        return self._cnx._prepared_statements is not None
+
+    def _statement_evicted(self):
+        """Check whether the connection closed the cached statement
+
+        Returns True or False.
+        """
+        # pylint: disable=W0212
+        cache = self._cnx._prepared_statements
+        return (cache is not None and
+                cache.peek(self._statement) is not self._stmt)
 
     def _handle_eof(self):
         """Handle EOF packet"""
@@ -878,13 +918,14 @@ class CMySQLCursorPrepared(CMySQLCursor):
         """
         if self._stmt:
             self.reset()
-            self._cnx.cmd_stmt_close(self._stmt)
+            if not self._statement_cached():
+                self._cnx.cmd_stmt_close(self._stmt)
             self._stmt = None
         super(CMySQLCursorPrepared, self).close()
 
     def reset(self, free=True):
         """Resets the prepared statement."""
-        if self._stmt:
+        if self._stmt and not self._statement_evicted():
             self._cnx.cmd_stmt_reset(self._stmt)
         super(CMySQLCursorPrepared, self).reset(free=free)
 
@@ -905,27 +946,34 @@ class CMySQLCursorPrepared(CMySQLCursor):
 
         self._cnx.handle_unread_result(prepared=True)
 
+        # Cached statements are looked up on each execution since other
+        # cursors can evict them
+        cached = self._statement_cached()
         if operation is not self._executed:
-            if self._stmt:
+            if self._stmt and not cached:
                 self._cnx.cmd_stmt_close(self._stmt)
+            self._stmt = None
 
-            self._executed = operation
-
+            self._executed = None
+            statement = operation
             try:
-                if not isinstance(operation, bytes):
+                if not isinstance(statement, bytes):
                     charset = self._cnx.charset
                     if charset == "utf8mb4":
                         charset = "utf8"
-                    operation = operation.encode(charset)
+                    statement = statement.encode(charset)
             except (UnicodeDecodeError, UnicodeEncodeError) as err:
                 raise errors.ProgrammingError(str(err))
 
             # need to convert %s to ? before sending it to MySQL
-            if b"%s" in operation:
-                operation = re.sub(RE_SQL_FIND_PARAM, b"?", operation)
+            if b"%s" in statement:
+                statement = re.sub(RE_SQL_FIND_PARAM, b"?", statement)
+            self._executed = operation
+            self._statement = statement
 
+        if self._stmt is None or cached:
             try:
-                self._stmt = self._cnx.cmd_stmt_prepare(operation)
+                self._stmt = self._cnx.cmd_stmt_prepare(self._statement)
             except (errors.Error, errors.ProgrammingError):
                 self._stmt = None
                 raise
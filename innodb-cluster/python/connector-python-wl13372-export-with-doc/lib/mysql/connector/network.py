@@ -86,6 +86,7 @@ class BaseMySQLSocket(object):
         self._packet_number = -1
         self._compressed_packet_number = -1
         self._packet_queue = deque()
+        self._recv_buffer = bytearray(b'')
         self.recvsize = 8192
 
     @property
@@ -154,6 +155,27 @@ class BaseMySQLSocket(object):
 
     send = send_plain
 
+    def send_commands(self, bufs):
+        """Send several commands to the MySQL server in a single write
+
+        The packets of each command are numbered starting with 0.
+        """
+        self._packet_number = 0
+        packets = []
+        for buf in bufs:
+            packets.extend(_prepare_packets(buf, 0))
+        data = b''.join(packets)
+        try:
+            if PY2:
+                self.sock.sendall(buffer(data))  # pylint: disable=E0602
+            else:
+                self.sock.sendall(data)
+        except IOError as err:
+            raise errors.OperationalError(
+                errno=2055, values=(self.get_address(), _strioerror(err)))
+        except AttributeError:
+            raise errors.OperationalError(errno=2006)
+
     def send_compressed(self, buf, packet_number=None,
                         compressed_packet_number=None):
         """Send compressed packets to the MySQL server"""
@@ -240,43 +262,41 @@ class BaseMySQLSocket(object):
                 raise errors.OperationalError(errno=2006)
 
     def recv_plain(self):
-        """Receive packets from the MySQL server"""
+        """Receive packets from the MySQL server
+
+        The data is read from the socket in chunks of at least recvsize
+        bytes, the data following the packet is kept for the next calls.
+        """
         try:
-            # Read the header of the MySQL packet, 4 bytes
-            packet = bytearray(b'')
-            packet_len = 0
-            while packet_len < 4:
-                chunk = self.sock.recv(4 - packet_len)
-                if not chunk:
-                    raise errors.InterfaceError(errno=2013)
-                packet += chunk
-                packet_len = len(packet)
+            buf = self._recv_buffer
+            if len(buf) < 4:
+                self._fill_recv_buffer(4)
 
             # Save the packet number and payload length
-            self._packet_number = packet[3]
-            if PY2:
-                payload_len = struct.unpack_from(
-                    "<I",
-                    buffer(packet[0:3] + b'\x00'))[0]  # pylint: disable=E0602
-            else:
-                payload_len = struct.unpack("<I", packet[0:3] + b'\x00')[0]
+            self._packet_number = buf[3]
+            packet_len = (buf[0] | buf[1] << 8 | buf[2] << 16) + 4
 
             # Read the payload
-            rest = payload_len
-            packet.extend(bytearray(payload_len))
-            packet_view = memoryview(packet)  # pylint: disable=E0602
-            packet_view = packet_view[4:]
-            while rest:
-                read = self.sock.recv_into(packet_view, rest)
-                if read == 0 and rest > 0:
-                    raise errors.InterfaceError(errno=2013)
-                packet_view = packet_view[read:]
-                rest -= read
+            if len(buf) < packet_len:
+                self._fill_recv_buffer(packet_len)
+            packet = buf[0:packet_len]
+            del buf[0:packet_len]
             return packet
         except IOError as err:
+            del self._recv_buffer[:]
             raise errors.OperationalError(
                 errno=2055, values=(self.get_address(), _strioerror(err)))
 
+    def _fill_recv_buffer(self, size):
+        """Read from the socket until the receive buffer holds size bytes"""
+        buf = self._recv_buffer
+        while len(buf) < size:
+            chunk = self.sock.recv(max(self.recvsize, size - len(buf)))
+            if not chunk:
+                del buf[:]
+                raise errors.InterfaceError(errno=2013)
+            buf += chunk
+
     def recv_py26_plain(self):
         """Receive packets from the MySQL server"""
         try:
@@ -30,6 +30,8 @@
 """
 
 import re
+from bisect import bisect_left
+from collections import deque
 from uuid import uuid4
 # pylint: disable=F0401
 try:
@@ -39,6 +41,8 @@ except ImportError:
     import Queue as queue
 # pylint: enable=F0401
 import threading
+import time
+import weakref
 
 from . import errors
 from .connection import MySQLConnection
@@ -47,6 +51,13 @@ CONNECTION_POOL_LOCK = threading.RLock()
 CNX_POOL_MAXSIZE = 32
 CNX_POOL_MAXNAMESIZE = 64
 CNX_POOL_NAMEREGEX = re.compile(r'[^a-zA-Z0-9._:\-*$#]')
+# Upper bounds, in seconds, of the checkout wait time histogram buckets
+CNX_POOL_WAIT_BUCKETS = (0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10)
+
+try:
+    _clock = time.monotonic  # pylint: disable=C0103
+except AttributeError:
+    _clock = time.time  # pylint: disable=C0103
 
 
 def generate_pool_name(**kwargs):
@@ -115,12 +126,24 @@ class PooledMySQLConnection(object):
         can be reused.
 
         When the pool is configured to reset the session, the session
-        state will be cleared by re-authenticating the user.
+        state will be cleared by re-authenticating the user. When the pool
+        has a ping interval, the connection is not pinged before the reset
+        and is marked as checked so the next checkout can skip the ping.
         """
         try:
             cnx = self._cnx
-            if self._cnx_pool.reset_session:
-                cnx.reset_session()
+            pool = self._cnx_pool
+            if pool.reset_session:
+                if pool.ping_interval:
+                    # pylint: disable=W0212
+                    cnx._reset_session()
+                    pool._count("pings_avoided")
+                    # pylint: enable=W0212
+                else:
+                    cnx.reset_session()
+            # pylint: disable=W0201,W0212
+            cnx._pool_last_used = _clock()
+            # pylint: enable=W0201,W0212
         finally:
             self._cnx_pool.add_connection(cnx)
             self._cnx = None
@@ -141,29 +164,124 @@ class PooledMySQLConnection(object):
 class MySQLConnectionPool(object):
     """Class defining a pool of MySQL connections"""
     def __init__(self, pool_size=5, pool_name=None, pool_reset_session=True,
-                 **kwargs):
+                 pool_ping_interval=0, pool_max_lifetime=None,
+                 pool_validation_interval=None, pool_min_size=None,
+                 pool_max_size=None, pool_max_idle_time=None,
+                 pool_open_threads=1, **kwargs):
         """Initialize
 
         Initialize a MySQL connection pool with a maximum number of
         connections set to pool_size. The rest of the keywords
         arguments, kwargs, are configuration arguments for MySQLConnection
         instances.
+
+        All pool_size connections are opened when the pool is created,
+        unless pool_min_size or pool_max_size is given. The pool then opens
+        pool_min_size connections (0 by default) when created and further
+        connections on demand, up to pool_max_size (pool_size by default).
+        With such an elastic pool, the following arguments can be used:
+
+        pool_max_idle_time: connections above pool_min_size which stayed
+            idle longer than this many seconds are closed. None, the
+            default, keeps them open.
+        pool_open_threads: number of threads opening the connections
+            needed to reach pool_min_size in parallel. Defaults to 1.
+
+        The health of the connections is controlled with the following
+        arguments, all in seconds:
+
+        pool_ping_interval: connections returned to the pool less than this
+            long ago are handed out without pinging the server. The default,
+            0, pings on every checkout.
+        pool_max_lifetime: connections opened longer than this ago are
+            reconnected on checkout. None, the default, means no limit.
+        pool_validation_interval: when set, a background thread pings the
+            idle connections every pool_validation_interval seconds, so
+            long-idle connections found stale are replaced before they are
+            handed out.
         """
-        self._pool_size = None
-        self._pool_name = None
+        self._init_state()
         self._reset_session = pool_reset_session
-        self._set_pool_size(pool_size)
+        if pool_min_size is None and pool_max_size is None:
+            self._open_on_demand = False
+            self._set_size_limits(pool_size, pool_size)
+        else:
+            self._open_on_demand = True
+            self._set_size_limits(
+                pool_min_size or 0,
+                pool_size if pool_max_size is None else pool_max_size)
         self._set_pool_name(pool_name or generate_pool_name(**kwargs))
-        self._cnx_config = {}
-        self._cnx_queue = queue.Queue(self._pool_size)
-        self._config_version = uuid4()
+        self._set_health_policy(pool_ping_interval, pool_max_lifetime,
+                                pool_validation_interval)
+        if pool_max_idle_time is not None and pool_max_idle_time <= 0:
+            raise AttributeError(
+                "Pool max idle time should be a positive number")
+        if pool_open_threads < 1:
+            raise AttributeError(
+                "Pool open threads should be higher than 0")
+        self._max_idle_time = pool_max_idle_time
+        self._open_threads = pool_open_threads
+        # Most recently returned connections are handed out first, so the
+        # connections left at the bottom are the ones idle the longest
+        self._cnx_queue = queue.LifoQueue(self._pool_size)
 
         if kwargs:
             self.set_config(**kwargs)
-            cnt = 0
-            while cnt < self._pool_size:
-                self.add_connection()
-                cnt += 1
+            self._fill()
+
+        intervals = [interval for interval in (
+            self._validation_interval,
+            self._max_idle_time if self._open_on_demand else None)
+                     if interval]
+        if intervals:
+            thread = threading.Thread(
+                target=_maintain_pool,
+                args=(weakref.ref(self), min(intervals),
+                      self._validation_stop),
+                name="{0}-maintenance".format(self._pool_name))
+            thread.daemon = True
+            thread.start()
+
+    def __del__(self):
+        # __init__() might have failed before creating the event
+        validation_stop = getattr(self, "_validation_stop", None)
+        if validation_stop is not None:
+            validation_stop.set()
+
+    def _init_state(self):
+        """Create the state shared with AsyncMySQLConnectionPool
+
+        Sizes and health policy are set to their defaults; __init__()
+        overrides them using its arguments.
+        """
+        self._validation_stop = threading.Event()
+        self._lock = threading.RLock()
+        self._waiters = deque()
+        self._pool_size = None
+        self._min_size = None
+        self._pool_name = None
+        self._open_on_demand = False
+        self._ping_interval = 0
+        self._max_lifetime = None
+        self._validation_interval = None
+        self._next_validation = None
+        self._max_idle_time = None
+        self._open_threads = 1
+        self._cnx_config = {}
+        self._connections = set()
+        self._slots = 0
+        self._config_version = uuid4()
+        self._stats = {
+            "pings": 0,
+            "pings_avoided": 0,
+            "stale_connections": 0,
+            "retired_connections": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "opened_connections": 0,
+            "evicted_connections": 0,
+        }
+        self._wait_histogram = [0] * (len(CNX_POOL_WAIT_BUCKETS) + 1)
 
     @property
     def pool_name(self):
@@ -175,11 +293,79 @@ class MySQLConnectionPool(object):
         """Return number of connections managed by the pool"""
         return self._pool_size
 
+    @property
+    def min_size(self):
+        """Return the number of connections kept open by the pool"""
+        return self._min_size
+
+    @property
+    def max_idle_time(self):
+        """Return the idle time after which extra connections are closed"""
+        return self._max_idle_time
+
+    @property
+    def open_connections(self):
+        """Return the number of connections opened by the pool"""
+        return self._slots
+
     @property
     def reset_session(self):
         """Return whether to reset session"""
         return self._reset_session
 
+    @property
+    def ping_interval(self):
+        """Return the idle time under which checkouts skip the ping"""
+        return self._ping_interval
+
+    @property
+    def max_lifetime(self):
+        """Return the time after which connections are reconnected"""
+        return self._max_lifetime
+
+    @property
+    def stats(self):
+        """Return the health check counters of the pool
+
+        The dictionary holds the number of pings sent ('pings'), the number
+        of pings skipped because the connection was used recently
+        ('pings_avoided'), the number of connections found broken by a ping
+        ('stale_connections'), the number of connections reconnected
+        because they exceeded the maximum lifetime ('retired_connections'),
+        the number of checkouts which had to wait for a connection ('waits'),
+        the number of them which timed out ('timeouts'), the number of
+        connections opened ('opened_connections') and the number of
+        connections closed after being idle too long ('evicted_connections').
+
+        Returns a dict.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    @property
+    def wait_histogram(self):
+        """Return the histogram of the checkout wait times
+
+        Every get_connection() call is counted in the first bucket whose
+        upper bound, in seconds, is greater or equal to its wait time. The
+        last bucket has no upper bound and is reported as None.
+
+        Returns a list of (upper bound, count) tuples.
+        """
+        with self._lock:
+            return list(zip(CNX_POOL_WAIT_BUCKETS + (None,),
+                            self._wait_histogram))
+
+    @property
+    def waiting(self):
+        """Return the number of requests waiting for a connection"""
+        return len(self._waiters)
+
+    def _count(self, name):
+        """Increment a health check counter"""
+        with self._lock:
+            self._stats[name] += 1
+
     def set_config(self, **kwargs):
         """Set the connection configuration for MySQLConnection instances
 
@@ -192,7 +378,7 @@ class MySQLConnectionPool(object):
         if not kwargs:
             return
 
-        with CONNECTION_POOL_LOCK:
+        with self._lock:
             try:
                 test_cnx = MySQLConnection()
                 if "use_pure" in kwargs:
@@ -218,6 +404,69 @@ class MySQLConnectionPool(object):
                 "lower or equal to {0}".format(CNX_POOL_MAXSIZE))
         self._pool_size = pool_size
 
+    def _set_size_limits(self, min_size, max_size):
+        """Set the minimum and maximum number of connections of the pool
+
+        Raises an AttributeError when max_size is not valid, see
+        _set_pool_size(), or when min_size is negative or higher than
+        max_size.
+        """
+        if min_size < 0 or min_size > max_size:
+            raise AttributeError(
+                "Pool minimum size should be 0 or higher and lower or "
+                "equal to the maximum size")
+        self._set_pool_size(max_size)
+        self._min_size = min_size
+
+    def resize(self, min_size=None, max_size=None):
+        """Change the minimum and maximum number of connections
+
+        Sizes which are not given are left unchanged. From then on, the
+        pool opens connections on demand. Idle connections above the new
+        maximum are closed right away, connections in use when they are
+        returned. Connections are opened to reach the new minimum.
+
+        Raises an AttributeError when the sizes are not valid.
+        """
+        excess = []
+        with self._lock:
+            self._set_size_limits(
+                self._min_size if min_size is None else min_size,
+                self._pool_size if max_size is None else max_size)
+            self._open_on_demand = True
+            self._cnx_queue.maxsize = self._pool_size
+            idle = self._cnx_queue.queue
+            while idle and self._slots - len(excess) > self._pool_size:
+                excess.append(idle.pop(0))
+            # Requests waiting on a full pool can open new connections
+            while self._waiters and self._slots < self._pool_size:
+                self._slots += 1
+                self._waiters.popleft().hand_over(None)
+        for cnx in excess:
+            self._close_connection(cnx)
+        if self._cnx_config:
+            self._fill()
+
+    def _set_health_policy(self, ping_interval, max_lifetime,
+                           validation_interval):
+        """Set the connection health policy of the pool
+
+        Raises an AttributeError when ping_interval is negative or when
+        max_lifetime or validation_interval is not a positive number.
+        """
+        if ping_interval is None or ping_interval < 0:
+            raise AttributeError(
+                "Pool ping interval should be 0 or a positive number")
+        if max_lifetime is not None and max_lifetime <= 0:
+            raise AttributeError(
+                "Pool max lifetime should be a positive number")
+        if validation_interval is not None and validation_interval <= 0:
+            raise AttributeError(
+                "Pool validation interval should be a positive number")
+        self._ping_interval = ping_interval
+        self._max_lifetime = max_lifetime
+        self._validation_interval = validation_interval
+
     def _set_pool_name(self, pool_name):
         r"""Set the name of the pool
 
@@ -237,9 +486,8 @@ class MySQLConnectionPool(object):
     def _queue_connection(self, cnx):
         """Put connection back in the queue
 
-        This method is putting a connection back in the queue. It will not
-        acquire a lock as the methods using _queue_connection() will have it
-        set.
+        This method is putting a connection back in the queue, or hands it
+        over to the first request waiting for a connection.
 
         Raises PoolError on errors.
         """
@@ -247,10 +495,14 @@ class MySQLConnectionPool(object):
             raise errors.PoolError(
                 "Connection instance not subclass of MySQLConnection.")
 
-        try:
-            self._cnx_queue.put(cnx, block=False)
-        except queue.Full:
-            errors.PoolError("Failed adding connection; queue is full")
+        with self._lock:
+            if self._waiters:
+                self._waiters.popleft().hand_over(cnx)
+                return
+            try:
+                self._cnx_queue.put(cnx, block=False)
+            except queue.Full:
+                errors.PoolError("Failed adding connection; queue is full")
 
     def add_connection(self, cnx=None):
         """Add a connection to the pool
@@ -265,72 +517,333 @@ class MySQLConnectionPool(object):
         connection can be added (maximum reached) or when the connection
         can not be instantiated.
         """
-        with CONNECTION_POOL_LOCK:
-            if not self._cnx_config:
-                raise errors.PoolError(
-                    "Connection configuration not available")
+        if not self._cnx_config:
+            raise errors.PoolError(
+                "Connection configuration not available")
 
-            if self._cnx_queue.full():
+        if not cnx:
+            self._reserve_slot()
+            try:
+                cnx = self._open_connection()
+            except:
+                self._release_slot()
+                raise
+        elif not isinstance(cnx, MySQLConnection):
+            raise errors.PoolError(
+                "Connection instance not subclass of MySQLConnection.")
+        else:
+            with self._lock:
+                if cnx not in self._connections:
+                    self._reserve_slot()
+                    self._connections.add(cnx)
+                    shrunk = False
+                else:
+                    shrunk = self._slots > self._pool_size
+            if shrunk:
+                # The pool was resized while the connection was in use
+                self._close_connection(cnx)
+                return
+
+        self._queue_connection(cnx)
+        if self._max_idle_time and self._open_on_demand:
+            self._evict_idle_connections()
+
+    def _reserve_slot(self):
+        """Count a connection about to be added to the pool
+
+        Raises PoolError when the pool holds the maximum number of
+        connections.
+        """
+        with self._lock:
+            if self._slots >= self._pool_size:
                 raise errors.PoolError(
                     "Failed adding connection; queue is full")
+            self._slots += 1
 
-            if not cnx:
-                cnx = MySQLConnection(**self._cnx_config)
-                try:
-                    if (self._reset_session and self._cnx_config['compress']
-                            and cnx.get_server_version() < (5, 7, 3)):
-                        raise errors.NotSupportedError("Pool reset session is "
-                                                       "not supported with "
-                                                       "compression for MySQL "
-                                                       "server version 5.7.2 "
-                                                       "or earlier.")
-                except KeyError:
-                    pass
+    def _release_slot(self):
+        """Stop counting a connection which was closed or failed to open
 
-                # pylint: disable=W0201,W0212
-                cnx._pool_config_version = self._config_version
-                # pylint: enable=W0201,W0212
+        When the pool opens connections on demand, the slot is handed over
+        to the first request waiting for a connection, which will open a
+        new one.
+        """
+        with self._lock:
+            if (self._open_on_demand and self._waiters
+                    and self._slots <= self._pool_size):
+                self._waiters.popleft().hand_over(None)
             else:
-                if not isinstance(cnx, MySQLConnection):
-                    raise errors.PoolError(
-                        "Connection instance not subclass of MySQLConnection.")
+                self._slots -= 1
 
-            self._queue_connection(cnx)
+    def _open_connection(self):
+        """Open a new connection for a reserved slot
+
+        Returns a MySQLConnection instance.
+        """
+        cnx = MySQLConnection(**self._cnx_config)
+        try:
+            if (self._reset_session and self._cnx_config['compress']
+                    and cnx.get_server_version() < (5, 7, 3)):
+                cnx.disconnect()
+                raise errors.NotSupportedError("Pool reset session is "
+                                               "not supported with "
+                                               "compression for MySQL "
+                                               "server version 5.7.2 "
+                                               "or earlier.")
+        except KeyError:
+            pass
+
+        # pylint: disable=W0201,W0212
+        cnx._pool_config_version = self._config_version
+        cnx._pool_created = cnx._pool_last_used = _clock()
+        # pylint: enable=W0201,W0212
+        with self._lock:
+            self._connections.add(cnx)
+            self._stats["opened_connections"] += 1
+        return cnx
+
+    def _close_connection(self, cnx):
+        """Close a connection and release its slot"""
+        try:
+            cnx.disconnect()
+        except errors.Error:
+            # Any error when closing means connection is closed
+            pass
+        with self._lock:
+            self._connections.discard(cnx)
+        self._release_slot()
+
+    def _fill(self):
+        """Open connections until the pool holds min_size of them
+
+        The connections are opened by up to pool_open_threads threads in
+        parallel. Each thread stops at its first error.
+
+        Raises the first error met opening a connection.
+        """
+        with self._lock:
+            cnt = max(0, self._min_size - self._slots)
+            self._slots += cnt
+        if not cnt:
+            return
+
+        failures = []
 
-    def get_connection(self):
+        def open_connections(num):
+            """Open num connections for already reserved slots"""
+            for done in range(num):
+                try:
+                    cnx = self._open_connection()
+                except Exception as err:  # pylint: disable=W0703
+                    failures.append(err)
+                    for _ in range(num - done):
+                        self._release_slot()
+                    return
+                self._queue_connection(cnx)
+
+        num_threads = min(self._open_threads, cnt)
+        if num_threads == 1:
+            open_connections(cnt)
+        else:
+            threads = [
+                threading.Thread(target=open_connections,
+                                 args=(cnt // num_threads
+                                       + (num < cnt % num_threads),))
+                for num in range(num_threads)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        if failures:
+            raise failures[0]
+
+    def get_connection(self, timeout=0):
         """Get a connection from the pool
 
         This method returns an PooledMySQLConnection instance which
         has a reference to the pool that created it, and the next available
         MySQL connection.
 
+        When no connection is idle, a new one is opened if the pool opens
+        connections on demand and holds less than pool_size of them.
+        Otherwise the request waits up to timeout seconds for a connection
+        to be returned. Waiting requests are served in
+        FIFO order. A timeout of 0, the default, does not wait and None
+        waits forever.
+
         When the MySQL connection is not connect, a reconnect is attempted.
 
         Raises PoolError on errors.
 
         Returns a PooledMySQLConnection instance.
         """
-        with CONNECTION_POOL_LOCK:
+        cnx = self._acquire(timeout)
+        if cnx is None:
             try:
-                cnx = self._cnx_queue.get(block=False)
-            except queue.Empty:
+                cnx = self._open_connection()
+            except:
+                self._release_slot()
+                raise
+        else:
+            try:
+                self._check_connection(cnx)
+            except errors.InterfaceError:
+                # Failed to reconnect, give connection back to pool
+                self._queue_connection(cnx)
+                raise
+
+        # pylint: disable=W0201,W0212
+        cnx._pool_last_used = None
+        # pylint: enable=W0201,W0212
+        return PooledMySQLConnection(self, cnx)
+
+    def _acquire(self, timeout):
+        """Take a connection from the queue, waiting up to timeout seconds
+
+        A request never takes a connection from the queue, or opens a new
+        one, while others are waiting. The time spent is recorded in the
+        wait histogram.
+
+        Raises PoolError when no connection is available in time.
+
+        Returns a MySQLConnection instance, or None when a slot was
+        reserved to open a new connection.
+        """
+        start = _clock()
+        with self._lock:
+            if not self._waiters:
+                if not self._cnx_queue.empty():
+                    self._record_wait(_clock() - start)
+                    return self._cnx_queue.get(block=False)
+                if self._open_on_demand and self._slots < self._pool_size:
+                    self._slots += 1
+                    self._record_wait(_clock() - start)
+                    return None
+
+            if timeout is not None and timeout <= 0:
+                self._record_wait(_clock() - start)
                 raise errors.PoolError(
                     "Failed getting connection; pool exhausted")
 
-            # pylint: disable=W0201,W0212
-            if not cnx.is_connected() \
-                    or self._config_version != cnx._pool_config_version:
-                cnx.config(**self._cnx_config)
+            self._stats["waits"] += 1
+            waiter = _PoolWaiter(self._lock)
+            self._waiters.append(waiter)
+            try:
+                if not waiter.wait(timeout):
+                    self._waiters.remove(waiter)
+                    self._stats["timeouts"] += 1
+                    raise errors.PoolError(
+                        "Failed getting connection; pool exhausted, timed "
+                        "out after {0} seconds".format(timeout))
+            finally:
+                self._record_wait(_clock() - start)
+            return waiter.cnx
+
+    def _record_wait(self, elapsed):
+        """Count a checkout wait time in the histogram"""
+        with self._lock:
+            self._wait_histogram[
+                bisect_left(CNX_POOL_WAIT_BUCKETS, elapsed)] += 1
+
+    def _check_connection(self, cnx, background=False):
+        """Make sure a connection taken from the queue can be used
+
+        The connection is reconnected when the configuration of the pool
+        changed, when it is older than the maximum lifetime or when it
+        does not answer a ping. The ping is skipped for connections used
+        less than ping_interval seconds ago.
+
+        Raises InterfaceError when reconnecting fails.
+
+        Returns True when the connection was checked, False when the check
+        was skipped.
+        """
+        # pylint: disable=W0201,W0212
+        now = _clock()
+        last_used = getattr(cnx, "_pool_last_used", None)
+        created = getattr(cnx, "_pool_created", now)
+        if self._config_version != getattr(cnx, "_pool_config_version",
+                                           None):
+            pass
+        elif self._max_lifetime and now - created >= self._max_lifetime:
+            self._count("retired_connections")
+        elif last_used is not None and now - last_used < self._ping_interval:
+            if not background:
+                self._count("pings_avoided")
+            return False
+        else:
+            self._count("pings")
+            if cnx.is_connected():
+                return True
+            self._count("stale_connections")
+
+        # Invalidate the timestamp first, a failed reconnect must be retried
+        cnx._pool_last_used = None
+        cnx.config(**self._cnx_config)
+        cnx.reconnect()
+        cnx._pool_config_version = self._config_version
+        cnx._pool_created = _clock()
+        return True
+        # pylint: enable=W0201,W0212
+
+    def _validate_connections(self):
+        """Check the idle connections of the pool
+
+        Every connection idle in the queue is taken out of it in turn and
+        checked without holding the pool lock, so that a slow ping or
+        reconnect does not block the requests for connections. The
+        connection is then queued again, or handed over to a waiting
+        request. Connections used recently are left alone, the others are
+        pinged and reconnected if found stale. Errors are not raised as
+        this runs in the background.
+        """
+        with self._lock:
+            idle = list(self._cnx_queue.queue)
+        for cnx in idle:
+            with self._lock:
                 try:
-                    cnx.reconnect()
-                except errors.InterfaceError:
-                    # Failed to reconnect, give connection back to pool
-                    self._queue_connection(cnx)
-                    raise
-                cnx._pool_config_version = self._config_version
-            # pylint: enable=W0201,W0212
+                    self._cnx_queue.queue.remove(cnx)
+                except ValueError:
+                    # Taken from the queue meanwhile
+                    continue
+            try:
+                if self._check_connection(cnx, background=True):
+                    # pylint: disable=W0201,W0212
+                    cnx._pool_last_used = _clock()
+                    # pylint: enable=W0201,W0212
+            except errors.Error:
+                pass
+            self._queue_connection(cnx)
 
-            return PooledMySQLConnection(self, cnx)
+    def _evict_idle_connections(self):
+        """Close the connections idle longer than max_idle_time
+
+        Connections are closed from the bottom of the queue, where the
+        longest idle ones are, as long as the pool holds more than
+        min_size connections.
+        """
+        now = _clock()
+        evicted = []
+        with self._lock:
+            idle = self._cnx_queue.queue
+            while idle and self._slots - len(evicted) > self._min_size:
+                last_used = getattr(idle[0], "_pool_last_used", None)
+                if (last_used is not None
+                        and now - last_used < self._max_idle_time):
+                    break
+                evicted.append(idle.pop(0))
+            self._stats["evicted_connections"] += len(evicted)
+        for cnx in evicted:
+            self._close_connection(cnx)
+
+    def _maintain(self):
+        """Validate and evict the idle connections when they are due"""
+        if self._validation_interval:
+            now = _clock()
+            if self._next_validation is None or now >= self._next_validation:
+                self._next_validation = now + self._validation_interval
+                self._validate_connections()
+        if self._max_idle_time and self._open_on_demand:
+            self._evict_idle_connections()
 
     def _remove_connections(self):
         """Close all connections
@@ -342,16 +855,19 @@ class MySQLConnectionPool(object):
 
         Returns int.
         """
-        with CONNECTION_POOL_LOCK:
+        with self._lock:
             cnt = 0
             cnxq = self._cnx_queue
             while cnxq.qsize():
                 try:
                     cnx = cnxq.get(block=False)
-                    cnx.disconnect()
-                    cnt += 1
                 except queue.Empty:
                     return cnt
+                self._connections.discard(cnx)
+                self._release_slot()
+                try:
+                    cnx.disconnect()
+                    cnt += 1
                 except errors.PoolError:
                     raise
                 except errors.Error:
@@ -359,3 +875,59 @@ class MySQLConnectionPool(object):
                     pass
 
             return cnt
+
+
+def _maintain_pool(pool_ref, interval, stop):
+    """Periodically validate and evict the idle connections of a pool
+
+    Runs in a daemon thread started by MySQLConnectionPool. Only a weak
+    reference to the pool is kept, the thread ends when the pool is
+    garbage collected.
+    """
+    while not stop.wait(interval):
+        pool = pool_ref()
+        if pool is None:
+            return
+        # pylint: disable=W0212
+        pool._maintain()
+        # pylint: enable=W0212
+        del pool
+
+
+class _PoolWaiter(object):
+    """A request waiting for a connection in a MySQLConnectionPool
+
+    The lock argument is the lock of the pool.
+    """
+    def __init__(self, lock):
+        self._cond = threading.Condition(lock)
+        self._ready = False
+        self.cnx = None
+
+    def hand_over(self, cnx):
+        """Hand over a connection to the waiter
+
+        Must be called holding the pool lock.
+        """
+        self.cnx = cnx
+        self._ready = True
+        self._cond.notify()
+
+    def wait(self, timeout=None):
+        """Wait until a connection is handed over
+
+        Must be called holding the pool lock. The timeout is the maximum
+        number of seconds to wait, None waits forever.
+
+        Returns True if a connection was handed over.
+        """
+        deadline = None if timeout is None else _clock() + timeout
+        while not self._ready:
+            if deadline is None:
+                self._cond.wait()
+                continue
+            remaining = deadline - _clock()
+            if remaining <= 0:
+                return False
+            self._cond.wait(remaining)
+        return True
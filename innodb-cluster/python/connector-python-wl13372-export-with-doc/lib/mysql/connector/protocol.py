@@ -34,7 +34,7 @@ import datetime
 from decimal import Decimal
 
 from .constants import (
-    FieldFlag, ServerCmd, FieldType, ClientFlag)
+    FieldFlag, ServerCmd, FieldType, ClientFlag, ServerFlag, SessionTrackType)
 from . import errors, utils
 from .authentication import get_auth_plugin
 from .catch23 import PY2, struct_unpack
@@ -254,10 +254,45 @@ class MySQLProtocol(object):
             if packet:
                 (packet, ok_packet['info_msg']) = utils.read_lc_string(packet)
                 ok_packet['info_msg'] = ok_packet['info_msg'].decode('utf-8')
+            if packet and ok_packet['status_flag'] & \
+                    ServerFlag.SERVER_SESSION_STATE_CHANGED:
+                ok_packet['session_state'] = self.parse_session_state(
+                    utils.read_lc_string(packet)[1])
         except ValueError:
             raise errors.InterfaceError("Failed parsing OK packet.")
         return ok_packet
 
+    def parse_session_state(self, data):
+        """Parse the session state changes found in an OK-packet
+
+        Each change is returned as a tuple holding the type, as defined in
+        SessionTrackType, and its value. The value of a system variable
+        change is a tuple with the name and the value of the variable.
+        Changes of unknown type are skipped.
+
+        Returns a list.
+        """
+        changes = []
+        while data:
+            (data, track_type) = utils.read_int(data, 1)
+            (data, value) = utils.read_lc_string(data)
+            if track_type == SessionTrackType.SYSTEM_VARIABLES:
+                (value, name) = utils.read_lc_string(value)
+                value = (name.decode('utf-8'),
+                         utils.read_lc_string(value)[1].decode('utf-8'))
+            elif track_type == SessionTrackType.GTIDS:
+                # The first byte is the encoding specification
+                value = utils.read_lc_string(value[1:])[1].decode('utf-8')
+            elif track_type in (SessionTrackType.SCHEMA,
+                                SessionTrackType.STATE_CHANGE,
+                                SessionTrackType.TRANSACTION_CHARACTERISTICS,
+                                SessionTrackType.TRANSACTION_STATE):
+                value = utils.read_lc_string(value)[1].decode('utf-8')
+            else:
+                continue
+            changes.append((track_type, value))
+        return changes
+
     def parse_column_count(self, packet):
         """Parse a MySQL packet with the number of columns in result set"""
         try:
@@ -339,10 +374,11 @@ class MySQLProtocol(object):
                         "{0} ({1}:{2}).".format(errmsg, lbl, val))
         return res
 
-    def read_text_result(self, sock, version, count=1):
+    def read_text_result(self, sock, version, count=1, max_size=None):
         """Read MySQL text result
 
-        Reads all or given number of rows from the socket.
+        Reads all or given number of rows from the socket. When max_size
+        is given, reading stops once the rows read reach max_size bytes.
 
         Returns a tuple with 2 elements: a list with all rows and
         the EOF packet.
@@ -351,17 +387,23 @@ class MySQLProtocol(object):
         eof = None
         rowdata = None
         i = 0
+        size = 0
         while True:
             if eof or i == count:
                 break
+            if max_size is not None and size >= max_size and rows:
+                break
             packet = sock.recv()
+            size += len(packet)
             if packet.startswith(b'\xff\xff\xff'):
                 datas = [packet[4:]]
                 packet = sock.recv()
                 while packet.startswith(b'\xff\xff\xff'):
                     datas.append(packet[4:])
+                    size += len(packet)
                     packet = sock.recv()
                 datas.append(packet[4:])
+                size += len(packet)
                 rowdata = utils.read_lc_string_list(bytearray(b'').join(datas))
             elif packet[4] == 254 and packet[0] < 7:
                 eof = self.parse_eof(packet)
@@ -481,21 +523,28 @@ class MySQLProtocol(object):
 
         return tuple(values)
 
-    def read_binary_result(self, sock, columns, count=1, charset='utf-8'):
+    def read_binary_result(self, sock, columns, count=1, charset='utf-8',
+                           max_size=None):
         """Read MySQL binary protocol result
 
         Reads all or given number of binary resultset rows from the socket.
+        When max_size is given, reading stops once the rows read reach
+        max_size bytes.
         """
         rows = []
         eof = None
         values = None
         i = 0
+        size = 0
         while True:
             if eof is not None:
                 break
             if i == count:
                 break
+            if max_size is not None and size >= max_size and rows:
+                break
             packet = sock.recv()
+            size += len(packet)
             if packet[4] == 254:
                 eof = self.parse_eof(packet)
                 values = None
@@ -650,8 +699,15 @@ class MySQLProtocol(object):
         return packet
 
     def make_stmt_execute(self, statement_id, data=(), parameters=(),
-                          flags=0, long_data_used=None, charset='utf8'):
-        """Make a MySQL packet with the Statement Execute command"""
+                          flags=0, long_data_used=None, charset='utf8',
+                          bound_types=None):
+        """Make a MySQL packet with the Statement Execute command
+
+        The bound_types argument is an optional dictionary holding, per
+        statement ID, the parameter types sent with the previous execution.
+        When the types did not change, they are not sent again and the MySQL
+        server reuses the ones it has; otherwise the dictionary is updated.
+        """
         iteration_count = 1
         null_bitmap = [0] * ((len(data) + 7) // 8)
         values = []
@@ -725,21 +781,23 @@ class MySQLProtocol(object):
                 types.append(utils.int1store(field_type) +
                              utils.int1store(flags))
 
-        packet = (
-            utils.int4store(statement_id) +
-            utils.int1store(flags) +
-            utils.int4store(iteration_count) +
-            b''.join([struct.pack('B', bit) for bit in null_bitmap]) +
-            utils.int1store(1)
-        )
-
-        for a_type in types:
-            packet += a_type
-
-        for a_value in values:
-            packet += a_value
-
-        return packet
+        types = b''.join(types)
+        new_params_bound = 1
+        if bound_types is not None and types:
+            if bound_types.get(statement_id) == types:
+                new_params_bound = 0
+                types = b''
+            else:
+                bound_types[statement_id] = types
+
+        return b''.join([
+            utils.int4store(statement_id),
+            utils.int1store(flags),
+            utils.int4store(iteration_count),
+            bytes(bytearray(null_bitmap)),
+            utils.int1store(new_params_bound),
+            types,
+        ] + values)
 
     def parse_auth_switch_request(self, packet):
         """Parse a MySQL AuthSwitchRequest-packet"""
@@ -0,0 +1,205 @@
+# Copyright (c) 2020, Oracle and/or its affiliates. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301  USA
+
+"""DNS SRV records resolution with a process-wide cache."""
+
+import random
+import threading
+import time
+
+import dns.resolver
+import dns.exception
+
+try:
+    _clock = time.monotonic  # pylint: disable=C0103
+except AttributeError:
+    _clock = time.time  # pylint: disable=C0103
+
+_REFRESH_RATIO = 0.75  # Refresh entries after this fraction of their TTL
+_MIN_TTL = 1  # Records with a TTL of 0 are still shared for a second
+
+
+def order_records(records, rand=random):
+    """Returns the SRV records in the order they should be tried.
+
+    Records are sorted by priority, lowest first. The records of each
+    priority group are ordered by weighted random selection as described in
+    RFC 2782: records with zero weight have a very small chance of being
+    selected before the others.
+
+    Args:
+        records (list): List of dictionaries with the `host`, `port`,
+                        `priority` and `weight` of each record.
+        rand (random.Random): The random number generator.
+
+    Returns:
+        list: The ordered records.
+    """
+    ordered = []
+    groups = {}
+    for record in records:
+        groups.setdefault(record["priority"], []).append(record)
+    for priority in sorted(groups):
+        # Records with zero weight first, as required by the selection
+        group = sorted(groups[priority], key=lambda rec: rec["weight"] != 0)
+        while group:
+            total = sum(rec["weight"] for rec in group)
+            selected = rand.randint(0, total)
+            running_sum = 0
+            for index, record in enumerate(group):
+                running_sum += record["weight"]
+                if running_sum >= selected:
+                    break
+            ordered.append(group.pop(index))
+    return ordered
+
+
+def _query(name):
+    """Queries the DNS SRV records of a name.
+
+    Returns a tuple with the list of records and their time to live.
+    """
+    answer = dns.resolver.query(name, "SRV")
+    records = [{"host": srv.target.to_text(omit_final_dot=True),
+                "port": srv.port,
+                "priority": srv.priority,
+                "weight": srv.weight} for srv in answer]
+    return records, answer.rrset.ttl
+
+
+class SRVCache(object):
+    """Caches the DNS SRV records of names while their TTL is not expired.
+
+    Records are refreshed in a background thread once a fraction of their
+    TTL has elapsed, so lookups keep hitting the cache as long as the name is
+    resolved. If a refresh fails, the cached records are used until they
+    expire.
+
+    Args:
+        query (callable): Function returning a tuple with the records of a
+                          name and their TTL in seconds.
+        refresh_ratio (float): Fraction of the TTL after which the records
+                               are refreshed in the background.
+    """
+    def __init__(self, query=_query, refresh_ratio=_REFRESH_RATIO):
+        self._query = query
+        self._refresh_ratio = refresh_ratio
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def _store(self, name, records, ttl):
+        """Stores the records of a name."""
+        ttl = max(ttl, _MIN_TTL)
+        now = _clock()
+        with self._lock:
+            self._entries[name] = [records, now + ttl,
+                                   now + ttl * self._refresh_ratio, False]
+
+    def _refresh(self, name):
+        """Refreshes the records of a name."""
+        try:
+            records, ttl = self._query(name)
+        except dns.exception.DNSException:
+            with self._lock:
+                entry = self._entries.get(name)
+                if entry is not None:
+                    entry[3] = False
+            return
+        self._store(name, records, ttl)
+        with self._lock:
+            self.refreshes += 1
+
+    def get_records(self, name):
+        """Returns the SRV records of a name.
+
+        Args:
+            name (str): The name to resolve.
+
+        Raises:
+            :class:`dns.exception.DNSException`: If the name can not be
+                                                 resolved.
+
+        Returns:
+            list: Copies of the records, as dictionaries with the `host`,
+                  `port`, `priority` and `weight` keys, which callers can
+                  modify.
+        """
+        now = _clock()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and now < entry[1]:
+                self.hits += 1
+                if now >= entry[2] and not entry[3]:
+                    entry[3] = True
+                    thread = threading.Thread(target=self._refresh,
+                                              args=(name,))
+                    thread.daemon = True
+                    thread.start()
+                return [dict(record) for record in entry[0]]
+            self.misses += 1
+        records, ttl = self._query(name)
+        self._store(name, records, ttl)
+        return [dict(record) for record in records]
+
+    def stats(self):
+        """Returns the cache counters.
+
+        Returns:
+            dict: The number of `hits`, `misses` and background `refreshes`,
+                  and the number of cached names as `size`.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "refreshes": self.refreshes, "size": len(self._entries)}
+
+    def clear(self):
+        """Removes all the cached records and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.refreshes = 0
+
+
+SRV_CACHE = SRVCache()
+
+
+def resolve_srv(name):
+    """Resolves the DNS SRV records of a name using the process-wide cache.
+
+    Args:
+        name (str): The name to resolve.
+
+    Raises:
+        :class:`dns.exception.DNSException`: If the name can not be resolved.
+
+    Returns:
+        list: The records in the order they should be tried.
+    """
+    return order_records(SRV_CACHE.get_records(name))
@@ -33,6 +33,15 @@ import os
 import subprocess
 import struct
 import sys
+import threading
+
+from collections import OrderedDict
+
+try:
+    import queue
+except ImportError:
+    # Python v2
+    import Queue as queue
 
 from .catch23 import struct_unpack, PY2
 
@@ -441,3 +450,162 @@ def linux_distribution():
                 distro.get("version_codename", ""))
 
     return ("", "", "")
+
+
+def staggered_connect(attempts, delay, dispose):
+    """Runs connection attempts in parallel, starting them one after another.
+
+    The first attempt is started right away and each of the following ones
+    is started after `delay` seconds, or as soon as the previous attempt
+    failed, as done by the Happy Eyeballs algorithm (RFC 8305). The result of
+    the first successful attempt is returned, the results of the attempts
+    completed afterwards are given to `dispose`.
+
+    Args:
+        attempts (list): Callables doing the connection attempts, by order
+                         of preference.
+        delay (float): Seconds to wait before starting the next attempt.
+        dispose (callable): Closes the result of an attempt which is not
+                            used.
+
+    Raises:
+        Exception: The error of the last failed attempt, if all of them
+                   failed.
+
+    Returns:
+        tuple: The index of the successful attempt and its result.
+    """
+    results = queue.Queue()
+    lock = threading.Lock()
+    done = []
+
+    def run(index, attempt):
+        """Runs an attempt and reports the result."""
+        try:
+            result = attempt()
+        except Exception as err:  # pylint: disable=W0703
+            results.put((index, False, err))
+            return
+        with lock:
+            if not done:
+                results.put((index, True, result))
+                return
+        dispose(result)
+
+    started = 0
+    pending = 0
+    error = None
+    while started < len(attempts) or pending:
+        timeout = None
+        if started < len(attempts):
+            thread = threading.Thread(target=run,
+                                      args=(started, attempts[started]))
+            thread.daemon = True
+            thread.start()
+            started += 1
+            pending += 1
+            if started < len(attempts):
+                timeout = delay
+        try:
+            index, success, result = results.get(timeout=timeout)
+        except queue.Empty:
+            continue
+        pending -= 1
+        if not success:
+            # Start the next attempt right away
+            error = result
+            continue
+        with lock:
+            done.append(index)
+        # Dispose the results reported before the winner was set
+        while True:
+            try:
+                _, late_success, late_result = results.get_nowait()
+            except queue.Empty:
+                return index, result
+            if late_success:
+                dispose(late_result)
+    raise error
+
+
+class LRUCache(object):
+    """Thread-safe cache keeping the least recently used entries out
+
+    The cache holds at most maxsize entries. When full, adding an entry
+    removes the one which was not used for the longest time. The number
+    of hits and misses of get() are counted.
+    """
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Get the value of key and mark it as the most recently used
+
+        Returns the value, or default when key is not cached.
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Add or replace the value of key
+
+        Returns the list of (key, value) pairs removed to make room.
+        """
+        evicted = []
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                evicted.append(self._data.popitem(last=False))
+        return evicted
+
+    def peek(self, key, default=None):
+        """Get the value of key without marking it as used
+
+        Returns the value, or default when key is not cached.
+        """
+        with self._lock:
+            return self._data.get(key, default)
+
+    def items(self):
+        """Returns the list of (key, value) pairs, least recently used first
+        """
+        with self._lock:
+            return list(self._data.items())
+
+    def pop(self, key, default=None):
+        """Remove key from the cache
+
+        Returns the value of key, or default when key is not cached.
+        """
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        """Remove all entries and reset the counters
+
+        Returns the list of (key, value) pairs removed.
+        """
+        with self._lock:
+            evicted = list(self._data.items())
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+        return evicted
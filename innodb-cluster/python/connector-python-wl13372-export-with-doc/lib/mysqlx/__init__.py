@@ -44,7 +44,7 @@ from .errors import (Error, InterfaceError, DatabaseError, NotSupportedError,
                      DataError, IntegrityError, ProgrammingError,
                      OperationalError, InternalError, PoolError, TimeoutError)
 from .result import (Column, Row, Result, BufferingResult, RowResult,
-                     SqlResult, DocResult, ColumnType)
+                     SqlResult, DocResult, ColumnType, PipelinedResult)
 from .statement import (Statement, FilterableStatement, SqlStatement,
                         FindStatement, AddStatement, RemoveStatement,
                         ModifyStatement, SelectStatement, InsertStatement,
@@ -61,7 +61,7 @@ _SSL_OPTS = ["ssl-cert", "ssl-ca", "ssl-key", "ssl-crl"]
 _SESS_OPTS = _SSL_OPTS + ["user", "password", "schema", "host", "port",
                           "routers", "socket", "ssl-mode", "auth", "use-pure",
                           "connect-timeout", "connection-attributes",
-                          "dns-srv"]
+                          "dns-srv", "connect-attempt-delay"]
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
@@ -234,6 +234,18 @@ def _validate_settings(settings):
             raise TypeError("The connection timeout value must be a positive "
                             "integer (including 0)")
 
+    if "connect-attempt-delay" in settings:
+        try:
+            if isinstance(settings["connect-attempt-delay"], STRING_TYPES):
+                settings["connect-attempt-delay"] = \
+                    int(settings["connect-attempt-delay"])
+            if not isinstance(settings["connect-attempt-delay"], INT_TYPES) \
+               or settings["connect-attempt-delay"] < 0:
+                raise ValueError
+        except ValueError:
+            raise TypeError("The connect attempt delay value must be a "
+                            "positive integer (including 0)")
+
     if "dns-srv" in settings:
         if not isinstance(settings["dns-srv"], bool):
             raise InterfaceError("The value of 'dns-srv' must be a boolean")
@@ -552,7 +564,7 @@ __all__ = [
 
     # mysqlx.result
     "Column", "Row", "Result", "BufferingResult", "RowResult",
-    "SqlResult", "DocResult", "ColumnType",
+    "SqlResult", "DocResult", "ColumnType", "PipelinedResult",
 
     # mysqlx.statement
     "DbDoc", "Statement", "FilterableStatement", "SqlStatement",
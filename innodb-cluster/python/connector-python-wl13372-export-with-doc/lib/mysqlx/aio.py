@@ -0,0 +1,1163 @@
+# Copyright (c) 2020, Oracle and/or its affiliates. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301  USA
+
+
+"""Asyncio implementation of the X DevAPI sessions.
+
+The sessions created by :func:`mysqlx.aio.get_session` run on an asyncio
+event loop. The statements are built by the same :mod:`mysqlx.statement`
+and :class:`mysqlx.protocol.Protocol` builders used by :class:`mysqlx.Session`,
+only the network I/O is asynchronous::
+
+    session = await mysqlx.aio.get_session(settings)
+    result = await session.sql("SELECT 1").execute()
+    async for row in result:
+        print(row[0])
+    await session.close()
+
+The :class:`mysqlx.Schema` helpers which read metadata from the server, such
+as ``get_collections()`` or ``create_collection()``, are not asynchronous;
+use SQL statements instead. Connection pooling and server-side prepared
+statements are not supported.
+
+Requires Python 3.7 or later.
+
+.. versionadded:: 8.0.19
+"""
+
+import asyncio
+import socket
+import uuid
+
+from functools import wraps
+
+from mysql.connector.aio import start_tls
+
+from . import _get_connection_settings
+from .authentication import (MySQL41AuthPlugin, PlainAuthPlugin,
+                             Sha256MemoryAuthPlugin)
+# pylint: disable=W0622
+from .errors import (InterfaceError, NotSupportedError, OperationalError,
+                     ProgrammingError)
+from .compat import STRING_TYPES
+from .connection import (_CONNECT_TIMEOUT, _LOGGER, _DROP_DATABASE_QUERY,
+                         _CREATE_DATABASE_QUERY, _SELECT_SCHEMA_NAME_QUERY,
+                         Connection, Session, create_ssl_context)
+from .constants import SSLMode, Auth
+from .crud import Schema
+from .helpers import escape, get_item_or_attr
+from .protocol import Protocol, MessageReaderWriter
+from .protobuf import Message, Protobuf, mysqlxpb_enum
+from .result import (BaseResult, BufferingResult, Result, RowResult,
+                     SqlResult, DocResult, rows_to_arrays)
+from .statement import AddStatement, quote_identifier
+
+
+class AsyncSocketStream(object):
+    """Implements a socket stream using asyncio streams."""
+    def __init__(self):
+        self._reader = None
+        self._writer = None
+        self._is_ssl = False
+        self._is_socket = False
+        self._host = None
+
+    async def connect(self, params, connect_timeout=_CONNECT_TIMEOUT):
+        """Connects to a TCP service or Unix socket.
+
+        Args:
+            params (tuple): The connection parameters.
+            connect_timeout (int): The connect timeout in milliseconds.
+
+        Raises:
+            :class:`mysqlx.InterfaceError`: If Unix socket is not supported.
+            :class:`socket.timeout`: If the connect timeout is exceeded.
+        """
+        self.close()
+        if connect_timeout is not None:
+            connect_timeout = connect_timeout / 1000  # Convert to seconds
+        if isinstance(params, tuple):
+            self._host = params[0]
+            connection = asyncio.open_connection(*params)
+        else:
+            if not hasattr(asyncio, "open_unix_connection"):
+                raise InterfaceError("Unix socket unsupported")
+            self._is_socket = True
+            connection = asyncio.open_unix_connection(params)
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                connection, connect_timeout)
+        except asyncio.TimeoutError:
+            raise socket.timeout("timed out")
+
+    async def read(self, count):
+        """Receive data from the stream.
+
+        Args:
+            count (int): The number of bytes to read.
+
+        Returns:
+            bytes: The data received.
+        """
+        if self._reader is None:
+            raise OperationalError("MySQLx Connection not available")
+        try:
+            return await self._reader.readexactly(count)
+        except asyncio.IncompleteReadError:
+            raise RuntimeError("Unexpected connection close")
+
+    def sendall(self, data):
+        """Write data to the stream buffer.
+
+        The data is sent by the event loop, :meth:`drain` waits until the
+        buffer is flushed.
+
+        Args:
+            data (bytes): The data to be sent.
+        """
+        if self._writer is None:
+            raise OperationalError("MySQLx Connection not available")
+        self._writer.write(data)
+
+    async def drain(self):
+        """Wait until the stream buffer is flushed."""
+        if self._writer is None:
+            raise OperationalError("MySQLx Connection not available")
+        await self._writer.drain()
+
+    def close(self):
+        """Close the stream."""
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._reader = None
+        self._writer = None
+        self._is_ssl = False
+        self._is_socket = False
+
+    async def set_ssl(self, ssl_mode, ssl_ca, ssl_crl, ssl_cert, ssl_key):
+        """Upgrade the stream to SSL.
+
+        Args:
+            ssl_mode (str): SSL mode.
+            ssl_ca (str): The certification authority certificate.
+            ssl_crl (str): The certification revocation lists.
+            ssl_cert (str): The certificate.
+            ssl_key (str): The certificate key.
+
+        Raises:
+            :class:`mysqlx.InterfaceError`: If the parameters are invalid.
+        """
+        try:
+            context = create_ssl_context(ssl_ca, ssl_crl, ssl_cert, ssl_key)
+        except InterfaceError:
+            self.close()
+            raise
+        server_hostname = None
+        if ssl_mode == SSLMode.VERIFY_IDENTITY:
+            context.check_hostname = True
+            server_hostname = self._host
+        self._reader, self._writer = await start_tls(
+            self._reader, self._writer, context,
+            server_hostname=server_hostname)
+        self._is_ssl = True
+
+    def is_ssl(self):
+        """Verifies if SSL is being used.
+
+        Returns:
+            bool: Returns `True` if SSL is being used.
+        """
+        return self._is_ssl
+
+    def is_socket(self):
+        """Verifies if socket connection is being used.
+
+        Returns:
+            bool: Returns `True` if socket connection is being used.
+        """
+        return self._is_socket
+
+    def is_secure(self):
+        """Verifies if connection is secure.
+
+        Returns:
+            bool: Returns `True` if connection is secure.
+        """
+        return self._is_ssl or self._is_socket
+
+    def is_open(self):
+        """Verifies if connection is open.
+
+        Returns:
+            bool: Returns `True` if connection is open.
+        """
+        return self._writer is not None
+
+
+class AsyncMessageReaderWriter(MessageReaderWriter):
+    """Implements an asynchronous Message Reader/Writer.
+
+    Messages are written to the stream buffer without blocking, reading a
+    message is a coroutine.
+
+    Args:
+        socket_stream (mysqlx.aio.AsyncSocketStream): `AsyncSocketStream`
+                                                      object.
+    """
+    async def _read_message(self):
+        """Read message.
+
+        Returns:
+            mysqlx.protobuf.Message: MySQL X Protobuf Message.
+        """
+        while True:
+            hdr = await self._stream.read(5)
+            msg_len, msg_type = self._parse_header(hdr)
+            payload = await self._stream.read(msg_len - 1)
+            msg = self._parse_payload(msg_type, payload)
+            if msg is not None:
+                return msg
+
+    async def read_message(self):
+        """Read message.
+
+        Returns:
+            mysqlx.protobuf.Message: MySQL X Protobuf Message.
+        """
+        if self._msg is not None:
+            msg = self._msg
+            self._msg = None
+            return msg
+        return await self._read_message()
+
+
+class AsyncProtocol(Protocol):
+    """Implements the MySQL X Protocol on top of asyncio streams.
+
+    The messages are built and sent by :class:`mysqlx.protocol.Protocol`,
+    the methods reading from the server are coroutines.
+
+    Args:
+        read_writer (mysqlx.aio.AsyncMessageReaderWriter): An asynchronous
+                                                           Message
+                                                           Reader/Writer.
+    """
+    async def _read_message(self, result):
+        """Read message.
+
+        Args:
+            result (Result): A `Result` based type object.
+        """
+        while True:
+            msg = await self._reader.read_message()
+            if not self._process_message(msg, result):
+                break
+        if msg.type == "Mysqlx.Sql.StmtExecuteOk":
+            return None
+        return msg
+
+    async def get_capabilites(self):
+        """Get capabilities.
+
+        Returns:
+            mysqlx.protobuf.Message: MySQL X Protobuf Message.
+        """
+        msg = Message("Mysqlx.Connection.CapabilitiesGet")
+        self._writer.write_message(
+            mysqlxpb_enum("Mysqlx.ClientMessages.Type.CON_CAPABILITIES_GET"),
+            msg)
+        msg = await self._reader.read_message()
+        while msg.type == "Mysqlx.Notice.Frame":
+            msg = await self._reader.read_message()
+        return msg
+
+    async def set_capabilities(self, **kwargs):
+        """Set capabilities.
+
+        Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            mysqlx.protobuf.Message: MySQL X Protobuf Message.
+        """
+        try:
+            # Protocol.set_capabilities() returns the read_ok() coroutine
+            return await super(AsyncProtocol, self).set_capabilities(**kwargs)
+        except InterfaceError as err:
+            # Skip capability "session_connect_attrs" error since
+            # is only available on version >= 8.0.16
+            if err.errno != 5002:
+                raise
+        return None
+
+    async def read_auth_continue(self):
+        """Read authenticate continue.
+
+        Raises:
+            :class:`InterfaceError`: If the message type is not
+                                     `Mysqlx.Session.AuthenticateContinue`
+
+        Returns:
+            str: The authentication data.
+        """
+        msg = await self._reader.read_message()
+        while msg.type == "Mysqlx.Notice.Frame":
+            msg = await self._reader.read_message()
+        if msg.type != "Mysqlx.Session.AuthenticateContinue":
+            raise InterfaceError("Unexpected message encountered during "
+                                 "authentication handshake")
+        return msg["auth_data"]
+
+    async def read_auth_ok(self):
+        """Read authenticate OK.
+
+        Raises:
+            :class:`mysqlx.InterfaceError`: If message type is `Mysqlx.Error`.
+        """
+        while True:
+            msg = await self._reader.read_message()
+            if msg.type == "Mysqlx.Session.AuthenticateOk":
+                break
+            if msg.type == "Mysqlx.Error":
+                raise InterfaceError(msg.msg)
+
+    async def close_result(self, result):
+        """Close the result.
+
+        Args:
+            result (Result): A `Result` based type object.
+
+        Raises:
+            :class:`mysqlx.OperationalError`: If message read is None.
+        """
+        msg = await self._read_message(result)
+        if msg is not None:
+            raise OperationalError("Expected to close the result")
+
+    async def read_row(self, result):
+        """Read row.
+
+        Args:
+            result (Result): A `Result` based type object.
+        """
+        msg = await self._read_message(result)
+        if msg is None:
+            return None
+        if msg.type == "Mysqlx.Resultset.Row":
+            return msg
+        self._reader.push_message(msg)
+        return None
+
+    async def get_column_metadata(self, result):
+        """Returns column metadata.
+
+        Args:
+            result (Result): A `Result` based type object.
+
+        Raises:
+            :class:`mysqlx.InterfaceError`: If unexpected message.
+        """
+        columns = []
+        while True:
+            msg = await self._read_message(result)
+            if msg is None:
+                break
+            if msg.type == "Mysqlx.Resultset.Row":
+                self._reader.push_message(msg)
+                break
+            if msg.type != "Mysqlx.Resultset.ColumnMetaData":
+                raise InterfaceError("Unexpected msg type")
+            columns.append(self._build_column(msg))
+        return columns
+
+    async def read_ok(self):
+        """Read OK.
+
+        Raises:
+            :class:`mysqlx.InterfaceError`: If unexpected message.
+        """
+        msg = await self._reader.read_message()
+        if msg.type == "Mysqlx.Error":
+            raise InterfaceError("Mysqlx.Error: {}".format(msg["msg"]),
+                                 errno=msg["code"])
+        if msg.type != "Mysqlx.Ok":
+            raise InterfaceError("Unexpected message encountered")
+
+
+class AsyncResult(Result):
+    """Allows retrieving information about non query operations performed on
+    the database, read asynchronously.
+
+    Args:
+        connection (mysqlx.aio.AsyncConnection): The Connection object.
+        ids (`list`): A list of IDs.
+    """
+    def __init__(self, connection, ids=None):
+        super(AsyncResult, self).__init__(None, ids)
+        self._connection = connection
+        self._protocol = connection.protocol
+
+    async def _init_result(self):
+        """Read the result."""
+        await self._connection.close_result(self)
+
+
+class AsyncBufferingResult(BufferingResult):
+    """Provides base functionality for result objects read asynchronously.
+
+    The rows are read with the ``fetch_one()`` and ``fetch_all()`` coroutines,
+    or using ``async for``.
+
+    Args:
+        connection (mysqlx.aio.AsyncConnection): The Connection object.
+    """
+    def __init__(self, connection):  # pylint: disable=W0231
+        BaseResult.__init__(self, None)
+        self._connection = connection
+        self._protocol = connection.protocol
+        self._columns = []
+        self._decoders = []
+        self._has_data = False
+        self._has_more_data = False
+        self._has_more_results = False
+        self._items = []
+        self._page_size = 0
+        self._position = -1
+        self._streaming = False
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self.fetch_one()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+    async def _init_result(self):
+        """Initialize the result."""
+        self._columns = await self._connection.get_column_metadata(self)
+        self._decoders = self._get_decoders()
+        self._has_more_data = True if len(self._columns) > 0 else False
+        self._items = []
+        self._page_size = 20
+        self._position = -1
+        self._connection.set_active_result(self if self._has_more_data
+                                           else None)
+
+    async def _read_item(self, dumping):
+        """Read item.
+
+        Args:
+            dumping (bool): `True` for dumping.
+
+        Returns:
+            :class:`mysqlx.Row` or :class:`mysqlx.DbDoc`: one result item.
+        """
+        row = await self._connection.read_row(self)
+        if row is None:
+            return None
+        return self._decode_item(row, dumping)
+
+    async def _page_in_items(self):
+        """Reads the page items.
+
+        Returns:
+            int: Total items read.
+        """
+        if self._closed:
+            return False
+
+        count = 0
+        for _ in range(self._page_size):
+            item = await self._read_item(False)
+            if item is None:
+                break
+            self._items.append(item)
+            count += 1
+        return count
+
+    async def fetch_one(self):
+        """Fetch one item.
+
+        Returns:
+            :class:`mysqlx.Row` or :class:`mysqlx.DbDoc`: one result item.
+        """
+        if self._closed:
+            return None
+
+        return await self._read_item(False)
+
+    async def fetch_all(self):
+        """Fetch all items.
+
+        Returns:
+            `list`: The list of items of :class:`mysqlx.DbDoc` or
+                    :class:`mysqlx.Row`.
+        """
+        while True:
+            if not await self._page_in_items():
+                break
+        return self._items
+
+
+class AsyncRowResult(AsyncBufferingResult, RowResult):
+    """Allows traversing asynchronously the Row objects returned by a
+    Table.select operation.
+
+    Args:
+        connection (mysqlx.aio.AsyncConnection): The Connection object.
+    """
+
+    async def _read_fields(self, size):
+        """Read the fields of the next rows, without decoding them.
+
+        See :meth:`mysqlx.RowResult._read_fields`.
+
+        Returns:
+            `list`: The fields of each row.
+        """
+        rows = []
+        while (size is None or len(rows) < size) and not self._closed:
+            row = await self._connection.read_row(self)
+            if row is None:
+                break
+            rows.append(row["field"])
+        return rows
+
+    async def fetch_arrays(self, size=None, use_numpy=None):
+        """Fetch the next rows as per-column arrays.
+
+        See :meth:`mysqlx.RowResult.fetch_arrays`.
+
+        Returns:
+            collections.OrderedDict: The column arrays, by column label.
+        """
+        return rows_to_arrays(self._columns, await self._read_fields(size),
+                              use_numpy)
+
+    async def fetch_columnar(self, chunk_size=10000, use_numpy=None):
+        """Iterate over the remaining rows as per-column arrays.
+
+        See :meth:`mysqlx.RowResult.fetch_columnar`, the chunks are iterated
+        using ``async for``.
+        """
+        if not chunk_size or chunk_size < 1:
+            raise ProgrammingError("chunk_size must be 1 or higher")
+        while True:
+            rows = await self._read_fields(chunk_size)
+            if not rows:
+                break
+            yield rows_to_arrays(self._columns, rows, use_numpy)
+
+
+class AsyncSqlResult(AsyncRowResult, SqlResult):
+    """Represents a result from a SQL statement read asynchronously.
+
+    Args:
+        connection (mysqlx.aio.AsyncConnection): The Connection object.
+    """
+    async def next_result(self):
+        """Process the next result.
+
+        Returns:
+            bool: Returns `True` if the fetch is done.
+        """
+        if self._closed:
+            return False
+        self._has_more_results = False
+        await self._init_result()
+        return True
+
+
+class AsyncDocResult(AsyncBufferingResult, DocResult):
+    """Allows traversing asynchronously the DbDoc objects returned by a
+    Collection.find operation.
+
+    Args:
+        connection (mysqlx.aio.AsyncConnection): The Connection object.
+    """
+
+
+def catch_network_exception(func):
+    """Decorator used to catch socket.error or RuntimeError in coroutines.
+
+    Raises:
+        :class:`mysqlx.InterfaceError`: If `socket.Error` or `RuntimeError`
+                                        is raised.
+    """
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        """Wrapper coroutine."""
+        try:
+            return await func(self, *args, **kwargs)
+        except (socket.error, RuntimeError):
+            self.disconnect()
+            raise InterfaceError("Cannot connect to host")
+    return wrapper
+
+
+class AsyncConnection(Connection):
+    """Asynchronous connection to a MySQL Server.
+
+    Prepared statements are not used, every statement is sent as a
+    Crud::<Operation> or Sql::StmtExecute message.
+
+    Args:
+        settings (dict): Dictionary with connection settings.
+    """
+    def __init__(self, settings):
+        super(AsyncConnection, self).__init__(settings)
+        self.stream = AsyncSocketStream()
+
+    async def connect(self):
+        """Attempt to connect to the MySQL server.
+
+        Raises:
+            :class:`mysqlx.InterfaceError`: If fails to connect to the MySQL
+                                            server.
+            :class:`mysqlx.TimeoutError`: If connect timeout was exceeded.
+        """
+        # Loop and check
+        error = None
+        while self._can_failover:
+            try:
+                await self.stream.connect(self._get_connection_params(),
+                                          self._connect_timeout)
+                self.reader_writer = AsyncMessageReaderWriter(self.stream)
+                self.protocol = AsyncProtocol(self.reader_writer)
+                await self._handle_capabilities()
+                await self._authenticate()
+                return
+            except socket.error as err:
+                error = err
+        raise self._get_connection_error(error)
+
+    async def _handle_capabilities(self):
+        """Handle capabilities.
+
+        Raises:
+            :class:`mysqlx.OperationalError`: If SSL is not enabled at the
+                                             server.
+        """
+        if self.settings.get("ssl-mode") == SSLMode.DISABLED:
+            return
+        if self.stream.is_socket():
+            if self.settings.get("ssl-mode"):
+                _LOGGER.warning("SSL not required when using Unix socket.")
+            return
+
+        data = (await self.protocol.get_capabilites()).capabilities
+        if not (get_item_or_attr(data[0], "name").lower() == "tls"
+                if data else False):
+            self.disconnect()
+            raise OperationalError("SSL not enabled at server")
+
+        await self.protocol.set_capabilities(tls=True)
+        await self.stream.set_ssl(
+            self.settings.get("ssl-mode", SSLMode.REQUIRED),
+            self.settings.get("ssl-ca"), self.settings.get("ssl-crl"),
+            self.settings.get("ssl-cert"), self.settings.get("ssl-key"))
+        if "attributes" in self.settings:
+            conn_attrs = self.settings["attributes"]
+            await self.protocol.set_capabilities(
+                session_connect_attrs=conn_attrs)
+
+    async def _authenticate(self):
+        """Authenticate with the MySQL server."""
+        auth = self.settings.get("auth")
+        if auth:
+            if auth == Auth.PLAIN:
+                await self._authenticate_plain()
+            elif auth == Auth.SHA256_MEMORY:
+                await self._authenticate_sha256_memory()
+            elif auth == Auth.MYSQL41:
+                await self._authenticate_mysql41()
+        elif self.stream.is_secure():
+            # Use PLAIN if no auth provided and connection is secure
+            await self._authenticate_plain()
+        else:
+            # Use MYSQL41 if connection is not secure
+            try:
+                await self._authenticate_mysql41()
+            except InterfaceError:
+                pass
+            else:
+                return
+            # Try SHA256_MEMORY if MYSQL41 fails
+            try:
+                await self._authenticate_sha256_memory()
+            except InterfaceError:
+                raise InterfaceError("Authentication failed using MYSQL41 and "
+                                     "SHA256_MEMORY, check username and "
+                                     "password or try a secure connection")
+
+    async def _authenticate_mysql41(self):
+        """Authenticate with the MySQL server using `MySQL41AuthPlugin`."""
+        plugin = MySQL41AuthPlugin(self._user, self._password)
+        self.protocol.send_auth_start(plugin.auth_name())
+        extra_data = await self.protocol.read_auth_continue()
+        self.protocol.send_auth_continue(plugin.auth_data(extra_data))
+        await self.protocol.read_auth_ok()
+
+    async def _authenticate_plain(self):
+        """Authenticate with the MySQL server using `PlainAuthPlugin`."""
+        if not self.stream.is_secure():
+            raise InterfaceError("PLAIN authentication is not allowed via "
+                                 "unencrypted connection")
+        plugin = PlainAuthPlugin(self._user, self._password)
+        self.protocol.send_auth_start(plugin.auth_name(),
+                                      auth_data=plugin.auth_data())
+        await self.protocol.read_auth_ok()
+
+    async def _authenticate_sha256_memory(self):
+        """Authenticate with the MySQL server using `Sha256MemoryAuthPlugin`."""
+        plugin = Sha256MemoryAuthPlugin(self._user, self._password)
+        self.protocol.send_auth_start(plugin.auth_name())
+        extra_data = await self.protocol.read_auth_continue()
+        self.protocol.send_auth_continue(plugin.auth_data(extra_data))
+        await self.protocol.read_auth_ok()
+
+    async def _get_result(self, result_class, *args):
+        """Flush the sent messages and read the result.
+
+        Args:
+            result_class (type): The result class.
+            *args: Extra arguments for the result class.
+
+        Returns:
+            `Result`: The result object.
+        """
+        await self.stream.drain()
+        result = result_class(self, *args)
+        await result._init_result()  # pylint: disable=W0212
+        return result
+
+    async def fetch_active_result(self):
+        """Fetch active result."""
+        if self._active_result is not None:
+            await self._active_result.fetch_all()
+            self._active_result = None
+
+    @catch_network_exception
+    async def send_sql(self, statement):
+        """Execute a SQL statement.
+
+        Args:
+            sql (str): The SQL statement.
+
+        Raises:
+            :class:`mysqlx.ProgrammingError`: If the SQL statement is not a
+                                              valid string.
+
+        Returns:
+            :class:`mysqlx.aio.AsyncSqlResult`: The result object.
+        """
+        sql = statement.sql
+        if self.protocol is None:
+            raise OperationalError("MySQLx Connection not available")
+        if not isinstance(sql, STRING_TYPES):
+            raise ProgrammingError("The SQL statement is not a valid string")
+        await self.fetch_active_result()
+        msg_type, msg = self.protocol.build_execute_statement("sql", sql)
+        self.protocol.send_msg_without_ps(msg_type, msg, statement)
+        return await self._get_result(AsyncSqlResult)
+
+    @catch_network_exception
+    async def send_insert(self, statement):
+        """Send an insert statement.
+
+        Args:
+            statement (`Statement`): It can be :class:`mysqlx.InsertStatement`
+                                     or :class:`mysqlx.AddStatement`.
+
+        Returns:
+            :class:`mysqlx.aio.AsyncResult`: A result object.
+        """
+        if self.protocol is None:
+            raise OperationalError("MySQLx Connection not available")
+        await self.fetch_active_result()
+        msg_type, msg = self.protocol.build_insert(statement)
+        self.protocol.send_msg(msg_type, msg)
+        ids = None
+        if isinstance(statement, AddStatement):
+            ids = statement.ids
+        return await self._get_result(AsyncResult, ids)
+
+    @catch_network_exception
+    async def send_find(self, statement):
+        """Send an find statement.
+
+        Args:
+            statement (`Statement`): It can be :class:`mysqlx.SelectStatement`
+                                     or :class:`mysqlx.FindStatement`.
+
+        Returns:
+            `Result`: It can be class:`mysqlx.aio.AsyncDocResult` or
+                      :class:`mysqlx.aio.AsyncRowResult`.
+        """
+        await self.fetch_active_result()
+        msg_type, msg = self.protocol.build_find(statement)
+        self.protocol.send_msg_without_ps(msg_type, msg, statement)
+        return await self._get_result(AsyncDocResult
+                                      if statement.is_doc_based()
+                                      else AsyncRowResult)
+
+    @catch_network_exception
+    async def send_delete(self, statement):
+        """Send an delete statement.
+
+        Args:
+            statement (`Statement`): It can be :class:`mysqlx.RemoveStatement`
+                                     or :class:`mysqlx.DeleteStatement`.
+
+        Returns:
+            :class:`mysqlx.aio.AsyncResult`: The result object.
+        """
+        await self.fetch_active_result()
+        msg_type, msg = self.protocol.build_delete(statement)
+        self.protocol.send_msg_without_ps(msg_type, msg, statement)
+        return await self._get_result(AsyncResult)
+
+    @catch_network_exception
+    async def send_update(self, statement):
+        """Send an update statement.
+
+        Args:
+            statement (`Statement`): It can be :class:`mysqlx.ModifyStatement`
+                                     or :class:`mysqlx.UpdateStatement`.
+
+        Returns:
+            :class:`mysqlx.aio.AsyncResult`: The result object.
+        """
+        await self.fetch_active_result()
+        msg_type, msg = self.protocol.build_update(statement)
+        self.protocol.send_msg_without_ps(msg_type, msg, statement)
+        return await self._get_result(AsyncResult)
+
+    @catch_network_exception
+    async def execute_nonquery(self, namespace, cmd, raise_on_fail,
+                               fields=None):
+        """Execute a non query command.
+
+        Args:
+            namespace (str): The namespace.
+            cmd (str): The command.
+            raise_on_fail (bool): `True` to raise on fail.
+            fields (Optional[dict]): The message fields.
+
+        Raises:
+            :class:`mysqlx.OperationalError`: On errors.
+
+        Returns:
+            :class:`mysqlx.aio.AsyncResult`: The result object.
+        """
+        try:
+            await self.fetch_active_result()
+            msg_type, msg = \
+                self.protocol.build_execute_statement(namespace, cmd, fields)
+            self.protocol.send_msg(msg_type, msg)
+            return await self._get_result(AsyncResult)
+        except OperationalError:
+            if raise_on_fail:
+                raise
+
+    @catch_network_exception
+    async def execute_sql_scalar(self, sql):
+        """Execute a SQL scalar.
+
+        Args:
+            sql (str): The SQL statement.
+
+        Raises:
+            :class:`mysqlx.InterfaceError`: If no data found.
+
+        Returns:
+            object: The value of the first column of the first row.
+        """
+        await self.fetch_active_result()
+        msg_type, msg = self.protocol.build_execute_statement("sql", sql)
+        self.protocol.send_msg(msg_type, msg)
+        result = await self._get_result(AsyncRowResult)
+        await result.fetch_all()
+        if result.count == 0:
+            raise InterfaceError("No data found")
+        return result[0][0]
+
+    @catch_network_exception
+    async def read_row(self, result):
+        """Read row.
+
+        Args:
+            result (:class:`mysqlx.aio.AsyncRowResult`): The result object.
+        """
+        return await self.protocol.read_row(result)
+
+    @catch_network_exception
+    async def close_result(self, result):
+        """Close result.
+
+        Args:
+            result (:class:`mysqlx.aio.AsyncResult`): The result object.
+        """
+        await self.protocol.close_result(result)
+
+    @catch_network_exception
+    async def get_column_metadata(self, result):
+        """Get column metadata.
+
+        Args:
+            result (:class:`mysqlx.aio.AsyncResult`): The result object.
+        """
+        return await self.protocol.get_column_metadata(result)
+
+    async def close_session(self):
+        """Close a sucessfully authenticated session."""
+        if not self.is_open():
+            return
+
+        try:
+            # Fetch any active result
+            await self.fetch_active_result()
+            # Send session close
+            self.protocol.send_close()
+            await self.protocol.read_ok()
+        except (InterfaceError, OperationalError) as err:
+            _LOGGER.warning("Warning: An error occurred while attempting to "
+                            "close the connection: {}".format(err))
+        finally:
+            # The remote connection with the server has been lost,
+            # close the connection locally.
+            self.stream.close()
+
+    async def close_connection(self):
+        """Announce to the server that the client wants to close the
+        connection. Discards any session state of the server.
+        """
+        if not self.is_open():
+            return
+        await self.fetch_active_result()
+        self.protocol.send_connection_close()
+        await self.protocol.read_ok()
+        self.stream.close()
+
+
+class AsyncSession(Session):
+    """Enables asynchronous interaction with a X Protocol enabled MySQL
+    Product.
+
+    Use :func:`mysqlx.aio.get_session` to create a connected session. The
+    statements returned by the session and its database objects are executed
+    with ``await statement.execute()``.
+
+    Args:
+        settings (dict): Connection data used to connect to the database.
+    """
+    def __init__(self, settings):  # pylint: disable=W0231
+        self.use_pure = settings.get("use-pure", Protobuf.use_pure)
+        self._settings = settings
+        if settings.get("pooling"):
+            raise NotSupportedError("Connection pooling is not supported by "
+                                    "asynchronous sessions")
+        self._init_settings()
+        self._connection = AsyncConnection(self._settings)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def connect(self):
+        """Connects to the MySQL server and sets the default schema."""
+        await self._connection.connect()
+        schema = self._settings.get("schema")
+        if schema:
+            try:
+                await self.sql("USE {}".format(
+                    quote_identifier(schema))).execute()
+            except OperationalError as err:
+                # Access denied for user will raise err.errno = 1044
+                errmsg = err.msg if err.errno == 1044 \
+                    else "Default schema '{}' does not exists".format(schema)
+                raise InterfaceError(errmsg, err.errno)
+
+    async def get_schemas(self):
+        """Returns the list of schemas in the current session.
+
+        Returns:
+            `list`: The list of schemas in the current session.
+        """
+        result = await self.sql("SHOW DATABASES").execute()
+        return [row[0] for row in await result.fetch_all()]
+
+    async def get_default_schema(self):
+        """Retrieves a Schema object from the current session by the schema
+        name configured in the connection settings.
+
+        Returns:
+            mysqlx.Schema: The Schema object with the given name at connect
+                           time.
+            None: In case the default schema was not provided with the
+                  initialization data.
+
+        Raises:
+            :class:`mysqlx.ProgrammingError`: If the provided default schema
+                                              does not exists.
+        """
+        schema = self._connection.settings.get("schema")
+        if schema:
+            result = await self.sql(
+                _SELECT_SCHEMA_NAME_QUERY.format(escape(schema))).execute()
+            res = await result.fetch_all()
+            try:
+                if res[0][0] == schema:
+                    return Schema(self, schema)
+            except IndexError:
+                raise ProgrammingError(
+                    "Default schema '{}' does not exists".format(schema))
+        return None
+
+    async def drop_schema(self, name):
+        """Drops the schema with the specified name.
+
+        Args:
+            name (string): The name of the Schema object to be retrieved.
+        """
+        await self._connection.execute_nonquery(
+            "sql", _DROP_DATABASE_QUERY.format(quote_identifier(name)), True)
+
+    async def create_schema(self, name):
+        """Creates a schema on the database and returns the corresponding
+        object.
+
+        Args:
+            name (string): A string value indicating the schema name.
+        """
+        await self._connection.execute_nonquery(
+            "sql", _CREATE_DATABASE_QUERY.format(quote_identifier(name)), True)
+        return Schema(self, name)
+
+    async def start_transaction(self):
+        """Starts a transaction context on the server."""
+        await self._connection.execute_nonquery("sql", "START TRANSACTION",
+                                                True)
+
+    async def commit(self):
+        """Commits all the operations executed after a call to
+        startTransaction().
+        """
+        await self._connection.execute_nonquery("sql", "COMMIT", True)
+
+    async def rollback(self):
+        """Discards all the operations executed after a call to
+        startTransaction().
+        """
+        await self._connection.execute_nonquery("sql", "ROLLBACK", True)
+
+    async def set_savepoint(self, name=None):
+        """Creates a transaction savepoint.
+
+        If a name is not provided, one will be generated using the uuid.uuid1()
+        function.
+
+        Args:
+            name (Optional[string]): The savepoint name.
+
+        Returns:
+            string: The savepoint name.
+        """
+        if name is None:
+            name = "{0}".format(uuid.uuid1())
+        elif not isinstance(name, STRING_TYPES) or len(name.strip()) == 0:
+            raise ProgrammingError("Invalid SAVEPOINT name")
+        await self._connection.execute_nonquery(
+            "sql", "SAVEPOINT {0}".format(quote_identifier(name)), True)
+        return name
+
+    async def rollback_to(self, name):
+        """Rollback to a transaction savepoint with the given name.
+
+        Args:
+            name (string): The savepoint name.
+        """
+        if not isinstance(name, STRING_TYPES) or len(name.strip()) == 0:
+            raise ProgrammingError("Invalid SAVEPOINT name")
+        await self._connection.execute_nonquery(
+            "sql", "ROLLBACK TO SAVEPOINT {0}".format(quote_identifier(name)),
+            True)
+
+    async def release_savepoint(self, name):
+        """Release a transaction savepoint with the given name.
+
+        Args:
+            name (string): The savepoint name.
+        """
+        if not isinstance(name, STRING_TYPES) or len(name.strip()) == 0:
+            raise ProgrammingError("Invalid SAVEPOINT name")
+        await self._connection.execute_nonquery(
+            "sql", "RELEASE SAVEPOINT {0}".format(quote_identifier(name)),
+            True)
+
+    async def close(self):
+        """Closes the session."""
+        await self._connection.close_session()
+        # Set an unconnected connection
+        self._connection = AsyncConnection(self._settings)
+
+    async def close_connections(self):
+        """Closes the underliying connection."""
+        await self._connection.close_connection()
+
+
+async def get_session(*args, **kwargs):
+    """Creates an asynchronous Session instance using the provided connection
+    data.
+
+    Args:
+        *args: Variable length argument list with the connection data used
+               to connect to a MySQL server. It can be a dictionary or a
+               connection string.
+        **kwargs: Arbitrary keyword arguments with connection data used to
+                  connect to the database.
+
+    Returns:
+        mysqlx.aio.AsyncSession: AsyncSession object.
+    """
+    settings = _get_connection_settings(*args, **kwargs)
+    session = AsyncSession(settings)
+    await session.connect()
+    return session
+
+
+__all__ = ["AsyncSession", "AsyncConnection", "AsyncResult", "AsyncRowResult",
+           "AsyncSqlResult", "AsyncDocResult", "get_session"]
@@ -42,11 +42,13 @@ import platform
 import os
 import re
 import threading
+import time
+import json
 
-import dns.resolver
 import dns.exception
 
-from functools import wraps
+from collections import deque
+from functools import partial, wraps
 
 from .authentication import (MySQL41AuthPlugin, PlainAuthPlugin,
                              Sha256MemoryAuthPlugin)
@@ -55,16 +57,19 @@ from .errors import (InterfaceError, NotSupportedError, OperationalError,
                      PoolError, ProgrammingError, TimeoutError)
 from .compat import PY3, STRING_TYPES, UNICODE_TYPES, queue
 from .crud import Schema
+from .dbdoc import DbDoc, ExprJSONEncoder
 from .constants import SSLMode, Auth
-from .helpers import escape, get_item_or_attr
+from .helpers import encode_to_bytes, escape, get_item_or_attr
 from .protocol import Protocol, MessageReaderWriter
-from .result import Result, RowResult, SqlResult, DocResult
+from .result import (Result, RowResult, SqlResult, DocResult,
+                     PipelinedResult)
 from .statement import SqlStatement, AddStatement, quote_identifier
 from .protobuf import Protobuf
 
 # pylint: disable=C0411,C0413
 sys.path.append("..")
-from mysql.connector.utils import linux_distribution
+from mysql.connector.srv import resolve_srv
+from mysql.connector.utils import linux_distribution, staggered_connect
 from mysql.connector.version import VERSION, LICENSE
 
 
@@ -79,6 +84,8 @@ _CNX_POOL_MAX_NAME_SIZE = 120
 _CNX_POOL_NAME_REGEX = re.compile(r'[^a-zA-Z0-9._:\-*$#]')
 _CNX_POOL_MAX_IDLE_TIME = 2147483
 _CNX_POOL_QUEUE_TIMEOUT = 2147483
+# Upper bound of the encoded size of a Crud.Insert row, besides the document
+_INSERT_ROW_OVERHEAD = 40
 
 _LOGGER = logging.getLogger("mysqlx")
 
@@ -111,6 +118,75 @@ def generate_pool_name(**kwargs):
     return "_".join(parts)
 
 
+def encode_document(doc):
+    """Serialize a document to JSON.
+
+    Args:
+        doc (object): A `dict`, :class:`mysqlx.DbDoc` or JSON string.
+
+    Raises:
+        :class:`mysqlx.ProgrammingError`: If the document type is not valid.
+
+    Returns:
+        bytes: The JSON encoded document.
+
+    .. versionadded:: 8.0.19
+    """
+    if isinstance(doc, DbDoc):
+        doc = doc.__dict__
+    if isinstance(doc, dict):
+        doc = json.dumps(doc, cls=ExprJSONEncoder)
+    elif not isinstance(doc, (STRING_TYPES, bytes)):
+        raise ProgrammingError("Invalid document type: {0}".format(type(doc)))
+    return encode_to_bytes(doc)
+
+
+def create_ssl_context(ssl_ca, ssl_crl, ssl_cert, ssl_key):
+    """Creates a SSL context for the X Protocol connections.
+
+    Args:
+        ssl_ca (str): The certification authority certificate.
+        ssl_crl (str): The certification revocation lists.
+        ssl_cert (str): The certificate.
+        ssl_key (str): The certificate key.
+
+    Raises:
+        :class:`mysqlx.InterfaceError`: If the parameters are invalid.
+
+    Returns:
+        ssl.SSLContext: The SSL context.
+    """
+    if hasattr(ssl, "PROTOCOL_TLS"):
+        protocol = ssl.PROTOCOL_TLS  # pylint: disable=E1101
+    else:
+        protocol = ssl.PROTOCOL_TLSv1
+
+    context = ssl.SSLContext(protocol)
+    context.load_default_certs()
+
+    if ssl_ca:
+        try:
+            context.load_verify_locations(ssl_ca)
+            context.verify_mode = ssl.CERT_REQUIRED
+        except (IOError, ssl.SSLError) as err:
+            raise InterfaceError("Invalid CA Certificate: {}".format(err))
+
+    if ssl_crl:
+        try:
+            context.load_verify_locations(ssl_crl)
+            context.verify_flags = ssl.VERIFY_CRL_CHECK_LEAF
+        except (IOError, ssl.SSLError) as err:
+            raise InterfaceError("Invalid CRL: {}".format(err))
+
+    if ssl_cert:
+        try:
+            context.load_cert_chain(ssl_cert, ssl_key)
+        except (IOError, ssl.SSLError) as err:
+            raise InterfaceError("Invalid Certificate/Key: {}".format(err))
+
+    return context
+
+
 class SocketStream(object):
     """Implements a socket stream."""
     def __init__(self):
@@ -162,6 +238,24 @@ class SocketStream(object):
             count -= len(data)
         return b"".join(buf)
 
+    def recv_into(self, buf):
+        """Receive data from the socket into a buffer.
+
+        Args:
+            buf (memoryview): The writable buffer receiving the data.
+
+        Returns:
+            int: The number of bytes received.
+
+        .. versionadded:: 8.0.19
+        """
+        if self._socket is None:
+            raise OperationalError("MySQLx Connection not available")
+        count = self._socket.recv_into(buf)
+        if count == 0:
+            raise RuntimeError("Unexpected connection close")
+        return count
+
     def sendall(self, data):
         """Send data to the socket.
 
@@ -206,36 +300,11 @@ class SocketStream(object):
             self.close()
             raise RuntimeError("Python installation has no SSL support")
 
-        if hasattr(ssl, "PROTOCOL_TLS"):
-            protocol = ssl.PROTOCOL_TLS  # pylint: disable=E1101
-        else:
-            protocol = ssl.PROTOCOL_TLSv1
-
-        context = ssl.SSLContext(protocol)
-        context.load_default_certs()
-
-        if ssl_ca:
-            try:
-                context.load_verify_locations(ssl_ca)
-                context.verify_mode = ssl.CERT_REQUIRED
-            except (IOError, ssl.SSLError) as err:
-                self.close()
-                raise InterfaceError("Invalid CA Certificate: {}".format(err))
-
-        if ssl_crl:
-            try:
-                context.load_verify_locations(ssl_crl)
-                context.verify_flags = ssl.VERIFY_CRL_CHECK_LEAF
-            except (IOError, ssl.SSLError) as err:
-                self.close()
-                raise InterfaceError("Invalid CRL: {}".format(err))
-
-        if ssl_cert:
-            try:
-                context.load_cert_chain(ssl_cert, ssl_key)
-            except (IOError, ssl.SSLError) as err:
-                self.close()
-                raise InterfaceError("Invalid Certificate/Key: {}".format(err))
+        try:
+            context = create_ssl_context(ssl_ca, ssl_crl, ssl_cert, ssl_key)
+        except InterfaceError:
+            self.close()
+            raise
 
         self._socket = context.wrap_socket(self._socket)
         if ssl_mode == SSLMode.VERIFY_IDENTITY:
@@ -313,6 +382,91 @@ def catch_network_exception(func):
     return wrapper
 
 
+class Pipeline(object):
+    """Sends several statements to the server without waiting for their
+    results.
+
+    While the pipeline is active, the messages of the executed statements are
+    buffered and sent to the server in a single write, and executing a
+    statement returns a :class:`mysqlx.PipelinedResult` instead of waiting for
+    its response. The responses are read in order when the pipeline is
+    synchronized, which happens on :meth:`sync`, when leaving the ``with``
+    block, when using a pending result or when running an operation that needs
+    its response right away, like ``Collection.count()``. It is also
+    synchronized once too many responses are pending or too many bytes were
+    written since the last synchronization.
+
+    The server executes every statement even if a previous one failed, the
+    error of a statement is raised when its result is used.
+
+    Args:
+        connection (mysqlx.connection.Connection): The Connection object.
+
+    .. versionadded:: 8.0.19
+    """
+    # Limit the unread responses and the bytes written since they were last
+    # read, so the server never blocks writing them while the client is still
+    # sending statements
+    _max_pending = 256
+    _max_pending_bytes = 1024 * 1024
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._pending = deque()
+        self._syncing = False
+        self._synced_bytes = connection.reader_writer.get_bytes_written()
+
+    def __enter__(self):
+        self._connection.set_pipeline(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.sync()
+        finally:
+            self._connection.set_pipeline(None)
+
+    def add(self, reader, *args):
+        """Queue the reader of the response of a message already written.
+
+        Args:
+            reader (callable): Reads the response and returns the result.
+            *args: The arguments passed to `reader`.
+
+        Returns:
+            mysqlx.PipelinedResult: The handle to the result.
+        """
+        result = PipelinedResult(self, partial(reader, *args))
+        self._pending.append(result)
+        if len(self._pending) >= self._max_pending or \
+           self._connection.reader_writer.get_bytes_written() - \
+           self._synced_bytes >= self._max_pending_bytes:
+            self.sync()
+        return result
+
+    def sync(self, until=None):
+        """Send the buffered messages and read the pending responses in order.
+
+        Args:
+            until (mysqlx.PipelinedResult): Stop after reading the response of
+                                            this result.
+        """
+        if self._syncing:
+            return
+        self._syncing = True
+        try:
+            while self._pending:
+                result = self._pending.popleft()
+                result.resolve()
+                if result is until:
+                    break
+            if not self._pending:
+                self._synced_bytes = \
+                    self._connection.reader_writer.get_bytes_written()
+        finally:
+            self._syncing = False
+
+
 class Connection(object):
     """Connection to a MySQL Server.
 
@@ -333,22 +487,49 @@ class Connection(object):
         self._cur_router = -1
         self._can_failover = True
         self._ensure_priorities()
-        self._routers.sort(key=lambda x: (x["priority"], -x.get("weight", 0)))
+        # Routers resolved from DNS SRV records are already in weighted random
+        # order, the sort is stable and keeps it within each priority
+        self._routers.sort(key=lambda x: x["priority"])
         self._connect_timeout = settings.get("connect-timeout",
                                              _CONNECT_TIMEOUT)
         if self._connect_timeout == 0:
             # None is assigned if connect timeout is 0, which disables timeouts
             # on socket operations
             self._connect_timeout = None
+        self._connect_attempt_delay = settings.get("connect-attempt-delay")
 
         self._stmt_counter = 0
         self._prepared_stmt_ids = []
         self._prepared_stmt_supported = True
+        self._pipeline = None
+        self._max_allowed_packet = None
 
     def fetch_active_result(self):
-        """Fetch active result."""
+        """Fetch active result.
+
+        The remaining items of a streaming result are discarded instead of
+        being buffered. The pending responses of an active pipeline are read
+        first.
+        """
+        if self._pipeline is not None:
+            self._pipeline.sync()
         if self._active_result is not None:
-            self._active_result.fetch_all()
+            if self._active_result.is_streaming():
+                self._active_result.discard_all()
+            else:
+                self._active_result.fetch_all()
+            self._active_result = None
+
+    def discard_active_result(self):
+        """Discard the remaining items of the active result without decoding
+        them.
+
+        .. versionadded:: 8.0.19
+        """
+        if self._pipeline is not None:
+            self._pipeline.sync()
+        if self._active_result is not None:
+            self._active_result.discard_all()
             self._active_result = None
 
     def set_active_result(self, result):
@@ -362,6 +543,80 @@ class Connection(object):
         """
         self._active_result = result
 
+    @catch_network_exception
+    def set_pipeline(self, pipeline):
+        """Set the active pipeline.
+
+        Args:
+            pipeline (mysqlx.connection.Pipeline): The pipeline, `None` to
+                                                   stop pipelining.
+
+        Raises:
+            :class:`mysqlx.ProgrammingError`: If a pipeline is already active.
+
+        .. versionadded:: 8.0.19
+        """
+        if pipeline is not None and self._pipeline is not None:
+            raise ProgrammingError("A pipeline is already active")
+        self._pipeline = pipeline
+        self.reader_writer.buffer_writes(pipeline is not None)
+
+    def _make_result(self, result_class, *args):
+        """Returns the result of the message just sent.
+
+        While a pipeline is active, a :class:`mysqlx.PipelinedResult` is
+        returned and the response is read later.
+
+        Args:
+            result_class (type): The result class.
+            *args: The arguments passed to the result class.
+
+        Returns:
+            `Result`: The result object.
+        """
+        if self._pipeline is not None:
+            return self._pipeline.add(self._read_result, result_class, *args)
+        return result_class(self, *args)
+
+    @catch_network_exception
+    def _read_result(self, result_class, *args):
+        """Read the response of a pipelined message.
+
+        Args:
+            result_class (type): The result class.
+            *args: The arguments passed to the result class.
+
+        Returns:
+            `Result`: The result object.
+        """
+        return result_class(self, *args)
+
+    @catch_network_exception
+    def _read_prepare_ok(self, statement):
+        """Read the response of a pipelined prepare statement.
+
+        Args:
+            statement (Statement): A `Statement` based type object.
+        """
+        self.fetch_active_result()
+        try:
+            self.protocol.read_prepare_ok()
+        except NotSupportedError:
+            self._prepared_stmt_supported = False
+            if statement.stmt_id in self._prepared_stmt_ids:
+                self._prepared_stmt_ids.remove(statement.stmt_id)
+            statement.prepared = False
+
+    @catch_network_exception
+    def _read_ok(self):
+        """Read the OK response of a pipelined message."""
+        self.fetch_active_result()
+        try:
+            self.protocol.read_ok()
+        except InterfaceError as err:
+            _LOGGER.warning("Warning: An error occurred in a pipelined "
+                            "message: {}".format(err))
+
     def _ensure_priorities(self):
         """Ensure priorities.
 
@@ -426,6 +681,11 @@ class Connection(object):
                                             server.
             :class:`mysqlx.TimeoutError`: If connect timeout was exceeded.
         """
+        self._max_allowed_packet = None
+        if self._connect_attempt_delay is not None and len(self._routers) > 1:
+            self._connect_staggered()
+            return
+
         # Loop and check
         error = None
         while self._can_failover:
@@ -440,21 +700,97 @@ class Connection(object):
             except socket.error as err:
                 error = err
 
+        raise self._get_connection_error(error)
+
+    def _open_stream(self, params):
+        """Opens a socket stream.
+
+        Args:
+            params (tuple): The connection parameters.
+
+        Returns:
+            SocketStream: The connected socket stream.
+
+        .. versionadded:: 8.0.19
+        """
+        stream = SocketStream()
+        stream.connect(params, self._connect_timeout)
+        return stream
+
+    def _connect_staggered(self):
+        """Attempt to connect to the routers in parallel.
+
+        The routers are tried by priority, the attempt to the next router
+        starts after `connect-attempt-delay` milliseconds or when the previous
+        attempt failed. The first established socket is used and the others
+        are closed. If the connection fails during the handshake, the router
+        is marked as unavailable and the remaining routers are tried.
+
+        Raises:
+            :class:`mysqlx.InterfaceError`: If fails to connect to the MySQL
+                                            server.
+            :class:`mysqlx.TimeoutError`: If connect timeout was exceeded.
+
+        .. versionadded:: 8.0.19
+        """
+        for router in self._routers:
+            router["available"] = True
+        remaining = list(range(len(self._routers)))
+        error = None
+        while remaining:
+            attempts = [partial(self._open_stream,
+                                (self._routers[index]["host"],
+                                 self._routers[index]["port"]))
+                        for index in remaining]
+            try:
+                index, self.stream = staggered_connect(
+                    attempts, self._connect_attempt_delay / 1000.0,
+                    lambda stream: stream.close())
+            except socket.error as err:
+                error = err
+                break
+            self._cur_router = remaining.pop(index)
+            self._can_failover = len(remaining) > 0
+            try:
+                self.reader_writer = MessageReaderWriter(self.stream)
+                self.protocol = Protocol(self.reader_writer)
+                self._handle_capabilities()
+                self._authenticate()
+                return
+            except socket.error as err:
+                error = err
+                self.stream.close()
+                self._routers[self._cur_router]["available"] = False
+
+        self._can_failover = False
+        raise self._get_connection_error(error)
+
+    def _get_connection_error(self, error):
+        """Returns the error to raise when all the connection attempts failed.
+
+        Args:
+            error (socket.error): The error of the last connection attempt.
+
+        Returns:
+            :class:`mysqlx.Error`: A :class:`mysqlx.InterfaceError` or a
+                                   :class:`mysqlx.TimeoutError`.
+        """
         # Python 2.7 does not raise a socket.timeout exception when using
         # settimeout(), but it raises a socket.error with errno.EAGAIN (11)
         # or errno.EINPROGRESS (115) if connect-timeout value is too low
         if error is not None and (isinstance(error, socket.timeout) or
                                   (error.errno in (11, 115) and not PY3)):
             if len(self._routers) <= 1:
-                raise TimeoutError("Connection attempt to the server was "
-                                   "aborted. Timeout of {0} ms was exceeded"
-                                   "".format(self._connect_timeout))
-            raise TimeoutError("All server connection attempts were aborted. "
-                               "Timeout of {0} ms was exceeded for each "
-                               "selected server".format(self._connect_timeout))
+                return TimeoutError("Connection attempt to the server was "
+                                    "aborted. Timeout of {0} ms was exceeded"
+                                    "".format(self._connect_timeout))
+            return TimeoutError("All server connection attempts were aborted. "
+                                "Timeout of {0} ms was exceeded for each "
+                                "selected server"
+                                "".format(self._connect_timeout))
         if len(self._routers) <= 1:
-            raise InterfaceError("Cannot connect to host: {0}".format(error))
-        raise InterfaceError("Failed to connect to any of the routers", 4001)
+            return InterfaceError("Cannot connect to host: {0}".format(error))
+        return InterfaceError("Failed to connect to any of the routers", 4001)
 
     def _handle_capabilities(self):
         """Handle capabilities.
@@ -564,7 +900,12 @@ class Connection(object):
             statement (Statement): A `Statement` based type object.
         """
         if statement.prepared:
-            self.protocol.send_prepare_deallocate(statement.stmt_id)
+            if self._pipeline is not None:
+                self.protocol.send_prepare_deallocate(statement.stmt_id,
+                                                      read_response=False)
+                self._pipeline.add(self._read_ok)
+            else:
+                self.protocol.send_prepare_deallocate(statement.stmt_id)
             self._prepared_stmt_ids.remove(statement.stmt_id)
             statement.prepared = False
 
@@ -576,6 +917,13 @@ class Connection(object):
             msg (mysqlx.protobuf.Message): MySQL X Protobuf Message.
             statement (Statement): A `Statement` based type object.
         """
+        if self._pipeline is not None:
+            self.protocol.send_prepare_prepare(msg_type, msg, statement,
+                                               read_response=False)
+            self._pipeline.add(self._read_prepare_ok, statement)
+            self._prepared_stmt_ids.append(statement.stmt_id)
+            statement.prepared = True
+            return
         try:
             self.fetch_active_result()
             self.protocol.send_prepare_prepare(msg_type, msg, statement)
@@ -658,7 +1006,7 @@ class Connection(object):
             msg_type, msg = self.protocol.build_execute_statement(
                 "sql", sql)
         self.protocol.send_msg_without_ps(msg_type, msg, statement)
-        return SqlResult(self)
+        return self._make_result(SqlResult)
 
     @catch_network_exception
     def send_insert(self, statement):
@@ -678,7 +1026,92 @@ class Connection(object):
         ids = None
         if isinstance(statement, AddStatement):
             ids = statement.ids
-        return Result(self, ids)
+        return self._make_result(Result, ids)
+
+    @catch_network_exception
+    def send_add_many(self, collection, docs, batch_bytes=None):
+        """Add documents to a collection in batches.
+
+        The documents are serialized to JSON as they are read from `docs` and
+        sent in Crud.Insert messages of up to `batch_bytes`, which is capped
+        to the server mysqlx_max_allowed_packet. Batches are sent without
+        waiting for the result of the previous ones.
+
+        Args:
+            collection (mysqlx.Collection): The Collection object.
+            docs (iterable): The documents.
+            batch_bytes (Optional[int]): The maximum size of each message.
+
+        Raises:
+            :class:`mysqlx.ProgrammingError`: If a document is too large.
+
+        Returns:
+            :class:`mysqlx.Result`: The result object.
+
+        .. versionadded:: 8.0.19
+        """
+        max_size = self.get_max_allowed_packet() - len(collection.name) - \
+            len(collection.schema.name) - 64
+        if batch_bytes:
+            max_size = min(max_size, batch_bytes)
+
+        pipeline = None
+        if self._pipeline is None:
+            pipeline = Pipeline(self)
+            self.set_pipeline(pipeline)
+        results = []
+        try:
+            batch = []
+            size = 0
+            for doc in docs:
+                doc = encode_document(doc)
+                doc_size = len(doc) + _INSERT_ROW_OVERHEAD
+                if doc_size > max_size:
+                    raise ProgrammingError(
+                        "The document size {0} exceeds the maximum insert "
+                        "size of {1} bytes".format(len(doc), max_size))
+                if size + doc_size > max_size:
+                    results.append(self._send_documents(collection, batch))
+                    batch = []
+                    size = 0
+                batch.append(doc)
+                size += doc_size
+            if batch:
+                results.append(self._send_documents(collection, batch))
+        finally:
+            if pipeline is not None:
+                pipeline.sync()
+                self.set_pipeline(None)
+
+        result = Result()
+        rows_affected = 0
+        generated_ids = []
+        for res in results:
+            res = res.get()
+            rows_affected += res.get_affected_items_count()
+            generated_ids.extend(res.get_generated_ids())
+            for warning in res.get_warnings():
+                result.append_warning(warning["level"], warning["code"],
+                                      warning["msg"])
+        result.set_rows_affected(rows_affected)
+        result.set_generated_ids(generated_ids)
+        return result
+
+    def _send_documents(self, collection, docs):
+        """Send a batch of JSON documents.
+
+        Args:
+            collection (mysqlx.Collection): The Collection object.
+            docs (list): The JSON encoded documents.
+
+        Returns:
+            mysqlx.PipelinedResult: The handle to the result.
+        """
+        msg_type, msg = self.protocol.build_insert_documents(collection, docs)
+        self.protocol.send_msg(msg_type, msg)
+        # Stream the batch instead of buffering the whole pipeline
+        self.reader_writer.flush()
+        return self._make_result(Result)
 
     @catch_network_exception
     def send_find(self, statement):
@@ -694,7 +1127,8 @@ class Connection(object):
         """
         msg_type, msg = self.protocol.build_find(statement)
         self._execute_prepared_pipeline(msg_type, msg, statement)
-        return DocResult(self) if statement.is_doc_based() else RowResult(self)
+        return self._make_result(DocResult if statement.is_doc_based()
+                                 else RowResult)
 
     @catch_network_exception
     def send_delete(self, statement):
@@ -709,7 +1143,7 @@ class Connection(object):
         """
         msg_type, msg = self.protocol.build_delete(statement)
         self._execute_prepared_pipeline(msg_type, msg, statement)
-        return Result(self)
+        return self._make_result(Result)
 
     @catch_network_exception
     def send_update(self, statement):
@@ -724,7 +1158,7 @@ class Connection(object):
         """
         msg_type, msg = self.protocol.build_update(statement)
         self._execute_prepared_pipeline(msg_type, msg, statement)
-        return Result(self)
+        return self._make_result(Result)
 
     @catch_network_exception
     def execute_nonquery(self, namespace, cmd, raise_on_fail, fields=None):
@@ -797,6 +1231,17 @@ class Connection(object):
         """
         return self.protocol.read_row(result)
 
+    @catch_network_exception
+    def skip_rows(self):
+        """Skip the rows of the active result set without decoding them.
+
+        Returns:
+            int: The number of skipped rows.
+
+        .. versionadded:: 8.0.19
+        """
+        return self.protocol.skip_rows()
+
     @catch_network_exception
     def close_result(self, result):
         """Close result.
@@ -815,6 +1260,21 @@ class Connection(object):
         """
         return self.protocol.get_column_metadata(result)
 
+    def get_max_allowed_packet(self):
+        """Returns the mysqlx_max_allowed_packet of the server.
+
+        The value is queried once per connection.
+
+        Returns:
+            int: The maximum size of a message.
+
+        .. versionadded:: 8.0.19
+        """
+        if self._max_allowed_packet is None:
+            self._max_allowed_packet = int(self.execute_sql_scalar(
+                "SELECT @@mysqlx_max_allowed_packet"))
+        return self._max_allowed_packet
+
     def get_next_statement_id(self):
         """Returns the next statement ID.
 
@@ -868,8 +1328,7 @@ class Connection(object):
         """Reset a sucessfully authenticated session."""
         if not self.is_open():
             return
-        if self._active_result is not None:
-            self._active_result.fetch_all()
+        self.discard_active_result()
         try:
             self.keep_open = self.protocol.send_reset(self.keep_open)
         except (InterfaceError, OperationalError) as err:
@@ -882,8 +1341,7 @@ class Connection(object):
         """
         if not self.is_open():
             return
-        if self._active_result is not None:
-            self._active_result.fetch_all()
+        self.discard_active_result()
         self.protocol.send_connection_close()
         self.protocol.read_ok()
         self.stream.close()
@@ -914,6 +1372,7 @@ class PooledConnection(Connection):
         self.pool = pool
         self.host = pool.cnx_config["host"]
         self.port = pool.cnx_config["port"]
+        self.idle_since = None
 
     def close_connection(self):
         """Closes the connection.
@@ -938,8 +1397,7 @@ class PooledConnection(Connection):
     def reconnect(self):
         """Reconnect this connection.
         """
-        if self._active_result is not None:
-            self._active_result.fetch_all()
+        self.discard_active_result()
         self._authenticate()
 
     def reset(self):
@@ -967,6 +1425,11 @@ class ConnectionPool(queue.Queue):
 
     Initializes the Pool with the given name and settings.
 
+    The pool keeps a count of slots, one for each connection opened or being
+    opened. A request either takes an idle connection, reserves a free slot
+    to open a new connection, or waits in a FIFO queue until a connection or
+    a slot is handed over to it. The pool state is guarded by the queue mutex.
+
     Args:
         name (str): The name of the pool, used to track a single pool per
                     combination of host and user.
@@ -1005,6 +1468,9 @@ class ConnectionPool(queue.Queue):
         self.cnx_config = kwargs
         self.host = kwargs['host']
         self.port = kwargs['port']
+        self._server_version = None
+        self._slots = 0
+        self._waiters = deque()
 
     def _set_pool_name(self, pool_name):
         r"""Set the name of the pool.
@@ -1033,13 +1499,20 @@ class ConnectionPool(queue.Queue):
         """
         return len(self._connections_openned)
 
+    @property
+    def waiting(self):
+        """Returns the number of requests waiting for a connection.
+        """
+        return len(self._waiters)
+
     def remove_connection(self, cnx=None):
         """Removes a connection to this pool.
 
         Args:
             cnx (PooledConnection): The connection object.
         """
-        self._connections_openned.remove(cnx)
+        with self.mutex:
+            self._connections_openned.remove(cnx)
 
     def add_connection(self, cnx=None):
         """Adds a connection to this pool.
@@ -1064,15 +1537,15 @@ class ConnectionPool(queue.Queue):
             raise PoolError("Failed adding connection; queue is full")
 
         if not cnx:
-            cnx = PooledConnection(self)
-            # mysqlx_wait_timeout is only available on MySQL 8
-            ver = cnx.sql('show variables like "version"'
-                         ).execute().fetch_all()[0][1]
-            if tuple([int(n) for n in ver.split("-")[0].split(".")]) > \
-                (8, 0, 10):
-                cnx.sql("set mysqlx_wait_timeout = {}"
-                        "".format(self.max_idle_time)).execute()
-            self._connections_openned.append(cnx)
+            with self.mutex:
+                if self._slots >= self.pool_max_size:
+                    raise PoolError("Failed adding connection; queue is full")
+                self._slots += 1
+            try:
+                cnx = self.open_connection()
+            except:
+                self.release_slot()
+                raise
         else:
             if not isinstance(cnx, PooledConnection):
                 raise PoolError(
@@ -1083,9 +1556,8 @@ class ConnectionPool(queue.Queue):
     def queue_connection(self, cnx):
         """Put connection back in the queue:
 
-        This method is putting a connection back in the queue.
-        It will not acquire a lock as the methods using _queue_connection() will
-        have it set.
+        This method is putting a connection back in the queue, or hands it
+        over to the first request waiting for a connection.
 
         Args:
             PooledConnection: The connection object.
@@ -1100,15 +1572,165 @@ class ConnectionPool(queue.Queue):
         # Reset the connection
         if self.reset_session:
             cnx.reset_session()
+        cnx.idle_since = time.time()
+        with self.mutex:
+            if self._waiters:
+                self._waiters.popleft().hand_over(cnx)
+            elif self._qsize() < self.pool_max_size:
+                self._put(cnx)
+
+    def release_slot(self):
+        """Releases the slot of a connection that was closed or failed to open.
+
+        The slot is handed over to the first request waiting for a
+        connection, which will open a new one.
+        """
+        with self.mutex:
+            if self._waiters:
+                self._waiters.popleft().hand_over(None)
+            else:
+                self._slots -= 1
+
+    def acquire(self, timeout=None):
+        """Takes an idle connection or reserves a slot to open a new one.
+
+        Requests are served in FIFO order, a request never takes a connection
+        or a slot while others are waiting for one.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait. Zero
+                             value means no wait, `None` means infinite.
+
+        Raises:
+            :class:`mysqlx.PoolError`: If the timeout is exceeded.
+
+        Returns:
+            PooledConnection: An idle connection, or `None` if a slot was
+                              reserved to open a new connection.
+        """
+        with self.mutex:
+            if not self._waiters:
+                if self._qsize() > 0:
+                    return self._get()
+                if self._slots < self.pool_max_size:
+                    self._slots += 1
+                    return None
+            if timeout is not None and timeout <= 0:
+                raise PoolError("Failed getting connection; pool exhausted")
+
+            waiter = _PoolWaiter(self.mutex)
+            self._waiters.append(waiter)
+            if not waiter.wait(timeout):
+                self._waiters.remove(waiter)
+                raise PoolError("pool max size has been reached")
+            return waiter.cnx
+
+    def get_connection(self, timeout=None):
+        """Get a connection ready to be used from this pool.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait for a
+                             connection. Zero value means no wait, `None`
+                             means infinite.
+
+        Raises:
+            :class:`mysqlx.PoolError`: If the timeout is exceeded.
+
+        Returns:
+            PooledConnection: A pooled connection object.
+        """
+        cnx = self.acquire(timeout)
+        try:
+            if cnx is None:
+                return self.open_connection()
+            return self.prepare_connection(cnx)
+        except:
+            self.release_slot()
+            raise
+
+    def open_connection(self, refresh=False):
+        """Opens a new connection for a reserved slot.
+
+        Args:
+            refresh (bool): `True` to query the server version again.
+
+        Returns:
+            PooledConnection: The new connection object.
+        """
+        cnx = PooledConnection(self)
+        self.track_connection(cnx)
         try:
-            self.put(cnx, block=False)
-        except queue.Full:
-            PoolError("Failed adding connection; queue is full")
+            cnx.connect()
+            self.setup_connection(cnx, refresh)
+        except:
+            cnx.disconnect()
+            self.remove_connection(cnx)
+            raise
+        return cnx
+
+    def setup_connection(self, cnx, refresh=False):
+        """Applies the pool session settings to a new authenticated session.
+
+        The server version is queried once and cached in the pool, since all
+        the connections in a pool target the same host and port.
+
+        Args:
+            cnx (PooledConnection): The connection object.
+            refresh (bool): `True` to query the server version again, used
+                            after the server connection has been lost.
+        """
+        if refresh or self._server_version is None:
+            ver = cnx.sql('show variables like "version"'
+                         ).execute().fetch_all()[0][1]
+            self._server_version = \
+                tuple([int(n) for n in ver.split("-")[0].split(".")])
+        # mysqlx_wait_timeout is only available on MySQL 8
+        if self._server_version > (8, 0, 10):
+            cnx.sql("set mysqlx_wait_timeout = {}"
+                    "".format(self.max_idle_time)).execute()
+
+    def prepare_connection(self, cnx):
+        """Prepares a connection taken from the queue to be returned.
+
+        A connection kept open by the server after the session reset is
+        returned as is, without any round trip. If the connection required
+        to re-authenticate, the pool session settings are applied again.
+        If the connection was idle longer than the server wait timeout or
+        it was closed by the server, a new connection is opened instead.
+
+        Args:
+            cnx (PooledConnection): The connection object.
+
+        Returns:
+            PooledConnection: A connection ready to be used.
+        """
+        expired = cnx.idle_since is not None and \
+            time.time() - cnx.idle_since >= self.max_idle_time
+        if not expired:
+            try:
+                # Only reset the connection by reauthentification if
+                # the connection was unnable to keep open by the server
+                if not cnx.keep_open:
+                    cnx.reset()
+                    self.setup_connection(cnx)
+                return cnx
+            except (RuntimeError, socket.error, InterfaceError,
+                    OperationalError):
+                pass
+        try:
+            cnx.close_connection()
+        except (RuntimeError, socket.error, InterfaceError):
+            pass
+        finally:
+            self.remove_connection(cnx)
+        # Connection was closed by the server, create new
+        return self.open_connection(refresh=True)
 
     def track_connection(self, connection):
         """Tracks connection in order of close it when client.close() is invoke.
         """
-        self._connections_openned.append(connection)
+        with self.mutex:
+            self._connections_openned.append(connection)
 
     def __str__(self):
         return self.name
@@ -1116,10 +1738,58 @@ class ConnectionPool(queue.Queue):
     def close(self):
         """Empty this ConnectionPool.
         """
-        for cnx in self._connections_openned:
+        with self.mutex:
+            connections = list(self._connections_openned)
+        for cnx in connections:
             cnx.close_connection()
 
 
+class _PoolWaiter(object):
+    """A request waiting for a connection in a :class:`ConnectionPool`.
+
+    Args:
+        lock (threading.Lock): The pool lock.
+    """
+    def __init__(self, lock):
+        self._cond = threading.Condition(lock)
+        self._ready = False
+        self.cnx = None
+
+    def hand_over(self, cnx):
+        """Hands over a connection or a slot (if cnx is `None`) to the waiter.
+
+        Must be called holding the pool lock.
+
+        Args:
+            cnx (PooledConnection): The connection object or `None`.
+        """
+        self.cnx = cnx
+        self._ready = True
+        self._cond.notify()
+
+    def wait(self, timeout=None):
+        """Waits until a connection or a slot is handed over.
+
+        Must be called holding the pool lock.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait.
+
+        Returns:
+            bool: `True` if a connection or a slot was handed over.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while not self._ready:
+            if deadline is None:
+                self._cond.wait()
+                continue
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            self._cond.wait(remaining)
+        return True
+
+
 class PoolsManager(object):
     """Manages a pool of connections for a host or hosts in routers.
 
@@ -1129,6 +1799,7 @@ class PoolsManager(object):
     """
     __instance = None
     __pools = {}
+    __lock = threading.Lock()
 
     def __new__(cls):
         if PoolsManager.__instance is None:
@@ -1173,6 +1844,8 @@ class PoolsManager(object):
         for pool in self.__pools.get(settings.get("client_id", "No id"), []):
             if pool.name in pool_names:
                 available_pools.append(pool)
+        # Return the pools in the order of the routers
+        available_pools.sort(key=lambda pool: pool_names.index(pool.name))
         return available_pools
 
     def _get_connections_settings(self, settings):
@@ -1197,8 +1870,8 @@ class PoolsManager(object):
                             "weight": 0,
                             "host": pool_settings["host"],
                             "port": pool_settings["port"]})
-        # Order routers
-        routers.sort(key=lambda x: (x["priority"], -x.get("weight", 0)))
+        # Order routers, keeping the weighted order of DNS SRV records
+        routers.sort(key=lambda x: x["priority"])
         for router in routers:
             connection_settings = pool_settings.copy()
             connection_settings["host"] = router["host"]
@@ -1221,19 +1894,20 @@ class PoolsManager(object):
         """
         connections_settings = self._get_connections_settings(cnx_settings)
 
-        # Subscribe client if it does not exists
-        if cnx_settings.get("client_id", "No id") not in self.__pools:
-            self.__pools[cnx_settings.get("client_id", "No id")] = []
+        with self.__lock:
+            # Subscribe client if it does not exists
+            if cnx_settings.get("client_id", "No id") not in self.__pools:
+                self.__pools[cnx_settings.get("client_id", "No id")] = []
 
-        # Create a pool for each router
-        for router_name, settings in connections_settings:
-            if self._pool_exists(cnx_settings.get("client_id", "No id"),
-                                 router_name):
-                continue
-            else:
-                pool = self.__pools.get(cnx_settings.get("client_id", "No id"),
-                                        [])
-                pool.append(ConnectionPool(router_name, **settings))
+            # Create a pool for each router
+            for router_name, settings in connections_settings:
+                if self._pool_exists(cnx_settings.get("client_id", "No id"),
+                                     router_name):
+                    continue
+                else:
+                    pool = self.__pools.get(
+                        cnx_settings.get("client_id", "No id"), [])
+                    pool.append(ConnectionPool(router_name, **settings))
 
     def get_connection(self, settings):
         """Get a connection from the pool.
@@ -1243,6 +1917,9 @@ class PoolsManager(object):
 
         When the MySQL connection is not connected, a reconnect is attempted.
 
+        If all the pools are exhausted, the request waits up to queue_timeout
+        for a connection of the pool with the highest priority.
+
         Raises:
             :class:`PoolError`: On errors.
 
@@ -1250,84 +1927,24 @@ class PoolsManager(object):
             PooledConnection: A pooled connection object.
         """
         pools = self._get_pools(settings)
-        # Pools are stored by router priority
-        num_pools = len(pools)
-        for pool_number in range(num_pools):
-            pool = pools[pool_number]
+        # Pools are stored by router priority, take a connection from the
+        # first pool that has one available without waiting
+        error = None
+        exhausted = []
+        for pool in pools:
             try:
-                # Check connections aviability in this pool
-                if pool.qsize() > 0:
-                    # We have connections in pool, try to return a working one
-                    with threading.RLock():
-                        try:
-                            cnx = pool.get(block=True,
-                                           timeout=pool.queue_timeout)
-                        except queue.Empty:
-                            raise PoolError(
-                                "Failed getting connection; pool exhausted")
-                        try:
-                            # Only reset the connection by reauthentification if
-                            # the connection was unnable to keep open by the server
-                            if not cnx.keep_open:
-                                cnx.reset()
-                            ver = cnx.sql('show variables like "version"'
-                                         ).execute().fetch_all()[0][1]
-                        except (RuntimeError, socket.error, InterfaceError):
-                            try:
-                                cnx.close_connection()
-                            except (RuntimeError, socket.error, InterfaceError):
-                                pass
-                            finally:
-                                pool.remove_connection(cnx)
-                            # Connection was closed by the server, create new
-                            cnx = PooledConnection(pool)
-                            pool.track_connection(cnx)
-                            cnx.connect()
-                            ver = cnx.sql('show variables like "version"'
-                                         ).execute().fetch_all()[0][1]
-                        # mysqlx_wait_timeout is only available on MySQL 8
-                        if tuple([int(n) for n in
-                                  ver.split("-")[0].split(".")]) > (8, 0, 10):
-                            cnx.sql("set mysqlx_wait_timeout = {}"
-                                    "".format(pool.max_idle_time)).execute()
-                        return cnx
-                elif pool.open_connections < pool.pool_max_size:
-                    # No connections in pool, but we can open a new one
-                    cnx = PooledConnection(pool)
-                    pool.track_connection(cnx)
-                    cnx.connect()
-                    # mysqlx_wait_timeout is only available on MySQL 8
-                    ver = cnx.sql('show variables like "version"'
-                                 ).execute().fetch_all()[0][1]
-                    if tuple([int(n) for n in
-                              ver.split("-")[0].split(".")]) > (8, 0, 10):
-                        cnx.sql("set mysqlx_wait_timeout = {}"
-                                "".format(pool.max_idle_time)).execute()
-                    return cnx
-                else:
-                    # Pool is exaust so the client needs to wait
-                    with threading.RLock():
-                        try:
-                            cnx = pool.get(block=True,
-                                           timeout=pool.queue_timeout)
-                            cnx.reset()
-                            # mysqlx_wait_timeout is only available on MySQL 8
-                            ver = cnx.sql('show variables like "version"'
-                                         ).execute().fetch_all()[0][1]
-                            if tuple([int(n) for n in
-                                      ver.split("-")[0].split(".")]) > \
-                                      (8, 0, 10):
-                                cnx.sql("set mysqlx_wait_timeout = {}"
-                                        "".format(pool.max_idle_time)
-                                       ).execute()
-                            return cnx
-                        except queue.Empty:
-                            raise PoolError("pool max size has been reached")
-            except (InterfaceError, TimeoutError):
-                if pool_number == num_pools - 1:
-                    raise
-                else:
-                    continue
+                return pool.get_connection(timeout=0)
+            except PoolError:
+                exhausted.append(pool)
+            except (InterfaceError, TimeoutError) as err:
+                error = err
+        if not exhausted:
+            if error is not None:
+                raise error
+            return None
+        # Wait in the pool with the highest priority
+        pool = exhausted[0]
+        return pool.get_connection(timeout=pool.queue_timeout)
 
     def close_pool(self, cnx_settings):
         """Closes the connections in the pools
@@ -1364,26 +1981,7 @@ class Session(object):
         self.use_pure = settings.get("use-pure", Protobuf.use_pure)
         self._settings = settings
 
-        # Check for DNS SRV
-        if settings.get("host") and settings.get("dns-srv"):
-            try:
-                srv_records = dns.resolver.query(settings["host"], "SRV")
-            except dns.exception.DNSException:
-                raise InterfaceError("Unable to locate any hosts for '{0}'"
-                                     "".format(settings["host"]))
-            self._settings["routers"] = []
-            for srv in srv_records:
-                self._settings["routers"].append({
-                    "host": srv.target.to_text(omit_final_dot=True),
-                    "port": srv.port,
-                    "priority": srv.priority,
-                    "weight": srv.weight
-                })
-
-        if "connection-attributes" not in self._settings or \
-           self._settings["connection-attributes"] != False:
-            self._settings["attributes"] = {}
-            self._init_attributes()
+        self._init_settings()
 
         if "pooling" in settings and settings["pooling"]:
             # Create pool and retrieve a Connection instance
@@ -1405,6 +2003,21 @@ class Session(object):
                     else "Default schema '{}' does not exists".format(schema)
                 raise InterfaceError(errmsg, err.errno)
 
+    def _init_settings(self):
+        """Resolve the DNS SRV records and setup the connection-attributes."""
+        # Check for DNS SRV
+        if self._settings.get("host") and self._settings.get("dns-srv"):
+            try:
+                self._settings["routers"] = resolve_srv(self._settings["host"])
+            except dns.exception.DNSException:
+                raise InterfaceError("Unable to locate any hosts for '{0}'"
+                                     "".format(self._settings["host"]))
+
+        if "connection-attributes" not in self._settings or \
+           self._settings["connection-attributes"] != False:
+            self._settings["attributes"] = {}
+            self._init_attributes()
+
     def _init_attributes(self):
         """Setup default and user defined connection-attributes."""
         if os.name == "nt":
@@ -1509,6 +2122,25 @@ class Session(object):
         """
         return SqlStatement(self._connection, sql)
 
+    def pipeline(self):
+        """Creates a :class:`mysqlx.connection.Pipeline` object to send several
+        statements to the server without waiting for their results.
+
+        Statements executed inside the ``with`` block return a
+        :class:`mysqlx.PipelinedResult`, resolved after the block::
+
+            with session.pipeline():
+                res = collection.add({"_id": "1"}).execute()
+                docs = collection.find().execute()
+            print(res.get_affected_items_count(), docs.fetch_all())
+
+        Returns:
+            mysqlx.connection.Pipeline: Pipeline object.
+
+        .. versionadded:: 8.0.19
+        """
+        return Pipeline(self._connection)
+
     def get_connection(self):
         """Returns the underlying connection.
 
@@ -46,6 +46,7 @@ _COUNT_SCHEMAS_QUERY = ("SELECT COUNT(*) FROM information_schema.schemata "
                         "WHERE schema_name = '{0}'")
 _COUNT_QUERY = "SELECT COUNT(*) FROM {0}.{1}"
 _DROP_TABLE_QUERY = "DROP TABLE IF EXISTS {0}.{1}"
+_ADD_MANY_BATCH_BYTES = 1048576
 
 
 class DatabaseObject(object):
@@ -333,6 +334,31 @@ class Collection(DatabaseObject):
         """
         return AddStatement(self).add(*values)
 
+    def add_many(self, docs, batch_bytes=None):
+        """Adds the documents of an iterable to a collection in batches.
+
+        The documents are serialized to JSON as the iterable is consumed and
+        sent in insert messages of up to ``batch_bytes``, capped to the
+        server ``mysqlx_max_allowed_packet``. Batches are sent without waiting
+        for the result of the previous ones. Each batch is inserted on its
+        own, if a batch fails the other batches are still inserted and the
+        first error is raised.
+
+        Args:
+            docs (iterable): The documents, as `dict`, :class:`mysqlx.DbDoc`
+                             or JSON strings.
+            batch_bytes (Optional[int]): The maximum size of each batch, 1 MiB
+                                         by default.
+
+        Returns:
+            mysqlx.Result: Result object with the affected items count, the
+                           generated ids and the warnings of all batches.
+
+        .. versionadded:: 8.0.19
+        """
+        return self._connection.send_add_many(
+            self, docs, batch_bytes or _ADD_MANY_BATCH_BYTES)
+
 
     def remove(self, condition):
         """Removes documents based on the ``condition``.
@@ -31,7 +31,14 @@
 from .compat import STRING_TYPES, BYTE_TYPES, UNICODE_TYPES
 from .helpers import get_item_or_attr
 from .dbdoc import DbDoc
-from .protobuf import Message, mysqlxpb_enum
+from .protobuf import Message, Protobuf, mysqlxpb_enum
+
+from mysql.connector.utils import LRUCache
+
+# Expressions parsed recently, see parse_expr()
+EXPR_CACHE = LRUCache(maxsize=1024)
+# Longer expressions are not cached, they are rarely parsed repeatedly
+EXPR_CACHE_MAX_LENGTH = 4096
 
 
 # pylint: disable=C0103,C0111
@@ -1262,3 +1269,43 @@ class ExprParser(object):
             first = False
             expr_list.append(self._expr().get_message())
         return expr_list
+
+
+def parse_expr(string, allow_relational=False, entry="expr"):
+    """Parse an expression string.
+
+    The result of each expression up to EXPR_CACHE_MAX_LENGTH long is cached
+    in EXPR_CACHE, keyed by the string, `allow_relational` and the parser
+    entry point, so expressions used repeatedly are lexed and parsed only
+    once. The cached messages are shared and must not be modified. The
+    cache hit rate is given by the `hits` and `misses` counters of
+    EXPR_CACHE.
+
+    Args:
+        string (str): The expression string.
+        allow_relational (bool): `True` to allow relational columns.
+        entry (str): The name of the :class:`ExprParser` method parsing the
+                     expression, like "expr" or "parse_order_spec".
+
+    Raises:
+        ValueError: If the expression is not valid.
+
+    Returns:
+        tuple: The parsed expression and the map of placeholder names to
+               positions.
+
+    .. versionadded:: 8.0.19
+    """
+    if not isinstance(string, STRING_TYPES) or \
+       len(string) > EXPR_CACHE_MAX_LENGTH:
+        parser = ExprParser(string, allow_relational)
+        return getattr(parser, entry)(), parser.placeholder_name_to_position
+    # Messages are dicts with the C extension and objects otherwise
+    key = (string, allow_relational, entry, Protobuf.use_pure)
+    parsed = EXPR_CACHE.get(key)
+    if parsed is None:
+        parser = ExprParser(string, allow_relational)
+        parsed = (getattr(parser, entry)(),
+                  parser.placeholder_name_to_position)
+        EXPR_CACHE.put(key, parsed)
+    return parsed
@@ -198,11 +198,17 @@ try:
         _mysqlxpb C++ extension."""
 
         factory = message_factory.MessageFactory()
+        # Message classes by type name, looking them up in the descriptor
+        # pool is slower than creating the message
+        prototypes = {}
 
         @staticmethod
         def new_message(name):
-            cls = _mysqlxpb_pure.factory.GetPrototype(
-                _DESCRIPTOR_POOL.FindMessageTypeByName(name))
+            cls = _mysqlxpb_pure.prototypes.get(name)
+            if cls is None:
+                cls = _mysqlxpb_pure.factory.GetPrototype(
+                    _DESCRIPTOR_POOL.FindMessageTypeByName(name))
+                _mysqlxpb_pure.prototypes[name] = cls
             return cls()
 
         @staticmethod
@@ -224,9 +230,7 @@ try:
             msg_type_name = SERVER_MESSAGES.get(msg_type)
             if not msg_type_name:
                 raise ValueError("Unknown msg_type: {0}".format(msg_type))
-            msg = _mysqlxpb_pure.new_message(msg_type_name)
-            msg.ParseFromString(payload)
-            return msg
+            return _mysqlxpb_pure.parse_message(msg_type_name, payload)
 except ImportError:
     HAVE_PROTOBUF = False
     if not HAVE_MYSQLXPB_CEXT:
@@ -321,9 +325,8 @@ class Message(object):
         Returns:
             object: The value of the provided key name.
         """
-        return self.__dict__["_msg"].get(name, default) \
-            if not Protobuf.use_pure \
-               else getattr(self.__dict__["_msg"], name, default)
+        return self._msg.get(name, default) if not Protobuf.use_pure \
+            else getattr(self._msg, name, default)
 
     def set_message(self, msg):
         """Sets the message.
@@ -340,7 +343,7 @@ class Message(object):
         Returns:
             dict: The dictionary representing a message containing parsed data.
         """
-        return self.__dict__["_msg"]
+        return self._msg
 
     def serialize_to_string(self):
         """Serializes a message to a string.
@@ -418,6 +421,99 @@ class Message(object):
         return msg
 
 
+class MessageView(Message):
+    """A server message decoded when its fields are first accessed.
+
+    Messages only checked by type, like `Mysqlx.Resultset.FetchDone`, are
+    never decoded. The fields of a `Mysqlx.Resultset.Row` are sliced from the
+    payload as bytes, without creating a protobuf message.
+
+    Args:
+        msg_type_name (string): Message type name.
+        payload (bytes): Serialized message data.
+
+    .. versionadded:: 8.0.19
+    """
+    def __init__(self, msg_type_name, payload):
+        # pylint: disable=W0231
+        self.__dict__["_type_name"] = msg_type_name
+        self.__dict__["_payload"] = payload
+        self.__dict__["_decoded"] = None
+
+    def __getattr__(self, name):
+        if name == "field" and self._type_name == "Mysqlx.Resultset.Row":
+            fields = self.__dict__.get("_fields")
+            if fields is None:
+                fields = row_fields(self._payload)
+                if fields is None:
+                    # Unexpected fields, decode the message instead
+                    fields = Message.__getattr__(self, name)
+                self.__dict__["_fields"] = fields
+            return fields
+        return Message.__getattr__(self, name)
+
+    @property
+    def _msg(self):
+        """The decoded message."""
+        msg = self.__dict__["_decoded"]
+        if msg is None:
+            msg = Protobuf.mysqlxpb.parse_message(self._type_name,
+                                                  self._payload)
+            self.__dict__["_decoded"] = msg
+        return msg
+
+    @property
+    def type(self):
+        """string: Message type name."""
+        return self._type_name
+
+    def set_message(self, msg):
+        """Sets the message.
+
+        Args:
+            msg (dict): Dictionary representing a message.
+        """
+        self.__dict__["_decoded"] = msg
+
+
+def row_fields(payload):
+    """Returns the fields of a serialized `Mysqlx.Resultset.Row` message.
+
+    The payload is indexed as integers, as `bytes` are on Python 3.
+
+    Args:
+        payload (bytes): Serialized message data.
+
+    Returns:
+        list: The field values as `bytes`, or `None` if the message holds
+              something else than fields.
+
+    .. versionadded:: 8.0.19
+    """
+    fields = []
+    pos = 0
+    end = len(payload)
+    while pos < end:
+        # Each field is tagged as field number 1 with a length prefix
+        if payload[pos] != 0x0a:
+            return None
+        size = payload[pos + 1]
+        pos += 2
+        if size > 0x7f:
+            size &= 0x7f
+            shift = 7
+            while True:
+                byte = payload[pos]
+                pos += 1
+                size |= (byte & 0x7f) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+        fields.append(payload[pos:pos + size])
+        pos += size
+    return fields if pos == end else None
+
+
 def mysqlxpb_enum(name):
     """Returns the value of a MySQL X Protobuf enumerator.
 
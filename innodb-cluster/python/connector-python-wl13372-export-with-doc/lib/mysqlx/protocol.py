@@ -30,7 +30,7 @@
 
 import struct
 
-from .compat import STRING_TYPES, INT_TYPES
+from .compat import STRING_TYPES, INT_TYPES, PY3
 from .errors import (InterfaceError, NotSupportedError, OperationalError,
                      ProgrammingError)
 from .expr import (ExprParser, build_expr, build_scalar, build_bool_scalar,
@@ -38,18 +38,63 @@ from .expr import (ExprParser, build_expr, build_scalar, build_bool_scalar,
 from .helpers import encode_to_bytes, get_item_or_attr
 from .result import Column
 from .protobuf import (CRUD_PREPARE_MAPPING, SERVER_MESSAGES,
-                       PROTOBUF_REPEATED_TYPES, Message, mysqlxpb_enum)
+                       PROTOBUF_REPEATED_TYPES, Message, MessageView, Protobuf,
+                       mysqlxpb_enum)
+
+_READ_BUFFER_SIZE = 65536
+_CONTENT_TYPE_JSON = 0x0002
 
 
 class MessageReaderWriter(object):
     """Implements a Message Reader/Writer.
 
+    Messages are read from a reusable receive buffer, filled with as much
+    data as the socket has available. Frames are sliced out of the buffer
+    without copying, so reading a result set costs a few system calls per
+    socket buffer instead of two per message.
+
     Args:
         socket_stream (mysqlx.connection.SocketStream): `SocketStream` object.
     """
     def __init__(self, socket_stream):
         self._stream = socket_stream
         self._msg = None
+        self._buffer = bytearray(_READ_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+        self._writes = None
+        self._written = 0
+
+    def _fill(self, count):
+        """Make sure the receive buffer holds `count` unread bytes.
+
+        The unread bytes are moved to the beginning of the buffer when there
+        is no room left for `count` bytes. A larger buffer is used while
+        reading messages bigger than the default buffer size.
+
+        Args:
+            count (int): The number of bytes required.
+        """
+        if self._end - self._start >= count:
+            return
+        size = len(self._buffer)
+        if self._start + count > size or \
+           (size > _READ_BUFFER_SIZE and self._start == self._end):
+            pending = self._end - self._start
+            if count > size or count <= _READ_BUFFER_SIZE < size:
+                buf = bytearray(max(count, _READ_BUFFER_SIZE))
+                view = memoryview(buf)
+                view[:pending] = self._view[self._start:self._end]
+                self._buffer, self._view = buf, view
+            else:
+                self._buffer[:pending] = self._buffer[self._start:self._end]
+            self._start = 0
+            self._end = pending
+        if self._writes:
+            self.flush()
+        while self._end - self._start < count:
+            self._end += self._stream.recv_into(self._view[self._end:])
 
     def _read_message(self):
         """Read message.
@@ -62,25 +107,67 @@ class MessageReaderWriter(object):
         Returns:
             mysqlx.protobuf.Message: MySQL X Protobuf Message.
         """
-        hdr = self._stream.read(5)
-        msg_len, msg_type = struct.unpack("<LB", hdr)
+        while True:
+            self._fill(5)
+            msg_len, msg_type = self._parse_header(self._buffer, self._start)
+            self._fill(msg_len + 4)
+            start = self._start + 5
+            self._start += msg_len + 4
+            payload = self._view[start:self._start]
+            msg = self._parse_payload(msg_type, payload if PY3
+                                      else payload.tobytes())
+            if msg is not None:
+                return msg
+
+    @staticmethod
+    def _parse_header(hdr, offset=0):
+        """Parse the message header.
+
+        Args:
+            hdr (bytes): The buffer holding the 5 bytes message header.
+            offset (int): The position of the header in the buffer.
+
+        Raises:
+            :class:`mysqlx.ProgrammingError`: If e connected server does not
+                                              have the MySQL X protocol plugin
+                                              enabled.
+
+        Returns:
+            tuple: The message length and the message type.
+        """
+        msg_len, msg_type = struct.unpack_from("<LB", hdr, offset)
         if msg_type == 10:
             raise ProgrammingError("The connected server does not have the "
                                    "MySQL X protocol plugin enabled or protocol"
                                    "mismatch")
-        payload = self._stream.read(msg_len - 1)
+        return msg_len, msg_type
+
+    @staticmethod
+    def _parse_payload(msg_type, payload):
+        """Parse the message payload.
+
+        Args:
+            msg_type (int): The message type.
+            payload (bytes): The message payload, it can be a `memoryview`.
+
+        Returns:
+            mysqlx.protobuf.Message: MySQL X Protobuf Message, or `None` if
+                                     the message should be skipped.
+        """
         msg_type_name = SERVER_MESSAGES.get(msg_type)
         if not msg_type_name:
             raise ValueError("Unknown msg_type: {0}".format(msg_type))
         # Do not parse empty notices, Message requires a type in payload.
-        if msg_type == 11 and payload == b"":
-            return self._read_message()
-        else:
-            try:
-                msg = Message.from_server_message(msg_type, payload)
-            except RuntimeError:
-                return self._read_message()
-        return msg
+        if msg_type == 11 and len(payload) == 0:
+            return None
+        if PY3 and Protobuf.use_pure:
+            # The payload is copied out of the receive buffer, it is decoded
+            # when its fields are used
+            return MessageView(msg_type_name, bytes(payload))
+        try:
+            return Message.from_server_message(msg_type, payload)
+        except RuntimeError:
+            return None
 
     def read_message(self):
         """Read message.
@@ -94,6 +181,40 @@ class MessageReaderWriter(object):
             return msg
         return self._read_message()
 
+    def skip_messages(self, msg_type):
+        """Skip consecutive messages of a given type without parsing them.
+
+        The first message of a different type is left unread.
+
+        Args:
+            msg_type (int): The type of the messages to skip.
+
+        Returns:
+            int: The number of skipped messages.
+
+        .. versionadded:: 8.0.19
+        """
+        count = 0
+        if self._msg is not None:
+            if self._msg.type != SERVER_MESSAGES[msg_type]:
+                return count
+            self._msg = None
+            count += 1
+        while True:
+            self._fill(5)
+            msg_len, frame_type = self._parse_header(self._buffer,
+                                                     self._start)
+            if frame_type != msg_type:
+                return count
+            # Discard the frame in chunks, without growing the buffer
+            skip = msg_len + 4
+            while self._end - self._start < skip:
+                skip -= self._end - self._start
+                self._start = 0
+                self._end = self._stream.recv_into(self._view)
+            self._start += skip
+            count += 1
+
     def push_message(self, msg):
         """Push message.
 
@@ -116,7 +237,50 @@ class MessageReaderWriter(object):
         """
         msg_str = encode_to_bytes(msg.serialize_to_string())
         header = struct.pack("<LB", len(msg_str) + 1, msg_id)
-        self._stream.sendall(b"".join([header, msg_str]))
+        self._written += len(msg_str) + 5
+        if self._writes is not None:
+            self._writes.extend((header, msg_str))
+        else:
+            self._stream.sendall(b"".join([header, msg_str]))
+
+    def buffer_writes(self, flag):
+        """Enable or disable the buffering of written messages.
+
+        While enabled, the written messages are kept in memory and sent in a
+        single write by :meth:`flush`, which is called before waiting for data
+        from the socket. Disabling it flushes the buffered messages.
+
+        Args:
+            flag (bool): `True` to buffer the written messages.
+
+        .. versionadded:: 8.0.19
+        """
+        if flag:
+            if self._writes is None:
+                self._writes = []
+        else:
+            self.flush()
+            self._writes = None
+
+    def flush(self):
+        """Send the buffered messages.
+
+        .. versionadded:: 8.0.19
+        """
+        if self._writes:
+            data = b"".join(self._writes)
+            del self._writes[:]
+            self._stream.sendall(data)
+
+    def get_bytes_written(self):
+        """Returns the number of bytes written, including the buffered ones.
+
+        Returns:
+            int: The number of bytes written.
+
+        .. versionadded:: 8.0.19
+        """
+        return self._written
 
 
 class Protocol(object):
@@ -282,26 +446,44 @@ class Protocol(object):
         """
         while True:
             msg = self._reader.read_message()
-            if msg.type == "Mysqlx.Error":
-                raise OperationalError(msg["msg"], msg["code"])
-            elif msg.type == "Mysqlx.Notice.Frame":
-                try:
-                    self._process_frame(msg, result)
-                except:
-                    continue
-            elif msg.type == "Mysqlx.Sql.StmtExecuteOk":
-                return None
-            elif msg.type == "Mysqlx.Resultset.FetchDone":
-                result.set_closed(True)
-            elif msg.type == "Mysqlx.Resultset.FetchDoneMoreResultsets":
-                result.set_has_more_results(True)
-            elif msg.type == "Mysqlx.Resultset.Row":
-                result.set_has_data(True)
-                break
-            else:
+            if not self._process_message(msg, result):
                 break
+        if msg.type == "Mysqlx.Sql.StmtExecuteOk":
+            return None
         return msg
 
+    def _process_message(self, msg, result):
+        """Process a message read while fetching a result.
+
+        Args:
+            msg (mysqlx.protobuf.Message): A MySQL X Protobuf Message.
+            result (Result): A `Result` based type object.
+
+        Raises:
+            :class:`mysqlx.OperationalError`: If the message is an error.
+
+        Returns:
+            bool: `True` if the message was consumed and the next message
+                  should be read.
+        """
+        if msg.type == "Mysqlx.Error":
+            raise OperationalError(msg["msg"], msg["code"])
+        elif msg.type == "Mysqlx.Notice.Frame":
+            try:
+                self._process_frame(msg, result)
+            except:
+                pass
+            return True
+        elif msg.type == "Mysqlx.Resultset.FetchDone":
+            result.set_closed(True)
+            return True
+        elif msg.type == "Mysqlx.Resultset.FetchDoneMoreResultsets":
+            result.set_has_more_results(True)
+            return True
+        elif msg.type == "Mysqlx.Resultset.Row":
+            result.set_has_data(True)
+        return False
+
     def get_capabilites(self):
         """Get capabilities.
 
@@ -441,7 +623,7 @@ class Protocol(object):
             if msg.type == "Mysqlx.Error":
                 raise InterfaceError(msg.msg)
 
-    def send_prepare_prepare(self, msg_type, msg, stmt):
+    def send_prepare_prepare(self, msg_type, msg, stmt, read_response=True):
         """
         Send prepare statement.
 
@@ -449,6 +631,9 @@ class Protocol(object):
             msg_type (str): Message ID string.
             msg (mysqlx.protobuf.Message): MySQL X Protobuf Message.
             stmt (Statement): A `Statement` based type object.
+            read_response (bool): `False` to leave the response unread, it
+                                  must be read later with
+                                  :meth:`read_prepare_ok`.
 
         Raises:
             :class:`mysqlx.NotSupportedError`: If prepared statements are not
@@ -491,6 +676,18 @@ class Protocol(object):
             mysqlxpb_enum("Mysqlx.ClientMessages.Type.PREPARE_PREPARE"),
             msg_prepare)
 
+        if read_response:
+            self.read_prepare_ok()
+
+    def read_prepare_ok(self):
+        """Read the response of a prepare statement.
+
+        Raises:
+            :class:`mysqlx.NotSupportedError`: If prepared statements are not
+                                               supported.
+
+        .. versionadded:: 8.0.19
+        """
         try:
             self.read_ok()
         except InterfaceError:
@@ -528,12 +725,14 @@ class Protocol(object):
             mysqlxpb_enum("Mysqlx.ClientMessages.Type.PREPARE_EXECUTE"),
             msg_execute)
 
-    def send_prepare_deallocate(self, stmt_id):
+    def send_prepare_deallocate(self, stmt_id, read_response=True):
         """
         Send prepare deallocate statement.
 
         Args:
             stmt_id (int): Statement ID.
+            read_response (bool): `False` to leave the response unread, it
+                                  must be read later with :meth:`read_ok`.
 
         .. versionadded:: 8.0.16
         """
@@ -542,7 +741,8 @@ class Protocol(object):
         self._writer.write_message(
             mysqlxpb_enum("Mysqlx.ClientMessages.Type.PREPARE_DEALLOCATE"),
             msg_dealloc)
-        self.read_ok()
+        if read_response:
+            self.read_ok()
 
     def send_msg_without_ps(self, msg_type, msg, stmt):
         """
@@ -754,6 +954,46 @@ class Protocol(object):
 
         return "Mysqlx.ClientMessages.Type.CRUD_INSERT", msg
 
+    def build_insert_documents(self, collection, docs):
+        """Build an insert statement of JSON documents.
+
+        Each document is sent as a JSON literal, instead of being converted
+        to a `Mysqlx.Expr.Object`. The server generates the missing `_id`
+        fields.
+
+        Args:
+            collection (mysqlx.Collection): The Collection object.
+            docs (list): The JSON encoded documents (bytes).
+
+        Returns:
+            (tuple): Tuple containing:
+
+                * `str`: Message ID string.
+                * :class:`mysqlx.protobuf.Message`: MySQL X Protobuf Message.
+
+        .. versionadded:: 8.0.19
+        """
+        msg = Message("Mysqlx.Crud.Insert",
+                      data_model=mysqlxpb_enum(
+                          "Mysqlx.Crud.DataModel.DOCUMENT"),
+                      collection=Message("Mysqlx.Crud.Collection",
+                                         name=collection.name,
+                                         schema=collection.schema.name))
+        literal = mysqlxpb_enum("Mysqlx.Expr.Expr.Type.LITERAL")
+        octets = mysqlxpb_enum("Mysqlx.Datatypes.Scalar.Type.V_OCTETS")
+        rows = []
+        for doc in docs:
+            scalar = Message("Mysqlx.Datatypes.Scalar", type=octets,
+                             v_octets=Message("Mysqlx.Datatypes.Scalar.Octets",
+                                              value=doc,
+                                              content_type=_CONTENT_TYPE_JSON))
+            row = Message("Mysqlx.Crud.Insert.TypedRow")
+            row["field"].extend([Message("Mysqlx.Expr.Expr", type=literal,
+                                         literal=scalar).get_message()])
+            rows.append(row.get_message())
+        msg["row"].extend(rows)
+        return "Mysqlx.ClientMessages.Type.CRUD_INSERT", msg
+
     def close_result(self, result):
         """Close the result.
 
@@ -781,6 +1021,17 @@ class Protocol(object):
         self._reader.push_message(msg)
         return None
 
+    def skip_rows(self):
+        """Skip the rows of the active result set without decoding them.
+
+        Returns:
+            int: The number of skipped rows.
+
+        .. versionadded:: 8.0.19
+        """
+        return self._reader.skip_messages(
+            mysqlxpb_enum("Mysqlx.ServerMessages.Type.RESULTSET_ROW"))
+
     def get_column_metadata(self, result):
         """Returns column metadata.
 
@@ -800,17 +1051,28 @@ class Protocol(object):
                 break
             if msg.type != "Mysqlx.Resultset.ColumnMetaData":
                 raise InterfaceError("Unexpected msg type")
-            col = Column(msg["type"], msg["catalog"], msg["schema"],
-                         msg["table"], msg["original_table"],
-                         msg["name"], msg["original_name"],
-                         msg.get("length", 21),
-                         msg.get("collation", 0),
-                         msg.get("fractional_digits", 0),
-                         msg.get("flags", 16),
-                         msg.get("content_type"))
-            columns.append(col)
+            columns.append(self._build_column(msg))
         return columns
 
+    @staticmethod
+    def _build_column(msg):
+        """Build a column from a `Mysqlx.Resultset.ColumnMetaData` message.
+
+        Args:
+            msg (mysqlx.protobuf.Message): MySQL X Protobuf Message.
+
+        Returns:
+            :class:`mysqlx.Column`: The column.
+        """
+        return Column(msg["type"], msg["catalog"], msg["schema"],
+                      msg["table"], msg["original_table"],
+                      msg["name"], msg["original_name"],
+                      msg.get("length", 21),
+                      msg.get("collation", 0),
+                      msg.get("fractional_digits", 0),
+                      msg.get("flags", 16),
+                      msg.get("content_type"))
+
     def read_ok(self):
         """Read OK.
 
@@ -1,4 +1,4 @@
-# Copyright (c) 2016, 2019, Oracle and/or its affiliates. All rights reserved.
+# Copyright (c) 2016, 2020, Oracle and/or its affiliates. All rights reserved.
 #
 # This program is free software; you can redistribute it and/or modify
 # it under the terms of the GNU General Public License, version 2.0, as
@@ -28,16 +28,36 @@
 
 """Implementation of the Result classes."""
 
+import array
+import binascii
 import decimal
+import functools
 import struct
 import sys
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
+from mysql.connector.columnar import (HAVE_NUMPY, _DAY_MICROSECONDS, _INT64,
+                                      _UINT64, days_from_civil)
+
 from .dbdoc import DbDoc
 from .charsets import MYSQL_CHARACTER_SETS
-from .compat import STRING_TYPES
+from .compat import PY3, STRING_TYPES
+from .errors import Error, InterfaceError, ProgrammingError
 from .helpers import decode_from_bytes, deprecated
+from .protobuf import HAVE_MYSQLXPB_CEXT, Protobuf
+
+if HAVE_MYSQLXPB_CEXT:
+    import _mysqlxpb
+
+if HAVE_NUMPY:
+    import numpy
+
+_FLOAT_UNPACK = {
+    "d": lambda payload: struct.unpack("<d", payload)[0],
+    "f": lambda payload: struct.unpack("<f", payload)[0],
+}
 
 
 # pylint: disable=C0111
@@ -45,24 +65,12 @@ def from_protobuf(col_type, payload):
     if len(payload) == 0:
         return None
 
-    try:
-        return {
-            ColumnProtoType.SINT: varsint_from_protobuf,
-            ColumnProtoType.UINT: varint_from_protobuf,
-            ColumnProtoType.BYTES: bytes_from_protobuf,
-            ColumnProtoType.DATETIME: datetime_from_protobuf,
-            ColumnProtoType.TIME: time_from_protobuf,
-            ColumnProtoType.FLOAT: float_from_protobuf,
-            ColumnProtoType.DOUBLE: double_from_protobuf,
-            ColumnProtoType.BIT: varint_from_protobuf,
-            ColumnProtoType.SET: set_from_protobuf,
-            ColumnProtoType.ENUM: bytes_from_protobuf,
-            ColumnProtoType.DECIMAL: decimal_from_protobuf,
-        }[col_type](payload)
-    except KeyError as err:
-        sys.stderr.write("{0}".format(err))
-        sys.stderr.write("{0}".format(payload.encode("hex")))
+    decoder = _find_decoder(col_type)
+    if decoder is None:
+        sys.stderr.write("{0}".format(col_type))
+        sys.stderr.write("{0}".format(binascii.hexlify(payload).decode()))
         return None
+    return decoder(payload)
 
 
 def bytes_from_protobuf(payload):
@@ -102,28 +110,43 @@ def varint_from_protobuf_stream(payload):
     raise EOFError("Payload too short")
 
 
+def varints_from_protobuf(payload, offset=0):
+    """Decode a sequence of varints, without slicing the payload.
+
+    This is the pure Python implementation of
+    ``_mysqlxpb.decode_varints()``.
+    """
+    values = []
+    value = 0
+    shift = 0
+    for char in bytearray(payload)[offset:]:
+        value |= (char & 0x7f) << shift
+        if char & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = 0
+            shift = 0
+    if shift:
+        raise EOFError("Payload too short")
+    return tuple(values)
+
+
 def varint_from_protobuf(payload):
-    i, payload = varint_from_protobuf_stream(payload)
-    if len(payload) != 0:
+    values = varints_from_protobuf(payload)
+    if len(values) == 0:
+        raise ValueError("Payload is empty")
+    if len(values) != 1:
         raise ValueError("Payload too long")
 
-    return i
+    return values[0]
 
 
 def varsint_from_protobuf(payload):
-    i, payload = varint_from_protobuf_stream(payload)
-    if len(payload) != 0:
-        raise ValueError("Payload too long")
+    i = varint_from_protobuf(payload)
 
     # Zigzag encoded, revert it
-    if i & 0x1:
-        i = ~i
-        i = (i >> 1)
-        i |= 1 << 63
-    else:
-        i = (i >> 1)
-
-    return i
+    return ~(i >> 1) if i & 0x1 else i >> 1
 
 
 def set_from_protobuf(payload):
@@ -147,14 +170,20 @@ def set_from_protobuf(payload):
     return set_pb
 
 
-def decimal_from_protobuf(payload):
+def decimal_tuple_from_protobuf(payload):
+    """Decode a BCD encoded decimal as a `decimal.Decimal` tuple.
+
+    This is the pure Python implementation of
+    ``_mysqlxpb.decode_decimal()``.
+    """
+    if len(payload) == 0:
+        raise ValueError("Payload is empty")
+    payload = bytearray(payload)
     digits = []
     sign = None
-    scale = payload[0] if isinstance(payload[0], int) else ord(payload[0])
-    payload = payload[1:]
+    scale = payload[0]
 
-    for item in payload:
-        char = item if isinstance(item, int) else ord(item)
+    for char in payload[1:]:
         high_bcd = (char & 0xf0) >> 4
         low_bcd = char & 0x0f
         if high_bcd < 0x0a:
@@ -169,57 +198,36 @@ def decimal_from_protobuf(payload):
                 break
             else:
                 raise ValueError("Invalid BCD")
-        elif high_bcd == 0x0c:
-            sign = 0
-            assert low_bcd == 0x00
-            break
-        elif high_bcd == 0x0d:
-            sign = 1
-            assert low_bcd == 0x00
+        elif high_bcd in (0x0c, 0x0d) and low_bcd == 0x00:
+            sign = 0 if high_bcd == 0x0c else 1
             break
         else:
-            raise ValueError("Invalid BCD: {0}".format(high_bcd))
+            raise ValueError("Invalid BCD")
 
-    return decimal.Decimal((sign, digits, -scale))
+    if sign is None:
+        raise ValueError("Invalid BCD")
+    return sign, tuple(digits), -scale
 
 
-def datetime_from_protobuf(payload):
-    # A sequence of varints
-    hour = 0
-    minutes = 0
-    seconds = 0
-    useconds = 0
-    year, payload = varint_from_protobuf_stream(payload)
-    month, payload = varint_from_protobuf_stream(payload)
-    day, payload = varint_from_protobuf_stream(payload)
-
-    try:
-        hour, payload = varint_from_protobuf_stream(payload)
-        minutes, payload = varint_from_protobuf_stream(payload)
-        seconds, payload = varint_from_protobuf_stream(payload)
-        useconds, payload = varint_from_protobuf_stream(payload)
-    except ValueError:
-        pass
-
-    return datetime(year, month, day, hour, minutes, seconds, useconds)
-
-
-def time_from_protobuf(payload):
+def decimal_from_protobuf(payload):
+    return decimal.Decimal(decimal_tuple_from_protobuf(payload))
+
+
+def datetime_from_protobuf(payload, decode_varints=varints_from_protobuf):
+    # A sequence of varints: year, month, day and optionally hour, minutes,
+    # seconds and useconds
+    values = decode_varints(payload)
+    if len(values) < 3:
+        raise EOFError("Payload too short")
+    return datetime(*values[:7])
+
+
+def time_from_protobuf(payload, decode_varints=varints_from_protobuf):
     # A sequence of varints
-    hour = 0
-    minutes = 0
-    seconds = 0
-    useconds = 0
-    negate = payload[0] == 1
-    payload = payload[1:]
-
-    try:
-        hour, payload = varint_from_protobuf_stream(payload)
-        minutes, payload = varint_from_protobuf_stream(payload)
-        seconds, payload = varint_from_protobuf_stream(payload)
-        useconds, payload = varint_from_protobuf_stream(payload)
-    except ValueError:
-        pass
+    negate = bytearray(payload[:1]) == b"\x01"
+    values = list(decode_varints(payload, 1)[:4])
+    values.extend([0] * (4 - len(values)))
+    hour, minutes, seconds, useconds = values
 
     if negate:
         # Negate the first non-zero value
@@ -330,6 +338,219 @@ class ColumnProtoType(object):
     DECIMAL = 18
 
 
+_DECODERS = {
+    ColumnProtoType.SINT: varsint_from_protobuf,
+    ColumnProtoType.UINT: varint_from_protobuf,
+    ColumnProtoType.BYTES: bytes_from_protobuf,
+    ColumnProtoType.DATETIME: datetime_from_protobuf,
+    ColumnProtoType.TIME: time_from_protobuf,
+    ColumnProtoType.FLOAT: float_from_protobuf,
+    ColumnProtoType.DOUBLE: double_from_protobuf,
+    ColumnProtoType.BIT: varint_from_protobuf,
+    ColumnProtoType.SET: set_from_protobuf,
+    ColumnProtoType.ENUM: bytes_from_protobuf,
+    ColumnProtoType.DECIMAL: decimal_from_protobuf,
+}
+
+if HAVE_MYSQLXPB_CEXT:
+    _CEXT_DECODERS = dict(_DECODERS)
+    _CEXT_DECODERS.update({
+        ColumnProtoType.SINT: _mysqlxpb.decode_sint,
+        ColumnProtoType.UINT: _mysqlxpb.decode_uint,
+        ColumnProtoType.DATETIME: functools.partial(
+            datetime_from_protobuf, decode_varints=_mysqlxpb.decode_varints),
+        ColumnProtoType.TIME: functools.partial(
+            time_from_protobuf, decode_varints=_mysqlxpb.decode_varints),
+        ColumnProtoType.BIT: _mysqlxpb.decode_uint,
+        ColumnProtoType.DECIMAL: lambda payload: decimal.Decimal(
+            _mysqlxpb.decode_decimal(payload)),
+    })
+
+
+def _find_decoder(col_type):
+    """Returns the function decoding the values of a column type, or `None`
+    if the column type is unknown."""
+    if HAVE_MYSQLXPB_CEXT and not Protobuf.use_pure:
+        return _CEXT_DECODERS.get(col_type)
+    return _DECODERS.get(col_type)
+
+
+def get_decoder(col_type):
+    """Returns the function decoding the values of a column type.
+
+    The C extension decoders are used, unless the pure Python implementation
+    of the protobuf messages is selected. The values of unknown column types
+    are handled by :func:`mysqlx.result.from_protobuf`.
+
+    Args:
+        col_type (int): The column proto type.
+
+    Returns:
+        callable: A function decoding a non-empty value.
+
+    .. versionadded:: 8.0.19
+    """
+    decoder = _find_decoder(col_type)
+    if decoder is None:
+        return functools.partial(from_protobuf, col_type)
+    return decoder
+
+
+def _date_to_days(payload, decode_varints):
+    """Decodes a date as days since epoch."""
+    year, month, day = decode_varints(payload)[:3]
+    return days_from_civil(year, month, day)
+
+
+def _datetime_to_micros(payload, decode_varints):
+    """Decodes a datetime as microseconds since epoch."""
+    values = decode_varints(payload) + (0, 0, 0, 0)
+    return (days_from_civil(values[0], values[1], values[2]) *
+            _DAY_MICROSECONDS + (values[3] * 3600 + values[4] * 60 +
+                                 values[5]) * 1000000 + values[6])
+
+
+def _time_to_micros(payload, decode_varints):
+    """Decodes a time as microseconds."""
+    values = decode_varints(payload, 1) + (0, 0, 0, 0)
+    micros = ((values[0] * 3600 + values[1] * 60 + values[2]) * 1000000 +
+              values[3])
+    return -micros if bytearray(payload[:1]) == b"\x01" else micros
+
+
+def _get_array_plan(column):
+    """Returns how the values of a column are stored by fetch_arrays().
+
+    Args:
+        column (mysqlx.Column): The column.
+
+    Returns:
+        tuple: The array typecode, the NumPy dtype name and the decoder. The
+               typecode is `None` for columns stored as objects, and the
+               decoder is `None` for columns decoded from the raw bytes.
+    """
+    proto_type = column.get_proto_type()
+    if HAVE_MYSQLXPB_CEXT and not Protobuf.use_pure:
+        decode_varints = _mysqlxpb.decode_varints
+    else:
+        decode_varints = varints_from_protobuf
+    if proto_type == ColumnProtoType.SINT:
+        return _INT64, "int64", get_decoder(proto_type)
+    if proto_type in (ColumnProtoType.UINT, ColumnProtoType.BIT):
+        return _UINT64, "uint64", get_decoder(proto_type)
+    if proto_type == ColumnProtoType.DOUBLE:
+        return "d", "float64", None
+    if proto_type == ColumnProtoType.FLOAT:
+        return "f", "float32", None
+    if proto_type == ColumnProtoType.DATETIME:
+        if column.get_type() == ColumnType.DATE:
+            return (_INT64, "datetime64[D]",
+                    functools.partial(_date_to_days,
+                                      decode_varints=decode_varints))
+        return (_INT64, "datetime64[us]",
+                functools.partial(_datetime_to_micros,
+                                  decode_varints=decode_varints))
+    if proto_type == ColumnProtoType.TIME:
+        return (_INT64, "timedelta64[us]",
+                functools.partial(_time_to_micros,
+                                  decode_varints=decode_varints))
+    return None, None, get_decoder(proto_type)
+
+
+def _build_array(column, index, rows, use_numpy):
+    """Builds the array holding the values of a column.
+
+    Args:
+        column (mysqlx.Column): The column.
+        index (int): The column index.
+        rows (list): The list of rows fields.
+        use_numpy (bool): `True` to return a NumPy array.
+
+    Returns:
+        array.array, numpy.ndarray or list: The column values.
+    """
+    typecode, dtype, decoder = _get_array_plan(column)
+    fields = [row[index] for row in rows]
+    if typecode is None:
+        values = [decoder(field) if field else None for field in fields]
+        if use_numpy:
+            result = numpy.empty(len(values), dtype=object)
+            result[:] = values
+            return result
+        return values
+
+    values = array.array(typecode)
+    if b"" not in fields:
+        if decoder is None:
+            # Floating point values are copied as is
+            if PY3:
+                values.frombytes(b"".join(fields))
+            else:
+                values.fromstring(b"".join(fields))
+        else:
+            values.extend(map(decoder, fields))
+        return numpy.frombuffer(values, dtype=dtype) if use_numpy else values
+
+    # NULL values, store zeros along with a mask
+    if decoder is None:
+        decoder = _FLOAT_UNPACK[typecode]
+    mask = bytearray([not field for field in fields])
+    values.extend([decoder(field) if field else 0 for field in fields])
+    if not use_numpy:
+        return [None if null else value for value, null in zip(values, mask)]
+    return numpy.ma.MaskedArray(numpy.frombuffer(values, dtype=dtype),
+                                mask=numpy.frombuffer(mask, dtype=bool))
+
+
+def rows_to_arrays(columns, rows, use_numpy=None):
+    """Converts rows to per-column arrays.
+
+    Integer, floating point, date, datetime and time columns are stored in
+    typed buffers: `array.array` objects, or NumPy arrays of the matching
+    dtype. Dates are stored as days since epoch, datetimes as microseconds
+    since epoch and times as microseconds. Other columns are stored as lists,
+    or NumPy arrays of objects.
+
+    Columns holding NULL values are returned as NumPy masked arrays, or as
+    lists when NumPy is not used, since `array.array` can not hold NULL.
+
+    Args:
+        columns (list): The list of :class:`mysqlx.Column` objects.
+        rows (list): The list of the fields of `Mysqlx.Resultset.Row`
+                     messages.
+        use_numpy (bool): `True` to return NumPy arrays, `False` to return
+                          `array.array` objects. NumPy arrays are returned by
+                          default when NumPy is installed.
+
+    Raises:
+        :class:`mysqlx.InterfaceError`: If NumPy is requested but not
+                                        installed.
+        :class:`mysqlx.ProgrammingError`: If several columns have the same
+                                          label.
+
+    Returns:
+        collections.OrderedDict: The column arrays, by column label.
+
+    .. versionadded:: 8.0.19
+    """
+    if use_numpy is None:
+        use_numpy = HAVE_NUMPY
+    elif use_numpy and not HAVE_NUMPY:
+        raise InterfaceError("The NumPy module is required to fetch NumPy "
+                             "arrays")
+    labels = set()
+    for column in columns:
+        label = column.get_column_label()
+        if label in labels:
+            raise ProgrammingError("Duplicate column label '{0}', use an "
+                                   "alias to fetch arrays".format(label))
+        labels.add(label)
+    return OrderedDict(
+        (column.get_column_label(), _build_array(column, index, rows,
+                                                 use_numpy))
+        for index, column in enumerate(columns))
+
+
 class Flags(object):
     def __init__(self, value):
         self._allowed_flags = {}
@@ -922,16 +1143,38 @@ class BufferingResult(BaseResult):
     def __init__(self, connection):
         super(BufferingResult, self).__init__(connection)
         self._columns = []
+        self._decoders = []
         self._has_data = False
         self._has_more_results = False
         self._items = []
         self._page_size = 0
         self._position = -1
+        self._streaming = False
         self._init_result()
 
     def __getitem__(self, index):
         return self._items[index]
 
+    def __iter__(self):
+        """Iterate over the items of the result.
+
+        The items already buffered are yielded first, the remaining items are
+        then streamed from the server one at a time, without being buffered.
+        Once the iteration has started, executing another statement on the
+        same session discards the items that were not read yet, without
+        decoding them.
+
+        .. versionadded:: 8.0.19
+        """
+        for item in self._items:
+            yield item
+        self._streaming = True
+        while True:
+            item = self.fetch_one()
+            if item is None:
+                break
+            yield item
+
     @property
     def count(self):
         """int: The total of items."""
@@ -940,6 +1183,7 @@ class BufferingResult(BaseResult):
     def _init_result(self):
         """Initialize the result."""
         self._columns = self._connection.get_column_metadata(self)
+        self._decoders = self._get_decoders()
         self._has_more_data = True if len(self._columns) > 0 else False
         self._items = []
         self._page_size = 20
@@ -959,13 +1203,36 @@ class BufferingResult(BaseResult):
         row = self._connection.read_row(self)
         if row is None:
             return None
-        item = [None] * len(row["field"])
-        if not dumping:
-            for key in range(len(row["field"])):
-                col = self._columns[key]
-                item[key] = from_protobuf(col.get_proto_type(),
-                                          row["field"][key])
-        return Row(self, item)
+        return self._decode_item(row, dumping)
+
+    def _decode_item(self, row, dumping):
+        """Decode item.
+
+        Args:
+            row (mysqlx.protobuf.Message): The `Mysqlx.Resultset.Row` message.
+            dumping (bool): `True` for dumping.
+
+        Returns:
+            :class:`mysqlx.Row`: A `Row` object.
+        """
+        fields = row["field"]
+        if dumping:
+            return Row(self, [None] * len(fields))
+        return Row(self, [decoder(field) if field else None
+                          for decoder, field in zip(self._decoders, fields)])
+
+    def _get_decoders(self):
+        """Returns the decoders of the columns of the result.
+
+        The decoders are looked up once per result set, so that decoding a
+        row only calls the prebound decoder of each column.
+
+        Returns:
+            `list`: The decoders of the columns.
+
+        .. versionadded:: 8.0.19
+        """
+        return [get_decoder(col.get_proto_type()) for col in self._columns]
 
     def _page_in_items(self):
         """Reads the page items.
@@ -1021,6 +1288,36 @@ class BufferingResult(BaseResult):
                 break
         return self._items
 
+    def discard_all(self):
+        """Discard the items that were not read yet.
+
+        The rows are skipped on the wire, without being decoded.
+
+        Returns:
+            int: The number of discarded items.
+
+        .. versionadded:: 8.0.19
+        """
+        count = 0
+        while not self._closed:
+            count += self._connection.skip_rows()
+            # Reads the end of the result set, or drops a row sent after a
+            # notice without decoding it
+            if self._connection.read_row(self) is None:
+                break
+            count += 1
+        return count
+
+    def is_streaming(self):
+        """Returns `True` if the result is being streamed.
+
+        Returns:
+            bool: `True` if the result is being iterated without buffering.
+
+        .. versionadded:: 8.0.19
+        """
+        return self._streaming
+
     def set_has_data(self, flag):
         """Sets if result has data.
 
@@ -1062,6 +1359,74 @@ class RowResult(BufferingResult):
         """
         return self._columns
 
+    def _read_fields(self, size):
+        """Read the fields of the next rows, without decoding them.
+
+        Args:
+            size (int): The maximum number of rows, `None` to read all the
+                        remaining rows.
+
+        Returns:
+            `list`: The fields of each row.
+        """
+        rows = []
+        while (size is None or len(rows) < size) and not self._closed:
+            row = self._connection.read_row(self)
+            if row is None:
+                break
+            rows.append(row["field"])
+        return rows
+
+    def fetch_arrays(self, size=None, use_numpy=None):
+        """Fetch the next rows as per-column arrays.
+
+        The rows are decoded straight into the column arrays, see
+        :func:`mysqlx.result.rows_to_arrays`. The items already buffered by
+        `fetch_all()` are not included.
+
+        Args:
+            size (int): The maximum number of rows, `None` to fetch all the
+                        remaining rows.
+            use_numpy (bool): `True` to return NumPy arrays, `False` to return
+                              `array.array` objects. NumPy arrays are
+                              returned by default when NumPy is installed.
+
+        Returns:
+            collections.OrderedDict: The column arrays, by column label.
+
+        .. versionadded:: 8.0.19
+        """
+        return rows_to_arrays(self._columns, self._read_fields(size),
+                              use_numpy)
+
+    def fetch_columnar(self, chunk_size=10000, use_numpy=None):
+        """Iterate over the remaining rows as per-column arrays.
+
+        The rows are fetched in chunks of `chunk_size` rows, so that memory
+        usage stays bounded.
+
+        Args:
+            chunk_size (int): The number of rows of each chunk.
+            use_numpy (bool): `True` to return NumPy arrays, `False` to return
+                              `array.array` objects.
+
+        Raises:
+            :class:`mysqlx.ProgrammingError`: If `chunk_size` is not a
+                                              positive number.
+
+        Returns:
+            iterator: The chunks, as returned by `fetch_arrays()`.
+
+        .. versionadded:: 8.0.19
+        """
+        if not chunk_size or chunk_size < 1:
+            raise ProgrammingError("chunk_size must be 1 or higher")
+        while True:
+            rows = self._read_fields(chunk_size)
+            if not rows:
+                break
+            yield rows_to_arrays(self._columns, rows, use_numpy)
+
 
 class SqlResult(RowResult):
     """Represents a result from a SQL statement.
@@ -1112,16 +1477,86 @@ class DocResult(BufferingResult):
     def __init__(self, connection):
         super(DocResult, self).__init__(connection)
 
-    def _read_item(self, dumping):
-        """Read item.
+    def _decode_item(self, row, dumping):
+        """Decode item.
 
         Args:
+            row (mysqlx.protobuf.Message): The `Mysqlx.Resultset.Row` message.
             dumping (bool): `True` for dumping.
 
         Returns:
             :class:`mysqlx.DbDoc`: A `DbDoc` object.
         """
-        row = super(DocResult, self)._read_item(dumping)
-        if row is None:
-            return None
+        row = super(DocResult, self)._decode_item(row, dumping)
         return DbDoc(decode_from_bytes(row[0]))
+
+
+class PipelinedResult(object):
+    """Handle to the result of a statement executed in a pipeline.
+
+    The result is read from the server when the pipeline is synchronized or
+    when the handle is first used, after the results of the statements
+    executed before it. Attribute access, indexing and iteration are delegated
+    to the result, so the handle can be used as the result itself.
+
+    Args:
+        pipeline (mysqlx.connection.Pipeline): The Pipeline object.
+        reader (callable): Reads the response and returns the result.
+
+    .. versionadded:: 8.0.19
+    """
+    def __init__(self, pipeline, reader):
+        self._pipeline = pipeline
+        self._reader = reader
+        self._done = False
+        self._result = None
+        self._error = None
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
+
+    def __getitem__(self, index):
+        return self.get()[index]
+
+    def __iter__(self):
+        return iter(self.get())
+
+    def resolve(self):
+        """Read the response of the statement.
+
+        An error raised by the statement is kept and raised by :meth:`get`.
+        """
+        try:
+            self._result = self._reader()
+        except Error as err:
+            self._error = err
+        self._reader = None
+        self._done = True
+
+    def done(self):
+        """Returns `True` if the response of the statement was read.
+
+        Returns:
+            bool: `True` if the response of the statement was read.
+        """
+        return self._done
+
+    def get(self):
+        """Returns the result of the statement, reading the pending responses
+        up to this statement.
+
+        Raises:
+            :class:`mysqlx.Error`: The error raised by the statement.
+
+        Returns:
+            `Result`: It can be :class:`mysqlx.Result`,
+                      :class:`mysqlx.SqlResult`, :class:`mysqlx.RowResult` or
+                      :class:`mysqlx.DocResult`.
+        """
+        if not self._done:
+            self._pipeline.sync(self)
+        if self._error is not None:
+            raise self._error
+        return self._result
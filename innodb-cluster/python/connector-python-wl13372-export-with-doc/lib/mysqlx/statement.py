@@ -33,7 +33,7 @@ import json
 import warnings
 
 from .errors import ProgrammingError, NotSupportedError
-from .expr import ExprParser
+from .expr import ExprParser, parse_expr
 from .compat import INT_TYPES, STRING_TYPES
 from .constants import LockContention
 from .dbdoc import DbDoc
@@ -302,8 +302,8 @@ class FilterableStatement(Statement):
         """
         self.has_sort = True
         self._sort_str = ",".join(flexible_params(*clauses))
-        self._sort_expr = ExprParser(self._sort_str,
-                                     not self._doc_based).parse_order_spec()
+        self._sort_expr = parse_expr(self._sort_str, not self._doc_based,
+                                     "parse_order_spec")[0]
         self._changed = True
         return self
 
@@ -320,11 +320,10 @@ class FilterableStatement(Statement):
         self.has_where = True
         self._where_str = condition
         try:
-            expr = ExprParser(condition, not self._doc_based)
-            self._where_expr = expr.expr()
+            self._where_expr, self._binding_map = parse_expr(
+                condition, not self._doc_based)
         except ValueError:
             raise ProgrammingError("Invalid condition")
-        self._binding_map = expr.placeholder_name_to_position
         self._changed = True
         return self
 
@@ -337,8 +336,8 @@ class FilterableStatement(Statement):
         fields = flexible_params(*fields)
         self.has_group_by = True
         self._grouping_str = ",".join(fields)
-        self._grouping = ExprParser(self._grouping_str,
-                                    not self._doc_based).parse_expr_list()
+        self._grouping = parse_expr(self._grouping_str, not self._doc_based,
+                                    "parse_expr_list")[0]
         self._changed = True
 
     def _set_having(self, condition):
@@ -348,7 +347,7 @@ class FilterableStatement(Statement):
             condition (str): The condition.
         """
         self.has_having = True
-        self._having = ExprParser(condition, not self._doc_based).expr()
+        self._having = parse_expr(condition, not self._doc_based)[0]
         self._changed = True
 
     def _set_projection(self, *fields):
@@ -363,9 +362,9 @@ class FilterableStatement(Statement):
         fields = flexible_params(*fields)
         self.has_projection = True
         self._projection_str = ",".join(fields)
-        self._projection_expr = ExprParser(
-            self._projection_str,
-            not self._doc_based).parse_table_select_projection()
+        self._projection_expr = parse_expr(
+            self._projection_str, not self._doc_based,
+            "parse_table_select_projection")[0]
         self._changed = True
         return self
 
@@ -716,8 +715,8 @@ class UpdateSpec(object):
             self.source = source
             if len(source) > 0 and source[0] == '$':
                 self.source = source[1:]
-            self.source = ExprParser(self.source,
-                                     False).document_field().identifier
+            self.source = parse_expr(self.source, False,
+                                     "document_field")[0].identifier
             self.value = value
 
     def _table_set(self, source, value):
@@ -729,7 +728,8 @@ class UpdateSpec(object):
         """
         self.update_type = mysqlxpb_enum(
             "Mysqlx.Crud.UpdateOperation.UpdateType.SET")
-        self.source = ExprParser(source, True).parse_table_update_field()
+        self.source = parse_expr(source, True,
+                                 "parse_table_update_field")[0]
         self.value = value
 
 
@@ -1,5 +1,5 @@
 ﻿/*
- * Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+ * Copyright (c) 2017, 2020, Oracle and/or its affiliates. All rights reserved.
  *
  * This program is free software; you can redistribute it and/or modify
  * it under the terms of the GNU General Public License, version 2.0, as
@@ -853,18 +853,22 @@ static const char* GetMessageNameByTypeId(Mysqlx::ServerMessages::Type type) {
 static PyObject* ParseServerMessage(PyObject* self, PyObject* args) {
   PyObject* result = NULL;
   int type;
-  const char* message_data;
-  int message_data_size;
+  Py_buffer message_data;
 
-  if (PyArg_ParseTuple(args, "is#", &type, &message_data, &message_data_size))
+  // Accept any buffer, payloads are memoryview slices of the receive buffer
+  if (PyArg_ParseTuple(args, "is*", &type, &message_data))
   {
     const char* type_name = GetMessageNameByTypeId(
         static_cast<Mysqlx::ServerMessages::Type>(type));
 
     if (type_name)
-      result = ParseMessageImpl(type_name, message_data, message_data_size);
+      result = ParseMessageImpl(type_name,
+                                static_cast<const char*>(message_data.buf),
+                                static_cast<int>(message_data.len));
     else
       PyErr_Format(PyExc_RuntimeError, "Unknown message type id: %i", type);
+
+    PyBuffer_Release(&message_data);
   }
 
   return result;
@@ -931,6 +935,181 @@ static PyObject* EnumValue(PyObject* self, PyObject* args) {
   return result;
 }
 
+// Reads a base 128 varint from [pos, end), advancing pos. Returns false if
+// the buffer ends before the last byte of the varint.
+static bool ReadVarint(const unsigned char*& pos, const unsigned char* end,
+                       unsigned long long& value) {
+  int shift = 0;
+
+  value = 0;
+  while (pos < end) {
+    unsigned char byte = *pos++;
+
+    if (shift < 64)
+      value |= static_cast<unsigned long long>(byte & 0x7f) << shift;
+    if ((byte & 0x80) == 0)
+      return true;
+    shift += 7;
+  }
+
+  return false;
+}
+
+
+// Reads the single varint held by a column value.
+static bool ReadColumnVarint(PyObject* args, unsigned long long& value) {
+  Py_buffer data;
+  bool valid = false;
+
+  if (!PyArg_ParseTuple(args, "s*", &data))
+    return false;
+
+  const unsigned char* pos = static_cast<const unsigned char*>(data.buf);
+  const unsigned char* end = pos + data.len;
+
+  if (pos == end)
+    PyErr_SetString(PyExc_ValueError, "Payload is empty");
+  else if (!ReadVarint(pos, end, value))
+    PyErr_SetString(PyExc_EOFError, "Payload too short");
+  else if (pos != end)
+    PyErr_SetString(PyExc_ValueError, "Payload too long");
+  else
+    valid = true;
+
+  PyBuffer_Release(&data);
+  return valid;
+}
+
+
+static PyObject* DecodeUint(PyObject* self, PyObject* args) {
+  unsigned long long value;
+
+  if (!ReadColumnVarint(args, value))
+    return NULL;
+
+  return PyLong_FromUnsignedLongLong(value);
+}
+
+
+static PyObject* DecodeSint(PyObject* self, PyObject* args) {
+  unsigned long long value;
+
+  if (!ReadColumnVarint(args, value))
+    return NULL;
+
+  // Zigzag encoded, revert it
+  return PyLong_FromLongLong(static_cast<long long>(value >> 1) ^
+                             -static_cast<long long>(value & 1));
+}
+
+
+static PyObject* DecodeVarints(PyObject* self, PyObject* args) {
+  PyObject* result = NULL;
+  Py_buffer data;
+  Py_ssize_t offset = 0;
+
+  if (!PyArg_ParseTuple(args, "s*|n", &data, &offset))
+    return NULL;
+
+  const unsigned char* pos = static_cast<const unsigned char*>(data.buf);
+  const unsigned char* end = pos + data.len;
+  // Datetime and time values hold at most 7 varints
+  unsigned long long values[8];
+  Py_ssize_t count = 0;
+
+  pos += offset < 0 ? 0 : (offset > data.len ? data.len : offset);
+  while (pos < end && count < 8) {
+    if (!ReadVarint(pos, end, values[count++])) {
+      PyErr_SetString(PyExc_EOFError, "Payload too short");
+      PyBuffer_Release(&data);
+      return NULL;
+    }
+  }
+
+  if (pos != end) {
+    PyErr_SetString(PyExc_ValueError, "Payload too long");
+  } else {
+    result = PyTuple_New(count);
+    for (Py_ssize_t i = 0; result && i < count; ++i) {
+      PyObject* value = PyLong_FromUnsignedLongLong(values[i]);
+
+      if (!value) {
+        Py_CLEAR(result);
+        break;
+      }
+      PyTuple_SET_ITEM(result, i, value);
+    }
+  }
+
+  PyBuffer_Release(&data);
+  return result;
+}
+
+
+static PyObject* DecodeDecimal(PyObject* self, PyObject* args) {
+  PyObject* result = NULL;
+  Py_buffer data;
+
+  if (!PyArg_ParseTuple(args, "s*", &data))
+    return NULL;
+
+  const unsigned char* pos = static_cast<const unsigned char*>(data.buf);
+  const unsigned char* end = pos + data.len;
+  std::string digits;
+  int sign = -1;
+
+  if (pos == end) {
+    PyErr_SetString(PyExc_ValueError, "Payload is empty");
+    PyBuffer_Release(&data);
+    return NULL;
+  }
+
+  // The first byte is the scale, followed by BCD digits and a sign nibble
+  int scale = *pos++;
+  digits.reserve(2 * (end - pos));
+  while (pos < end && sign < 0) {
+    int high_bcd = (*pos & 0xf0) >> 4;
+    int low_bcd = *pos & 0x0f;
+
+    ++pos;
+    if (high_bcd < 0x0a) {
+      digits.push_back(static_cast<char>(high_bcd));
+      if (low_bcd < 0x0a)
+        digits.push_back(static_cast<char>(low_bcd));
+      else if (low_bcd == 0x0c || low_bcd == 0x0d)
+        sign = low_bcd == 0x0d;
+      else
+        break;
+    } else if ((high_bcd == 0x0c || high_bcd == 0x0d) && low_bcd == 0x00) {
+      sign = high_bcd == 0x0d;
+    } else {
+      break;
+    }
+  }
+
+  if (sign < 0) {
+    PyErr_SetString(PyExc_ValueError, "Invalid BCD");
+  } else {
+    PyObject* digits_tuple = PyTuple_New(digits.size());
+
+    for (size_t i = 0; digits_tuple && i < digits.size(); ++i) {
+      PyObject* digit = PyLong_FromLong(digits[i]);
+
+      if (!digit) {
+        Py_CLEAR(digits_tuple);
+        break;
+      }
+      PyTuple_SET_ITEM(digits_tuple, i, digit);
+    }
+    if (digits_tuple)
+      result = Py_BuildValue("(iNi)", sign, digits_tuple, -scale);
+  }
+
+  PyBuffer_Release(&data);
+  return result;
+}
+
+
 #ifdef PY3
 static void MyFree(void *) {
   google::protobuf::ShutdownProtobufLibrary();
@@ -953,6 +1132,14 @@ init_mysqlxpb() {
     { "serialize_message", SerializeMessage, METH_VARARGS,
       "Serialize a message." },
     { "enum_value", EnumValue, METH_VARARGS, "Get enum value." },
+    { "decode_uint", DecodeUint, METH_VARARGS,
+      "Decode an unsigned integer column value." },
+    { "decode_sint", DecodeSint, METH_VARARGS,
+      "Decode a signed integer column value." },
+    { "decode_varints", DecodeVarints, METH_VARARGS,
+      "Decode the varints of a datetime or time column value." },
+    { "decode_decimal", DecodeDecimal, METH_VARARGS,
+      "Decode a decimal column value as a decimal.Decimal tuple." },
     { NULL, NULL, 0, NULL }
   };
 
@@ -234,7 +234,8 @@ def get_test_modules():
     for finder, name, is_pkg in walk_packages(__path__, prefix=__name__+'.'):
         if ('.test_' not in name or
                 ('django' in name and not DJANGO_VERSION) or
-                ('cext' in name and not MYSQL_CAPI)):
+                ('cext' in name and not MYSQL_CAPI) or
+                ('_aio' in name and sys.version_info < (3, 7))):
             continue
 
         module_path = os.path.join(finder.path, name.split('.')[-1] + '.py')
@@ -0,0 +1,386 @@
+# Copyright (c) 2020, Oracle and/or its affiliates. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301  USA
+
+"""Unittests for mysql.connector.aio
+"""
+
+import asyncio
+import os
+import socket
+import ssl
+import threading
+
+import tests
+from mysql.connector import aio, errors
+from mysql.connector.constants import FieldType
+from tests.test_cursor import _ReplayServer
+
+
+def run(coro):
+    """Runs a coroutine until it completes"""
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def get_config():
+    """Returns the MySQL configuration for asynchronous connections"""
+    config = tests.get_mysql_config()
+    config['ssl_disabled'] = True
+    return config
+
+
+class _TLSEchoServer(object):
+    """Local server upgrading connections to TLS and echoing the data"""
+
+    def __init__(self):
+        self.context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.context.load_cert_chain(
+            os.path.join(tests.SSL_DIR, 'tests_server_cert.pem'),
+            os.path.join(tests.SSL_DIR, 'tests_server_key.pem'))
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(4)
+        self.port = self._server.getsockname()[1]
+        thread = threading.Thread(target=self._accept)
+        thread.daemon = True
+        thread.start()
+
+    def close(self):
+        """Stops accepting connections"""
+        self._server.close()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self._server.accept()
+            except socket.error:
+                return
+            thread = threading.Thread(target=self._serve, args=(sock,))
+            thread.daemon = True
+            thread.start()
+
+    def _serve(self, sock):
+        try:
+            sock = self.context.wrap_socket(sock, server_side=True)
+            while True:
+                data = sock.recv(1024)
+                if not data:
+                    break
+                sock.sendall(data)
+        except (socket.error, ssl.SSLError):
+            pass
+        sock.close()
+
+
+class _Writer(object):
+    """StreamWriter without start_tls(), like before Python 3.11"""
+
+    def __init__(self, writer):
+        self.transport = writer.transport
+        self.drain = writer.drain
+
+
+class StartTLSTests(tests.MySQLConnectorTests):
+
+    """Testing the upgrade of asyncio streams to TLS"""
+
+    def setUp(self):
+        self.server = _TLSEchoServer()
+
+    def tearDown(self):
+        self.server.close()
+
+    def _echo(self, wrap_writer=False):
+        async def echo():
+            reader, writer = await asyncio.open_connection(
+                '127.0.0.1', self.server.port)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            # Python 3.11 closes the transport when the plain writer is
+            # garbage collected
+            plain_writer = writer
+            if wrap_writer:
+                writer = _Writer(writer)
+            reader, writer = await aio.start_tls(reader, writer, context)
+            self.assertTrue(writer.get_extra_info('ssl_object'))
+            writer.write(b'spam')
+            await writer.drain()
+            data = await reader.readexactly(4)
+            writer.close()
+            plain_writer.close()
+            return data
+        return run(echo())
+
+    def test_start_tls(self):
+        self.assertEqual(b'spam', self._echo())
+
+    def test_start_tls_loop(self):
+        self.assertEqual(b'spam', self._echo(wrap_writer=True))
+
+    def test_switch_to_ssl(self):
+        async def echo():
+            sock = aio.AsyncMySQLSocket(port=self.server.port)
+            await sock.open_connection()
+            await sock.switch_to_ssl(None, None, None)
+            sock.send(b'spam', 0)
+            await sock.drain()
+            return await sock.recv()
+        self.assertEqual(bytearray(b'\x04\x00\x00\x00spam'), run(echo()))
+
+
+class AsyncMySQLConnectionTests(tests.MySQLConnectorTests):
+
+    def setUp(self):
+        self.cnx = run(aio.connect(**get_config()))
+
+    def tearDown(self):
+        run(self.cnx.close())
+
+    def test_connect(self):
+        self.assertTrue(run(self.cnx.is_connected()))
+        self.assertTrue(isinstance(self.cnx, aio.AsyncMySQLConnection))
+        self.assertEqual(tests.MYSQL_VERSION,
+                         self.cnx.get_server_version()[0:3])
+        run(self.cnx.close())
+        self.assertFalse(run(self.cnx.is_connected()))
+
+    def test_connect_error(self):
+        config = get_config()
+        config['password'] = 'wrong password'
+        self.assertRaises(errors.ProgrammingError, run, aio.connect(**config))
+
+    def test_execute(self):
+        cur = self.cnx.cursor()
+        run(cur.execute("SELECT %s, %s", (1, 'a')))
+        self.assertEqual((1, 'a'), run(cur.fetchone()))
+        self.assertEqual(None, run(cur.fetchone()))
+        self.assertEqual(1, cur.rowcount)
+        run(cur.close())
+
+    def test_async_iteration(self):
+        async def fetch():
+            cur = self.cnx.cursor()
+            await cur.execute("SELECT 1 UNION SELECT 2 UNION SELECT 3")
+            return [row[0] async for row in cur]
+        self.assertEqual([1, 2, 3], run(fetch()))
+
+    def test_cursor_types(self):
+        stmt = "SELECT 1 AS a, 'b' AS b"
+        expected = [
+            ({}, (1, 'b')),
+            ({'buffered': True}, (1, 'b')),
+            ({'raw': True}, (bytearray(b'1'), bytearray(b'b'))),
+            ({'dictionary': True}, {'a': 1, 'b': 'b'}),
+            ({'dictionary': True, 'buffered': True}, {'a': 1, 'b': 'b'}),
+        ]
+        for kwargs, row in expected:
+            cur = self.cnx.cursor(**kwargs)
+            run(cur.execute(stmt))
+            self.assertEqual([row], run(cur.fetchall()))
+            run(cur.close())
+
+        cur = self.cnx.cursor(named_tuple=True)
+        run(cur.execute(stmt))
+        row = run(cur.fetchone())
+        self.assertEqual((1, 'b'), (row.a, row.b))
+        run(cur.close())
+
+        self.assertRaises(errors.NotSupportedError, self.cnx.cursor,
+                          prepared=True)
+
+    def test_executemany(self):
+        table = "aio_executemany"
+        cur = self.cnx.cursor()
+        run(cur.execute("DROP TABLE IF EXISTS {0}".format(table)))
+        run(cur.execute("CREATE TABLE {0} (id INT, c1 VARCHAR(10))"
+                        "".format(table)))
+        try:
+            data = [(i, 'c{0}'.format(i)) for i in range(10)]
+            run(cur.executemany("INSERT INTO {0} (id, c1) VALUES (%s, %s)"
+                                "".format(table), data))
+            self.assertEqual(10, cur.rowcount)
+            run(cur.execute("SELECT id, c1 FROM {0} ORDER BY id"
+                            "".format(table)))
+            self.assertEqual(data, run(cur.fetchall()))
+        finally:
+            run(cur.execute("DROP TABLE IF EXISTS {0}".format(table)))
+
+    def test_multi(self):
+        async def execute():
+            cur = self.cnx.cursor()
+            results = []
+            async for result in await cur.execute("SELECT 1; SELECT 2",
+                                                  multi=True):
+                results.append(await result.fetchall())
+            return results
+        self.assertEqual([[(1,)], [(2,)]], run(execute()))
+
+    def test_transaction(self):
+        run(self.cnx.start_transaction())
+        self.assertTrue(self.cnx.in_transaction)
+        run(self.cnx.rollback())
+        self.assertFalse(self.cnx.in_transaction)
+
+    def test_unread_result(self):
+        cur = self.cnx.cursor()
+        run(cur.execute("SELECT 1 UNION SELECT 2"))
+        other = self.cnx.cursor()
+        self.assertRaises(errors.InternalError, run,
+                          other.execute("SELECT 3"))
+        run(cur.fetchall())
+
+    def test_concurrent_connections(self):
+        async def query(value):
+            async with aio.AsyncMySQLConnection(**get_config()) as cnx:
+                cur = cnx.cursor()
+                await cur.execute("SELECT SLEEP(0.2), %s", (value,))
+                return (await cur.fetchone())[1]
+
+        async def gather():
+            return await asyncio.gather(*[query(i) for i in range(10)])
+        self.assertEqual(list(range(10)), run(gather()))
+
+
+class AsyncMySQLCursorBatchTests(tests.MySQLConnectorTests):
+
+    def test_executemany_batches(self):
+        """Spread executemany() INSERT rows over statements"""
+        # The server has a max_allowed_packet of 1024 bytes
+        server = _ReplayServer([(b'max_allowed_packet', FieldType.LONG)],
+                               [(b'1024',)])
+        cnx = run(aio.connect(host='127.0.0.1', port=server.port,
+                              user='root', password='', database='myconnpy',
+                              ssl_disabled=True))
+        self.assertRaises(errors.NotSupportedError, getattr, cnx,
+                          'max_allowed_packet')
+        self.assertEqual(1024, run(cnx.get_max_allowed_packet()))
+
+        cur = cnx.cursor()
+        del server.queries[:]
+        run(cur.executemany("INSERT INTO t1 (id, name) VALUES (%s, %s)",
+                            ((i, 'x' * 50) for i in range(20))))
+        self.assertEqual(20, cur.rowcount)
+        self.assertEqual(1, cur.lastrowid)
+        self.assertTrue(len(server.queries) > 1)
+        self.assertTrue(all([len(query) <= 512 for query in server.queries]))
+        run(cnx.close())
+
+
+class AsyncMySQLConnectionPoolTests(tests.MySQLConnectorTests):
+
+    def test___init__(self):
+        pool = aio.AsyncMySQLConnectionPool(
+            pool_size=2, pool_name='aio_init', host='127.0.0.1',
+            user='root')
+        self.assertEqual('aio_init', pool.pool_name)
+        self.assertEqual(2, pool.pool_size)
+        self.assertEqual(0, pool.min_size)
+        self.assertEqual('127.0.0.1', pool._cnx_config['host'])
+        self.assertEqual(0, pool.waiting)
+        self.assertEqual(0, pool.stats['waits'])
+        self.assertEqual(0, sum(count for _, count in pool.wait_histogram))
+        self.assertEqual(0, pool.open_connections)
+        self.assertRaises(errors.NotSupportedError, pool.resize, max_size=3)
+
+        self.assertRaises(errors.PoolError, aio.AsyncMySQLConnectionPool,
+                          pool_name='aio_init', spam='ham')
+        self.assertRaises(AttributeError, aio.AsyncMySQLConnectionPool,
+                          pool_size=0, pool_name='aio_init')
+
+        # The maximum size replaces pool_size, connections are always
+        # opened on demand and not checked in the background
+        pool = aio.AsyncMySQLConnectionPool(
+            pool_size=2, pool_name='aio_init', pool_min_size=0,
+            pool_max_size=4, host='127.0.0.1')
+        self.assertEqual(4, pool.pool_size)
+        for key, value in (('pool_min_size', 1), ('pool_ping_interval', 1),
+                           ('pool_max_lifetime', 60),
+                           ('pool_validation_interval', 1),
+                           ('pool_max_idle_time', 60),
+                           ('pool_open_threads', 2), ('pool_timeout', 1)):
+            self.assertRaises(errors.NotSupportedError,
+                              aio.AsyncMySQLConnectionPool,
+                              pool_name='aio_init', host='127.0.0.1',
+                              **{key: value})
+
+    def test_connect_pool_timeout(self):
+        server = _ReplayServer([(b'1', FieldType.LONG)], [(b'1',)])
+        config = dict(host='127.0.0.1', port=server.port, user='root',
+                      password='', ssl_disabled=True,
+                      pool_name='aio_timeout', pool_max_size=1)
+        cnx = run(aio.connect(**config))
+        self.assertEqual(1, cnx._cnx_pool.pool_size)
+        # The pool is exhausted, pool_timeout bounds the wait
+        self.assertRaises(errors.PoolError, run,
+                          aio.connect(pool_timeout=0.1, **config))
+        self.assertEqual(1, cnx._cnx_pool.stats['timeouts'])
+        self.assertRaises(errors.PoolError, run,
+                          aio.connect(**dict(config, pool_max_size=2)))
+        self.assertRaises(errors.NotSupportedError, run,
+                          aio.connect(pool_name='aio_unsupported',
+                                      pool_min_size=1, host='127.0.0.1'))
+        pool = aio._CONNECTION_POOLS.pop('aio_timeout')
+        run(cnx.close())
+        run(pool._remove_connections())
+
+    def test_get_connection(self):
+        pool = aio.AsyncMySQLConnectionPool(pool_size=2, **get_config())
+
+        async def query():
+            cnx = await pool.get_connection()
+            try:
+                cur = cnx.cursor()
+                await cur.execute("SELECT CONNECTION_ID()")
+                return (await cur.fetchone())[0]
+            finally:
+                await cnx.close()
+
+        async def gather():
+            return await asyncio.gather(*[query() for _ in range(20)])
+        self.assertEqual(2, len(set(run(gather()))))
+        self.assertEqual(2, run(pool._remove_connections()))
+
+    def test_pool_exhausted(self):
+        pool = aio.AsyncMySQLConnectionPool(pool_size=1, **get_config())
+        cnx = run(pool.get_connection())
+        self.assertRaises(errors.PoolError, run,
+                          pool.get_connection(timeout=0.1))
+        run(cnx.close())
+        cnx = run(pool.get_connection(timeout=0.1))
+        self.assertTrue(isinstance(cnx, aio.AsyncPooledMySQLConnection))
+        self.assertRaises(errors.PoolError, cnx.config, user='spam')
+        run(cnx.close())
+        run(pool._remove_connections())
+
+    def test_connect_pooled(self):
+        config = get_config()
+        config['pool_name'] = 'aio_pool'
+        cnx = run(aio.connect(**config))
+        self.assertTrue(isinstance(cnx, aio.AsyncPooledMySQLConnection))
+        self.assertEqual('aio_pool', cnx.pool_name)
+        run(cnx.close())
@@ -37,7 +37,11 @@ import timeit
 import unittest
 from decimal import Decimal
 import io
+import re
 import socket
+import struct
+import threading
+import time
 
 import tests
 from . import PY2
@@ -2015,3 +2019,361 @@ class WL13335(tests.MySQLConnectorTests):
         cnx_config['client_flags'] =flags
         # connection must be successful
         _ = self.cnx.__class__(**cnx_config)
+
+
+class _SessionServer(object):
+    """Local server recording the statements sent after connecting
+
+    The server accepts connections without checking the credentials and
+    answers every command with an OK packet, after waiting delay seconds
+    to simulate a network hop. The autocommit status flag follows the
+    SET statements, statements are recorded in queries.
+
+    When session_track is True, the server reports changes of the schema
+    and of the tracked system variables like a MySQL server would.
+    """
+
+    def __init__(self, delay=0, session_track=False):
+        self.delay = delay
+        self.session_track = session_track
+        self.queries = []
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(16)
+        self.port = self._server.getsockname()[1]
+        thread = threading.Thread(target=self._accept)
+        thread.daemon = True
+        thread.start()
+
+    def close(self):
+        """Stops accepting connections"""
+        self._server.close()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self._server.accept()
+            except socket.error:
+                return
+            thread = threading.Thread(target=self._serve, args=(sock,))
+            thread.daemon = True
+            thread.start()
+
+    @staticmethod
+    def _packet(seq, payload):
+        return struct.pack('<I', len(payload))[0:3] + \
+            struct.pack('<B', seq % 256) + payload
+
+    @staticmethod
+    def _lc_string(value):
+        if not isinstance(value, bytes):
+            value = value.encode('utf8')
+        return struct.pack('<B', len(value)) + value
+
+    def _session_state(self, query, tracked):
+        """Returns the session state changes caused by a query"""
+        changes = []
+        if query.startswith('USE '):
+            changes.append((constants.SessionTrackType.SCHEMA,
+                            self._lc_string(query[4:])))
+        match = re.search(r"NAMES '(\w+)'", query)
+        if match:
+            for name in ('character_set_client', 'character_set_connection',
+                         'character_set_results'):
+                if name in tracked:
+                    changes.append((
+                        constants.SessionTrackType.SYSTEM_VARIABLES,
+                        self._lc_string(name) +
+                        self._lc_string(match.group(1))))
+        for name, quoted, value in re.findall(
+                r"@@session\.(\w+) = (?:'([^']*)'|(\w+))", query):
+            value = quoted or value
+            if name in tracked:
+                changes.append((constants.SessionTrackType.SYSTEM_VARIABLES,
+                                self._lc_string(name) +
+                                self._lc_string(value)))
+        return b''.join(struct.pack('<B', track_type) + self._lc_string(data)
+                        for track_type, data in changes)
+
+    def _serve(self, sock):
+        caps = (constants.ClientFlag.PROTOCOL_41 |
+                constants.ClientFlag.SECURE_CONNECTION |
+                constants.ClientFlag.PLUGIN_AUTH |
+                constants.ClientFlag.CONNECT_WITH_DB |
+                constants.ClientFlag.LONG_PASSWD |
+                constants.ClientFlag.TRANSACTIONS)
+        if self.session_track:
+            caps |= constants.ClientFlag.SESION_TRACK
+        greeting = (b'\x0a8.0.19\x00' + struct.pack('<I', 1) +
+                    b'abcdefgh\x00' + struct.pack('<HBHHB', caps & 0xffff, 255,
+                                                   2, caps >> 16, 21) +
+                    b'\x00' * 10 + b'ijklmnopqrst\x00' +
+                    b'mysql_native_password\x00')
+        autocommit = True
+        default_tracked = ('autocommit', 'character_set_client',
+                           'character_set_connection',
+                           'character_set_results', 'time_zone')
+        tracked = default_tracked
+        state = b''
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock_file = sock.makefile('rb')
+        try:
+            sock.sendall(self._packet(0, greeting))
+            sock_file.read(
+                4 + struct.unpack('<I', sock_file.read(3) + b'\x00')[0] - 3)
+            seq = 2
+            while True:
+                time.sleep(self.delay)
+                status = constants.ServerFlag.STATUS_AUTOCOMMIT \
+                    if autocommit else 0
+                if state:
+                    status |= constants.ServerFlag.SERVER_SESSION_STATE_CHANGED
+                    state = b'\x00' + self._lc_string(state)
+                sock.sendall(self._packet(
+                    seq, b'\x00\x00\x00' + struct.pack('<HH', status, 0) +
+                    state))
+                state = b''
+                header = sock_file.read(4)
+                if len(header) < 4:
+                    break
+                payload = sock_file.read(
+                    struct.unpack('<I', header[0:3] + b'\x00')[0])
+                seq = 1
+                if payload[0:1] == b'\x01':
+                    break
+                elif payload[0:1] == b'\x1f':
+                    autocommit = True
+                    tracked = default_tracked
+                elif payload[0:1] == b'\x03':
+                    query = payload[1:].decode('utf8')
+                    self.queries.append(query)
+                    if 'autocommit = ' in query:
+                        autocommit = 'autocommit = ON' in query
+                    if self.session_track:
+                        match = re.search(
+                            r"session_track_system_variables = '([^']*)'",
+                            query)
+                        if match:
+                            tracked = match.group(1).split(',')
+                        state = self._session_state(query, tracked)
+        except socket.error:
+            pass
+        sock_file.close()
+        sock.close()
+
+
+class MySQLConnectionSessionSetupTests(tests.MySQLConnectorTests):
+
+    """Testing the statements sent to setup a session"""
+
+    def setUp(self):
+        self.server = _SessionServer()
+
+    def tearDown(self):
+        self.server.close()
+
+    def _connect(self, **kwargs):
+        return connection.MySQLConnection(
+            host='127.0.0.1', port=self.server.port, user='root',
+            password='', database='myconnpy', ssl_disabled=True, **kwargs)
+
+    def test__post_connection(self):
+        # The handshake sets the character set, autocommit is ON by default
+        cnx = self._connect(autocommit=True)
+        self.assertEqual([], self.server.queries)
+        cnx.close()
+
+        cnx = self._connect()
+        self.assertEqual(["SET @@session.autocommit = OFF"],
+                         self.server.queries)
+        cnx.close()
+
+        del self.server.queries[:]
+        cnx = self._connect(collation='utf8mb4_ja_0900_as_cs',
+                            time_zone='+01:00',
+                            sql_mode=['STRICT_ALL_TABLES', 'NO_ZERO_DATE'])
+        self.assertEqual(
+            ["SET NAMES 'utf8mb4' COLLATE 'utf8mb4_ja_0900_as_cs', "
+             "@@session.autocommit = OFF, @@session.time_zone = '+01:00', "
+             "@@session.sql_mode = 'STRICT_ALL_TABLES,NO_ZERO_DATE'"],
+            self.server.queries)
+        self.assertEqual('utf8mb4', cnx.charset)
+
+        # Resetting the session reverts to the server character set
+        del self.server.queries[:]
+        cnx.cmd_reset_connection()
+        self.assertEqual(1, len(self.server.queries))
+        self.assertTrue(self.server.queries[0].startswith("SET NAMES"))
+        cnx.close()
+
+    def test_reset_session(self):
+        cnx = self._connect(charset='latin1')
+        del self.server.queries[:]
+        cnx.reset_session(user_variables={'ham': 'spam'},
+                          session_variables={'sql_big_selects': 1})
+        self.assertEqual(
+            ["SET NAMES 'latin1' COLLATE 'latin1_swedish_ci', "
+             "@@session.autocommit = OFF",
+             "SET @`ham` = 'spam', SESSION `sql_big_selects` = 1"],
+            self.server.queries)
+        cnx.close()
+
+    def test_connect_latency(self):
+        """Benchmark connect to first query latency over a slow network"""
+        self.server.delay = 0.005
+        runs = 20
+        timings = []
+        for _ in range(runs):
+            start = time.time()
+            cnx = self._connect(time_zone='+00:00', sql_mode='TRADITIONAL')
+            cnx.cmd_query("DO 1")
+            timings.append(time.time() - start)
+            cnx.close()
+        timings.sort()
+        tests.MESSAGES["INFO"].append(
+            "connect and first query with 5ms per round trip: "
+            "p50={0:.3f}ms".format(timings[runs // 2] * 1000))
+
+
+class MySQLConnectionSessionTrackTests(tests.MySQLConnectorTests):
+
+    """Testing the session state mirrored using the session state tracker"""
+
+    def setUp(self):
+        self.server = _SessionServer(session_track=True)
+
+    def tearDown(self):
+        self.server.close()
+
+    def _connect(self, **kwargs):
+        return connection.MySQLConnection(
+            host='127.0.0.1', port=self.server.port, user='root',
+            password='', database='myconnpy', ssl_disabled=True, **kwargs)
+
+    def test__post_connection(self):
+        cnx = self._connect(time_zone='+01:00')
+        self.assertTrue(cnx._client_flags & constants.ClientFlag.SESION_TRACK)
+        self.assertEqual(
+            ["SET @@session.session_track_schema = ON, "
+             "@@session.session_track_system_variables = '{0}', "
+             "@@session.autocommit = OFF, @@session.time_zone = '+01:00'"
+             "".format(','.join(constants.SESSION_TRACK_VARIABLES))],
+            self.server.queries)
+        self.assertEqual({'autocommit': 'OFF', 'time_zone': '+01:00'},
+                         cnx._session_variables)
+        cnx.close()
+
+        # Servers without the session state tracker are queried
+        server = _SessionServer()
+        cnx = connection.MySQLConnection(
+            host='127.0.0.1', port=server.port, user='root', password='',
+            ssl_disabled=True)
+        self.assertFalse(cnx._session_track)
+        self.assertEqual(["SET @@session.autocommit = OFF"], server.queries)
+        cnx.close()
+        server.close()
+
+    def test_getters(self):
+        cnx = self._connect(time_zone='+01:00', sql_mode='NO_ZERO_DATE')
+        del self.server.queries[:]
+        self.assertEqual('myconnpy', cnx.database)
+        self.assertEqual('+01:00', cnx.time_zone)
+        self.assertEqual('NO_ZERO_DATE', cnx.sql_mode)
+        self.assertFalse(cnx.autocommit)
+        self.assertEqual([], self.server.queries)
+
+        # Changes made by statements are reported by the server
+        cnx.cmd_query("USE spam")
+        cnx.cmd_query("SET @@session.time_zone = '+02:00'")
+        self.assertEqual('spam', cnx.database)
+        self.assertEqual('+02:00', cnx.time_zone)
+
+        # The mirror is forgotten when the connection is closed
+        cnx.close()
+        self.assertFalse(cnx._session_track)
+        self.assertEqual({}, cnx._session_variables)
+
+    def test_setters(self):
+        cnx = self._connect(time_zone='+01:00', sql_mode='NO_ZERO_DATE')
+        del self.server.queries[:]
+        cnx.database = 'myconnpy'
+        cnx.time_zone = '+01:00'
+        cnx.sql_mode = ['NO_ZERO_DATE']
+        cnx.autocommit = False
+        cnx.set_charset_collation(collation='utf8mb4_general_ci')
+        self.assertEqual([], self.server.queries)
+
+        cnx.database = 'spam'
+        cnx.time_zone = '+02:00'
+        cnx.sql_mode = ['NO_ZERO_DATE', 'STRICT_ALL_TABLES']
+        cnx.autocommit = True
+        cnx.set_charset_collation('latin1')
+        self.assertEqual(
+            ["USE spam", "SET @@session.time_zone = '+02:00'",
+             "SET @@session.sql_mode = 'NO_ZERO_DATE,STRICT_ALL_TABLES'",
+             "SET @@session.autocommit = ON",
+             "SET NAMES 'latin1' COLLATE 'latin1_swedish_ci'"],
+            self.server.queries)
+        self.assertEqual('spam', cnx.database)
+        self.assertTrue(cnx.autocommit)
+
+        # Character set changes made by statements are noticed
+        del self.server.queries[:]
+        cnx.cmd_query("SET NAMES 'utf8mb4'")
+        cnx.set_charset_collation('latin1')
+        self.assertEqual(
+            ["SET NAMES 'utf8mb4'",
+             "SET NAMES 'latin1' COLLATE 'latin1_swedish_ci'"],
+            self.server.queries)
+        cnx.close()
+
+    def test_cmd_reset_connection(self):
+        cnx = self._connect(time_zone='+01:00')
+        cnx.cmd_query("USE spam")
+        del self.server.queries[:]
+        cnx.cmd_reset_connection()
+        # Tracking is enabled again, the current schema is kept
+        self.assertEqual(1, len(self.server.queries))
+        self.assertTrue(self.server.queries[0].startswith(
+            "SET @@session.session_track_schema = ON"))
+        self.assertTrue(cnx._session_track)
+        self.assertEqual('spam', cnx.database)
+        self.assertEqual('+01:00', cnx.time_zone)
+        cnx.close()
+
+    def test_unknown_changes(self):
+        changed = constants.ServerFlag.SERVER_SESSION_STATE_CHANGED
+        cnx = self._connect(time_zone='+01:00')
+
+        # EOF packets report the session state changed, not the changes
+        eof = b'\x05\x00\x00\x05\xfe' + struct.pack('<HH', 0, changed)
+        cnx._handle_eof(eof)
+        self.assertFalse(cnx._session_track)
+        self.assertEqual({}, cnx._session_variables)
+        del self.server.queries[:]
+        cnx.database = 'myconnpy'
+        self.assertEqual(["USE myconnpy"], self.server.queries)
+        cnx.cmd_reset_connection()
+
+        # OK packets without the changes
+        ok = b'\x07\x00\x00\x01\x00\x00\x00' + struct.pack('<HH', changed, 0)
+        self.assertTrue(cnx._session_track)
+        cnx._handle_ok(ok)
+        self.assertFalse(cnx._session_track)
+        cnx.close()
+
+    def test_round_trips(self):
+        """Benchmark reading and setting the session state"""
+        self.server.delay = 0.005
+        cnx = self._connect(time_zone='+00:00')
+        start = time.time()
+        for _ in range(10):
+            cnx.database = 'myconnpy'
+            cnx.autocommit = False
+            cnx.time_zone = '+00:00'
+            (cnx.database, cnx.autocommit, cnx.time_zone)
+        tests.MESSAGES["INFO"].append(
+            "10 times reading and setting database, autocommit and "
+            "time_zone with 5ms per round trip: {0:.3f}ms".format(
+                (time.time() - start) * 1000))
+        cnx.close()
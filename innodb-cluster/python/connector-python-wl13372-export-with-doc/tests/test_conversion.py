@@ -341,6 +341,116 @@ class MySQLConverterTests(tests.MySQLConnectorTests):
         res = self.cnv.row_to_python(data, description)
         self.assertEqual(res, self._to_python_exp)
 
+    def test_row_decoder(self):
+        """Convert rows using a decoder compiled from the fields"""
+        data = [v[0] for v in self._to_python_data]
+        description = [v[1] for v in self._to_python_data]
+
+        decode = self.cnv.row_decoder(description)
+        self.assertEqual(self._to_python_exp, decode(data))
+        self.assertEqual((None,) * len(data), decode([None] * len(data)))
+        self.assertTrue(decode is self.cnv.row_decoder(description))
+        self.assertTrue(decode is self.cnv.row_decoder(list(description)))
+
+        # Charset and Unicode are resolved when compiling
+        description = [
+            ('name', constants.FieldType.VAR_STRING,
+             None, None, None, None, True, 0),
+            ('data', constants.FieldType.STRING,
+             None, None, None, None, True, constants.FieldFlag.BINARY),
+        ]
+        data = (b'\xe4 latin', b'\xe4\xff')
+        self.cnv.set_charset('latin1')
+        decode = self.cnv.row_decoder(description)
+        self.assertEqual((u'\xe4 latin', u'\xe4\xff'), decode(data))
+        self.cnv.set_unicode(False)
+        self.assertFalse(decode is self.cnv.row_decoder(description))
+        self.assertEqual((b'\xe4 latin', u'\xe4\xff'),
+                         self.cnv.row_decoder(description)(data))
+        self.cnv.set_charset('utf8')
+        self.cnv.set_unicode(True)
+        self.assertEqual((u'spam', b'\xe4\xff'),
+                         self.cnv.row_decoder(description)((b'spam', data[1])))
+
+        # Errors report the field like row_to_python() does
+        description = [('id', constants.FieldType.LONG),
+                       ('price', constants.FieldType.DOUBLE)]
+        decode = self.cnv.row_decoder(description)
+        self.assertEqual((1, 1.5), decode((b'1', b'1.5')))
+        try:
+            decode((b'1', b'abc'))
+        except ValueError as err:
+            self.assertTrue(err.message.endswith("(field price)"))
+        else:
+            self.fail("ValueError not raised")
+
+    def test_row_decoder_wide(self):
+        """Convert rows of results with many columns"""
+        description = [('c{0}'.format(i), constants.FieldType.LONG)
+                       for i in range(1000)]
+        decode = self.cnv.row_decoder(description)
+        data = [str(i).encode() for i in range(1000)]
+        self.assertEqual(tuple(range(1000)), decode(data))
+        data[-1] = None
+        self.assertEqual(tuple(range(999)) + (None,), decode(data))
+
+    def test_row_decoder_converter_class(self):
+        """Use overridden methods of converter classes in row decoders"""
+        description = [('id', constants.FieldType.LONG),
+                       ('name', constants.FieldType.VAR_STRING,
+                        None, None, None, None, True, 0)]
+        data = (b'42', b'spam')
+
+        class IntConverter(conversion.MySQLConverter):
+            def _LONG_to_python(self, value, dsc=None):
+                return int(value) * 2
+
+        class RowConverter(conversion.MySQLConverter):
+            def row_to_python(self, row, fields):
+                row = conversion.MySQLConverter.row_to_python(
+                    self, row, fields)
+                return tuple(reversed(row))
+
+        class BaseConverter(conversion.MySQLConverterBase):
+            def to_python(self, vtype, value):
+                return vtype[0]
+
+        self.assertEqual(
+            (84, 'spam'), IntConverter().row_decoder(description)(data))
+        self.assertEqual(
+            ('spam', 42), RowConverter().row_decoder(description)(data))
+        self.assertEqual(
+            ('id', 'name'), BaseConverter().row_decoder(description)(data))
+
+    def test_row_decoder_benchmark(self):
+        """Convert 100k rows field by field and with a row decoder"""
+        count = 100000
+        description = [
+            ('id', constants.FieldType.LONGLONG),
+            ('price', constants.FieldType.NEWDECIMAL),
+            ('ratio', constants.FieldType.DOUBLE),
+            ('name', constants.FieldType.VAR_STRING,
+             None, None, None, None, True, 0),
+            ('created', constants.FieldType.DATETIME),
+        ]
+        rows = [(str(i).encode(), b'12.50', b'0.25', b'row' + str(i).encode(),
+                 b'2020-01-02 03:04:05') for i in range(count)]
+
+        start = time.time()
+        exp = [self.cnv._convert_row(row, description) for row in rows]
+        field_by_field = time.time() - start
+
+        start = time.time()
+        decode = self.cnv.row_decoder(description)
+        res = [decode(row) for row in rows]
+        compiled = time.time() - start
+
+        self.assertEqual(exp, res)
+        tests.MESSAGES["INFO"].append(
+            "MySQLConverter: converted {0} rows in {1:.2f}s field by field, "
+            "{2:.2f}s with a row decoder".format(
+                count, field_by_field, compiled))
+
     def test__FLOAT_to_python(self):
         """Convert a MySQL FLOAT/DOUBLE to a Python float type"""
         data = b'3.14'
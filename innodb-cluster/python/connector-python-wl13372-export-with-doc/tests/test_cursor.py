@@ -41,15 +41,23 @@ in tests/py2/bugs.py or tests/py3/bugs.py. It might be that these files need
 to be created first.
 """
 
+import array
 import datetime
+import io
 from collections import namedtuple
 from decimal import Decimal
 import re
+import socket
+import struct
+import threading
 import time
+import unittest
 
 from . import PY2
 import tests
-from mysql.connector import (connection, cursor, errors)
+from mysql.connector import (columnar, connection, conversion, cursor,
+                             errors)
+from mysql.connector.constants import ClientFlag, FieldType
 
 
 class CursorModule(tests.MySQLConnectorTests):
@@ -95,6 +103,86 @@ class CursorModule(tests.MySQLConnectorTests):
         for exp, stmt in cases:
             self.assertEqual(exp, re.search(regex, stmt).group(1))
 
+    def test__params_layout(self):
+        """Split and cache operations around their parameter markers"""
+        cursor.PARAMS_LAYOUT_CACHE.clear()
+        stmt = "SELECT %s, '%%s', %s FROM t1"
+        exp = [b"SELECT ", b", '%", b"', ", b" FROM t1"]
+        self.assertEqual(exp, cursor._params_layout(stmt, 'utf8'))
+        self.assertEqual(exp, cursor._params_layout(stmt.encode(), 'utf8'))
+        self.assertEqual(exp, cursor._params_layout(stmt, 'utf8'))
+        self.assertEqual((1, 2), (cursor.PARAMS_LAYOUT_CACHE.hits,
+                                  cursor.PARAMS_LAYOUT_CACHE.misses))
+        stmt = "SELECT %s, '{0}'".format("x" * cursor.PARAMS_LAYOUT_MAX_LENGTH)
+        self.assertEqual(2, len(cursor._params_layout(stmt, 'utf8')))
+        self.assertFalse((stmt, 'utf8', False) in cursor.PARAMS_LAYOUT_CACHE)
+
+        # The layout depends on the character set
+        stmt = u"SELECT '\u00e4', %s"
+        self.assertEqual([b"SELECT '\xc3\xa4', ", b""],
+                         cursor._params_layout(stmt, 'utf8'))
+        self.assertEqual([b"SELECT '\xe4', ", b""],
+                         cursor._params_layout(stmt, 'latin1'))
+
+        stmt = "SELECT %(a)s, 100%(b)%, %(a)s"
+        self.assertEqual(
+            ([b"SELECT ", b", 100%, ", b""], [b"a", b"a"]),
+            cursor._params_layout(stmt, 'utf8', pyformat=True))
+        self.assertEqual(
+            None, cursor._params_layout("SELECT %(a)d", 'utf8', True))
+
+    def test__batch_insert_size(self):
+        """Limit the size of multi row INSERT statements"""
+        max_size = 16 * 1024 * 1024
+        cases = [
+            (4 * 1024 * 1024, 4 * 1024 * 1024 - 1024),
+            (64 * 1024 * 1024, max_size),
+            (2048, 1024),
+            (1024, 512),
+            (1, 1),
+        ]
+        for max_allowed_packet, exp in cases:
+            self.assertEqual(exp, cursor._batch_insert_size(
+                max_allowed_packet, max_size))
+
+    def test__interpolate_params(self):
+        """Join statement segments with parameters"""
+        segments = [b"SELECT ", b", ", b""]
+        self.assertEqual(
+            b"SELECT 1, 'a'",
+            cursor._interpolate_params(segments, (b"1", bytearray(b"'a'"))))
+        self.assertRaises(errors.ProgrammingError,
+                          cursor._interpolate_params, segments, (b"1",))
+        self.assertRaises(errors.ProgrammingError,
+                          cursor._interpolate_params, segments,
+                          (b"1", b"2", b"3"))
+        self.assertEqual(b"SELECT 1",
+                         cursor._interpolate_params([b"SELECT 1"], ()))
+
+    def test__prepare_statement_benchmark(self):
+        """Interpolate the parameters of a statement 100k times"""
+        class Connection(object):
+            python_charset = 'utf8'
+            converter = conversion.MySQLConverter('utf8')
+
+        cur = cursor.MySQLCursor()
+        cur._connection = Connection()
+        count = 100000
+        stmt = ("SELECT id, name FROM employees "
+                "WHERE id = %s AND name = %s AND hired > %s")
+        params = (12345, "O'Neil", datetime.date(2020, 1, 2))
+        self.assertEqual(
+            b"SELECT id, name FROM employees "
+            b"WHERE id = 12345 AND name = 'O\\'Neil' AND hired > '2020-01-02'",
+            cur._prepare_statement(stmt, params))
+        start = time.time()
+        for _ in range(count):
+            cur._prepare_statement(stmt, params)
+        elapsed = time.time() - start
+        tests.MESSAGES["INFO"].append(
+            "MySQLCursor: interpolated {0} statements in {1:.2f}s "
+            "({2:.0f} statements/s)".format(count, elapsed, count / elapsed))
+
 
 class CursorBaseTests(tests.MySQLConnectorTests):
 
@@ -1461,3 +1549,575 @@ class MySQLCursorBufferedNamedTupleTests(tests.TestsCursor):
         self.assertEqual(exp.id, row[0].id)
         self.assertEqual(exp.name, row[0].name)
         self.assertEqual(exp.city, row[0].city)
+
+
+class ColumnarModule(tests.MySQLConnectorTests):
+
+    def test_days_from_civil(self):
+        epoch = datetime.date(1970, 1, 1).toordinal()
+        for day in (datetime.date(1, 1, 1), datetime.date(1600, 2, 29),
+                    datetime.date(1969, 12, 31), datetime.date(2000, 3, 1),
+                    datetime.date(9999, 12, 31)):
+            self.assertEqual(day.toordinal() - epoch,
+                             columnar.days_from_civil(day.year, day.month,
+                                                      day.day))
+
+    def test_to_arrays(self):
+        description = [
+            ('a', FieldType.LONGLONG, None, None, None, None, 1, 0),
+            ('b', FieldType.VAR_STRING, None, None, None, None, 1, 0)]
+        arrays = columnar.to_arrays(description, [([(1, 'x'), (2, None)],
+                                                   False)], use_numpy=False)
+        self.assertEqual(['a', 'b'], list(arrays))
+        self.assertEqual(array.array('q', [1, 2]), arrays['a'])
+        self.assertEqual(['x', None], arrays['b'])
+
+        # Columns with the same name would overwrite each other
+        self.assertRaises(errors.ProgrammingError, columnar.to_arrays,
+                          description + description[:1], [([], False)],
+                          use_numpy=False)
+
+
+class MySQLCursorColumnarTests(tests.MySQLConnectorTests):
+
+    query = ("SELECT -5 AS i, CAST(18446744073709551615 AS UNSIGNED) AS u, "
+             "CAST(2.5 AS DOUBLE) AS d, DATE('2020-02-29') AS dt, "
+             "TIMESTAMP('2020-02-29 23:59:59.123456') AS ts, "
+             "TIME('-12:34:56.5') AS tm, 'ham' AS s UNION ALL "
+             "SELECT 7, 1, NULL, NULL, TIMESTAMP('1969-12-31'), "
+             "TIME('00:00:01'), NULL")
+
+    def setUp(self):
+        config = tests.get_mysql_config()
+        self.cnx = connection.MySQLConnection(**config)
+
+    def tearDown(self):
+        self.cnx.close()
+
+    def _check_arrays(self, arrays):
+        self.assertEqual(['i', 'u', 'd', 'dt', 'ts', 'tm', 's'],
+                         list(arrays.keys()))
+        self.assertEqual(array.array('q', [-5, 7]), arrays['i'])
+        self.assertEqual(array.array('Q', [18446744073709551615, 1]),
+                         arrays['u'])
+        # Columns holding NULL values are returned as lists
+        self.assertEqual([2.5, None], arrays['d'])
+        self.assertEqual(
+            [(datetime.date(2020, 2, 29) - datetime.date(1970, 1, 1)).days,
+             None], arrays['dt'])
+        self.assertEqual(array.array('q', [1583020799123456, -86400000000]),
+                         arrays['ts'])
+        self.assertEqual(array.array('q', [-45296500000, 1000000]),
+                         arrays['tm'])
+        self.assertEqual(['ham', None], arrays['s'])
+
+    def test_fetch_arrays(self):
+        for kwargs in ({}, {'buffered': True}, {'raw': True},
+                       {'dictionary': True}, {'prepared': True}):
+            cur = self.cnx.cursor(**kwargs)
+            cur.execute(self.query)
+            arrays = cur.fetch_arrays(use_numpy=False)
+            if kwargs.get('raw'):
+                # Raw cursors keep the values of other columns as bytes
+                arrays['s'] = [val and bytes(val).decode()
+                               for val in arrays['s']]
+            self._check_arrays(arrays)
+            self.assertEqual(2, cur.rowcount)
+            cur.close()
+
+        # The row prefetched by fetchone() is included
+        cur = self.cnx.cursor()
+        cur.execute(self.query)
+        self.assertEqual(-5, cur.fetchone()[0])
+        self.assertEqual(array.array('q', [7]),
+                         cur.fetch_arrays(use_numpy=False)['i'])
+        cur.close()
+
+    def test_fetch_columnar(self):
+        cur = self.cnx.cursor()
+        cur.execute("SELECT seq FROM (SELECT 1 AS seq UNION SELECT 2 UNION "
+                    "SELECT 3 UNION SELECT 4 UNION SELECT 5) AS t")
+        chunks = [list(chunk['seq'])
+                  for chunk in cur.fetch_columnar(2, use_numpy=False)]
+        self.assertEqual([[1, 2], [3, 4], [5]], chunks)
+        self.assertRaises(errors.ProgrammingError, next,
+                          cur.fetch_columnar(0))
+        cur.close()
+
+    @unittest.skipIf(not columnar.HAVE_NUMPY, "NumPy not available")
+    def test_fetch_arrays_numpy(self):
+        import numpy
+        cur = self.cnx.cursor()
+        cur.execute(self.query)
+        arrays = cur.fetch_arrays()
+        self.assertEqual(numpy.int64, arrays['i'].dtype)
+        self.assertEqual(numpy.dtype('datetime64[us]'), arrays['ts'].dtype)
+        self.assertEqual(numpy.datetime64('2020-02-29T23:59:59.123456'),
+                         arrays['ts'][0])
+        self.assertEqual(numpy.timedelta64(-45296500000, 'us'),
+                         arrays['tm'][0])
+        self.assertEqual([False, True], list(numpy.ma.getmaskarray(
+            arrays['dt'])))
+        self.assertEqual(numpy.datetime64('2020-02-29'), arrays['dt'][0])
+        self.assertEqual(object, arrays['s'].dtype)
+        cur.close()
+
+
+def _packet(seq, payload):
+    """Returns a MySQL packet with the given sequence number and payload"""
+    return struct.pack('<I', len(payload))[0:3] + struct.pack('<B', seq % 256) \
+        + payload
+
+
+def _lc_string(value):
+    """Returns a length coded string"""
+    return struct.pack('<B', len(value)) + value
+
+
+class _ReplayServer(object):
+    """Local server replaying captured result packets
+
+    The server accepts a single connection without checking the credentials
+    and answers every SELECT statement with the same result set. Other
+    statements are recorded in queries and get an OK packet reporting a
+    row for each VALUES list.
+
+    Prepared statement commands are recorded in commands. Statements are
+    prepared with a parameter for each question mark and executions fail
+    when a parameter value contains 'fail'.
+    """
+
+    def __init__(self, columns, rows):
+        self.queries = []
+        self.commands = []
+        eof = b'\xfe\x00\x00\x02\x00'
+        packets = [struct.pack('<B', len(columns))]
+        for name, field_type in columns:
+            packets.append(
+                _lc_string(b'def') + b'\x00\x00\x00' + _lc_string(name) +
+                _lc_string(name) + b'\x0c' +
+                struct.pack('<HIBHB', 33, 255, field_type, 0, 0) +
+                b'\x00\x00')
+        packets.append(eof)
+        for row in rows:
+            packets.append(b''.join([_lc_string(value) for value in row]))
+        packets.append(eof)
+        self.result = b''.join([_packet(seq, payload)
+                                for seq, payload in enumerate(packets, 1)])
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(1)
+        self.port = self._server.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _serve(self):
+        caps = (ClientFlag.PROTOCOL_41 | ClientFlag.SECURE_CONNECTION |
+                ClientFlag.PLUGIN_AUTH | ClientFlag.CONNECT_WITH_DB |
+                ClientFlag.LONG_PASSWD | ClientFlag.TRANSACTIONS)
+        ok_packet = b'\x00\x00\x00\x02\x00\x00\x00'
+        greeting = (b'\x0a8.0.19\x00' + struct.pack('<I', 1) +
+                    b'abcdefgh\x00' + struct.pack('<HBHHB', caps & 0xffff, 33,
+                                                   2, caps >> 16, 21) +
+                    b'\x00' * 10 + b'ijklmnopqrst\x00' +
+                    b'mysql_native_password\x00')
+        sock, _ = self._server.accept()
+        # Like the MySQL server, do not delay small packets
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock_file = sock.makefile('rb')
+        sock.sendall(_packet(0, greeting))
+        sock_file.read(4 + struct.unpack('<I', sock_file.read(3) + b'\x00')[0]
+                       - 3)
+        sock.sendall(_packet(2, ok_packet))
+        while True:
+            header = sock_file.read(4)
+            if len(header) < 4:
+                break
+            payload = sock_file.read(
+                struct.unpack('<I', header[0:3] + b'\x00')[0])
+            if payload[0:1] == b'\x01':
+                break
+            if payload[0:7].upper() == b'\x03SELECT':
+                sock.sendall(self.result)
+            elif payload[0:1] == b'\x03':
+                self.queries.append(payload[1:])
+                affected_rows = payload.count(b'),(') + 1
+                insert_id = len(self.queries)
+                sock.sendall(_packet(1, b'\x00' + struct.pack(
+                    '<BBHH', affected_rows, insert_id, 2, 0)))
+            elif payload[0:1] in (b'\x16', b'\x17', b'\x18', b'\x19',
+                                  b'\x1a'):
+                self.commands.append(payload)
+                sock.sendall(self._stmt_response(payload))
+            else:
+                sock.sendall(_packet(1, ok_packet))
+        sock.close()
+        self._server.close()
+
+    def _stmt_response(self, payload):
+        """Returns the response to a prepared statement command"""
+        if payload[0:1] == b'\x16':
+            num_params = payload.count(b'?')
+            packets = [b'\x00' + struct.pack('<IHHBH', len(self.commands), 0,
+                                             num_params, 0, 0)]
+            if num_params:
+                packets.extend(
+                    [_lc_string(b'def') + b'\x00\x00\x00' +
+                     _lc_string(b'?') + _lc_string(b'') + b'\x0c' +
+                     struct.pack('<HIBHB', 63, 0, FieldType.VAR_STRING, 0,
+                                 0) + b'\x00\x00'] * num_params)
+                packets.append(b'\xfe\x00\x00\x02\x00')
+            return b''.join([_packet(seq, packet)
+                             for seq, packet in enumerate(packets, 1)])
+        elif payload[0:1] == b'\x17':
+            if b'fail' in payload:
+                return _packet(1, b'\xff' + struct.pack('<H', 1062) +
+                               b'#23000Duplicate entry')
+            return _packet(1, b'\x00' + struct.pack(
+                '<BBHH', 1, len(self.commands) % 250, 2, 0))
+        elif payload[0:1] == b'\x1a':
+            return _packet(1, b'\x00\x00\x00\x02\x00\x00\x00')
+        return b''
+
+
+class MySQLCursorBatchTests(tests.MySQLConnectorTests):
+
+    columns = [(b'id', FieldType.LONGLONG), (b'name', FieldType.VAR_STRING)]
+
+    def _connect(self, rows, server=None, **kwargs):
+        server = server or _ReplayServer(self.columns, rows)
+        return connection.MySQLConnection(
+            host='127.0.0.1', port=server.port, user='root', password='',
+            database='myconnpy', ssl_disabled=True, **kwargs)
+
+    def test_fetch_batches(self):
+        for count in (0, 1, 999, 1000, 1001, 2500):
+            rows = [(str(i).encode(), 'row{0}'.format(i).encode())
+                    for i in range(count)]
+            exp = [(i, 'row{0}'.format(i)) for i in range(count)]
+            cnx = self._connect(rows)
+
+            cur = cnx.cursor()
+            cur.execute("SELECT id, name FROM t1")
+            self.assertEqual(exp, list(cur))
+            self.assertEqual(count or -1, cur.rowcount)
+            self.assertFalse(cnx.unread_result)
+
+            cur.execute("SELECT id, name FROM t1")
+            res = cur.fetchmany(7)
+            res.extend(cur.fetchmany(993))
+            if count <= 1000:
+                # The end of the result set is detected with the last row
+                self.assertFalse(cnx.unread_result)
+            else:
+                res.append(cur.fetchone())
+                if count > 1001:
+                    res.extend(cur.fetchall())
+            self.assertEqual(exp, res)
+            self.assertEqual(count or -1, cur.rowcount)
+            self.assertEqual([], cur.fetchmany(10))
+
+            cur = cnx.cursor(dictionary=True)
+            cur.execute("SELECT id, name FROM t1")
+            self.assertEqual([{'id': row[0], 'name': row[1]}
+                              for row in exp[0:3]], cur.fetchmany(3))
+            self.assertEqual(max(count - 3, 0), len(list(cur)))
+
+            cur = cnx.cursor(raw=True)
+            cur.execute("SELECT id, name FROM t1")
+            self.assertEqual(rows[0:3], [tuple(bytes(value) for value in row)
+                                         for row in cur.fetchmany(3)])
+            self.assertEqual(max(count - 3, 0), len(list(cur)))
+            cur.close()
+            cnx.close()
+
+    def test_executemany_batches(self):
+        """Spread executemany() INSERT rows over statements"""
+        # The server has a max_allowed_packet of 2048 bytes
+        server = _ReplayServer([(b'max_allowed_packet', FieldType.LONG)],
+                               [(b'2048',)])
+        cnx = self._connect(None, server)
+        cur = cnx.cursor()
+        sent = []
+        del server.queries[:]
+
+        def generate_rows(count):
+            for i in range(count):
+                sent.append(cur._executed is not None)
+                yield (i, 'x' * 50)
+
+        cur.executemany("INSERT INTO t1 (id, name) VALUES (%s, %s)",
+                        generate_rows(100))
+        self.assertEqual(100, cur.rowcount)
+        self.assertEqual(1, cur.lastrowid)
+        self.assertTrue(len(server.queries) > 1)
+        self.assertTrue(all([len(query) <= 1024 for query in server.queries]))
+        self.assertEqual(100, sum([query.count(b"'x") for query
+                                   in server.queries]))
+        self.assertEqual(server.queries[-1], cur._executed)
+        # Rows were generated while the first statements were executed
+        self.assertTrue(sent[0] is False and sent[-1] is True)
+
+        # A row too large for the limit gets a statement of its own
+        del server.queries[:]
+        cur.executemany("INSERT INTO t1 (id, name) VALUES (%s, %s)",
+                        [(1, 'x' * 2000), (2, 'y')])
+        self.assertEqual(2, len(server.queries))
+        self.assertEqual(2, cur.rowcount)
+
+        # Statements sent before an error are executed
+        del server.queries[:]
+        self.assertRaises(errors.ProgrammingError, cur.executemany,
+                          "INSERT INTO t1 (id, name) VALUES (%s, %s)",
+                          [(1, 'x' * 50)] * 50 + [(1,)])
+        self.assertTrue(len(server.queries) > 1)
+        cur.execute("SELECT 1")
+        self.assertEqual([(2048,)], cur.fetchall())
+
+        cur.executemany("INSERT INTO t1 (id, name) VALUES (%s, %s)",
+                        iter([]))
+        self.assertEqual(0, cur.rowcount)
+        cnx.close()
+
+    def test_executemany_not_rewritten(self):
+        """Only read max_allowed_packet when rewriting INSERT statements"""
+        server = _ReplayServer([(b'max_allowed_packet', FieldType.LONG)],
+                               [(b'2048',)])
+        cnx = self._connect(None, server)
+        cur = cnx.cursor()
+        del server.queries[:]
+        # The comment in the VALUES row prevents rewriting the statement
+        cur.executemany("INSERT INTO t1 (id, name) VALUES (%s /* id */, %s)",
+                        [(1, 'x'), (2, 'y')])
+        self.assertEqual(2, len(server.queries))
+        self.assertEqual(None, cnx._max_allowed_packet)
+        cnx.close()
+
+    def test_executemany_prepared_pipeline(self):
+        """Pipeline executions of a prepared statement"""
+        server = _ReplayServer(self.columns, [])
+        cnx = self._connect(None, server)
+        cur = cnx.cursor(prepared=True)
+        stmt = "INSERT INTO t1 (id, name) VALUES (%s, %s)"
+        data = [(1000 + i, 'row{0}'.format(i)) for i in range(600)]
+
+        cur.executemany(stmt, data, pipeline=True)
+        self.assertEqual(600, cur.rowcount)
+        self.assertEqual([b'\x16'] + [b'\x17'] * 600,
+                         [command[0:1] for command in server.commands])
+        # The parameter types are only sent with the first execution
+        self.assertEqual([1] + [0] * 599,
+                         [bytearray(command)[11] for command
+                          in server.commands[1:]])
+
+        # Changing types are sent again
+        del server.commands[:]
+        cur.executemany(stmt, [(1, 'a'), (2, None), (3, None), (4, 'd')],
+                        pipeline=True)
+        self.assertEqual([1, 1, 0, 1], [bytearray(command)[11] for command
+                                        in server.commands])
+
+        # Executions sent before and after an error are read
+        del server.commands[:]
+        self.assertRaises(errors.IntegrityError, cur.executemany, stmt,
+                          data[0:10] + [(10, 'fail')] + data[11:20],
+                          pipeline=True)
+        self.assertEqual(20, len(server.commands))
+        cur.executemany(stmt, data[0:3], pipeline=True)
+        self.assertEqual(3, cur.rowcount)
+
+        # Parameters are checked before sending them
+        del server.commands[:]
+        self.assertRaises(errors.ProgrammingError, cur.executemany, stmt,
+                          data[0:5] + [(1,)] + data[0:5], pipeline=True)
+        self.assertEqual(5, len(server.commands))
+
+        # Statements are not reset unless long data was sent
+        del server.commands[:]
+        cur.executemany(stmt, data[0:3])
+        cur.execute(stmt, (1, io.BytesIO(b'long data')))
+        cur.execute(stmt, (2, 'b'))
+        cur.execute(stmt, (3, 'c'))
+        self.assertEqual([b'\x17'] * 3 + [b'\x18', b'\x17', b'\x1a',
+                                          b'\x17', b'\x17'],
+                         [command[0:1] for command in server.commands])
+        cnx.close()
+
+    def test_prepared_statement_cache(self):
+        """Share prepared statements between cursors of a connection"""
+        server = _ReplayServer(self.columns, [])
+        cnx = self._connect(None, server)
+        stmt = "INSERT INTO t1 (id, name) VALUES (%s, %s)"
+
+        # Without cache, cursors close their statement
+        cur = cnx.cursor(prepared=True)
+        cur.execute(stmt, (1, 'a'))
+        cur.close()
+        self.assertEqual([b'\x16', b'\x17', b'\x19'],
+                         [command[0:1] for command in server.commands])
+        cnx.close()
+
+        server = _ReplayServer(self.columns, [])
+        cnx = self._connect(None, server, prepared_statement_cache_size=2)
+
+        def prepared(command):
+            """Returns the statements prepared and the IDs closed"""
+            return [(command[0:1], command[1:]) for command in server.commands
+                    if command[0:1] in (b'\x16', b'\x19')]
+
+        for i in range(3):
+            cur = cnx.cursor(prepared=True)
+            cur.execute("{0} ".format(stmt).strip(), (i, 'a'))
+            statement_id = cur._prepared['statement_id']
+            cur.close()
+        self.assertEqual(1, len(prepared(server.commands)))
+
+        # The least recently used statement is closed
+        cur = cnx.cursor(prepared=True)
+        cur.execute("DELETE FROM t1 WHERE id = %s", (1,))
+        cur.execute("UPDATE t1 SET id = %s", (1,))
+        self.assertEqual((b'\x19', struct.pack('<I', statement_id)),
+                         prepared(server.commands)[-1])
+        del server.commands[:]
+        cur.execute(stmt, (1, 'a'))
+        self.assertEqual([b'\x16', b'\x19', b'\x17'],
+                         [command[0:1] for command in server.commands])
+
+        # Long data sent by a cursor is reset before the next execution
+        cur2 = cnx.cursor(prepared=True)
+        cur.execute(stmt, (1, io.BytesIO(b'long data')))
+        del server.commands[:]
+        cur2.execute(stmt, (2, 'b'))
+        self.assertEqual([b'\x1a', b'\x17'],
+                         [command[0:1] for command in server.commands])
+
+        # Statements are deallocated when the session is reset
+        cnx.reset_session()
+        del server.commands[:]
+        cur.execute(stmt, (1, 'a'))
+        self.assertEqual([b'\x16', b'\x17'],
+                         [command[0:1] for command in server.commands])
+        cnx.close()
+
+        cnx = connection.MySQLConnection()
+        for size in (-1, 'a'):
+            self.assertRaises(errors.InterfaceError, cnx.config,
+                              prepared_statement_cache_size=size)
+
+    def test_executemany_prepared_benchmark(self):
+        """Execute a prepared INSERT 20k times one by one and pipelined."""
+        count = 20000
+        server = _ReplayServer(self.columns, [])
+        cnx = self._connect(None, server)
+        cur = cnx.cursor(prepared=True)
+        stmt = "INSERT INTO t1 (id, name) VALUES (%s, %s)"
+        data = [(i, 'row{0}'.format(i)) for i in range(count)]
+        cur.execute(stmt, data[0])
+        statement_id = cur._prepared['statement_id']
+
+        def reset_loop():
+            for params in data:
+                cnx.cmd_stmt_reset(statement_id)
+                cur.execute(stmt, params)
+
+        def execute_loop():
+            for params in data:
+                cur.execute(stmt, params)
+
+        results = []
+        for label, func in (
+                ("execute() with COM_STMT_RESET", reset_loop),
+                ("execute()", execute_loop),
+                ("pipelined executemany()",
+                 lambda: cur.executemany(stmt, data, pipeline=True))):
+            start = time.time()
+            func()
+            results.append("{0}: {1:.2f}s".format(label, time.time() - start))
+        cnx.close()
+        tests.MESSAGES["INFO"].append(
+            "Prepared INSERT executed {0} times; {1}".format(
+                count, ", ".join(results)))
+
+    def test_unread_result(self):
+        """Report rows read ahead as unread until they are fetched"""
+        rows = [(str(i).encode(), b'ham') for i in range(3)]
+        cnx = self._connect(rows)
+        for method in ('close', 'cursor'):
+            cur = cnx.cursor()
+            cur.execute("SELECT id, name FROM t1")
+            self.assertEqual((0, 'ham'), cur.fetchone())
+            self.assertEqual((1, 'ham'), cur.fetchone())
+            self.assertTrue(cnx.unread_result)
+            self.assertRaises(errors.InternalError,
+                              getattr(cur if method == 'close' else cnx,
+                                      method))
+            self.assertEqual((2, 'ham'), cur.fetchone())
+            self.assertFalse(cnx.unread_result)
+            self.assertEqual(None, cur.fetchone())
+            cur.close()
+        cnx.close()
+
+        # Consuming the result does not read from the socket
+        cnx = self._connect(rows, consume_results=True)
+        cur = cnx.cursor()
+        cur.execute("SELECT id, name FROM t1")
+        self.assertEqual((0, 'ham'), cur.fetchone())
+        self.assertTrue(cur.close())
+        self.assertFalse(cnx.unread_result)
+        cur = cnx.cursor()
+        cur.execute("SELECT id, name FROM t1")
+        self.assertEqual(3, len(cur.fetchall()))
+        cnx.close()
+
+    def test_read_ahead_size(self):
+        rows = [(str(i).encode(), b'x' * 250) for i in range(50)]
+        cnx = self._connect(rows)
+        for read_ahead_size, max_batch in ((0, 1), (1000, 4)):
+            cur = cnx.cursor()
+            cur.read_ahead_size = read_ahead_size
+            cur.execute("SELECT id, name FROM t1")
+            fetched = []
+            batches = []
+            while True:
+                row = cur.fetchone()
+                if row is None:
+                    break
+                fetched.append(row[0])
+                batches.append(len(cur._batch))
+            fetched.extend(row[0] for row in cur.fetchmany(10))
+            self.assertEqual(list(range(50)), fetched)
+            self.assertEqual(max_batch, max(batches))
+        cnx.close()
+
+    def test_fetch_batches_benchmark(self):
+        """Fetch 200k rows one by one and in batches."""
+        count = 200000
+        rows = [(str(i).encode(), b'row' + str(i).encode())
+                for i in range(count)]
+        cnx = self._connect(rows)
+        cur = cnx.cursor()
+        results = []
+        for label, batch_size, size in (("rows read one by one", 1, None),
+                                        ("iteration", None, None),
+                                        ("fetchmany(1000)", None, 1000)):
+            cur._read_batch_size = batch_size or \
+                cursor.MySQLCursor._read_batch_size
+            start = time.time()
+            cur.execute("SELECT id, name FROM t1")
+            if size:
+                fetched = 0
+                chunk = cur.fetchmany(size)
+                while chunk:
+                    fetched += len(chunk)
+                    chunk = cur.fetchmany(size)
+            else:
+                fetched = len([row for row in cur])
+            elapsed = time.time() - start
+            self.assertEqual(count, fetched)
+            results.append("{0} {1:.2f}s ({2:.0f} rows/s)".format(
+                label, elapsed, count / elapsed))
+        cnx.close()
+        tests.MESSAGES["INFO"].append(
+            "MySQLCursor: fetched {0} rows with {1}".format(
+                count, ", ".join(results)))
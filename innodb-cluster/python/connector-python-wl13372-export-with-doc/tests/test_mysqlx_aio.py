@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2020, Oracle and/or its affiliates. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+
+"""Unittests for mysqlx.aio
+"""
+
+import asyncio
+import unittest
+
+import tests
+import mysqlx
+import mysqlx.aio
+
+from mysqlx.errors import InterfaceError, NotSupportedError
+
+from .test_aio import _TLSEchoServer
+
+
+def run(coro):
+    """Runs a coroutine until it completes."""
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+@unittest.skipIf(tests.MYSQL_VERSION < (5, 7, 14), "XPlugin not compatible")
+class MySQLxAsyncSessionTests(tests.MySQLxTests):
+
+    def setUp(self):
+        self.connect_kwargs = tests.get_mysqlx_config()
+        self.connect_kwargs["ssl-mode"] = mysqlx.SSLMode.DISABLED
+        self.schema_name = self.connect_kwargs["schema"]
+        try:
+            self.session = run(mysqlx.aio.get_session(self.connect_kwargs))
+        except mysqlx.Error as err:
+            self.fail("{0}".format(err))
+
+    def tearDown(self):
+        run(self.session.close())
+
+    def test_sql(self):
+        result = run(self.session.sql("SELECT 1, 'a'").execute())
+        rows = run(result.fetch_all())
+        self.assertEqual(1, len(rows))
+        self.assertEqual(1, rows[0][0])
+        self.assertEqual("a", rows[0][1])
+
+    def test_async_iteration(self):
+        async def fetch():
+            result = await self.session.sql(
+                "SELECT 1 UNION SELECT 2 UNION SELECT 3").execute()
+            return [row[0] async for row in result]
+        self.assertEqual([1, 2, 3], run(fetch()))
+
+    def test_active_result(self):
+        # An unread result is fetched before the next statement is sent
+        result = run(self.session.sql("SELECT 1 UNION SELECT 2").execute())
+        other = run(self.session.sql("SELECT 3").execute())
+        self.assertEqual(2, result.count)
+        self.assertEqual(3, run(other.fetch_one())[0])
+
+    def test_collection(self):
+        collection_name = "aio_collection"
+        schema = self.session.get_schema(self.schema_name)
+        run(self.session.sql(
+            "CREATE TABLE IF NOT EXISTS {0}.{1} (doc JSON, _id VARBINARY(32) "
+            "GENERATED ALWAYS AS (JSON_UNQUOTE(JSON_EXTRACT(doc, '$._id'))) "
+            "STORED PRIMARY KEY)".format(self.schema_name, collection_name)
+        ).execute())
+        try:
+            collection = schema.get_collection(collection_name)
+            run(collection.add({"_id": "1", "name": "Fred", "age": 21},
+                               {"_id": "2", "name": "Barney", "age": 28}
+                              ).execute())
+            result = run(collection.find("age > 25").execute())
+            docs = run(result.fetch_all())
+            self.assertEqual(1, len(docs))
+            self.assertEqual("Barney", docs[0]["name"])
+
+            result = run(collection.modify("_id = '1'")
+                         .set("age", 22).execute())
+            self.assertEqual(1, result.get_affected_items_count())
+            result = run(collection.remove("_id = '2'").execute())
+            self.assertEqual(1, result.get_affected_items_count())
+        finally:
+            run(self.session.sql("DROP TABLE IF EXISTS {0}.{1}".format(
+                self.schema_name, collection_name)).execute())
+
+    def test_transaction(self):
+        table_name = "{0}.aio_transaction".format(self.schema_name)
+        run(self.session.sql("CREATE TABLE {0} (id INT)"
+                             "".format(table_name)).execute())
+        try:
+            run(self.session.start_transaction())
+            run(self.session.sql("INSERT INTO {0} VALUES (1)"
+                                 "".format(table_name)).execute())
+            run(self.session.rollback())
+            result = run(self.session.sql("SELECT COUNT(*) FROM {0}"
+                                          "".format(table_name)).execute())
+            self.assertEqual(0, run(result.fetch_one())[0])
+        finally:
+            run(self.session.sql("DROP TABLE {0}".format(table_name))
+                .execute())
+
+    def test_concurrent_sessions(self):
+        async def query(value):
+            async with await mysqlx.aio.get_session(
+                    self.connect_kwargs) as session:
+                result = await session.sql(
+                    "SELECT {0}".format(value)).execute()
+                return (await result.fetch_one())[0]
+
+        async def gather():
+            return await asyncio.gather(*[query(i) for i in range(10)])
+        self.assertEqual(list(range(10)), run(gather()))
+
+    def test_pooling_not_supported(self):
+        settings = self.connect_kwargs.copy()
+        settings["pooling"] = True
+        self.assertRaises(NotSupportedError, mysqlx.aio.AsyncSession,
+                          settings)
+
+    def test_connect_error(self):
+        settings = self.connect_kwargs.copy()
+        settings["port"] = 1
+        self.assertRaises(InterfaceError, run,
+                          mysqlx.aio.get_session(settings))
+
+    def test_ssl_mode_default(self):
+        settings = self.connect_kwargs.copy()
+        del settings["ssl-mode"]
+
+        async def query():
+            async with await mysqlx.aio.get_session(settings) as session:
+                self.assertTrue(session.get_connection().stream.is_ssl())
+                result = await session.sql("SELECT 1").execute()
+                return (await result.fetch_one())[0]
+        self.assertEqual(1, run(query()))
+
+
+class AsyncSocketStreamTests(tests.MySQLxTests):
+
+    def setUp(self):
+        self.server = _TLSEchoServer()
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_set_ssl(self):
+        async def echo():
+            stream = mysqlx.aio.AsyncSocketStream()
+            await stream.connect(("127.0.0.1", self.server.port))
+            await stream.set_ssl(mysqlx.SSLMode.REQUIRED, None, None, None,
+                                 None)
+            self.assertTrue(stream.is_ssl())
+            stream.sendall(b"spam")
+            await stream.drain()
+            data = await stream.read(4)
+            stream.close()
+            return data
+        self.assertEqual(b"spam", run(echo()))
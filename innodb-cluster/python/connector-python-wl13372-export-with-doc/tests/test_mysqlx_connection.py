@@ -31,6 +31,7 @@
 """Unittests for mysqlx.connection
 """
 
+import json
 import logging
 import os
 import platform
@@ -45,11 +46,13 @@ import mysqlx
 from threading import Thread
 from time import sleep
 
-from mysqlx.connection import SocketStream
+from mysqlx.connection import Pipeline, SocketStream
+from mysqlx.helpers import get_item_or_attr
 from mysqlx.compat import STRING_TYPES
 from mysqlx.errors import InterfaceError, OperationalError, ProgrammingError
 from mysqlx.protocol import  Message, MessageReaderWriter, Protocol
-from mysqlx.protobuf import HAVE_MYSQLXPB_CEXT, mysqlxpb_enum, Protobuf
+from mysqlx.protobuf import (HAVE_MYSQLXPB_CEXT, MessageView, Protobuf,
+                             mysqlxpb_enum, row_fields)
 from mysql.connector.utils import linux_distribution
 from mysql.connector.version import VERSION, LICENSE
 
@@ -645,6 +648,34 @@ class MySQLxSessionTests(tests.MySQLxTests):
         config["connect-timeout"] = "abc"
         self.assertRaises(TypeError, mysqlx.get_session, config)
 
+    def test_connect_attempt_delay(self):
+        config = self.connect_kwargs.copy()
+        # The first router is unreachable, the second one is tried in
+        # parallel after the delay instead of waiting for the timeout
+        routers = [
+            {"host": "192.0.2.255", "port": config["port"], "priority": 10},
+            {"host": "127.0.0.1", "port": config["port"], "priority": 20}
+        ]
+        settings = {"user": config["user"], "password": config["password"],
+                    "routers": routers, "connect-timeout": 10000,
+                    "connect-attempt-delay": 100}
+        time_start = time.time()
+        session = mysqlx.get_session(settings)
+        self.assertTrue(time.time() - time_start < 5)
+        self.assertEqual(1, session.get_connection()._cur_router)
+        session.close()
+
+        # Fail to connect to all hosts
+        routers[1]["host"] = "bad_host"
+        settings["connect-timeout"] = 2000
+        self.assertRaises((InterfaceError, mysqlx.TimeoutError),
+                          mysqlx.get_session, settings)
+
+        # The value must be a positive integer
+        for value in (-1, 10.5, "abc"):
+            settings["connect-attempt-delay"] = value
+            self.assertRaises(TypeError, mysqlx.get_session, settings)
+
     def test_get_schemas(self):
         schema_name = "test_get_schemas"
         self.session.create_schema(schema_name)
@@ -1390,3 +1421,517 @@ class MySQLxInnitialNoticeTests(tests.MySQLxTests):
         rows = session.sql("show databases").execute().fetch_all()
         self.assertEqual(rows[0][0], "information_schema")
         session.close()
+
+
+class _PipelineSession(object):
+    """Session returning the given connection."""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def get_connection(self):
+        return self._connection
+
+
+class MySQLxPipelineTests(tests.MySQLxTests):
+
+    def setUp(self):
+        self.client, self.server = socket.socketpair()
+        self.connection = mysqlx.connection.Connection({})
+        self.connection.stream._socket = self.client
+        self.connection.reader_writer = MessageReaderWriter(
+            self.connection.stream)
+        self.connection.protocol = Protocol(self.connection.reader_writer)
+        self.session = _PipelineSession(self.connection)
+        self.received = []
+        self.inserted = []
+        self.insert_sizes = []
+        self.writes = [0]
+        sendall = self.connection.stream.sendall
+        def counting_sendall(data):
+            self.writes[0] += 1
+            return sendall(data)
+        self.connection.stream.sendall = counting_sendall
+        self.thread = Thread(target=self._serve)
+        self.thread.start()
+
+    def tearDown(self):
+        self.client.close()
+        self.thread.join()
+        self.server.close()
+
+    def _write(self, msg_type, msg):
+        payload = msg.serialize_to_string()
+        self.server.sendall(struct.pack("<LB", len(payload) + 1, mysqlxpb_enum(
+            "Mysqlx.ServerMessages.Type.{0}".format(msg_type))) + payload)
+
+    def _write_state(self, param, values):
+        state = Message("Mysqlx.Notice.SessionStateChanged", param=mysqlxpb_enum(
+            "Mysqlx.Notice.SessionStateChanged.Parameter.{0}".format(param)))
+        state["value"].extend([value.get_message() for value in values])
+        self._write("NOTICE", Message("Mysqlx.Notice.Frame", type=3,
+                                      payload=state.serialize_to_string()))
+
+    def _insert(self, payload):
+        """Store the inserted documents and send the rows affected and the
+        generated ids."""
+        msg = Message.from_message("Mysqlx.Crud.Insert", payload)
+        docs = []
+        for row in msg["row"]:
+            literal = get_item_or_attr(get_item_or_attr(row, "field")[0],
+                                       "literal")
+            docs.append(json.loads(get_item_or_attr(
+                get_item_or_attr(literal, "v_octets"), "value").decode()))
+        self.inserted.append(docs)
+        self.insert_sizes.append(len(payload) + 1)
+        ids = [Message("Mysqlx.Datatypes.Scalar", type=mysqlxpb_enum(
+            "Mysqlx.Datatypes.Scalar.Type.V_OCTETS"), v_octets=Message(
+                "Mysqlx.Datatypes.Scalar.Octets",
+                value="id{0}".format(index).encode()))
+               for index, doc in enumerate(docs) if "_id" not in doc]
+        self._write_state("ROWS_AFFECTED", [Message(
+            "Mysqlx.Datatypes.Scalar", type=mysqlxpb_enum(
+                "Mysqlx.Datatypes.Scalar.Type.V_UINT"),
+            v_unsigned_int=len(docs))])
+        if ids:
+            self._write_state("GENERATED_DOCUMENT_IDS", ids)
+
+    def _serve(self):
+        """Reply OK to Prepare/Deallocate and StmtExecuteOk to statements,
+        or an error if the message contains b"fail" or executes a statement
+        that failed to prepare."""
+        stream = self.server.makefile("rb")
+        prepare = mysqlxpb_enum("Mysqlx.ClientMessages.Type.PREPARE_PREPARE")
+        prepare_types = (prepare, mysqlxpb_enum(
+            "Mysqlx.ClientMessages.Type.PREPARE_DEALLOCATE"))
+        execute = mysqlxpb_enum("Mysqlx.ClientMessages.Type.PREPARE_EXECUTE")
+        insert = mysqlxpb_enum("Mysqlx.ClientMessages.Type.CRUD_INSERT")
+        prepare_failed = False
+        while True:
+            header = stream.read(5)
+            if len(header) < 5:
+                return
+            msg_len, msg_type = struct.unpack("<LB", header)
+            payload = stream.read(msg_len - 1)
+            self.received.append(msg_type)
+            if msg_type == prepare:
+                prepare_failed = b"fail" in payload
+            if b"fail" in payload or (msg_type == execute and prepare_failed):
+                self._write("ERROR", Message(
+                    "Mysqlx.Error", severity=0, code=1146, sql_state="42S02",
+                    msg="Table 'test.fail' doesn't exist"))
+            elif msg_type in prepare_types:
+                self._write("OK", Message("Mysqlx.Ok"))
+            else:
+                if msg_type == insert:
+                    self._insert(payload)
+                self._write("SQL_STMT_EXECUTE_OK",
+                            Message("Mysqlx.Sql.StmtExecuteOk"))
+
+    def test_pipeline(self):
+        statements = [mysqlx.SqlStatement(self.connection, sql) for sql in
+                      ("DO 1", "DO fail", "DO 3")]
+        with Pipeline(self.connection) as pipeline:
+            results = [stmt.execute() for stmt in statements]
+            self.assertEqual(0, self.writes[0])
+            self.assertFalse(any(result.done() for result in results))
+            # Using a result reads the responses up to its statement
+            self.assertFalse(results[0].has_data())
+            self.assertEqual(1, self.writes[0])
+            self.assertEqual([True, False, False],
+                             [result.done() for result in results])
+            results.append(statements[0].execute())
+            pipeline.sync()
+            self.assertEqual(2, self.writes[0])
+        self.assertTrue(all(result.done() for result in results))
+        self.assertIsInstance(results[0].get(), mysqlx.SqlResult)
+        # The error is raised when the result is used, the statements after
+        # it are not affected
+        self.assertRaises(OperationalError, results[1].get)
+        self.assertRaises(OperationalError, getattr, results[1],
+                          "get_warnings")
+        self.assertEqual(0, results[2].get_affected_items_count())
+        self.assertEqual(0, results[3].get_affected_items_count())
+
+        # Statements waiting for their response synchronize the pipeline
+        with Pipeline(self.connection):
+            result = statements[2].execute()
+            self.assertEqual(0, self.connection.execute_nonquery(
+                "sql", "DO 4", True).get_affected_items_count())
+            self.assertTrue(result.done())
+        self.assertEqual(3, self.writes[0])
+
+        with Pipeline(self.connection):
+            self.assertRaises(ProgrammingError,
+                              Pipeline(self.connection).__enter__)
+
+    def test_pipeline_max_pending_bytes(self):
+        stmt = mysqlx.SqlStatement(self.connection,
+                                   "DO '{0}'".format("x" * 1000))
+        with Pipeline(self.connection) as pipeline:
+            pipeline._max_pending_bytes = 4000
+            results = [stmt.execute() for _ in range(3)]
+            self.assertEqual(0, self.writes[0])
+            # The fourth statement passes the limit, the buffered messages
+            # are sent and the responses read
+            results.append(stmt.execute())
+            self.assertEqual(1, self.writes[0])
+            self.assertTrue(all(result.done() for result in results))
+            results = [stmt.execute() for _ in range(3)]
+            self.assertEqual(1, self.writes[0])
+        self.assertEqual(2, self.writes[0])
+        self.assertTrue(all(result.done() for result in results))
+
+    def test_pipeline_prepared_statements(self):
+        schema = mysqlx.Schema(self.session, "test")
+        stmt = mysqlx.Table(schema, "t").delete().where("a = 1")
+        with Pipeline(self.connection):
+            # Crud::Delete, Prepare::Prepare + Prepare::Execute and
+            # Prepare::Execute
+            results = [stmt.execute() for _ in range(3)]
+            # Prepare::Deallocate + Crud::Delete
+            stmt.where("a = 2")
+            results.append(stmt.execute())
+        self.assertEqual(1, self.writes[0])
+        self.assertEqual([mysqlxpb_enum("Mysqlx.ClientMessages.Type.{0}"
+                                        "".format(msg_type))
+                          for msg_type in ("CRUD_DELETE", "PREPARE_PREPARE",
+                                           "PREPARE_EXECUTE", "PREPARE_EXECUTE",
+                                           "PREPARE_DEALLOCATE",
+                                           "CRUD_DELETE")], self.received)
+        for result in results:
+            self.assertEqual(0, result.get_affected_items_count())
+        self.assertFalse(stmt.prepared)
+        self.assertEqual([], self.connection._prepared_stmt_ids)
+
+        # A failed Prepare::Prepare disables prepared statements
+        stmt = mysqlx.Table(schema, "fail").delete().where("a = 1")
+        with Pipeline(self.connection):
+            results = [stmt.execute() for _ in range(3)]
+        for result in results:
+            self.assertRaises(OperationalError, result.get)
+        self.assertFalse(stmt.prepared)
+        self.assertFalse(self.connection._prepared_stmt_supported)
+
+    def test_add_many(self):
+        self.connection._max_allowed_packet = 1024
+        collection = mysqlx.Collection(
+            mysqlx.Schema(self.session, "test"), "docs")
+        docs = ({"_id": str(index), "name": "x" * 100} if index % 2 else
+                {"name": "y" * 100, "index": index} for index in range(20))
+        result = collection.add_many(docs)
+        self.assertEqual(20, result.get_affected_items_count())
+        # Each message is smaller than mysqlx_max_allowed_packet
+        self.assertEqual([5, 5, 5, 5], [len(batch) for batch in self.inserted])
+        self.assertTrue(all(size + 4 <= 1024 for size in self.insert_sizes))
+        self.assertEqual(["id0", "id2", "id4", "id1", "id3"] * 2,
+                         result.get_generated_ids())
+        self.assertEqual({"name": "y" * 100, "index": 0}, self.inserted[0][0])
+        self.assertEqual({"_id": "1", "name": "x" * 100},
+                         self.inserted[0][1])
+
+        # JSON strings and DbDoc objects, in batches of batch_bytes
+        del self.inserted[:]
+        result = collection.add_many(
+            ['{"_id": "a"}', mysqlx.DbDoc({"_id": "b"}), {"_id": "c"}],
+            batch_bytes=120)
+        self.assertEqual(3, result.get_affected_items_count())
+        self.assertEqual([[{"_id": "a"}, {"_id": "b"}], [{"_id": "c"}]],
+                         self.inserted)
+        self.assertEqual([], result.get_generated_ids())
+
+        self.assertRaises(ProgrammingError, collection.add_many,
+                          [{"name": "x" * 1024}])
+        self.assertRaises(ProgrammingError, collection.add_many, [1])
+
+    def test_pipeline_benchmark(self):
+        """Execute 5k statements with and without a pipeline."""
+        count = 5000
+        stmt = mysqlx.SqlStatement(self.connection, "DO 1")
+        start = time.time()
+        for _ in range(count):
+            stmt.execute()
+        elapsed = time.time() - start
+        start = time.time()
+        with Pipeline(self.connection):
+            results = [stmt.execute() for _ in range(count)]
+        pipelined = time.time() - start
+        self.assertTrue(all(result.done() for result in results))
+        tests.MESSAGES["INFO"].append(
+            "X Protocol pipeline: {0} statements in {1:.2f}s, {2:.2f}s "
+            "without pipeline".format(count, pipelined, elapsed))
+
+
+class _ResetServer(object):
+    """Local server resetting connections once the client sent data"""
+
+    def __init__(self):
+        self.accepted = 0
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(4)
+        self.port = self._server.getsockname()[1]
+        thread = Thread(target=self._accept)
+        thread.daemon = True
+        thread.start()
+
+    def close(self):
+        """Stops accepting connections"""
+        self._server.close()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self._server.accept()
+            except socket.error:
+                return
+            self.accepted += 1
+            sock.recv(1024)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER,
+                            struct.pack("ii", 1, 0))
+            sock.close()
+
+
+class MySQLxStaggeredConnectTests(tests.MySQLxTests):
+
+    def test_connect_handshake_error(self):
+        # Both routers accept the connection and fail during the handshake
+        servers = [_ResetServer(), _ResetServer()]
+        routers = [{"host": "127.0.0.1", "port": server.port,
+                    "priority": priority}
+                   for server, priority in zip(servers, (100, 90))]
+        connection = mysqlx.connection.Connection({
+            "user": "root", "password": "", "ssl-mode": "disabled",
+            "routers": routers, "connect-attempt-delay": 1000})
+        try:
+            self.assertRaises(InterfaceError, connection.connect)
+        finally:
+            for server in servers:
+                server.close()
+        # The second router was tried once the first one failed
+        self.assertEqual([1, 1], [server.accepted for server in servers])
+        self.assertEqual([False, False],
+                         [router["available"] for router in routers])
+        self.assertFalse(connection._can_failover)
+
+
+class _ResultConnection(object):
+    """Connection reading results through a Protocol without a server"""
+
+    def __init__(self, protocol):
+        self.protocol = protocol
+
+    def fetch_active_result(self):
+        pass
+
+    def set_active_result(self, result):
+        pass
+
+    def get_column_metadata(self, result):
+        return self.protocol.get_column_metadata(result)
+
+    def read_row(self, result):
+        return self.protocol.read_row(result)
+
+    def skip_rows(self):
+        return self.protocol.skip_rows()
+
+
+class MySQLxMessageReaderWriterTests(tests.MySQLxTests):
+
+    def setUp(self):
+        self.client, self.server = socket.socketpair()
+        self.stream = SocketStream()
+        self.stream._socket = self.client
+        self.reader_writer = MessageReaderWriter(self.stream)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def _row_frame(self, *fields):
+        msg = Message("Mysqlx.Resultset.Row")
+        msg["field"].extend(fields)
+        payload = msg.serialize_to_string()
+        return struct.pack("<LB", len(payload) + 1, mysqlxpb_enum(
+            "Mysqlx.ServerMessages.Type.RESULTSET_ROW")) + payload
+
+    def _send(self, *chunks):
+        def send():
+            for chunk in chunks:
+                self.server.sendall(chunk)
+                sleep(0.01)
+        thread = Thread(target=send)
+        thread.start()
+        return thread
+
+    def test_read_message(self):
+        frame = self._row_frame(b"abc", b"\x02")
+        large_frame = self._row_frame(b"x" * 200000)
+        # Empty notice, a frame split in the header, a frame larger than the
+        # receive buffer and several frames in a single chunk
+        thread = self._send(b"\x01\x00\x00\x00\x0b", frame[:3], frame[3:],
+                            large_frame, frame * 3)
+        msg = self.reader_writer.read_message()
+        self.assertEqual([b"abc", b"\x02"], list(msg["field"]))
+        msg = self.reader_writer.read_message()
+        self.assertEqual(200000, len(msg["field"][0]))
+        for _ in range(3):
+            msg = self.reader_writer.read_message()
+            self.assertEqual([b"abc", b"\x02"], list(msg["field"]))
+        thread.join()
+
+    def test_skip_messages(self):
+        frame = self._row_frame(b"abc", b"\x02")
+        large_frame = self._row_frame(b"x" * 200000)
+        done = Message("Mysqlx.Resultset.FetchDone").serialize_to_string()
+        done_frame = struct.pack("<LB", len(done) + 1, mysqlxpb_enum(
+            "Mysqlx.ServerMessages.Type.RESULTSET_FETCH_DONE")) + done
+        thread = self._send(frame * 2, large_frame[:100], large_frame[100:],
+                            frame, done_frame)
+        self.reader_writer.push_message(self.reader_writer.read_message())
+        self.assertEqual(4, self.reader_writer.skip_messages(mysqlxpb_enum(
+            "Mysqlx.ServerMessages.Type.RESULTSET_ROW")))
+        # The large frame was skipped without growing the receive buffer
+        self.assertEqual(65536, len(self.reader_writer._buffer))
+        msg = self.reader_writer.read_message()
+        self.assertEqual("Mysqlx.Resultset.FetchDone", msg.type)
+        thread.join()
+
+    def _frame(self, msg_type, msg_name, **fields):
+        msg = Message(msg_name)
+        for key, value in fields.items():
+            msg[key] = value
+        payload = msg.serialize_to_string()
+        return struct.pack("<LB", len(payload) + 1, mysqlxpb_enum(
+            "Mysqlx.ServerMessages.Type.{0}".format(msg_type))) + payload
+
+    def test_discard_all_doc_result(self):
+        warning = Message("Mysqlx.Notice.Warning", level=2, code=1287,
+                          msg="spam")
+        frames = [
+            self._frame("RESULTSET_COLUMN_META_DATA",
+                        "Mysqlx.Resultset.ColumnMetaData", type=7,
+                        name=b"doc", content_type=2),
+            self._row_frame(b'{"_id": "1"}\x00'),
+            # A notice sent in the middle of the rows
+            self._frame("NOTICE", "Mysqlx.Notice.Frame", type=1, scope=2,
+                        payload=warning.serialize_to_string()),
+            self._row_frame(b'{"_id": "2"}\x00'),
+            self._row_frame(b'{"_id": "3"}\x00'),
+            self._frame("RESULTSET_FETCH_DONE", "Mysqlx.Resultset.FetchDone"),
+            self._frame("SQL_STMT_EXECUTE_OK", "Mysqlx.Sql.StmtExecuteOk"),
+        ]
+        thread = self._send(b"".join(frames))
+        result = mysqlx.result.DocResult(
+            _ResultConnection(Protocol(self.reader_writer)))
+        self.assertEqual("1", result.fetch_one()["_id"])
+        self.assertEqual(2, result.discard_all())
+        self.assertEqual(None, result.fetch_one())
+        thread.join()
+
+    def test_fetch_arrays_row_result(self):
+        frames = [
+            self._frame("RESULTSET_COLUMN_META_DATA",
+                        "Mysqlx.Resultset.ColumnMetaData", type=1,
+                        name=b"id"),
+        ]
+        # Signed integers are zigzag encoded
+        frames.extend([self._row_frame(struct.pack("<B", 2 * i))
+                       for i in range(1, 6)])
+        frames.extend([
+            self._frame("RESULTSET_FETCH_DONE", "Mysqlx.Resultset.FetchDone"),
+            self._frame("SQL_STMT_EXECUTE_OK", "Mysqlx.Sql.StmtExecuteOk"),
+        ])
+        thread = self._send(b"".join(frames))
+        result = mysqlx.result.RowResult(
+            _ResultConnection(Protocol(self.reader_writer)))
+        self.assertEqual([1, 2],
+                         list(result.fetch_arrays(2, use_numpy=False)["id"]))
+        self.assertEqual([[3, 4], [5]],
+                         [list(chunk["id"]) for chunk
+                          in result.fetch_columnar(2, use_numpy=False)])
+        self.assertEqual([], list(result.fetch_arrays(use_numpy=False)["id"]))
+        thread.join()
+
+    def test_read_message_connection_close(self):
+        self.server.sendall(self._row_frame(b"abc")[:6])
+        self.server.close()
+        self.assertRaises(RuntimeError, self.reader_writer.read_message)
+
+    def test_read_message_benchmark(self):
+        """Read 1M Mysqlx.Resultset.Row frames from a socketpair."""
+        count = 1000000
+        frame = self._row_frame(b"\x02", b"abcdefghij\x00",
+                                b"\x9a\x99\x99\x99\x99\x99\xf1\x3f")
+        thread = Thread(target=self.server.sendall, args=(frame * count,))
+        thread.start()
+
+        recv_into = self.stream.recv_into
+        calls = [0]
+        def counting_recv_into(buf):
+            calls[0] += 1
+            return recv_into(buf)
+        self.stream.recv_into = counting_recv_into
+
+        start = time.time()
+        for _ in range(count):
+            msg = self.reader_writer.read_message()
+        elapsed = time.time() - start
+        thread.join()
+        self.assertEqual(3, len(msg["field"]))
+        # Several frames must be read with each system call
+        self.assertTrue(calls[0] < count / 10)
+        tests.MESSAGES["INFO"].append(
+            "MessageReaderWriter ({0}): {1} messages in {2:.2f}s "
+            "({3:.0f} messages/s), {4} recv_into calls".format(
+                "C extension" if Protobuf.mysqlxpb.__name__ == "_mysqlxpb"
+                else "pure Python", count, elapsed, count / elapsed, calls[0]))
+
+    def test_message_view(self):
+        frame = self._row_frame(b"abc", b"", b"x" * 200)
+        ok = Message("Mysqlx.Ok", msg="bye").serialize_to_string()
+        ok_frame = struct.pack("<LB", len(ok) + 1, mysqlxpb_enum(
+            "Mysqlx.ServerMessages.Type.OK")) + ok
+        self.server.sendall(frame + ok_frame)
+        msg = self.reader_writer.read_message()
+        self.assertEqual("Mysqlx.Resultset.Row", msg.type)
+        self.assertEqual([b"abc", b"", b"x" * 200], list(msg["field"]))
+        msg = self.reader_writer.read_message()
+        self.assertEqual("Mysqlx.Ok", msg.type)
+        self.assertEqual("bye", msg["msg"])
+
+        view = MessageView("Mysqlx.Resultset.Row", frame[5:])
+        self.assertEqual("Mysqlx.Resultset.Row", view.type)
+        self.assertEqual(None, view.__dict__["_decoded"])
+        self.assertEqual([b"abc", b"", b"x" * 200], view["field"])
+        # Unexpected content is decoded by protobuf
+        self.assertEqual(None, row_fields(b"\x12\x00"))
+
+    def test_read_row_benchmark(self):
+        """Read and access the fields of 200k Mysqlx.Resultset.Row frames
+        with each protobuf backend."""
+        count = 200000
+        frame = self._row_frame(b"\x02", b"abcdefghij\x00",
+                                b"\x9a\x99\x99\x99\x99\x99\xf1\x3f")
+        backends = [True] if HAVE_MYSQLXPB_CEXT is False else [True, False]
+        use_pure = Protobuf.use_pure
+        try:
+            for pure in backends:
+                Protobuf.set_use_pure(pure)
+                thread = Thread(target=self.server.sendall,
+                                args=(frame * count,))
+                thread.start()
+                start = time.time()
+                for _ in range(count):
+                    fields = self.reader_writer.read_message()["field"]
+                elapsed = time.time() - start
+                thread.join()
+                self.assertEqual(3, len(fields))
+                tests.MESSAGES["INFO"].append(
+                    "Row messages ({0}): {1} messages in {2:.2f}s ({3:.0f} "
+                    "messages/s)".format("pure Python" if pure
+                                         else "C extension", count, elapsed,
+                                         count / elapsed))
+        finally:
+            Protobuf.set_use_pure(use_pure)
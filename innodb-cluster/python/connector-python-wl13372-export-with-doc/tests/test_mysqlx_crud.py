@@ -31,15 +31,23 @@
 """Unittests for mysqlx.crud
 """
 
+import array
+import decimal
 import gc
+import io
 import logging
+import sys
 import unittest
 import threading
 import time
 
+from datetime import datetime, timedelta
+
 import tests
 import mysqlx
 
+from mysqlx.expr import EXPR_CACHE
+
 LOGGER = logging.getLogger(tests.LOGGER_NAME)
 
 _CREATE_TEST_TABLE_QUERY = "CREATE TABLE `{0}`.`{1}` (id INT)"
@@ -649,6 +657,35 @@ class MySQLxCollectionTests(tests.MySQLxTests):
 
         self.schema.drop_collection(collection_name)
 
+    @unittest.skipIf(tests.MYSQL_VERSION < (8, 0, 5),
+                     "Server side _id generation unavailable")
+    def test_add_many(self):
+        collection_name = "collection_test"
+        collection = self.schema.create_collection(collection_name)
+        docs = ({"_id": str(index), "name": "Fred", "age": index}
+                if index % 2 else {"name": "Wilma", "age": index}
+                for index in range(1000))
+        result = collection.add_many(docs, batch_bytes=4096)
+        self.assertEqual(1000, result.get_affected_items_count())
+        self.assertEqual(500, len(result.get_generated_ids()))
+        self.assertEqual(1000, collection.count())
+        doc = collection.find("age = 1").execute().fetch_one()
+        self.assertEqual("1", doc["_id"])
+        self.assertEqual("Fred", doc["name"])
+
+        # JSON strings and DbDoc objects
+        result = collection.add_many(
+            ['{"_id": "a", "age": 8}', mysqlx.DbDoc({"_id": "b"})])
+        self.assertEqual(2, result.get_affected_items_count())
+        self.assertEqual(1002, collection.count())
+
+        # The batches after a failed one are inserted
+        self.assertRaises(mysqlx.OperationalError, collection.add_many,
+                          [{"_id": "a"}, {"_id": "c"}], batch_bytes=60)
+        self.assertEqual(1003, collection.count())
+
+        self.schema.drop_collection(collection_name)
+
     @unittest.skipIf(tests.MYSQL_VERSION < (8, 0, 2),
                      "CONT_IN operator unavailable")
     def test_cont_in_operator(self):
@@ -1722,6 +1759,50 @@ class MySQLxCollectionTests(tests.MySQLxTests):
 
         self.schema.drop_collection(collection_name)
 
+    def test_streaming(self):
+        collection_name = "collection_test"
+        collection = self.schema.create_collection(collection_name)
+        collection.add([{"_id": str(i), "value": i}
+                        for i in range(100)]).execute()
+
+        # Iterating does not buffer the items
+        result = collection.find().sort("value").execute()
+        values = [doc["value"] for doc in result]
+        self.assertEqual(list(range(100)), values)
+        self.assertEqual(0, result.count)
+
+        # The items buffered with fetch_all() are iterated first
+        result = collection.find().sort("value").execute()
+        result.fetch_all()
+        self.assertEqual(100, len(list(result)))
+
+        # The remaining items of a streamed result are discarded when a new
+        # statement is executed
+        result = collection.find().sort("value").execute()
+        for doc in result:
+            if doc["value"] == 9:
+                break
+        self.assertTrue(result.is_streaming())
+        doc = collection.find("value = 50").execute().fetch_one()
+        self.assertEqual(50, doc["value"])
+        self.assertEqual(None, result.fetch_one())
+        self.assertEqual(0, result.count)
+
+        # A result that is not streamed is still buffered
+        result = collection.find().execute()
+        result.fetch_one()
+        self.assertEqual(100, collection.count())
+        self.assertEqual(99, len(result.fetch_all()))
+
+        # Table select results are streamed too
+        table = self.schema.get_collection_as_table(collection_name)
+        result = table.select("doc").execute()
+        self.assertEqual(100, len([row for row in result]))
+        table.select().execute()
+        self.assertEqual(None, result.fetch_one())
+
+        self.schema.drop_collection(collection_name)
+
     def test_remove_one(self):
         collection_name = "collection_test"
         collection = self.schema.create_collection(collection_name)
@@ -3127,3 +3208,222 @@ class MySQLxViewTests(tests.MySQLxTests):
         self.assertEqual("active", col.get_column_name())
         self.assertEqual(self.view_name, col.get_table_name())
         self.assertEqual(mysqlx.ColumnType.BIT, col.get_type())
+
+
+class _ColumnsConnection(object):
+    """Connection returning the given columns as the result metadata."""
+
+    def __init__(self, columns):
+        self.protocol = None
+        self._columns = columns
+
+    def fetch_active_result(self):
+        pass
+
+    def get_column_metadata(self, result):
+        return self._columns
+
+    def set_active_result(self, result):
+        pass
+
+
+class MySQLxRowDecodingTests(tests.MySQLxTests):
+
+    def setUp(self):
+        proto = mysqlx.result.ColumnProtoType
+        self.columns = [
+            mysqlx.result.Column(proto.SINT, length=11, collation=0, flags=0),
+            mysqlx.result.Column(proto.UINT, length=20, collation=0, flags=0),
+            mysqlx.result.Column(proto.DOUBLE, length=22, collation=0,
+                                 flags=0),
+            mysqlx.result.Column(proto.DECIMAL, length=12, collation=0,
+                                 flags=0),
+            mysqlx.result.Column(proto.DATETIME, length=26, collation=0,
+                                 flags=1),
+            mysqlx.result.Column(proto.TIME, length=10, collation=0, flags=0),
+            mysqlx.result.Column(proto.BYTES, length=40, collation=33,
+                                 flags=0),
+        ]
+        self.fields = [
+            b"\xf3\x01",  # -122
+            b"\x80\x80\x80\x80\x80\x80\x80\x80\x80\x01",  # 2 ** 63
+            b"\x9a\x99\x99\x99\x99\x99\xf1\x3f",  # 1.1
+            b"\x02\x01\x23\x45\x6d",  # -1234.56
+            b"\xe4\x0f\x02\x1d\x17\x3b\x3b\xc0\xc4\x07",
+            b"\x01\x0c\x22\x38",
+            b"MySQL Connector/Python\x00",
+        ]
+        self.row = mysqlx.protobuf.Message("Mysqlx.Resultset.Row")
+        self.row["field"].extend(self.fields + [b""])
+        self.columns.append(self.columns[0])
+
+    def test_decode_row(self):
+        result = mysqlx.RowResult(_ColumnsConnection(self.columns))
+        row = result._decode_item(self.row, False)
+        self.assertEqual(-122, row[0])
+        self.assertEqual(2 ** 63, row[1])
+        self.assertEqual((1.1,), row[2])
+        self.assertEqual(decimal.Decimal("-1234.56"), row[3])
+        self.assertEqual(datetime(2020, 2, 29, 23, 59, 59, 123456), row[4])
+        self.assertEqual(timedelta(hours=-12, minutes=34, seconds=56), row[5])
+        self.assertEqual("MySQL Connector/Python", row[6])
+        self.assertEqual(None, row[7])
+
+        # Each column value is decoded like from_protobuf() does
+        for index, field in enumerate(self.fields):
+            proto_type = self.columns[index].get_proto_type()
+            self.assertEqual(mysqlx.result.from_protobuf(proto_type, field),
+                             result._decoders[index](field))
+
+    def test_decode_row_unknown_type(self):
+        # Values of unknown column types are decoded as None
+        decoder = mysqlx.result.get_decoder(99)
+        stderr = sys.stderr
+        sys.stderr = io.BytesIO() if tests.PY2 else io.StringIO()
+        try:
+            self.assertEqual(None, decoder(b"\x01"))
+            self.assertEqual(None, mysqlx.result.from_protobuf(99, b"\x01"))
+        finally:
+            sys.stderr = stderr
+
+    @unittest.skipIf(not mysqlx.protobuf.HAVE_MYSQLXPB_CEXT,
+                     "C extension not available")
+    def test_decode_row_cext(self):
+        # The C extension and pure Python decoders must give the same values
+        for col, field in zip(self.columns, self.fields):
+            proto_type = col.get_proto_type()
+            self.assertEqual(mysqlx.result._DECODERS[proto_type](field),
+                             mysqlx.result._CEXT_DECODERS[proto_type](field))
+
+    def test_rows_to_arrays(self):
+        proto = mysqlx.result.ColumnProtoType
+        columns = [
+            mysqlx.result.Column(proto.SINT, length=11, collation=0, flags=0,
+                                 name=b"i"),
+            mysqlx.result.Column(proto.UINT, length=20, collation=0, flags=0,
+                                 name=b"u"),
+            mysqlx.result.Column(proto.DOUBLE, length=22, collation=0,
+                                 flags=0, name=b"d"),
+            mysqlx.result.Column(proto.DATETIME, length=26, collation=0,
+                                 flags=1, name=b"ts"),
+            mysqlx.result.Column(proto.TIME, length=10, collation=0, flags=0,
+                                 name=b"tm"),
+            mysqlx.result.Column(proto.BYTES, length=40, collation=33,
+                                 flags=0, name=b"s"),
+        ]
+        rows = [[self.fields[0], self.fields[1], self.fields[2],
+                 self.fields[4], self.fields[5], self.fields[6]],
+                [b"\x02", b"\x00", b"", b"\xb1\x0f\x0c\x1f", b"\x00",
+                 b""]]
+        arrays = mysqlx.result.rows_to_arrays(columns, rows, use_numpy=False)
+        self.assertEqual(["i", "u", "d", "ts", "tm", "s"], list(arrays))
+        self.assertEqual(array.array("q", [-122, 1]), arrays["i"])
+        self.assertEqual(array.array("Q", [2 ** 63, 0]), arrays["u"])
+        self.assertEqual([1.1, None], arrays["d"])
+        self.assertEqual(array.array("q", [1583020799123456, -86400000000]),
+                         arrays["ts"])
+        self.assertEqual(array.array("q", [-45296000000, 0]), arrays["tm"])
+        self.assertEqual(["MySQL Connector/Python", None], arrays["s"])
+        self.assertRaises(mysqlx.ProgrammingError,
+                          mysqlx.result.rows_to_arrays,
+                          columns + columns[:1], [], False)
+
+        if mysqlx.result.HAVE_NUMPY:
+            import numpy
+            arrays = mysqlx.result.rows_to_arrays(columns, rows)
+            self.assertEqual(numpy.datetime64("2020-02-29T23:59:59.123456"),
+                             arrays["ts"][0])
+            self.assertEqual([False, True],
+                             list(numpy.ma.getmaskarray(arrays["d"])))
+        else:
+            self.assertRaises(mysqlx.InterfaceError,
+                              mysqlx.result.rows_to_arrays, columns, rows,
+                              True)
+
+    def test_decode_row_benchmark(self):
+        """Decode 100k rows of typed columns."""
+        count = 100000
+        result = mysqlx.RowResult(_ColumnsConnection(self.columns))
+        start = time.time()
+        for _ in range(count):
+            row = result._decode_item(self.row, False)
+        elapsed = time.time() - start
+        self.assertEqual(-122, row[0])
+        tests.MESSAGES["INFO"].append(
+            "RowResult ({0}): decoded {1} rows of {2} columns in {3:.2f}s "
+            "({4:.0f} rows/s)".format(
+                "C extension" if mysqlx.protobuf.HAVE_MYSQLXPB_CEXT and
+                not mysqlx.protobuf.Protobuf.use_pure else "pure Python",
+                count, len(self.columns), elapsed, count / elapsed))
+
+
+class _StatementSession(object):
+    """Session whose connection only numbers the statements."""
+
+    def __init__(self):
+        self._stmt_counter = 0
+
+    def get_connection(self):
+        return self
+
+    def get_next_statement_id(self):
+        self._stmt_counter += 1
+        return self._stmt_counter
+
+
+class MySQLxExprCacheTests(tests.MySQLxTests):
+
+    def setUp(self):
+        schema = mysqlx.Schema(_StatementSession(), "test")
+        self.collection = mysqlx.Collection(schema, "docs")
+        self.table = mysqlx.Table(schema, "tbl")
+        self.cache = EXPR_CACHE
+        self.cache.clear()
+
+    def test_parse_expr(self):
+        condition = "age > :age AND name = :name"
+        stmt = self.collection.find(condition).sort("age DESC")
+        self.assertEqual({"age": 0, "name": 1}, stmt.get_binding_map())
+        self.assertEqual((0, 2), (self.cache.hits, self.cache.misses))
+
+        # The same expressions are parsed once
+        other = self.collection.find(condition).sort("age DESC")
+        self.assertEqual((2, 2), (self.cache.hits, self.cache.misses))
+        self.assertIs(stmt.get_where_expr(), other.get_where_expr())
+        self.assertEqual(mysqlx.expr(condition).expr().serialize_to_string(),
+                         stmt.get_where_expr().serialize_to_string())
+
+        # The entry point and relational columns are part of the key
+        self.table.select("age").where(condition)
+        self.assertEqual((2, 4), (self.cache.hits, self.cache.misses))
+        self.collection.find("age").fields("age")
+        self.assertEqual((2, 6), (self.cache.hits, self.cache.misses))
+
+        # Invalid expressions are not cached
+        for _ in range(2):
+            self.assertRaises(mysqlx.ProgrammingError, self.collection.find,
+                              "age >")
+        self.assertEqual(6, len(self.cache))
+
+    def test_find_benchmark(self):
+        """Build 10k find() statements over 100 expressions."""
+        count = 10000
+        conditions = ["age > :age AND name = 'n{0}'".format(index)
+                      for index in range(100)]
+        timings = []
+        for cached in (False, True):
+            self.cache.clear()
+            start = time.time()
+            for index in range(count):
+                if not cached:
+                    self.cache.clear()
+                self.collection.find(conditions[index % 100]) \
+                    .fields("name", "age").sort("age DESC")
+            timings.append(time.time() - start)
+        # 100 conditions, the projection and the sort are parsed once
+        self.assertEqual(102, self.cache.misses)
+        self.assertEqual(count * 3 - 102, self.cache.hits)
+        tests.MESSAGES["INFO"].append(
+            "find() construction: {0} statements in {1:.2f}s, {2:.2f}s "
+            "without the expression cache".format(count, timings[1],
+                                                   timings[0]))
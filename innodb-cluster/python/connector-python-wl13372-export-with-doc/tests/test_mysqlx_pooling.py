@@ -42,7 +42,7 @@ from mysqlx.errors import InterfaceError, ProgrammingError
 from mysql.connector.utils import linux_distribution
 from mysql.connector.version import VERSION, LICENSE
 from .test_mysqlx_connection import build_uri
-from time import sleep
+from time import sleep, time
 from threading import Thread
 
 CREATE_USER = "CREATE USER '{user}'@'{host}' IDENTIFIED BY '{password}'"
@@ -423,6 +423,103 @@ class MySQLxClientTests(tests.MySQLxTests):
         # No errors should raise from closing client.
         client.close()
 
+    @unittest.skipIf(tests.MYSQL_VERSION < (8, 0, 16), "not reset compatible")
+    def test_warm_checkout_round_trips(self):
+        """Test warm checkout does not send messages to the server."""
+        settings = self.connect_kwargs.copy()
+        pooling_dict = {"enabled": True, "max_size": 1}
+        cnx_options = {"pooling": pooling_dict}
+        client = mysqlx.get_client(settings, cnx_options)
+
+        session = client.get_session()
+        cnx = session.get_connection()
+        session.close()
+
+        sent = []
+        write_message = cnx.reader_writer.write_message
+        def counting_write_message(msg_id, msg):
+            sent.append(msg_id)
+            write_message(msg_id, msg)
+        cnx.reader_writer.write_message = counting_write_message
+
+        # The connection was kept open by the server, so the cached server
+        # version and session settings must be reused
+        session = client.get_session()
+        self.assertEqual(cnx, session.get_connection())
+        self.assertEqual(sent, [])
+        session.close()
+        client.close()
+
+    @unittest.skipIf(tests.MYSQL_VERSION < (8, 0, 16), "not reset compatible")
+    def test_checkout_latency(self):
+        """Benchmark the checkout latency of a warm pool."""
+        settings = self.connect_kwargs.copy()
+        pooling_dict = {"enabled": True, "max_size": 1}
+        cnx_options = {"pooling": pooling_dict}
+        client = mysqlx.get_client(settings, cnx_options)
+        client.get_session().close()
+
+        runs = 1000
+        timings = []
+        for _ in range(runs):
+            start = time()
+            session = client.get_session()
+            timings.append(time() - start)
+            session.close()
+        client.close()
+
+        timings.sort()
+        tests.MESSAGES["INFO"].append(
+            "mysqlx pool checkout latency ({0} runs): p50={1:.3f}ms "
+            "p99={2:.3f}ms".format(runs, timings[runs // 2] * 1000,
+                                   timings[int(runs * 0.99)] * 1000))
+
+    def test_checkout_stress(self):
+        """Benchmark many threads sharing the connections of one client."""
+        settings = self.connect_kwargs.copy()
+        max_size = 10
+        runs = 20
+        for num_threads in (64, 256):
+            pooling_dict = {"enabled": True, "max_size": max_size,
+                            "queue_timeout": 60000}
+            cnx_options = {"pooling": pooling_dict}
+            client = mysqlx.get_client(settings, cnx_options)
+            timings = []
+            errors = []
+            peak = [0]
+
+            def worker():
+                for _ in range(runs):
+                    start = time()
+                    try:
+                        session = client.get_session()
+                    except mysqlx.Error as err:
+                        errors.append(err)
+                        continue
+                    timings.append(time() - start)
+                    pool = session.get_connection().pool
+                    peak[0] = max(peak[0], pool.open_connections)
+                    session.sql("SELECT 1").execute().fetch_all()
+                    session.close()
+
+            workers = [Thread(target=worker) for _ in range(num_threads)]
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            client.close()
+
+            self.assertEqual(errors, [])
+            self.assertEqual(len(timings), num_threads * runs)
+            self.assertTrue(peak[0] <= max_size)
+
+            timings.sort()
+            tests.MESSAGES["INFO"].append(
+                "mysqlx pool checkout with {0} threads: p50={1:.3f}ms "
+                "p99={2:.3f}ms peak open connections={3}"
+                "".format(num_threads, timings[len(timings) // 2] * 1000,
+                          timings[int(len(timings) * 0.99)] * 1000, peak[0]))
+
 @unittest.skipIf(tests.MYSQL_VERSION < (5, 7, 14), "XPlugin not compatible")
 class MySQLxClientPoolingTests(tests.MySQLxTests):
     def setUp(self):
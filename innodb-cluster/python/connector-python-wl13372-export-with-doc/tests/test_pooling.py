@@ -29,6 +29,11 @@
 """Unittests for mysql.connector.pooling
 """
 
+import gc
+import socket
+import struct
+import threading
+import time
 import uuid
 try:
     from Queue import Queue
@@ -334,6 +339,562 @@ class MySQLConnectionPoolTests(tests.MySQLConnectorTests):
         self.assertRaises(errors.PoolError, cnxpool.get_connection)
 
 
+class _HealthCheckConnection(MySQLConnection):
+    """MySQLConnection counting the round trips done by the pool"""
+
+    def __init__(self):
+        super(_HealthCheckConnection, self).__init__()
+        self.alive = True
+        self.pings = 0
+        self.reconnects = 0
+        self.resets = 0
+
+    def is_connected(self):
+        self.pings += 1
+        return self.alive
+
+    def reconnect(self, attempts=1, delay=0):
+        self.reconnects += 1
+        self.alive = True
+
+    def cmd_reset_connection(self):
+        self.resets += 1
+
+
+class MySQLConnectionPoolHealthTests(tests.MySQLConnectorTests):
+
+    """Testing the connection health policy of MySQLConnectionPool"""
+
+    def _pool(self, **kwargs):
+        cnxpool = pooling.MySQLConnectionPool(pool_name='health', pool_size=1,
+                                              **kwargs)
+        cnxpool.set_config(user='root', host='localhost')
+        cnx = _HealthCheckConnection()
+        cnx._pool_config_version = cnxpool._config_version
+        cnx._pool_created = pooling._clock()
+        cnxpool.add_connection(cnx)
+        return cnxpool, cnx
+
+    def test___init__(self):
+        for kwargs in ({'pool_ping_interval': -1},
+                       {'pool_ping_interval': None},
+                       {'pool_max_lifetime': 0},
+                       {'pool_validation_interval': -1}):
+            self.assertRaises(AttributeError, pooling.MySQLConnectionPool,
+                              pool_name='test', **kwargs)
+        cnxpool = pooling.MySQLConnectionPool(pool_name='test')
+        self.assertEqual(0, cnxpool.ping_interval)
+        self.assertEqual(None, cnxpool.max_lifetime)
+
+        # Pools which failed before creating their state are collected
+        # without errors
+        cnxpool = pooling.MySQLConnectionPool.__new__(
+            pooling.MySQLConnectionPool)
+        cnxpool.__del__()
+
+    def test_ping_interval(self):
+        cnxpool, cnx = self._pool(pool_ping_interval=60)
+
+        # Connections of unknown age are pinged
+        pcnx = cnxpool.get_connection()
+        self.assertEqual(1, cnx.pings)
+
+        # Returning the connection resets the session without a ping and
+        # the next checkout skips the ping as well
+        pcnx.close()
+        self.assertEqual((1, 1), (cnx.pings, cnx.resets))
+        for _ in range(10):
+            cnxpool.get_connection().close()
+        self.assertEqual((1, 11), (cnx.pings, cnx.resets))
+        self.assertEqual({'pings': 1, 'pings_avoided': 21,
+                          'stale_connections': 0, 'retired_connections': 0,
+                          'waits': 0, 'timeouts': 0,
+                          'opened_connections': 0,
+                          'evicted_connections': 0},
+                         cnxpool.stats)
+
+        # A connection that failed to reset is pinged on next checkout
+        cnx.cmd_reset_connection = None
+        pcnx = cnxpool.get_connection()
+        self.assertRaises(TypeError, pcnx.close)
+        cnxpool.get_connection()
+        self.assertEqual(2, cnx.pings)
+
+    def test_ping_every_checkout(self):
+        cnxpool, cnx = self._pool()
+        for _ in range(3):
+            cnxpool.get_connection().close()
+        # One ping on checkout and one in reset_session()
+        self.assertEqual((6, 3), (cnx.pings, cnx.resets))
+        self.assertEqual(3, cnxpool.stats['pings'])
+        self.assertEqual(0, cnxpool.stats['pings_avoided'])
+
+    def test_stale_connection(self):
+        cnxpool, cnx = self._pool(pool_ping_interval=60)
+        cnx.alive = False
+        cnxpool.get_connection().close()
+        self.assertEqual(1, cnx.reconnects)
+        self.assertEqual(1, cnxpool.stats['stale_connections'])
+
+        # Connections idle longer than the ping interval are pinged again
+        cnx.alive = False
+        cnx._pool_last_used -= 61
+        cnxpool.get_connection().close()
+        self.assertEqual(2, cnx.reconnects)
+        self.assertEqual(2, cnxpool.stats['stale_connections'])
+
+    def test_max_lifetime(self):
+        cnxpool, cnx = self._pool(pool_ping_interval=60,
+                                  pool_max_lifetime=30)
+        cnxpool.get_connection().close()
+        self.assertEqual(0, cnx.reconnects)
+
+        cnx._pool_created -= 31
+        cnxpool.get_connection().close()
+        self.assertEqual(1, cnx.reconnects)
+        self.assertEqual(1, cnxpool.stats['retired_connections'])
+        self.assertEqual(0, cnxpool.stats['stale_connections'])
+
+        cnxpool.get_connection().close()
+        self.assertEqual(1, cnx.reconnects)
+
+    def test_validation_interval(self):
+        cnxpool, cnx = self._pool(pool_ping_interval=60,
+                                  pool_validation_interval=0.01)
+        cnx.alive = False
+        # The connection is checked outside of the queue, then queued again
+        deadline = time.time() + 5
+        while not (cnx.reconnects and cnxpool._cnx_queue.qsize()) \
+                and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(1, cnxpool.stats['stale_connections'])
+        self.assertEqual(1, cnx.reconnects)
+
+        # The validated connection is handed out without a ping
+        pings = cnx.pings
+        cnxpool.get_connection().close()
+        self.assertEqual(pings, cnx.pings)
+
+        # The validation thread stops with the pool
+        threads = [thread for thread in threading.enumerate()
+                   if thread.name == 'health-maintenance']
+        self.assertEqual(1, len(threads))
+        del cnxpool
+        gc.collect()
+        threads[0].join(5)
+        self.assertFalse(threads[0].is_alive())
+
+    def test_validate_connections_unlocked(self):
+        cnxpool, cnx = self._pool(pool_ping_interval=60)
+        pinging = threading.Event()
+        release = threading.Event()
+
+        def is_connected():
+            pinging.set()
+            release.wait(5)
+            return False
+        cnx.is_connected = is_connected
+
+        thread = threading.Thread(target=cnxpool._validate_connections)
+        thread.start()
+        self.assertTrue(pinging.wait(5))
+        # The pool is not locked while the connection is checked, the
+        # request waits for the connection and gets it once checked
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        start = time.time()
+        self.assertEqual(0, cnxpool.stats['stale_connections'])
+        self.assertTrue(time.time() - start < 0.2)
+        pcnx = cnxpool.get_connection(timeout=5)
+        thread.join(5)
+        timer.join(5)
+        self.assertTrue(pcnx._cnx is cnx)
+        self.assertEqual(1, cnx.reconnects)
+        self.assertEqual(1, cnxpool.stats['stale_connections'])
+        pcnx.close()
+        self.assertEqual(1, cnxpool._cnx_queue.qsize())
+
+class MySQLConnectionPoolWaitTests(tests.MySQLConnectorTests):
+
+    """Testing blocking checkout of MySQLConnectionPool"""
+
+    def _pool(self, pool_size=1, pool_name='wait'):
+        cnxpool = pooling.MySQLConnectionPool(pool_name=pool_name,
+                                              pool_size=pool_size,
+                                              pool_ping_interval=60)
+        cnxpool.set_config(user='root', host='localhost')
+        for _ in range(pool_size):
+            cnx = _HealthCheckConnection()
+            cnx._pool_config_version = cnxpool._config_version
+            cnx._pool_created = cnx._pool_last_used = pooling._clock()
+            cnxpool.add_connection(cnx)
+        return cnxpool
+
+    def _wait_for_waiters(self, cnxpool, count):
+        deadline = time.time() + 5
+        while cnxpool.waiting < count and time.time() < deadline:
+            time.sleep(0.001)
+        self.assertEqual(count, cnxpool.waiting)
+
+    def test_get_connection_timeout(self):
+        cnxpool = self._pool()
+        pcnx = cnxpool.get_connection()
+        self.assertRaises(errors.PoolError, cnxpool.get_connection)
+
+        start = time.time()
+        self.assertRaises(errors.PoolError, cnxpool.get_connection,
+                          timeout=0.05)
+        self.assertTrue(time.time() - start >= 0.05)
+        self.assertEqual(0, cnxpool.waiting)
+        self.assertEqual(1, cnxpool.stats['waits'])
+        self.assertEqual(1, cnxpool.stats['timeouts'])
+
+        # A returned connection is handed over to the waiting request
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(cnxpool.get_connection(timeout=5)))
+        thread.start()
+        self._wait_for_waiters(cnxpool, 1)
+        cnx = pcnx._cnx
+        pcnx.close()
+        thread.join()
+        self.assertEqual(cnx, result[0]._cnx)
+        self.assertEqual(0, cnxpool._cnx_queue.qsize())
+        self.assertEqual(2, cnxpool.stats['waits'])
+        self.assertEqual(1, cnxpool.stats['timeouts'])
+
+        histogram = cnxpool.wait_histogram
+        self.assertEqual(None, histogram[-1][0])
+        self.assertEqual(4, sum(count for _, count in histogram))
+
+    def test_fifo_order(self):
+        cnxpool = self._pool()
+        pcnx = cnxpool.get_connection()
+        served = []
+
+        def worker(num):
+            cnx = cnxpool.get_connection(timeout=None)
+            served.append(num)
+            cnx.close()
+
+        workers = []
+        for num in range(5):
+            thread = threading.Thread(target=worker, args=(num,))
+            thread.start()
+            workers.append(thread)
+            self._wait_for_waiters(cnxpool, num + 1)
+
+        # A new request does not overtake the waiting ones
+        self.assertRaises(errors.PoolError, cnxpool.get_connection)
+        pcnx.close()
+        for thread in workers:
+            thread.join()
+        self.assertEqual(list(range(5)), served)
+        self.assertEqual(1, cnxpool._cnx_queue.qsize())
+
+    def test_pool_lock(self):
+        cnxpool_a = self._pool(pool_name='wait_a')
+        cnxpool_b = self._pool(pool_name='wait_b')
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with cnxpool_a._lock:
+                locked.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        locked.wait(5)
+        try:
+            # Pools do not share a lock
+            cnxpool_b.get_connection().close()
+        finally:
+            release.set()
+            thread.join()
+
+    def test_checkout_benchmark(self):
+        """Benchmark many threads sharing a few pooled connections"""
+        pool_size = 4
+        runs = 100
+        for num_threads in (16, 64):
+            results = {}
+            for mode in ('retry', 'wait'):
+                cnxpool = self._pool(pool_size=pool_size,
+                                     pool_name='bench_' + mode)
+                timings = []
+                attempts = [0]
+
+                def worker():
+                    for _ in range(runs):
+                        start = time.time()
+                        while True:
+                            attempts[0] += 1
+                            try:
+                                if mode == 'wait':
+                                    pcnx = cnxpool.get_connection(timeout=60)
+                                else:
+                                    pcnx = cnxpool.get_connection()
+                                break
+                            except errors.PoolError:
+                                time.sleep(0.001)
+                        timings.append(time.time() - start)
+                        time.sleep(0.0005)
+                        pcnx.close()
+
+                workers = [threading.Thread(target=worker)
+                           for _ in range(num_threads)]
+                start = time.time()
+                for thread in workers:
+                    thread.start()
+                for thread in workers:
+                    thread.join()
+                elapsed = time.time() - start
+
+                self.assertEqual(num_threads * runs, len(timings))
+                self.assertEqual(pool_size, cnxpool._cnx_queue.qsize())
+                timings.sort()
+                results[mode] = (
+                    elapsed, attempts[0], timings[len(timings) // 2] * 1000,
+                    timings[int(len(timings) * 0.99)] * 1000,
+                    timings[-1] * 1000)
+
+            for mode in ('retry', 'wait'):
+                tests.MESSAGES["INFO"].append(
+                    "classic pool checkout ({0}) with {1} threads: {2:.2f}s "
+                    "{3} attempts p50={4:.3f}ms p99={5:.3f}ms "
+                    "max={6:.3f}ms".format(
+                        mode, num_threads, *results[mode]))
+            self.assertEqual(num_threads * runs, results['wait'][1])
+
+
+def _packet(seq, payload):
+    """Returns a MySQL packet with the given sequence number and payload"""
+    return struct.pack('<I', len(payload))[0:3] + struct.pack('<B', seq % 256) \
+        + payload
+
+
+class _PoolServer(object):
+    """Local server accepting any number of connections
+
+    Connections are accepted without checking the credentials, after
+    waiting delay seconds, and every command gets an OK packet.
+    """
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.connections = 0
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(64)
+        self.port = self._server.getsockname()[1]
+        thread = threading.Thread(target=self._accept)
+        thread.daemon = True
+        thread.start()
+
+    def config(self, **kwargs):
+        """Returns the connection arguments to connect to the server"""
+        kwargs.update(host='127.0.0.1', port=self.port, user='root',
+                      password='', ssl_disabled=True)
+        return kwargs
+
+    def close(self):
+        """Stops accepting connections"""
+        self._server.close()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self._server.accept()
+            except socket.error:
+                return
+            self.connections += 1
+            thread = threading.Thread(target=self._serve,
+                                      args=(sock, self.connections))
+            thread.daemon = True
+            thread.start()
+
+    def _serve(self, sock, thread_id):
+        caps = (ClientFlag.PROTOCOL_41 | ClientFlag.SECURE_CONNECTION |
+                ClientFlag.PLUGIN_AUTH | ClientFlag.LONG_PASSWD |
+                ClientFlag.TRANSACTIONS)
+        ok_packet = b'\x00\x00\x00\x02\x00\x00\x00'
+        greeting = (b'\x0a8.0.19\x00' + struct.pack('<I', thread_id) +
+                    b'abcdefgh\x00' + struct.pack('<HBHHB', caps & 0xffff, 33,
+                                                   2, caps >> 16, 21) +
+                    b'\x00' * 10 + b'ijklmnopqrst\x00' +
+                    b'mysql_native_password\x00')
+        time.sleep(self.delay)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock_file = sock.makefile('rb')
+        try:
+            sock.sendall(_packet(0, greeting))
+            sock_file.read(
+                4 + struct.unpack('<I', sock_file.read(3) + b'\x00')[0] - 3)
+            sock.sendall(_packet(2, ok_packet))
+            while True:
+                header = sock_file.read(4)
+                if len(header) < 4:
+                    break
+                payload = sock_file.read(
+                    struct.unpack('<I', header[0:3] + b'\x00')[0])
+                if payload[0:1] == b'\x01':
+                    break
+                sock.sendall(_packet(1, ok_packet))
+        except socket.error:
+            pass
+        sock_file.close()
+        sock.close()
+
+
+class MySQLConnectionPoolElasticTests(tests.MySQLConnectorTests):
+
+    """Testing elastic sizing of MySQLConnectionPool"""
+
+    def setUp(self):
+        self.server = _PoolServer()
+
+    def tearDown(self):
+        self.server.close()
+        mysql.connector._CONNECTION_POOLS = {}
+
+    def test___init__(self):
+        config = self.server.config()
+        self.assertRaises(AttributeError, pooling.MySQLConnectionPool,
+                          pool_name='test', pool_min_size=3, pool_max_size=2)
+        self.assertRaises(AttributeError, pooling.MySQLConnectionPool,
+                          pool_name='test', pool_min_size=-1)
+        self.assertRaises(AttributeError, pooling.MySQLConnectionPool,
+                          pool_name='test', pool_max_size=0)
+        self.assertRaises(AttributeError, pooling.MySQLConnectionPool,
+                          pool_name='test', pool_max_idle_time=0)
+        self.assertRaises(AttributeError, pooling.MySQLConnectionPool,
+                          pool_name='test', pool_open_threads=0)
+
+        # Fixed size pools open all connections upfront
+        cnxpool = pooling.MySQLConnectionPool(pool_size=3, **config)
+        self.assertEqual((3, 3), (cnxpool.min_size, cnxpool.pool_size))
+        self.assertEqual(3, self.server.connections)
+
+        # Elastic pools open the minimum number of connections
+        cnxpool = pooling.MySQLConnectionPool(pool_min_size=1, **config)
+        self.assertEqual((1, 5), (cnxpool.min_size, cnxpool.pool_size))
+        self.assertEqual(1, cnxpool.open_connections)
+        self.assertEqual(4, self.server.connections)
+
+    def test_open_on_demand(self):
+        cnxpool = pooling.MySQLConnectionPool(
+            pool_max_size=3, **self.server.config())
+        self.assertEqual(0, self.server.connections)
+
+        pcnxs = [cnxpool.get_connection() for _ in range(3)]
+        last_id = pcnxs[-1].connection_id
+        self.assertEqual(3, cnxpool.open_connections)
+        self.assertEqual(3, cnxpool.stats['opened_connections'])
+        self.assertRaises(errors.PoolError, cnxpool.get_connection)
+        for pcnx in pcnxs:
+            pcnx.close()
+
+        # Idle connections are reused, the most recently returned first
+        pcnx = cnxpool.get_connection()
+        self.assertEqual(last_id, pcnx.connection_id)
+        pcnx.close()
+        self.assertEqual(3, self.server.connections)
+
+        # Fixed size pools do not replace closed connections
+        cnxpool = pooling.MySQLConnectionPool(pool_size=1,
+                                              **self.server.config())
+        cnxpool._remove_connections()
+        self.assertRaises(errors.PoolError, cnxpool.get_connection)
+
+    def test_open_threads(self):
+        server = _PoolServer(delay=0.1)
+        timings = {}
+        try:
+            for num_threads in (1, 4):
+                start = time.time()
+                cnxpool = pooling.MySQLConnectionPool(
+                    pool_min_size=4, pool_open_threads=num_threads,
+                    **server.config())
+                timings[num_threads] = time.time() - start
+                self.assertEqual(4, cnxpool._cnx_queue.qsize())
+                cnxpool._remove_connections()
+        finally:
+            server.close()
+        self.assertTrue(timings[1] >= 0.4)
+        self.assertTrue(timings[4] < timings[1])
+        tests.MESSAGES["INFO"].append(
+            "classic pool opening 4 connections taking 100ms each: "
+            "1 thread={0:.3f}s 4 threads={1:.3f}s".format(timings[1],
+                                                          timings[4]))
+
+    def test_max_idle_time(self):
+        cnxpool = pooling.MySQLConnectionPool(
+            pool_min_size=1, pool_max_size=4, pool_max_idle_time=0.05,
+            **self.server.config())
+        pcnxs = [cnxpool.get_connection() for _ in range(4)]
+        for pcnx in pcnxs:
+            pcnx.close()
+        self.assertEqual(4, cnxpool.open_connections)
+
+        deadline = time.time() + 5
+        while cnxpool.open_connections > 1 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(1, cnxpool.open_connections)
+        self.assertEqual(1, cnxpool._cnx_queue.qsize())
+        self.assertEqual(3, cnxpool.stats['evicted_connections'])
+
+    def test_resize(self):
+        cnxpool = pooling.MySQLConnectionPool(
+            pool_max_size=2, **self.server.config())
+        pcnxs = [cnxpool.get_connection() for _ in range(2)]
+
+        # Connections above the new maximum are closed when returned
+        cnxpool.resize(max_size=1)
+        pcnxs[0].close()
+        self.assertEqual(1, cnxpool.open_connections)
+        self.assertEqual(0, cnxpool._cnx_queue.qsize())
+        pcnxs[1].close()
+        self.assertEqual(1, cnxpool._cnx_queue.qsize())
+
+        # Requests waiting on a full pool open new connections
+        pcnx = cnxpool.get_connection()
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(cnxpool.get_connection(timeout=5)))
+        thread.start()
+        deadline = time.time() + 5
+        while not cnxpool.waiting and time.time() < deadline:
+            time.sleep(0.001)
+        cnxpool.resize(max_size=2)
+        thread.join()
+        self.assertEqual(2, cnxpool.open_connections)
+        self.assertNotEqual(pcnx.connection_id, result[0].connection_id)
+        pcnx.close()
+        result[0].close()
+
+        # Connections are opened to reach the new minimum
+        cnxpool.resize(min_size=3, max_size=4)
+        self.assertEqual(3, cnxpool.open_connections)
+        self.assertEqual(3, cnxpool._cnx_queue.qsize())
+        self.assertRaises(AttributeError, cnxpool.resize, min_size=5)
+
+    def test_connect(self):
+        config = self.server.config(pool_name='elastic', pool_max_size=1)
+        mysql.connector.connect(**config).close()
+        cnxpool = mysql.connector._CONNECTION_POOLS['elastic']
+        self.assertEqual(1, cnxpool.pool_size)
+
+        config['pool_max_size'] = 3
+        config['pool_min_size'] = 2
+        mysql.connector.connect(**config).close()
+        self.assertEqual((2, 3), (cnxpool.min_size, cnxpool.pool_size))
+        self.assertEqual(2, cnxpool.open_connections)
+
+        config['pool_size'] = 2
+        self.assertRaises(errors.PoolError, mysql.connector.connect, **config)
+
+
 class ModuleConnectorPoolingTests(tests.MySQLConnectorTests):
 
     """Testing MySQL Connector module pooling functionality"""
@@ -35,7 +35,8 @@ import decimal
 
 import tests
 from mysql.connector import (protocol, errors)
-from mysql.connector.constants import (ClientFlag, FieldType, FieldFlag)
+from mysql.connector.constants import (ClientFlag, FieldType, FieldFlag,
+                                       ServerFlag, SessionTrackType)
 
 OK_PACKET = bytearray(b'\x07\x00\x00\x01\x00\x01\x00\x00\x00\x01\x00')
 OK_PACKET_RESULT = {
@@ -249,6 +250,27 @@ class MySQLProtocolTests(tests.MySQLConnectorTests):
         res = self._protocol.parse_ok(okpkt)
         self.assertEqual(exp, res)
 
+        # Session state changes
+        state = (b'\x01\x05\x04spam' +
+                 b'\x00\x11\x09time_zone\x06+01:00' +
+                 b'\x05\x09\x08T_______' +
+                 b'\x09\x02\x00\x00')
+        okpkt = bytearray(b'\x00\x01\x00\x00\x40\x01\x00\x00' +
+                          bytes(bytearray([len(state)])) + state)
+        okpkt = bytearray(struct.pack('<I', len(okpkt))[0:3]) + \
+            bytearray(b'\x01') + okpkt
+        exp = OK_PACKET_RESULT.copy()
+        exp['status_flag'] = ServerFlag.SERVER_SESSION_STATE_CHANGED
+        exp['info_msg'] = ''
+        exp['session_state'] = [
+            (SessionTrackType.SCHEMA, 'spam'),
+            (SessionTrackType.SYSTEM_VARIABLES,
+             ('time_zone', '+01:00')),
+            (SessionTrackType.TRANSACTION_STATE, 'T_______'),
+        ]
+        res = self._protocol.parse_ok(okpkt)
+        self.assertEqual(exp, res)
+
     def test_parse_column_count(self):
         """Parse the number of columns"""
         packet = bytearray(b'\x01\x00\x00\x01\x03')
@@ -574,3 +596,24 @@ class MySQLProtocolTests(tests.MySQLConnectorTests):
         self.assertRaises(errors.ProgrammingError,
                           self._protocol.make_stmt_execute,
                           statement_id, data, (1, 2))
+
+        # Parameter types are only sent when they changed
+        bound_types = {}
+        data = (None, 'Ham')
+        res = self._protocol.make_stmt_execute(statement_id, data, (1, 2),
+                                               bound_types=bound_types)
+        self.assertEqual({statement_id: b'\x06\x00\x0f\x00'}, bound_types)
+        self.assertEqual(
+            b'\x01\x00\x00\x00\x00\x01\x00\x00\x00\x01\x01\x06\x00'
+            b'\x0f\x00\x03\x48\x61\x6d', res)
+        data = (None, 'Spam')
+        res = self._protocol.make_stmt_execute(statement_id, data, (1, 2),
+                                               bound_types=bound_types)
+        self.assertEqual(
+            b'\x01\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00'
+            b'\x04\x53\x70\x61\x6d', res)
+        data = (1, 'Spam')
+        res = self._protocol.make_stmt_execute(statement_id, data, (1, 2),
+                                               bound_types=bound_types)
+        self.assertEqual(b'\x00\x01\x01\x80\x0f\x00', res[9:15])
+        self.assertEqual({statement_id: b'\x01\x80\x0f\x00'}, bound_types)
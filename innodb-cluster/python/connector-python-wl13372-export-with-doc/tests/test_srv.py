@@ -0,0 +1,158 @@
+# Copyright (c) 2020, Oracle and/or its affiliates. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301  USA
+
+"""Unittests for mysql.connector.srv
+"""
+
+import random
+import threading
+
+import dns.exception
+
+import tests
+from mysql.connector import srv
+
+
+def _record(host, priority, weight):
+    return {"host": host, "port": 3306, "priority": priority,
+            "weight": weight}
+
+
+class _Query(object):
+    """Query function returning the given records and counting calls."""
+
+    def __init__(self, records, ttl):
+        self.records = records
+        self.ttl = ttl
+        self.calls = 0
+        self.event = threading.Event()
+
+    def __call__(self, name):
+        self.calls += 1
+        self.event.set()
+        if self.records is None:
+            raise dns.exception.DNSException()
+        return self.records, self.ttl
+
+
+class SRVTests(tests.MySQLConnectorTests):
+
+    """Testing the DNS SRV cache and records ordering.
+
+    These tests should not make a connection to the database.
+    """
+
+    def setUp(self):
+        self.now = 1000.0
+        self._clock = srv._clock
+        srv._clock = lambda: self.now
+
+    def tearDown(self):
+        srv._clock = self._clock
+
+    def test_order_records(self):
+        records = [_record("c", 20, 10), _record("a1", 10, 0),
+                   _record("a2", 10, 60), _record("a3", 10, 40)]
+        rand = random.Random(13)
+        first = {"a1": 0, "a2": 0, "a3": 0}
+        for _ in range(10000):
+            ordered = srv.order_records(records, rand)
+            self.assertEqual(4, len(ordered))
+            self.assertEqual(set(["a1", "a2", "a3"]),
+                             set(rec["host"] for rec in ordered[:3]))
+            self.assertEqual("c", ordered[3]["host"])
+            first[ordered[0]["host"]] += 1
+        # Selection is proportional to the weight within a priority
+        self.assertTrue(5500 < first["a2"] < 6500, first)
+        self.assertTrue(3500 < first["a3"] < 4500, first)
+        self.assertTrue(first["a1"] < 200, first)
+
+        # Zero weights only, all of them are returned
+        records = [_record("a", 0, 0), _record("b", 0, 0)]
+        self.assertEqual(["a", "b"], sorted(
+            rec["host"] for rec in srv.order_records(records)))
+        self.assertEqual([], srv.order_records([]))
+
+    def test_cache(self):
+        query = _Query([_record("a", 10, 1)], 60)
+        cache = srv.SRVCache(query)
+        self.assertEqual("a", cache.get_records("db.local")[0]["host"])
+        self.assertEqual("a", cache.get_records("db.local")[0]["host"])
+        self.assertEqual(1, query.calls)
+        self.assertEqual({"hits": 1, "misses": 1, "refreshes": 0, "size": 1},
+                         cache.stats())
+
+        # Expired records are resolved again
+        self.now += 61
+        query.records = [_record("b", 10, 1)]
+        self.assertEqual("b", cache.get_records("db.local")[0]["host"])
+        self.assertEqual(2, query.calls)
+        self.assertEqual(2, cache.stats()["misses"])
+
+        # Resolution errors are raised when nothing is cached
+        query.records = None
+        self.assertRaises(dns.exception.DNSException, cache.get_records,
+                          "other.local")
+
+        # Changing the returned records does not change the cached ones
+        cache.get_records("db.local")[0]["available"] = False
+        self.assertEqual(_record("b", 10, 1),
+                         cache.get_records("db.local")[0])
+
+        cache.clear()
+        self.assertEqual({"hits": 0, "misses": 0, "refreshes": 0, "size": 0},
+                         cache.stats())
+
+    def test_cache_refresh(self):
+        query = _Query([_record("a", 10, 1)], 100)
+        cache = srv.SRVCache(query, refresh_ratio=0.5)
+        cache.get_records("db.local")
+        query.event.clear()
+
+        # Refreshed in the background, the cached records are returned
+        self.now += 60
+        query.records = [_record("b", 10, 1)]
+        self.assertEqual("a", cache.get_records("db.local")[0]["host"])
+        self.assertTrue(query.event.wait(5))
+        for _ in range(500):
+            if cache.stats()["refreshes"]:
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual("b", cache.get_records("db.local")[0]["host"])
+        self.assertEqual({"hits": 2, "misses": 1, "refreshes": 1, "size": 1},
+                         cache.stats())
+
+        # A failed refresh keeps the records until they expire
+        self.now += 60
+        query.records = None
+        query.event.clear()
+        self.assertEqual("b", cache.get_records("db.local")[0]["host"])
+        self.assertTrue(query.event.wait(5))
+        self.now += 50
+        self.assertRaises(dns.exception.DNSException, cache.get_records,
+                          "db.local")
@@ -30,6 +30,8 @@
 """
 
 import struct
+import threading
+import time
 
 import tests
 from mysql.connector import utils
@@ -268,3 +270,63 @@ class UtilsTests(tests.MySQLConnectorTests):
         exprest = bytearray(b'\xdd\xdd')
         self.assertEqual((exprest, exp), utils.read_lc_int(lcs),
                          "Failed getting length coded long long")
+
+    def test_staggered_connect(self):
+        """Run connection attempts in parallel."""
+        blocked = threading.Event()
+        disposed = []
+
+        def hang():
+            blocked.wait(5)
+            return "late"
+
+        def fail():
+            raise ValueError("refused")
+
+        # The first attempt hangs, the next one starts after the delay
+        start = time.time()
+        self.assertEqual((1, "second"), utils.staggered_connect(
+            [hang, lambda: "second"], 0.05, disposed.append))
+        self.assertTrue(time.time() - start < 1)
+        blocked.set()
+        for _ in range(100):
+            if disposed:
+                break
+            time.sleep(0.01)
+        self.assertEqual(["late"], disposed)
+
+        # A failed attempt starts the next one without waiting
+        start = time.time()
+        self.assertEqual((2, "third"), utils.staggered_connect(
+            [fail, fail, lambda: "third"], 10, disposed.append))
+        self.assertTrue(time.time() - start < 1)
+
+        # The error of the last attempt is raised when all of them fail
+        self.assertRaises(ValueError, utils.staggered_connect,
+                          [fail, fail], 0.01, disposed.append)
+
+    def test_lru_cache(self):
+        """Keep the most recently used entries of a LRUCache."""
+        cache = utils.LRUCache(maxsize=2)
+        self.assertEqual([], cache.put("a", 1))
+        self.assertEqual([], cache.put("b", 2))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual([("b", 2)], cache.put("c", 3))
+        self.assertFalse("b" in cache)
+        self.assertEqual(None, cache.get("b"))
+        self.assertEqual("none", cache.get("b", "none"))
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+        # Replacing a value does not evict other entries
+        self.assertEqual([], cache.put("a", 10))
+        self.assertEqual(2, len(cache))
+        self.assertEqual([("c", 3), ("a", 10)], cache.items())
+        # Peeking does not change the order nor the counters
+        self.assertEqual(3, cache.peek("c"))
+        self.assertEqual(None, cache.peek("b"))
+        self.assertEqual([("c", 3), ("a", 10)], cache.items())
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+        self.assertEqual(3, cache.pop("c"))
+        self.assertEqual(None, cache.pop("c"))
+        self.assertEqual([("a", 10)], cache.clear())
+        self.assertEqual((0, 0, 0), (len(cache), cache.hits, cache.misses))